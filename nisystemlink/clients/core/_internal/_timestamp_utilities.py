@@ -3,9 +3,15 @@
 """Implementation of TimestampUtilities."""
 
 import datetime
+import functools
+import re
 
 from typing_extensions import final
 
+_TIMESTAMP_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})\.(\d{1,6})\d*Z", re.ASCII
+)
+
 
 @final
 class TimestampUtilities:
@@ -30,6 +36,14 @@ class TimestampUtilities:
         Returns:
             The string representation of the timestamp.
         """
+        # Fast path for plain UTC datetimes, which don't need any conversion.
+        # Subclasses such as pandas.Timestamp may format differently.
+        if type(value) is datetime.datetime:
+            if value.tzinfo is None:
+                return value.isoformat() + "Z"
+            if value.tzinfo is datetime.timezone.utc:
+                return value.isoformat()[:-6] + "Z"  # strip "+00:00"
+
         # Use timezone-aware conversion to avoid deprecated utcfromtimestamp usage and
         # preserve exact UTC semantics (value assumed either naive UTC or aware).
         if value.tzinfo is None:
@@ -39,6 +53,7 @@ class TimestampUtilities:
         return value.isoformat().replace("+00:00", "Z")
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def str_to_datetime(cls, timestamp: str) -> datetime.datetime:
         """Attempt to parse a SystemLink-formatted timestamp string into a ``datetime.datetime``.
 
@@ -52,6 +67,22 @@ class TimestampUtilities:
         Raises:
             ValueError: if the timestamp format is not as expected
         """
+        # Timestamps returned by the server always match this pattern. Repeated
+        # timestamps, such as the updates from a single write, are cached.
+        match = _TIMESTAMP_PATTERN.fullmatch(timestamp)
+        if match is not None:
+            year, month, day, hour, minute, second, fraction = match.groups()
+            return datetime.datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                int(fraction.ljust(6, "0")),
+                datetime.timezone.utc,
+            )
+
         # Python's supported ISO format requires exactly 6 digits after the
         # decimal, and doesn't support "Z" as the timezone
         # Valid format is: YYYY-MM-DDThh:mm:ss.ssssss+NN:NN
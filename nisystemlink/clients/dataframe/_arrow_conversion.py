@@ -0,0 +1,84 @@
+"""Conversion between the string encoding of table data and pyarrow types."""
+
+from typing import List
+
+try:
+    import pyarrow as pa  # type: ignore
+except Exception:
+    pa = None
+
+from . import models
+
+
+def arrow_type(data_type: models.DataType) -> "pa.DataType":  # type: ignore[name-defined]
+    """Gets the Arrow type used to represent values of a column data type.
+
+    Args:
+        data_type: The data type of a table column.
+
+    Returns:
+        The corresponding Arrow type. Timestamps are UTC with millisecond precision
+        and no time zone.
+    """
+    if data_type == models.DataType.Timestamp:
+        return pa.timestamp("ms")
+    return {
+        models.DataType.Bool: pa.bool_,
+        models.DataType.Float32: pa.float32,
+        models.DataType.Float64: pa.float64,
+        models.DataType.Int32: pa.int32,
+        models.DataType.Int64: pa.int64,
+        models.DataType.String: pa.string,
+    }[data_type]()
+
+
+def arrow_schema(
+    columns: List[models.Column],
+) -> "pa.Schema":  # type: ignore[name-defined]
+    """Gets the Arrow schema used to represent rows of a table.
+
+    Args:
+        columns: The columns of the table.
+
+    Returns:
+        A schema with a field for each column, in the same order.
+    """
+    return pa.schema(
+        [
+            pa.field(
+                column.name,
+                arrow_type(column.data_type),
+                nullable=column.column_type == models.ColumnType.Nullable,
+            )
+            for column in columns
+        ]
+    )
+
+
+def data_frame_to_record_batch(
+    frame: models.DataFrame, columns: List[models.Column]
+) -> "pa.RecordBatch":  # type: ignore[name-defined]
+    """Parses the string-encoded values of a :class:`.DataFrame` into a RecordBatch.
+
+    Args:
+        frame: The data frame to convert. Its ``columns`` must be set.
+        columns: The table columns included in the frame, in the frame's column
+            order.
+
+    Returns:
+        A RecordBatch with the schema returned by :func:`arrow_schema`.
+    """
+    schema = arrow_schema(columns)
+    values = list(zip(*frame.data)) if frame.data else [()] * len(columns)
+    arrays = []
+    for column, column_values in zip(columns, values):
+        strings = pa.array(column_values, type=pa.string())
+        if column.data_type == models.DataType.Timestamp:
+            # Values are in UTC and include a zone designator, which Arrow only
+            # accepts when parsing into a zoned timestamp.
+            arrays.append(
+                strings.cast(pa.timestamp("ms", tz="UTC")).cast(pa.timestamp("ms"))
+            )
+        else:
+            arrays.append(strings.cast(arrow_type(column.data_type)))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
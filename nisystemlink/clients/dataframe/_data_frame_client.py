@@ -1,8 +1,9 @@
 """Implementation of DataFrameClient."""
 
-from collections.abc import Iterable
+import sys
+from collections.abc import Iterable, Iterator
 from io import BytesIO
-from typing import List, Union
+from typing import List, Literal, TYPE_CHECKING, Union
 
 try:
     import pyarrow as pa  # type: ignore
@@ -23,6 +24,51 @@ from uplink import Body, Field, Path, Query, retry
 
 from . import models
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _coalesce_batches(
+    batches: Iterable["pa.RecordBatch"],  # type: ignore[name-defined]
+    max_rows: int | None,
+    max_bytes: int | None,
+) -> Iterator["pa.RecordBatch"]:  # type: ignore[name-defined]
+    """Combine consecutive small RecordBatches until a row or byte threshold is reached.
+
+    Args:
+        batches: The RecordBatches to coalesce. All batches must share the same schema.
+        max_rows: The number of buffered rows at which the buffered batches are combined
+            and yielded, or None to ignore row counts.
+        max_bytes: The number of buffered bytes at which the buffered batches are
+            combined and yielded, or None to ignore batch sizes.
+
+    Returns:
+        An iterator of RecordBatches. If neither threshold is set, the input batches are
+        yielded unchanged.
+    """
+    if max_rows is None and max_bytes is None:
+        yield from batches
+        return
+
+    pending: List["pa.RecordBatch"] = []  # type: ignore[name-defined]
+    pending_rows = 0
+    pending_bytes = 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        pending_bytes += batch.nbytes
+        if (max_rows is not None and pending_rows >= max_rows) or (
+            max_bytes is not None and pending_bytes >= max_bytes
+        ):
+            yield pending[0] if len(pending) == 1 else pa.concat_batches(pending)
+            pending = []
+            pending_rows = 0
+            pending_bytes = 0
+
+    if pending:
+        yield pending[0] if len(pending) == 1 else pa.concat_batches(pending)
+
+
 # retry for common http status codes and any Connection error
 
 
@@ -279,6 +325,7 @@ class DataFrameClient(BaseClient):
             Union[
                 models.AppendTableDataRequest,
                 models.DataFrame,
+                "pd.DataFrame",
                 "pa.RecordBatch",  # type: ignore[name-defined]
                 Iterable["pa.RecordBatch"],  # type: ignore[name-defined]
             ]
@@ -286,7 +333,14 @@ class DataFrameClient(BaseClient):
         ),
         *,
         end_of_data: bool | None = None,
-    ) -> None:
+        compression: Literal["zstd", "lz4"] | None = "zstd",
+        compression_level: int | None = None,
+        coalesce_rows: int | None = None,
+        coalesce_bytes: int | None = None,
+        chunk_size: int = 10_000,
+        use_arrow: bool | None = None,
+        columns: List[models.Column] | None = None,
+    ) -> models.ArrowIngestionStatistics | None:
         """Appends one or more rows of data to the table identified by its ID.
 
         Args:
@@ -298,6 +352,10 @@ class DataFrameClient(BaseClient):
                 * ``AppendTableDataRequest``: Sent as-is via JSON; ``end_of_data`` must be ``None``.
                 * ``DataFrame`` (service model): Wrapped into an
                   ``AppendTableDataRequest`` (``end_of_data`` optional) and sent as JSON.
+                * ``pandas.DataFrame``: Validated against the table's column data types and
+                  converted column-wise, ``chunk_size`` rows at a time. Streamed as Arrow IPC
+                  when ``pyarrow`` is installed; otherwise each chunk is sent as a JSON
+                  request. The frame's index is ignored. See ``use_arrow``.
                 * Single ``pyarrow.RecordBatch``: Treated the same as an iterable containing one
                   batch and streamed as Arrow IPC. ``end_of_data`` (if provided) is sent as a
                   query parameter.
@@ -309,6 +367,34 @@ class DataFrameClient(BaseClient):
             end_of_data: Whether additional rows may be appended in future requests. Required when
                 ``data`` is ``None`` or the RecordBatch iterator is empty; must be omitted when
                 passing an ``AppendTableDataRequest`` (include it inside that model instead).
+            compression: The codec used to compress RecordBatches in the Arrow IPC stream:
+                ``"zstd"`` (the default), ``"lz4"``, or ``None`` to send uncompressed data.
+                Uncompressed streams avoid the CPU cost of compression on fast networks.
+                Ignored for JSON ingestion.
+            compression_level: The codec-specific compression level, or ``None`` to use the
+                codec's default. Requires ``compression``.
+            coalesce_rows: Combine consecutive RecordBatches until at least this many rows
+                are buffered before writing them as a single IPC message. Batches that are
+                already large enough are written as-is. Ignored for JSON ingestion.
+            coalesce_bytes: Combine consecutive RecordBatches until at least this many
+                bytes are buffered before writing them as a single IPC message. May be
+                combined with ``coalesce_rows``, in which case whichever threshold is
+                reached first causes the buffered batches to be written. Ignored for JSON
+                ingestion.
+            chunk_size: The number of rows of a ``pandas.DataFrame`` to convert at a time.
+                Each chunk becomes one RecordBatch, or one request for JSON ingestion.
+            use_arrow: Whether to stream a ``pandas.DataFrame`` as Arrow IPC (``True``) or
+                send it as JSON (``False``). Defaults to Arrow when ``pyarrow`` is
+                installed.
+            columns: The table's columns, used to validate and convert a
+                ``pandas.DataFrame``. Pass them when appending to the same table
+                repeatedly to avoid fetching the table's metadata on every call.
+                Fetched from the service when ``None``.
+
+        Returns:
+            Statistics about the Arrow IPC stream, including the number of bytes sent and
+            the compression ratio, when RecordBatches were streamed. ``None`` when the data
+            was sent as JSON.
 
         Raises:
             ValueError: If parameter constraints are violated.
@@ -321,7 +407,7 @@ class DataFrameClient(BaseClient):
                     "end_of_data must not be provided separately when passing an AppendTableDataRequest."
                 )
             self._append_table_data_json(id, data)
-            return
+            return None
 
         if isinstance(data, models.DataFrame):
             if end_of_data is None:
@@ -331,7 +417,56 @@ class DataFrameClient(BaseClient):
                     frame=data, end_of_data=end_of_data
                 )
             self._append_table_data_json(id, request_model)
-            return
+            return None
+
+        # A pandas DataFrame can only be passed once pandas has been imported
+        pandas = sys.modules.get("pandas")
+        if pandas is not None and isinstance(data, pandas.DataFrame):
+            from . import _pandas_conversion
+
+            if chunk_size < 1:
+                raise ValueError("chunk_size must be at least 1.")
+            if use_arrow is None:
+                use_arrow = pa is not None
+            elif use_arrow and pa is None:
+                raise RuntimeError(
+                    "pyarrow is not installed. Install to stream pandas DataFrames as Arrow."
+                )
+
+            if columns is None:
+                columns = self.get_table_metadata(id).columns
+            _pandas_conversion.validate_pandas_frame(data, columns)
+
+            if use_arrow:
+                data = _pandas_conversion.pandas_frame_to_record_batches(
+                    data, columns, chunk_size
+                )
+            else:
+                frames = _pandas_conversion.pandas_frame_to_data_frames(
+                    data, columns, chunk_size
+                )
+                pending = next(frames, None)
+                if pending is None:
+                    if end_of_data is None:
+                        raise ValueError(
+                            "end_of_data must be provided when the pandas DataFrame is empty."
+                        )
+                    self._append_table_data_json(
+                        id, models.AppendTableDataRequest(end_of_data=end_of_data)
+                    )
+                    return None
+                for frame in frames:
+                    self._append_table_data_json(
+                        id, models.AppendTableDataRequest(frame=pending)
+                    )
+                    pending = frame
+                self._append_table_data_json(
+                    id,
+                    models.AppendTableDataRequest(
+                        frame=pending, end_of_data=end_of_data
+                    ),
+                )
+                return None
 
         if pa is not None and isinstance(data, pa.RecordBatch):
             data = [data]
@@ -349,7 +484,7 @@ class DataFrameClient(BaseClient):
                     id,
                     models.AppendTableDataRequest(end_of_data=end_of_data),
                 )
-                return
+                return None
 
             if pa is None:
                 raise RuntimeError(
@@ -361,23 +496,51 @@ class DataFrameClient(BaseClient):
                     "Iterable provided to data must yield pyarrow.RecordBatch objects."
                 )
 
+            if compression is not None and compression not in ("zstd", "lz4"):
+                raise ValueError("compression must be 'zstd', 'lz4', or None.")
+            if compression is None and compression_level is not None:
+                raise ValueError(
+                    "compression_level must not be provided when compression is None."
+                )
+            if coalesce_rows is not None and coalesce_rows < 1:
+                raise ValueError("coalesce_rows must be at least 1.")
+            if coalesce_bytes is not None and coalesce_bytes < 1:
+                raise ValueError("coalesce_bytes must be at least 1.")
+
+            options = pa.ipc.IpcWriteOptions(
+                compression=(
+                    pa.Codec(compression, compression_level=compression_level)
+                    if compression is not None
+                    else None
+                )
+            )
+            statistics = models.ArrowIngestionStatistics()
+
+            def _count_batches() -> Iterator["pa.RecordBatch"]:  # type: ignore[name-defined]
+                yield first_batch
+                statistics.batch_count += 1
+                for batch in iterator:
+                    yield batch
+                    statistics.batch_count += 1
+
             def _generate_body() -> Iterable[memoryview]:
-                batch = first_batch
                 with BytesIO() as buf:
-                    options = pa.ipc.IpcWriteOptions(compression="zstd")
-                    writer = pa.ipc.new_stream(buf, batch.schema, options=options)
+                    writer = pa.ipc.new_stream(buf, first_batch.schema, options=options)
 
-                    while True:
+                    for batch in _coalesce_batches(
+                        _count_batches(), coalesce_rows, coalesce_bytes
+                    ):
                         writer.write_batch(batch)
+                        statistics.message_count += 1
+                        statistics.row_count += batch.num_rows
+                        statistics.uncompressed_bytes += batch.nbytes
+                        statistics.bytes_sent += buf.tell()
                         with buf.getbuffer() as view, view[0 : buf.tell()] as slice:
                             yield slice
                         buf.seek(0)
-                        try:
-                            batch = next(iterator)
-                        except StopIteration:
-                            break
 
                     writer.close()
+                    statistics.bytes_sent += buf.tell()
                     with buf.getbuffer() as view, view[0 : buf.tell()] as slice:
                         yield slice
 
@@ -414,7 +577,7 @@ class DataFrameClient(BaseClient):
                             inner=ex,
                         ) from ex
                 raise
-            return
+            return statistics
 
         if data is None:
             if end_of_data is None:
@@ -424,10 +587,11 @@ class DataFrameClient(BaseClient):
             self._append_table_data_json(
                 id, models.AppendTableDataRequest(end_of_data=end_of_data)
             )
-            return
+            return None
 
         raise ValueError(
-            "Unsupported type for data. Expected AppendTableDataRequest, DataFrame, Iterable[RecordBatch], or None."
+            "Unsupported type for data. Expected AppendTableDataRequest, DataFrame, "
+            "pandas.DataFrame, Iterable[RecordBatch], or None."
         )
 
     @post("tables/{id}/query-data", args=[Path, Body])
@@ -0,0 +1,203 @@
+"""Conversion of pandas DataFrames to the formats accepted by the DataFrame Service."""
+
+from collections.abc import Iterator
+from typing import List
+
+import numpy as np
+import pandas as pd
+from pandas.api import types as pdtypes
+
+try:
+    import pyarrow as pa  # type: ignore
+except Exception:
+    pa = None
+
+from . import models
+from ._arrow_conversion import arrow_type
+
+_INTEGER_RANGES = {
+    models.DataType.Int32: (-(2**31), 2**31 - 1),
+    models.DataType.Int64: (-(2**63), 2**63 - 1),
+}
+
+
+def validate_pandas_frame(frame: pd.DataFrame, columns: List[models.Column]) -> None:
+    """Validates that a pandas DataFrame can be appended to a table with the given columns.
+
+    Args:
+        frame: The pandas DataFrame to validate. Its index is ignored.
+        columns: The columns of the target table.
+
+    Raises:
+        ValueError: if the frame has duplicate or unknown columns, omits a column that
+            is not nullable, or has a column whose dtype or values are incompatible with
+            the table column's data type.
+    """
+    if frame.columns.has_duplicates:
+        raise ValueError("The pandas DataFrame must not contain duplicate columns.")
+
+    columns_by_name = {column.name: column for column in columns}
+    unknown = [name for name in frame.columns if name not in columns_by_name]
+    if unknown:
+        raise ValueError(
+            f"The pandas DataFrame contains columns not in the table: {unknown}."
+        )
+
+    missing = [
+        column.name
+        for column in columns
+        if column.column_type != models.ColumnType.Nullable
+        and column.name not in frame.columns
+    ]
+    if missing:
+        raise ValueError(
+            f"The pandas DataFrame is missing non-nullable table columns: {missing}."
+        )
+
+    for name in frame.columns:
+        _validate_series(frame[name], columns_by_name[name].data_type)
+
+
+def _validate_series(series: pd.Series, data_type: models.DataType) -> None:
+    dtype = series.dtype
+    is_integer = pdtypes.is_integer_dtype(dtype) and not pdtypes.is_bool_dtype(dtype)
+    if data_type == models.DataType.Bool:
+        compatible = pdtypes.is_bool_dtype(dtype)
+    elif data_type in (models.DataType.Int32, models.DataType.Int64):
+        compatible = is_integer
+    elif data_type in (models.DataType.Float32, models.DataType.Float64):
+        compatible = is_integer or pdtypes.is_float_dtype(dtype)
+    elif data_type == models.DataType.String:
+        compatible = pdtypes.is_string_dtype(dtype) or pdtypes.is_object_dtype(dtype)
+    elif data_type == models.DataType.Timestamp:
+        compatible = pdtypes.is_datetime64_any_dtype(dtype)
+    else:
+        compatible = False
+
+    if not compatible:
+        raise ValueError(
+            f"Column '{series.name}' has dtype '{dtype}', which is not compatible "
+            f"with the table column's data type {data_type.value}."
+        )
+
+    if is_integer and data_type in _INTEGER_RANGES and series.notna().any():
+        minimum, maximum = _INTEGER_RANGES[data_type]
+        if int(series.min()) < minimum or int(series.max()) > maximum:
+            raise ValueError(
+                f"Column '{series.name}' contains values outside the range of "
+                f"{data_type.value}."
+            )
+
+
+def pandas_frame_to_record_batches(
+    frame: pd.DataFrame, columns: List[models.Column], chunk_size: int
+) -> Iterator["pa.RecordBatch"]:  # type: ignore[name-defined]
+    """Converts a validated pandas DataFrame to RecordBatches, one column at a time.
+
+    Args:
+        frame: The pandas DataFrame to convert. Its index is ignored.
+        columns: The columns of the target table.
+        chunk_size: The maximum number of rows in each RecordBatch.
+
+    Returns:
+        An iterator of RecordBatches that are converted lazily, one chunk at a time.
+    """
+    data_types = {column.name: column.data_type for column in columns}
+    names = [str(name) for name in frame.columns]
+    for start in range(0, len(frame), chunk_size):
+        chunk = frame.iloc[start : start + chunk_size]
+        arrays = [
+            _series_to_arrow(chunk[name], data_types[name]) for name in frame.columns
+        ]
+        yield pa.record_batch(arrays, names=names)
+
+
+def _series_to_arrow(
+    series: pd.Series, data_type: models.DataType
+) -> "pa.Array":  # type: ignore[name-defined]
+    if data_type == models.DataType.Timestamp:
+        values = _to_utc_naive(series)
+        # Truncate to milliseconds like the service does for JSON timestamps.
+        return pa.array(values, from_pandas=True).cast(pa.timestamp("ms"), safe=False)
+
+    # NaN is a valid value in NumPy float columns rather than a null. Other dtypes
+    # use pandas' null semantics, so None, NaN, NaT, and pd.NA become nulls.
+    from_pandas = not (
+        isinstance(series.dtype, np.dtype) and pdtypes.is_float_dtype(series.dtype)
+    )
+    if data_type == models.DataType.String and not isinstance(
+        series.dtype, pd.StringDtype
+    ):
+        series = _to_string_objects(series)
+    return pa.array(series, type=arrow_type(data_type), from_pandas=from_pandas)
+
+
+def pandas_frame_to_data_frames(
+    frame: pd.DataFrame, columns: List[models.Column], chunk_size: int
+) -> Iterator[models.DataFrame]:
+    """Converts a validated pandas DataFrame to the string encoding of
+    :class:`.DataFrame`, using vectorized conversions for each column.
+
+    Args:
+        frame: The pandas DataFrame to convert. Its index is ignored.
+        columns: The columns of the target table.
+        chunk_size: The maximum number of rows in each DataFrame.
+
+    Returns:
+        An iterator of DataFrames that are converted lazily, one chunk at a time.
+    """
+    data_types = {column.name: column.data_type for column in columns}
+    names = [str(name) for name in frame.columns]
+    for start in range(0, len(frame), chunk_size):
+        chunk = frame.iloc[start : start + chunk_size]
+        encoded = [
+            _series_to_strings(chunk[name], data_types[name]) for name in frame.columns
+        ]
+        rows = np.column_stack(encoded).tolist() if encoded else []
+        yield models.DataFrame(columns=names, data=rows)
+
+
+def _series_to_strings(series: pd.Series, data_type: models.DataType) -> np.ndarray:
+    if isinstance(series.dtype, np.dtype) and pdtypes.is_float_dtype(series.dtype):
+        mask = np.zeros(len(series), dtype=bool)
+    else:
+        mask = series.isna().to_numpy()
+
+    if data_type == models.DataType.Bool:
+        values = series.to_numpy(dtype=bool, na_value=False)
+        strings = np.where(values, "true", "false").astype(object)
+    elif data_type == models.DataType.Timestamp:
+        values = _to_utc_naive(series).to_numpy(dtype="datetime64[ms]")
+        strings = np.char.add(np.datetime_as_string(values, unit="ms"), "Z").astype(
+            object
+        )
+    elif data_type in (models.DataType.Float32, models.DataType.Float64):
+        numpy_type = np.float32 if data_type == models.DataType.Float32 else np.float64
+        values = series.to_numpy(dtype=numpy_type, na_value=np.nan)
+        # NumPy formats floats with the shortest representation that round-trips to
+        # the same binary value.
+        strings = values.astype(str).astype(object)
+        strings[np.isnan(values)] = "NaN"
+        strings[np.isposinf(values)] = "Infinity"
+        strings[np.isneginf(values)] = "-Infinity"
+    elif data_type in (models.DataType.Int32, models.DataType.Int64):
+        values = series.to_numpy(dtype=np.int64, na_value=0)
+        strings = values.astype(str).astype(object)
+    else:
+        strings = _to_string_objects(series).to_numpy(dtype=object)
+
+    strings[mask] = None
+    return strings
+
+
+def _to_utc_naive(series: pd.Series) -> pd.Series:
+    if getattr(series.dtype, "tz", None) is not None:
+        return series.dt.tz_convert("UTC").dt.tz_localize(None)
+    return series
+
+
+def _to_string_objects(series: pd.Series) -> pd.Series:
+    return series.map(
+        lambda value: value if isinstance(value, str) else str(value),
+        na_action="ignore",
+    )
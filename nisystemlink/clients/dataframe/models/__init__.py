@@ -1,5 +1,6 @@
 from ._append_table_data_request import AppendTableDataRequest
 from ._api_info import ApiInfo, Operation, OperationsV1
+from ._arrow_ingestion_statistics import ArrowIngestionStatistics
 from ._create_table_request import CreateTableRequest
 from ._column import Column
 from ._column_filter import FilterOperation, ColumnFilter
@@ -22,6 +23,7 @@ from ._query_decimated_data_request import (
 )
 from ._query_table_data_request import QueryTableDataRequest
 from ._query_tables_request import QueryTablesRequest
+from ._table_ingestion_statistics import TableIngestionStatistics
 from ._table_metadata import TableMetadata
 from ._table_rows import TableRows
 
@@ -0,0 +1,33 @@
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+
+
+class ArrowIngestionStatistics(JsonModel):
+    """Statistics about the Arrow IPC stream sent when appending ``pyarrow.RecordBatch``
+    data to a table.
+    """
+
+    batch_count: int = 0
+    """The number of record batches provided by the caller."""
+
+    message_count: int = 0
+    """The number of record batch messages written to the IPC stream after coalescing."""
+
+    row_count: int = 0
+    """The total number of rows sent."""
+
+    uncompressed_bytes: int = 0
+    """The in-memory size of the sent record batches before serialization and
+    compression."""
+
+    bytes_sent: int = 0
+    """The number of bytes of the IPC stream sent as the request body, including the
+    schema and end-of-stream messages."""
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """The ratio of :attr:`uncompressed_bytes` to :attr:`bytes_sent`, or None if
+        nothing was sent.
+        """
+        if self.bytes_sent == 0:
+            return None
+        return self.uncompressed_bytes / self.bytes_sent
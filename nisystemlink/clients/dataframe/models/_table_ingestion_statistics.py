@@ -0,0 +1,36 @@
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+
+
+class TableIngestionStatistics(JsonModel):
+    """Throughput counters for the appends scheduled for a single table."""
+
+    table_id: str
+    """The ID of the table."""
+
+    rows_queued: int = 0
+    """The number of rows waiting to be sent."""
+
+    rows_sent: int = 0
+    """The number of rows successfully appended to the table."""
+
+    requests_sent: int = 0
+    """The number of successful append requests. Several queued appends may be
+    combined into a single request."""
+
+    requests_failed: int = 0
+    """The number of append requests that failed."""
+
+    upload_seconds: float = 0.0
+    """The total time spent sending append requests for the table."""
+
+    finished: bool = False
+    """Whether the table has been marked as complete with ``end_of_data``."""
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """The number of rows sent per second spent uploading, or None if nothing has
+        been sent.
+        """
+        if self.upload_seconds == 0:
+            return None
+        return self.rows_sent / self.upload_seconds
@@ -0,0 +1,8 @@
+from ._decimation import decimate_data, decimate_data_lttb
+from ._ingestion_scheduler import TableIngestionScheduler
+from ._parallel_read import query_table_data_parallel
+from ._query_to_file import query_table_data_to_file
+from ._table_metadata import iterate_tables, TableMetadataCache
+from ._table_mirror import TableMirror
+
+# flake8: noqa
@@ -0,0 +1,66 @@
+import os
+from typing import List, Tuple
+
+try:
+    import pyarrow as pa  # type: ignore
+except Exception:
+    pa = None
+from nisystemlink.clients.dataframe._arrow_conversion import (
+    arrow_schema,
+    data_frame_to_record_batch,
+)
+from nisystemlink.clients.dataframe._data_frame_client import DataFrameClient
+from nisystemlink.clients.dataframe.models import Column, QueryTableDataRequest
+
+
+def write_query_pages(
+    client: DataFrameClient,
+    id: str,
+    request: QueryTableDataRequest,
+    columns: List[Column],
+    path: str | os.PathLike,
+) -> Tuple[int, List[str | None] | None]:
+    """Writes each page of a query to an uncompressed Arrow IPC file as it is fetched.
+
+    Args:
+        client: The ``DataFrameClient`` to use for the requests.
+        id: Unique ID of the table.
+        request: The query, which must select ``columns`` in the same order.
+        columns: The table columns returned by the query.
+        path: The file to write. An existing file is replaced.
+
+    Returns:
+        The number of rows written and the last row returned by the query, or None if
+        the query returned no rows.
+    """
+    rows = 0
+    last_row = None
+    with pa.OSFile(os.fspath(path), "wb") as sink, pa.ipc.new_file(
+        sink, arrow_schema(columns)
+    ) as writer:
+        while True:
+            response = client.query_table_data(id, request)
+            if response.frame.data:
+                writer.write_batch(data_frame_to_record_batch(response.frame, columns))
+                rows += len(response.frame.data)
+                last_row = response.frame.data[-1]
+            if response.continuation_token is None:
+                break
+            request = request.model_copy(
+                update={"continuation_token": response.continuation_token}
+            )
+    return rows, last_row
+
+
+def read_memory_mapped(
+    path: str | os.PathLike,
+) -> "pa.Table":  # type: ignore[name-defined]
+    """Reads an uncompressed Arrow IPC file without copying its data into memory.
+
+    Args:
+        path: The file to read.
+
+    Returns:
+        A table whose buffers reference the memory-mapped file.
+    """
+    return pa.ipc.open_file(pa.memory_map(os.fspath(path), "r")).read_all()
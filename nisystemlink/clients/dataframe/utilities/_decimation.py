@@ -0,0 +1,300 @@
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+from nisystemlink.clients.dataframe.models import DecimationMethod, DecimationOptions
+
+_DEFAULT_INTERVALS = 1000
+# Buckets up to this size are decimated by comparing every pair of rows in
+# neighboring buckets at once. Larger buckets are decimated one at a time, since
+# the per-bucket Python overhead is then small next to the work on each bucket.
+_LTTB_MAX_TABLE_WIDTH = 32
+# The number of elements in each chunk of the pairwise triangle areas
+_LTTB_CHUNK_SIZE = 1 << 20
+
+
+def decimate_data(
+    data: pd.DataFrame, options: DecimationOptions | None = None
+) -> pd.DataFrame:
+    """Decimates rows of data that were already downloaded, using the same methods and
+    parameters as :meth:`.DataFrameClient.query_decimated_data`.
+
+    Rows are ordered by ``x_column`` and, except for ``LOSSY``, the range of x values
+    is divided into ``intervals`` intervals of equal width:
+
+    * ``LOSSY`` returns ``intervals`` rows evenly distributed in x order.
+    * ``MAX_MIN`` returns, for each interval, the rows with the maximum and minimum
+      value of each of the ``y_columns``.
+    * ``ENTRY_EXIT`` returns the rows returned by ``MAX_MIN`` plus the first and last
+      row of each interval.
+
+    Every step is vectorized with NumPy, so data can be re-decimated interactively,
+    for example while zooming or panning a plot.
+
+    Args:
+        data: The rows to decimate. Must include ``x_column`` and ``y_columns``.
+        options: The decimation options. ``x_column`` is required. ``y_columns``
+            defaults to all other numeric and timestamp columns, ``intervals`` to 1000,
+            and ``method`` to ``LOSSY``.
+
+    Returns:
+        The selected rows of ``data`` ordered by ``x_column``, with their original
+        index. Rows whose x value is missing are excluded.
+
+    Raises:
+        ValueError: if ``x_column`` isn't specified, the x or y columns aren't numeric
+            or timestamp columns of ``data``, or ``intervals`` is less than 1.
+    """
+    options = options or DecimationOptions()
+    x_column = _validate_x_column(data, options.x_column)
+    intervals = _validate_intervals(options.intervals)
+    method = options.method or DecimationMethod.Lossy
+    y_columns = options.y_columns
+    if y_columns is None:
+        y_columns = [
+            column
+            for column in data.columns
+            if column != x_column and _is_numeric(data[column])
+        ]
+    for column in y_columns:
+        if column not in data.columns or not _is_numeric(data[column]):
+            raise ValueError(
+                f"y column '{column}' must be a numeric or timestamp column of data."
+            )
+
+    x = _to_float(data[x_column])
+    rows = _sorted_rows(x)
+    x = x[rows]
+    if len(rows) <= intervals:
+        return data.iloc[rows]
+
+    if method == DecimationMethod.Lossy:
+        selected = np.unique(np.linspace(0, len(rows) - 1, intervals).round())
+        return data.iloc[rows[selected.astype(np.intp)]]
+
+    starts, ends = _interval_bounds(x, intervals)
+    selected_rows: List[np.ndarray] = []
+    if method == DecimationMethod.EntryExit:
+        selected_rows += [starts, ends - 1]
+    for column in y_columns:
+        y = _to_float(data[column])[rows]
+        selected_rows.append(_extreme_positions(y, starts, ends, np.fmax))
+        selected_rows.append(_extreme_positions(y, starts, ends, np.fmin))
+
+    selected = (
+        np.unique(np.concatenate(selected_rows))
+        if selected_rows
+        else np.empty(0, dtype=np.intp)
+    )
+    return data.iloc[rows[selected]]
+
+
+def decimate_data_lttb(
+    data: pd.DataFrame, x_column: str, y_column: str, intervals: int = 1000
+) -> pd.DataFrame:
+    """Decimates rows of data with the Largest-Triangle-Three-Buckets algorithm.
+
+    LTTB keeps the visual shape of a single series better than ``LOSSY`` while
+    returning exactly ``intervals`` rows. The first and last rows are always kept,
+    and the remaining rows are divided into ``intervals - 2`` buckets of equal size.
+    From each bucket, the row forming the largest triangle with the row selected
+    from the previous bucket and the average of the next bucket is selected.
+
+    Since each bucket's row depends on the row selected before it, the buckets take
+    one Python step each. When buckets hold at most 32 rows, the triangle areas for
+    every pair of rows in neighboring buckets are computed up front with NumPy, so
+    each step is just a lookup. Larger buckets have their areas computed one bucket
+    at a time, which costs one small NumPy call per bucket.
+
+    Args:
+        data: The rows to decimate.
+        x_column: The name of the numeric or timestamp column to use as the x-axis.
+        y_column: The name of the numeric or timestamp column to preserve the shape of.
+        intervals: The number of rows to return.
+
+    Returns:
+        The selected rows of ``data`` ordered by ``x_column``, with their original
+        index. Rows whose x or y value is missing are excluded.
+
+    Raises:
+        ValueError: if the x or y column isn't a numeric or timestamp column of
+            ``data``, or ``intervals`` is less than 3.
+    """
+    x_column = _validate_x_column(data, x_column)
+    if y_column not in data.columns or not _is_numeric(data[y_column]):
+        raise ValueError(
+            f"y column '{y_column}' must be a numeric or timestamp column of data."
+        )
+    if intervals < 3:
+        raise ValueError("intervals must be at least 3.")
+
+    x = _to_float(data[x_column])
+    y = _to_float(data[y_column])
+    rows = _sorted_rows(np.where(np.isnan(y), np.nan, x))
+    if len(rows) <= intervals:
+        return data.iloc[rows]
+    x = x[rows]
+    y = y[rows]
+
+    # Split the rows between the first and last into buckets, and find the average
+    # point of the bucket following each one. The last row follows the last bucket.
+    edges = np.linspace(1, len(rows) - 1, intervals - 1).astype(np.intp)
+    counts = np.diff(edges)
+    average_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    average_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    next_x = np.append(average_x[1:], x[-1])
+    next_y = np.append(average_y[1:], y[-1])
+
+    if np.max(counts) <= _LTTB_MAX_TABLE_WIDTH:
+        selected = _lttb_select_by_table(x, y, edges, next_x, next_y)
+    else:
+        selected = _lttb_select_by_bucket(x, y, edges, next_x, next_y)
+    return data.iloc[rows[selected]]
+
+
+def _lttb_select_by_bucket(
+    x: np.ndarray,
+    y: np.ndarray,
+    edges: np.ndarray,
+    next_x: np.ndarray,
+    next_y: np.ndarray,
+) -> np.ndarray:
+    """Selects the LTTB rows one bucket at a time."""
+    selected = np.empty(len(edges) + 1, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = len(x) - 1
+    previous = 0
+    for bucket in range(len(edges) - 1):
+        start, end = edges[bucket], edges[bucket + 1]
+        areas = np.abs(
+            (x[previous] - next_x[bucket]) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y[bucket] - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def _lttb_select_by_table(
+    x: np.ndarray,
+    y: np.ndarray,
+    edges: np.ndarray,
+    next_x: np.ndarray,
+    next_y: np.ndarray,
+) -> np.ndarray:
+    """Selects the LTTB rows by finding, for every row of every bucket, the row of
+    the next bucket that would be selected after it, and then following those links
+    from the first row.
+
+    This gives the same rows as :func:`_lttb_select_by_bucket`, but only the link
+    following is left in Python.
+    """
+    buckets = len(edges) - 1
+    width = int(np.max(np.diff(edges)))
+    # The rows of each bucket, padded by repeating the last row. A repeated row
+    # never wins, since argmax picks the first of equal areas.
+    rows = np.minimum(edges[:-1, None] + np.arange(width), edges[1:, None] - 1)
+
+    # The rows that can precede each bucket: the first row, then the rows of the
+    # bucket before
+    previous = np.concatenate([np.zeros((1, width), dtype=np.intp), rows[:-1]])
+    best = np.empty((buckets, width), dtype=np.intp)
+    chunk = max(1, _LTTB_CHUNK_SIZE // (width * width))
+    for start in range(0, buckets, chunk):
+        end = min(start + chunk, buckets)
+        xp = x[previous[start:end]][:, :, None]
+        yp = y[previous[start:end]][:, :, None]
+        xc = x[rows[start:end]][:, None, :]
+        yc = y[rows[start:end]][:, None, :]
+        nx = next_x[start:end, None, None]
+        ny = next_y[start:end, None, None]
+        areas = np.abs((xp - nx) * (yc - yp) - (xp - xc) * (ny - yp))
+        best[start:end] = np.argmax(areas, axis=2)
+
+    links = best.tolist()
+    choices = np.empty(buckets, dtype=np.intp)
+    choice = 0
+    for bucket in range(buckets):
+        choice = links[bucket][choice]
+        choices[bucket] = choice
+
+    selected = np.empty(buckets + 2, dtype=np.intp)
+    selected[0] = 0
+    selected[1:-1] = rows[np.arange(buckets), choices]
+    selected[-1] = len(x) - 1
+    return selected
+
+
+def _validate_x_column(data: pd.DataFrame, x_column: str | None) -> str:
+    if x_column is None:
+        raise ValueError("x_column must be specified to decimate local data.")
+    if x_column not in data.columns or not _is_numeric(data[x_column]):
+        raise ValueError(
+            f"x column '{x_column}' must be a numeric or timestamp column of data."
+        )
+    return x_column
+
+
+def _validate_intervals(intervals: int | None) -> int:
+    if intervals is None:
+        return _DEFAULT_INTERVALS
+    if intervals < 1:
+        raise ValueError("intervals must be at least 1.")
+    return intervals
+
+
+def _is_numeric(series: pd.Series) -> bool:
+    return (
+        pd.api.types.is_numeric_dtype(series.dtype)
+        and not pd.api.types.is_bool_dtype(series.dtype)
+    ) or pd.api.types.is_datetime64_any_dtype(series.dtype)
+
+
+def _to_float(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = series.to_numpy(dtype="datetime64[ns]")
+        result = values.view(np.int64).astype(np.float64)
+        result[np.isnat(values)] = np.nan
+        return result
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _sorted_rows(x: np.ndarray) -> np.ndarray:
+    """Gets the positions of the rows with an x value, in ascending x order."""
+    missing = np.isnan(x)
+    if missing.any():
+        rows = np.flatnonzero(~missing)
+        values = x[rows]
+    else:
+        rows = np.arange(len(x))
+        values = x
+    if np.any(values[1:] < values[:-1]):
+        rows = rows[np.argsort(values, kind="stable")]
+    return rows
+
+
+def _interval_bounds(x: np.ndarray, intervals: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Gets the start and end positions of the non-empty intervals of sorted x values."""
+    span = x[-1] - x[0]
+    if span > 0:
+        bins = np.minimum(
+            ((x - x[0]) / span * intervals).astype(np.intp), intervals - 1
+        )
+    else:
+        bins = np.zeros(len(x), dtype=np.intp)
+    starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+    ends = np.r_[starts[1:], len(x)]
+    return starts, ends
+
+
+def _extreme_positions(
+    y: np.ndarray, starts: np.ndarray, ends: np.ndarray, reduce: np.ufunc
+) -> np.ndarray:
+    """Gets the position of the first extreme value of each interval, ignoring NaN."""
+    extremes = reduce.reduceat(y, starts)
+    hits = np.flatnonzero(y == np.repeat(extremes, ends - starts))
+    first = np.searchsorted(hits, starts)
+    found = first < len(hits)
+    positions = hits[first[found]]
+    # Intervals with only NaN values have no extreme, so the next hit is outside them.
+    return positions[positions < ends[found]]
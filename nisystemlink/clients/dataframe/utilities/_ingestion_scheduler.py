@@ -0,0 +1,356 @@
+import threading
+import time
+from collections import deque
+from types import TracebackType
+from typing import Any, Deque, Dict, List, Tuple, Type, Union
+
+try:
+    import pyarrow as pa  # type: ignore
+except Exception:
+    pa = None
+import pandas as pd
+from nisystemlink.clients import core
+from nisystemlink.clients.dataframe._data_frame_client import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    DataFrame,
+    TableIngestionStatistics,
+)
+
+
+class _TableQueue:
+    """The appends waiting to be sent to a single table."""
+
+    def __init__(self, table_id: str) -> None:
+        self.items: Deque[Any] = deque()
+        self.finish_requested = False
+        self.busy = False
+        self.scheduled = False
+        self.error: Exception | None = None
+        self.statistics = TableIngestionStatistics(table_id=table_id)
+        # Fetched on the first pandas append, so later ones skip the metadata request
+        self.columns: List[Column] | None = None
+
+    @property
+    def has_work(self) -> bool:
+        return bool(self.items) or (
+            self.finish_requested and not self.statistics.finished
+        )
+
+
+class TableIngestionScheduler:
+    """Appends data to many tables concurrently.
+
+    Appends are queued per table and sent by a bounded pool of worker threads, each
+    with its own :class:`.DataFrameClient` and HTTP session. At most one request is
+    in flight for each table, so rows are appended in the order they were queued.
+    Consecutive queued appends of the same kind are combined into a single request of
+    up to ``max_batch_rows`` rows. Tables with queued data take turns, so a table
+    receiving a steady stream of data cannot starve the others.
+
+    If a request fails, the rows queued for that table are discarded, and the error
+    is raised by the next call to :meth:`append`, :meth:`finish`, or :meth:`flush`.
+    Other tables are unaffected.
+    """
+
+    def __init__(
+        self,
+        configuration: core.HttpConfiguration | None = None,
+        *,
+        max_workers: int = 8,
+        max_batch_rows: int = 10_000,
+        max_queued_rows: int | None = None,
+    ) -> None:
+        """Initialize a scheduler and start its worker threads.
+
+        Args:
+            configuration: Defines the web server to connect to and information about
+                how to connect. If not provided, the
+                :class:`HttpConfigurationManager <nisystemlink.clients.core.HttpConfigurationManager>`
+                is used to obtain the configuration.
+            max_workers: The maximum number of concurrent append requests.
+            max_batch_rows: The maximum number of queued rows to combine into a single
+                request. A single queued append larger than this is sent as-is.
+            max_queued_rows: The maximum number of rows waiting to be sent across all
+                tables, or None for no limit. :meth:`append` blocks while the limit is
+                reached.
+
+        Raises:
+            ValueError: if ``max_workers``, ``max_batch_rows``, or ``max_queued_rows``
+                is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        if max_batch_rows < 1:
+            raise ValueError("max_batch_rows must be at least 1.")
+        if max_queued_rows is not None and max_queued_rows < 1:
+            raise ValueError("max_queued_rows must be at least 1.")
+
+        if configuration is None:
+            configuration = core.HttpConfigurationManager.get_configuration()
+        self._configuration = configuration
+        self._max_batch_rows = max_batch_rows
+        self._max_queued_rows = max_queued_rows
+        self._local = threading.local()
+        self._condition = threading.Condition()
+        self._tables: Dict[str, _TableQueue] = {}
+        self._ready: Deque[_TableQueue] = deque()
+        self._queued_rows = 0
+        self._closed = False
+        self._workers = [
+            threading.Thread(
+                target=self._run,
+                name=f"TableIngestionScheduler-{i}",
+                daemon=True,
+            )
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self) -> "TableIngestionScheduler":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def append(
+        self,
+        table_id: str,
+        data: Union[
+            DataFrame, pd.DataFrame, "pa.RecordBatch"  # type: ignore[name-defined]
+        ],
+    ) -> None:
+        """Queue rows to append to a table.
+
+        Args:
+            table_id: Unique ID of the table.
+            data: The rows to append, as a ``DataFrame`` model, a ``pandas.DataFrame``,
+                or a ``pyarrow.RecordBatch``.
+
+        Raises:
+            ValueError: if ``data`` isn't a supported type or the table was already
+                finished.
+            RuntimeError: if the scheduler is closed.
+            ApiException: if a previous append to the table failed.
+        """
+        rows = self._row_count(data)
+        with self._condition:
+            table = self._get_table(table_id)
+            if table.finish_requested:
+                raise ValueError(f"Table '{table_id}' has already been finished.")
+            while (
+                self._max_queued_rows is not None
+                and 0 < self._queued_rows
+                and self._queued_rows + rows > self._max_queued_rows
+            ):
+                self._condition.wait()
+            self._raise_error(table)
+            table.items.append(data)
+            table.statistics.rows_queued += rows
+            self._queued_rows += rows
+            self._schedule(table)
+
+    def finish(self, table_id: str) -> None:
+        """Mark a table as complete once all rows queued for it have been appended.
+
+        The ``end_of_data`` flag is sent with the last queued rows, or on its own if
+        no rows are queued.
+
+        Args:
+            table_id: Unique ID of the table.
+
+        Raises:
+            RuntimeError: if the scheduler is closed.
+            ApiException: if a previous append to the table failed.
+        """
+        with self._condition:
+            table = self._get_table(table_id)
+            table.finish_requested = True
+            self._schedule(table)
+
+    def flush(self) -> None:
+        """Wait until all queued rows have been sent.
+
+        Raises:
+            ApiException: if an append failed since the error was last raised.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: all(
+                    not (table.busy or table.has_work)
+                    for table in self._tables.values()
+                )
+            )
+            for table in self._tables.values():
+                self._raise_error(table)
+
+    def close(self) -> None:
+        """Wait until all queued rows have been sent, then stop the worker threads.
+
+        Raises:
+            ApiException: if an append failed since the error was last raised.
+        """
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            for worker in self._workers:
+                worker.join()
+
+    def get_statistics(self, table_id: str) -> TableIngestionStatistics:
+        """Get the throughput counters for a table.
+
+        Args:
+            table_id: Unique ID of the table.
+
+        Returns:
+            A snapshot of the table's counters.
+
+        Raises:
+            KeyError: if nothing has been queued for the table.
+        """
+        with self._condition:
+            return self._tables[table_id].statistics.model_copy()
+
+    def get_all_statistics(self) -> Dict[str, TableIngestionStatistics]:
+        """Get the throughput counters for every table.
+
+        Returns:
+            A snapshot of the counters of each table, by table ID.
+        """
+        with self._condition:
+            return {
+                table_id: table.statistics.model_copy()
+                for table_id, table in self._tables.items()
+            }
+
+    def _get_table(self, table_id: str) -> _TableQueue:
+        if self._closed:
+            raise RuntimeError("The scheduler is closed.")
+        table = self._tables.get(table_id)
+        if table is None:
+            table = self._tables[table_id] = _TableQueue(table_id)
+        self._raise_error(table)
+        return table
+
+    def _raise_error(self, table: _TableQueue) -> None:
+        error, table.error = table.error, None
+        if error is not None:
+            raise error
+
+    def _schedule(self, table: _TableQueue) -> None:
+        if table.has_work and not table.busy and not table.scheduled:
+            table.scheduled = True
+            self._ready.append(table)
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._ready or self._closed)
+                if not self._ready:
+                    return
+                table = self._ready.popleft()
+                table.scheduled = False
+                table.busy = True
+                batch, rows = self._take_batch(table)
+                end_of_data = table.finish_requested and not table.items
+
+            start = time.perf_counter()
+            try:
+                self._send(table, batch, end_of_data)
+                error = None
+            except Exception as ex:
+                error = ex
+            elapsed = time.perf_counter() - start
+
+            with self._condition:
+                statistics = table.statistics
+                statistics.upload_seconds += elapsed
+                statistics.rows_queued -= rows
+                self._queued_rows -= rows
+                if error is None:
+                    statistics.rows_sent += rows
+                    statistics.requests_sent += 1
+                    statistics.finished = statistics.finished or end_of_data
+                else:
+                    statistics.requests_failed += 1
+                    discarded = statistics.rows_queued
+                    statistics.rows_queued = 0
+                    self._queued_rows -= discarded
+                    table.items.clear()
+                    table.finish_requested = False
+                    table.error = error
+                table.busy = False
+                self._schedule(table)
+                self._condition.notify_all()
+
+    def _take_batch(self, table: _TableQueue) -> Tuple[List[Any], int]:
+        batch: List[Any] = []
+        rows = 0
+        while table.items:
+            item = table.items[0]
+            item_rows = self._row_count(item)
+            if batch and (
+                rows + item_rows > self._max_batch_rows
+                or not self._can_combine(batch[0], item)
+            ):
+                break
+            batch.append(table.items.popleft())
+            rows += item_rows
+        return batch, rows
+
+    def _send(self, table: _TableQueue, batch: List[Any], end_of_data: bool) -> None:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = DataFrameClient(self._configuration)
+
+        table_id = table.statistics.table_id
+        data: Any
+        if not batch:
+            data = None
+        elif isinstance(batch[0], DataFrame):
+            data = DataFrame(
+                columns=batch[0].columns,
+                data=[row for frame in batch for row in frame.data],
+            )
+        elif isinstance(batch[0], pd.DataFrame):
+            data = pd.concat(batch, ignore_index=True) if len(batch) > 1 else batch[0]
+            if table.columns is None:
+                table.columns = client.get_table_metadata(table_id).columns
+        else:
+            data = batch
+        client.append_table_data(
+            table_id, data, end_of_data=end_of_data or None, columns=table.columns
+        )
+
+    @staticmethod
+    def _can_combine(first: Any, item: Any) -> bool:
+        if type(first) is not type(item):
+            return False
+        if isinstance(first, DataFrame):
+            return first.columns == item.columns
+        if isinstance(first, pd.DataFrame):
+            return list(first.columns) == list(item.columns)
+        return first.schema == item.schema
+
+    @staticmethod
+    def _row_count(data: Any) -> int:
+        if isinstance(data, DataFrame):
+            return len(data.data)
+        if isinstance(data, pd.DataFrame):
+            return len(data)
+        if pa is not None and isinstance(data, pa.RecordBatch):
+            return data.num_rows
+        raise ValueError(
+            "Unsupported type for data. Expected DataFrame, pandas.DataFrame, or "
+            "RecordBatch."
+        )
@@ -0,0 +1,189 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, List, Tuple
+
+import numpy as np
+import pandas as pd
+from nisystemlink.clients.dataframe._data_frame_client import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    ColumnFilter,
+    ColumnOrderBy,
+    ColumnType,
+    DataFrame,
+    DataType,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+
+from ._prefetch import DONE, put_until_stopped
+
+_INDEX_DATA_TYPES = (DataType.Int32, DataType.Int64, DataType.Timestamp)
+
+
+def query_table_data_parallel(
+    client: DataFrameClient,
+    id: str,
+    query: QueryTableDataRequest | None = None,
+    *,
+    partitions: int = 4,
+    max_workers: int = 4,
+    prefetch_pages: int = 2,
+) -> Generator[DataFrame, None, None]:
+    """Reads all rows matching a query by splitting the table's index column into
+    disjoint ranges that are read concurrently.
+
+    The minimum and maximum index values matching the query are found first, then
+    the range between them is split into ``partitions`` ranges of equal width. Each
+    range is paged through with continuation tokens on a worker thread, and pages are
+    yielded in ascending index order. Closing the generator stops the workers after
+    their in-flight requests complete.
+
+    Args:
+        client: The ``DataFrameClient`` to use for the requests.
+        id: Unique ID of a data table with an INT32, INT64, or TIMESTAMP index column.
+        query: The columns, filters, and page size (``take``) to use. Must not specify
+            ``order_by`` or ``continuation_token``; rows are always returned in
+            ascending index order.
+        partitions: The number of index ranges to split the table into.
+        max_workers: The maximum number of ranges to read concurrently.
+        prefetch_pages: The maximum number of pages each worker reads ahead of the
+            caller.
+
+    Returns:
+        A generator of data frames, one per page of results, in ascending index
+        order.
+
+    Raises:
+        ValueError: if the table doesn't have an INT32, INT64, or TIMESTAMP index
+            column, ``query`` specifies ``order_by`` or ``continuation_token``, or
+            ``partitions``, ``max_workers``, or ``prefetch_pages`` is less than 1.
+        ApiException: if unable to communicate with the DataFrame Service.
+    """
+    query = query or QueryTableDataRequest()
+    if query.order_by:
+        raise ValueError("query must not specify order_by.")
+    if query.continuation_token is not None:
+        raise ValueError("query must not specify a continuation_token.")
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1.")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    if prefetch_pages < 1:
+        raise ValueError("prefetch_pages must be at least 1.")
+
+    metadata = client.get_table_metadata(id)
+    index = next(
+        (c for c in metadata.columns if c.column_type == ColumnType.Index), None
+    )
+    if index is None or index.data_type not in _INDEX_DATA_TYPES:
+        raise ValueError(
+            "The table must have an INT32, INT64, or TIMESTAMP index column."
+        )
+
+    bounds = _find_bounds(client, id, query, index.name)
+    if bounds is None:
+        return
+    ranges = _split_range(*bounds, index.data_type, partitions)
+
+    queues: List[queue.Queue] = [queue.Queue(maxsize=prefetch_pages) for _ in ranges]
+    stop = threading.Event()
+
+    def read_range(position: int, lower: str, upper: str, is_last: bool) -> None:
+        pages = queues[position]
+        try:
+            filters = list(query.filters or []) + [
+                ColumnFilter(
+                    column=index.name,
+                    operation=FilterOperation.GreaterThanEquals,
+                    value=lower,
+                ),
+                ColumnFilter(
+                    column=index.name,
+                    operation=(
+                        FilterOperation.LessThanEquals
+                        if is_last
+                        else FilterOperation.LessThan
+                    ),
+                    value=upper,
+                ),
+            ]
+            request = query.model_copy(
+                update={
+                    "filters": filters,
+                    "order_by": [ColumnOrderBy(column=index.name)],
+                }
+            )
+            while not stop.is_set():
+                response = client.query_table_data(id, request)
+                put_until_stopped(pages, response.frame, stop)
+                if response.continuation_token is None:
+                    break
+                request = request.model_copy(
+                    update={"continuation_token": response.continuation_token}
+                )
+            put_until_stopped(pages, DONE, stop)
+        except Exception as ex:
+            put_until_stopped(pages, ex, stop)
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(ranges)),
+        thread_name_prefix="query_table_data_parallel",
+    )
+    try:
+        for position, (lower, upper) in enumerate(ranges):
+            executor.submit(
+                read_range, position, lower, upper, position == len(ranges) - 1
+            )
+        for pages in queues:
+            while True:
+                page = pages.get()
+                if page is DONE:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _find_bounds(
+    client: DataFrameClient, id: str, query: QueryTableDataRequest, index: str
+) -> Tuple[str, str] | None:
+    values: List[str] = []
+    for descending in (False, True):
+        request = QueryTableDataRequest(
+            columns=[index],
+            filters=query.filters,
+            order_by=[ColumnOrderBy(column=index, descending=descending)],
+            take=1,
+        )
+        rows = client.query_table_data(id, request).frame.data
+        if not rows or rows[0][0] is None:
+            return None
+        values.append(rows[0][0])
+    return values[0], values[1]
+
+
+def _split_range(
+    lower: str, upper: str, data_type: DataType, partitions: int
+) -> List[Tuple[str, str]]:
+    if data_type == DataType.Timestamp:
+        low = pd.Timestamp(lower).value // 1_000_000
+        high = pd.Timestamp(upper).value // 1_000_000
+    else:
+        low, high = int(lower), int(upper)
+
+    # Split the inclusive range [low, high] so that no partition is empty.
+    span = high - low + 1
+    partitions = min(partitions, span)
+    edges = [low + span * i // partitions for i in range(partitions)] + [high]
+    if data_type == DataType.Timestamp:
+        strings = [
+            s + "Z"
+            for s in np.datetime_as_string(np.array(edges, dtype="datetime64[ms]"))
+        ]
+    else:
+        strings = [str(edge) for edge in edges]
+    return list(zip(strings[:-1], strings[1:]))
@@ -0,0 +1,65 @@
+import queue
+import threading
+from typing import Callable, Generator, Iterable, TypeVar
+
+_T = TypeVar("_T")
+
+DONE = object()
+"""Put in a queue by a producer after its last item."""
+
+_PUT_TIMEOUT_SECONDS = 0.1
+
+
+def put_until_stopped(items: queue.Queue, item: object, stop: threading.Event) -> None:
+    """Put an item in a bounded queue, giving up if ``stop`` is set while waiting for
+    space.
+    """
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=_PUT_TIMEOUT_SECONDS)
+            return
+        except queue.Full:
+            continue
+
+
+def prefetch(
+    produce: Callable[[], Iterable[_T]], max_items: int, name: str
+) -> Generator[_T, None, None]:
+    """Iterate over items produced on a background thread.
+
+    Args:
+        produce: A function returning the items to produce. It is called on the
+            background thread.
+        max_items: The maximum number of items produced ahead of the caller.
+        name: The name of the background thread.
+
+    Returns:
+        A generator of the produced items. An exception raised while producing items
+        is raised by the generator. Closing the generator stops the producer after
+        the item it is producing.
+    """
+    items: queue.Queue = queue.Queue(maxsize=max_items)
+    stop = threading.Event()
+
+    def run() -> None:
+        try:
+            for item in produce():
+                put_until_stopped(items, item, stop)
+                if stop.is_set():
+                    return
+            put_until_stopped(items, DONE, stop)
+        except Exception as ex:
+            put_until_stopped(items, ex, stop)
+
+    thread = threading.Thread(target=run, name=name, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
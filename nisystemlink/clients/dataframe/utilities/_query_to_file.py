@@ -0,0 +1,62 @@
+import os
+
+try:
+    import pyarrow as pa  # type: ignore
+except Exception:
+    pa = None
+from nisystemlink.clients.dataframe._data_frame_client import DataFrameClient
+from nisystemlink.clients.dataframe.models import QueryTableDataRequest
+
+from ._arrow_files import read_memory_mapped, write_query_pages
+
+
+def query_table_data_to_file(
+    client: DataFrameClient,
+    id: str,
+    path: str | os.PathLike,
+    query: QueryTableDataRequest | None = None,
+) -> "pa.Table":  # type: ignore[name-defined]
+    """Reads all rows matching a query into a memory-mapped Arrow IPC file.
+
+    Each page of results is written to the file as soon as it is fetched, so only one
+    page is held in memory at a time. The returned table is backed by the
+    memory-mapped file rather than memory, so results larger than the available RAM
+    can be sliced and processed without copying them. The operating system pages in
+    only the parts of the file that are accessed.
+
+    Args:
+        client: The ``DataFrameClient`` to use for the requests.
+        id: Unique ID of a data table.
+        path: The file to write. An existing file is replaced. The file must not be
+            modified or deleted while the returned table is in use.
+        query: The columns, filters, sorting, and page size (``take``) to use, or None
+            to read all columns of all rows.
+
+    Returns:
+        A table with a chunk for each page of results. Values are converted to the
+        Arrow types matching the table's column data types, with timestamps in UTC.
+
+    Raises:
+        RuntimeError: if ``pyarrow`` is not installed.
+        ValueError: if ``query`` includes columns that are not in the table.
+        ApiException: if unable to communicate with the DataFrame Service.
+    """
+    if pa is None:
+        raise RuntimeError(
+            "pyarrow is not installed. Install to query table data into a file."
+        )
+    query = query or QueryTableDataRequest()
+
+    table_columns = client.get_table_metadata(id).columns
+    if query.columns is None:
+        columns = table_columns
+    else:
+        columns_by_name = {column.name: column for column in table_columns}
+        unknown = [name for name in query.columns if name not in columns_by_name]
+        if unknown:
+            raise ValueError(f"query includes columns not in the table: {unknown}.")
+        columns = [columns_by_name[name] for name in query.columns]
+    request = query.model_copy(update={"columns": [column.name for column in columns]})
+
+    write_query_pages(client, id, request, columns, path)
+    return read_memory_mapped(path)
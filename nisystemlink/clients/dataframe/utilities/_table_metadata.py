@@ -0,0 +1,181 @@
+import threading
+from typing import Callable, Dict, Generator, Iterable, List
+
+from nisystemlink.clients.dataframe._data_frame_client import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    PagedTables,
+    QueryTablesRequest,
+    TableMetadata,
+)
+
+from ._prefetch import prefetch
+
+# IDs are sent in the query string; keep the URL well under common 8 KB limits
+_MAX_IDS_PER_REQUEST = 100
+
+
+def _pages(
+    fetch: Callable[[str | None], PagedTables], continuation_token: str | None = None
+) -> Generator[PagedTables, None, None]:
+    while True:
+        page = fetch(continuation_token)
+        yield page
+        continuation_token = page.continuation_token
+        if continuation_token is None:
+            return
+
+
+class TableMetadataCache:
+    """Caches table metadata by table ID.
+
+    The cache is filled by :meth:`get`, :meth:`get_many`, and :func:`iterate_tables`,
+    so looking up the schema of a table that was already listed or queried doesn't
+    send a request. A cached entry is replaced only by metadata with the same or a
+    later ``metadata_modified_at``. Use :meth:`invalidate` after changing a table's
+    metadata to have the next lookup fetch it again.
+
+    The cache can be shared between threads.
+    """
+
+    def __init__(self, client: DataFrameClient) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            client: The ``DataFrameClient`` to use to fetch metadata that isn't
+                cached.
+        """
+        self._client = client
+        self._lock = threading.Lock()
+        self._tables: Dict[str, TableMetadata] = {}
+
+    def __contains__(self, id: str) -> bool:
+        with self._lock:
+            return id in self._tables
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tables)
+
+    def get(self, id: str) -> TableMetadata:
+        """Get the metadata of a table, fetching it if it isn't cached.
+
+        Args:
+            id: Unique ID of the table.
+
+        Returns:
+            The metadata for the table.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        with self._lock:
+            table = self._tables.get(id)
+        if table is None:
+            table = self._client.get_table_metadata(id)
+            self.update([table])
+        return table
+
+    def get_many(self, ids: Iterable[str]) -> Dict[str, TableMetadata]:
+        """Get the metadata of several tables, fetching the ones that aren't cached
+        with as few requests as possible.
+
+        Args:
+            ids: Unique IDs of the tables.
+
+        Returns:
+            The metadata for each table, by ID. Tables that don't exist are omitted.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service
+                or provided an invalid argument.
+        """
+        ids = list(dict.fromkeys(ids))
+        with self._lock:
+            missing = [id for id in ids if id not in self._tables]
+        for start in range(0, len(missing), _MAX_IDS_PER_REQUEST):
+            chunk = missing[start : start + _MAX_IDS_PER_REQUEST]
+            for page in _pages(
+                lambda token: self._client.list_tables(
+                    take=len(chunk), id=chunk, continuation_token=token
+                )
+            ):
+                self.update(page.tables)
+        with self._lock:
+            return {id: self._tables[id] for id in ids if id in self._tables}
+
+    def update(self, tables: Iterable[TableMetadata]) -> None:
+        """Add tables to the cache, replacing entries with older metadata.
+
+        Args:
+            tables: The metadata of the tables to add.
+        """
+        with self._lock:
+            for table in tables:
+                cached = self._tables.get(table.id)
+                if (
+                    cached is None
+                    or cached.metadata_modified_at <= table.metadata_modified_at
+                ):
+                    self._tables[table.id] = table
+
+    def invalidate(self, id: str | None = None) -> None:
+        """Remove a table, or every table, from the cache.
+
+        Args:
+            id: Unique ID of the table to remove, or None to clear the cache.
+        """
+        with self._lock:
+            if id is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(id, None)
+
+
+def iterate_tables(
+    client: DataFrameClient,
+    query: QueryTablesRequest | None = None,
+    *,
+    prefetch_pages: int = 1,
+    cache: TableMetadataCache | None = None,
+) -> Generator[TableMetadata, None, None]:
+    """Iterate over every table returned by a query, following continuation tokens.
+
+    The next pages are fetched on a background thread while the caller processes the
+    current page.
+
+    Args:
+        client: The ``DataFrameClient`` to use for the requests.
+        query: The query to run, or None to list every table. Its
+            ``continuation_token`` is used for the first page.
+        prefetch_pages: The maximum number of pages fetched ahead of the caller.
+        cache: A cache to add the metadata of each returned table to.
+
+    Returns:
+        A generator of the metadata of each table, in the order returned by the
+        service. Closing the generator stops fetching pages.
+
+    Raises:
+        ValueError: if ``prefetch_pages`` is less than 1.
+        ApiException: if unable to communicate with the DataFrame Service
+            or provided an invalid argument.
+    """
+    if prefetch_pages < 1:
+        raise ValueError("prefetch_pages must be at least 1.")
+
+    def fetch(continuation_token: str | None) -> PagedTables:
+        if query is None:
+            return client.list_tables(continuation_token=continuation_token)
+        return client.query_tables(
+            query.model_copy(update={"continuation_token": continuation_token})
+        )
+
+    def produce() -> Iterable[List[TableMetadata]]:
+        first_token = query.continuation_token if query is not None else None
+        for page in _pages(fetch, first_token):
+            if cache is not None:
+                cache.update(page.tables)
+            yield page.tables
+
+    for tables in prefetch(produce, prefetch_pages, "iterate_tables"):
+        yield from tables
@@ -0,0 +1,224 @@
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+try:
+    import pyarrow as pa  # type: ignore
+except Exception:
+    pa = None
+from nisystemlink.clients.core._uplink._json_model import JsonModel
+from nisystemlink.clients.dataframe._arrow_conversion import arrow_schema
+from nisystemlink.clients.dataframe._data_frame_client import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    Column,
+    ColumnFilter,
+    ColumnOrderBy,
+    ColumnType,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+
+from ._arrow_files import read_memory_mapped, write_query_pages
+
+_STATE_FILE = "mirror.json"
+
+
+class _MirrorState(JsonModel):
+    columns: List[Column]
+    metadata_revision: int
+    rows_modified_at: datetime
+    row_count: int = 0
+    watermark: str | None = None
+    segments: List[str] = []
+
+
+class TableMirror:
+    """A local copy of an append-only table that is kept up to date incrementally.
+
+    Rows are stored in uncompressed Arrow IPC files in a directory named after the
+    table ID, along with the highest index value mirrored so far (the watermark) and
+    the table's ``rows_modified_at`` and ``row_count``. :meth:`refresh` only fetches
+    rows with an index greater than the watermark, and skips the query entirely if
+    the table hasn't been modified. :meth:`read` memory-maps the files, so the
+    returned table references the mirrored data without copying it.
+
+    The table's rows must only ever be appended in increasing index order. If the
+    table's columns change or rows are removed, the mirror is rebuilt from scratch.
+    """
+
+    def __init__(
+        self,
+        client: DataFrameClient,
+        id: str,
+        directory: str | os.PathLike,
+        *,
+        page_size: int = 10_000,
+    ) -> None:
+        """Initialize a mirror of a table.
+
+        Args:
+            client: The ``DataFrameClient`` to use to fetch table data.
+            id: Unique ID of the table to mirror.
+            directory: The directory containing the mirrors of all tables. The
+                table's data is stored in a subdirectory named after its ID.
+            page_size: The number of rows to fetch per request.
+
+        Raises:
+            RuntimeError: if ``pyarrow`` is not installed.
+            ValueError: if ``page_size`` is less than 1.
+        """
+        if pa is None:
+            raise RuntimeError(
+                "pyarrow is not installed. Install to mirror tables locally."
+            )
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
+        self._client = client
+        self._id = id
+        self._directory = Path(directory) / id
+        self._page_size = page_size
+        self._state = self._load_state()
+
+    @property
+    def id(self) -> str:
+        """The ID of the mirrored table."""
+        return self._id
+
+    @property
+    def directory(self) -> Path:
+        """The directory containing the mirrored data."""
+        return self._directory
+
+    @property
+    def watermark(self) -> str | None:
+        """The highest index value mirrored so far, or None if the mirror is empty."""
+        return self._state.watermark if self._state else None
+
+    @property
+    def row_count(self) -> int:
+        """The number of rows in the mirror."""
+        return self._state.row_count if self._state else 0
+
+    @property
+    def rows_modified_at(self) -> datetime | None:
+        """The table's ``rows_modified_at`` as of the last refresh, or None if the
+        mirror has never been refreshed.
+        """
+        return self._state.rows_modified_at if self._state else None
+
+    def refresh(self) -> int:
+        """Fetch the rows appended to the table since the last refresh.
+
+        Returns:
+            The number of rows added to the mirror.
+
+        Raises:
+            ApiException: if unable to communicate with the DataFrame Service.
+            ValueError: if the table has no index column.
+        """
+        metadata = self._client.get_table_metadata(self._id)
+        state = self._state
+        if state is not None and (
+            state.metadata_revision != metadata.metadata_revision
+            or metadata.row_count < state.row_count
+        ):
+            self.clear()
+            state = None
+        if state is None:
+            state = _MirrorState(
+                columns=metadata.columns,
+                metadata_revision=metadata.metadata_revision,
+                rows_modified_at=metadata.rows_modified_at,
+            )
+        elif (
+            state.rows_modified_at == metadata.rows_modified_at
+            and state.row_count == metadata.row_count
+        ):
+            return 0
+
+        index = next(
+            (c for c in state.columns if c.column_type == ColumnType.Index), None
+        )
+        if index is None:
+            raise ValueError("The table must have an index column.")
+        request = QueryTableDataRequest(
+            columns=[column.name for column in state.columns],
+            filters=(
+                [
+                    ColumnFilter(
+                        column=index.name,
+                        operation=FilterOperation.GreaterThan,
+                        value=state.watermark,
+                    )
+                ]
+                if state.watermark is not None
+                else None
+            ),
+            order_by=[ColumnOrderBy(column=index.name)],
+            take=self._page_size,
+        )
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        segment = f"segment-{len(state.segments):06d}.arrow"
+        path = self._directory / segment
+        rows_added, last_row = write_query_pages(
+            self._client, self._id, request, state.columns, path
+        )
+
+        if rows_added:
+            state.segments.append(segment)
+        else:
+            path.unlink()
+        state.row_count += rows_added
+        if last_row is not None:
+            state.watermark = last_row[state.columns.index(index)]
+        state.rows_modified_at = metadata.rows_modified_at
+        self._save_state(state)
+        return rows_added
+
+    def read(
+        self, columns: List[str] | None = None
+    ) -> "pa.Table":  # type: ignore[name-defined]
+        """Read the mirrored rows without copying them into memory.
+
+        Args:
+            columns: The names of the columns to include, or None to include all
+                columns.
+
+        Returns:
+            A table backed by memory-mapped Arrow IPC files, with one chunk per page of
+            rows fetched from the service. Timestamps are in UTC. The table has no
+            columns if the mirror has never been refreshed.
+        """
+        if self._state is None:
+            return pa.table({})
+        tables = [
+            read_memory_mapped(self._directory / segment)
+            for segment in self._state.segments
+        ]
+        table = (
+            pa.concat_tables(tables)
+            if tables
+            else arrow_schema(self._state.columns).empty_table()
+        )
+        return table.select(columns) if columns is not None else table
+
+    def clear(self) -> None:
+        """Delete the mirrored data so that the next refresh fetches the whole table."""
+        shutil.rmtree(self._directory, ignore_errors=True)
+        self._state = None
+
+    def _load_state(self) -> _MirrorState | None:
+        path = self._directory / _STATE_FILE
+        if not path.exists():
+            return None
+        return _MirrorState.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def _save_state(self, state: _MirrorState) -> None:
+        path = self._directory / _STATE_FILE
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(state.model_dump_json(), encoding="utf-8")
+        os.replace(temporary_path, path)
+        self._state = state
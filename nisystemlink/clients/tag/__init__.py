@@ -2,6 +2,13 @@
 
 from ._data_type import DataType
 from ._retention_type import RetentionType
+from ._queue_full_policy import QueueFullPolicy
+from ._timer_scheduler import (
+    AsyncioTimerScheduler,
+    ThreadedTimerScheduler,
+    TimerHandle,
+    TimerScheduler,
+)
 from ._tag_data import TagData
 from ._tag_with_aggregates import TagWithAggregates
 from ._async_tag_query_result_collection import AsyncTagQueryResultCollection
@@ -16,6 +23,7 @@ from ._tag_path_utilities import TagPathUtilities
 from ._tag_query_result_collection import TagQueryResultCollection
 from ._tag_subscription import TagSubscription
 from ._tag_selection import TagSelection
+from ._tag_metadata_cache import TagMetadataCache
 from ._tag_manager import TagManager
 
 # flake8: noqa
@@ -3,16 +3,27 @@
 """Implementation of AsyncTagQueryResultCollection."""
 
 import abc
-from typing import List
+import asyncio
+from collections import deque
+from typing import Deque, List, Tuple
 
 from nisystemlink.clients import core, tag as tbase
 
 
 class AsyncTagQueryResultCollection(abc.ABC):
-    """Represents a paginated list of tags returned by an asynchronous query."""
+    """Represents a paginated list of tags returned by an asynchronous query.
+
+    When the collection has a :attr:`max_concurrency`, moving to a page also requests
+    the pages after it in parallel, so that they're ready when they're needed.
+    """
 
     def __init__(
-        self, first_page: List[tbase.TagData], total_count: int, skip: int
+        self,
+        first_page: List[tbase.TagData],
+        total_count: int,
+        skip: int,
+        *,
+        max_concurrency: int | None = None
     ) -> None:
         """Initialize an instance with the first page of query results.
 
@@ -20,7 +31,14 @@ class AsyncTagQueryResultCollection(abc.ABC):
             first_page: The first page of results, or None if there are no results.
             total_count: The total number of results in the query.
             skip: The skip used for the first page of results.
+            max_concurrency: The maximum number of pages to request at once, or None
+                to request one page at a time.
+
+        Raises:
+            ValueError: if ``max_concurrency`` is less than one.
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency cannot be 0 or negative")
         self._total_count = total_count
         self._current_page: List[tbase.TagData] | None = None
         if first_page:
@@ -33,6 +51,10 @@ class AsyncTagQueryResultCollection(abc.ABC):
             pass  # leave it as None, even if passed in as []
         self._skip = skip
         self._current_skip = skip
+        self._max_concurrency = max_concurrency
+        self._prefetched: Deque[Tuple[int, asyncio.Future[List[tbase.TagData]]]] = (
+            deque()
+        )
 
     @property
     def current_page(self) -> List[tbase.TagData] | None:  # noqa: D401
@@ -43,6 +65,13 @@ class AsyncTagQueryResultCollection(abc.ABC):
         """
         return self._current_page
 
+    @property
+    def max_concurrency(self) -> int | None:  # noqa: D401
+        """The maximum number of pages requested at once, or None if pages are
+        requested one at a time.
+        """
+        return self._max_concurrency
+
     @property
     def total_count(self) -> int:  # noqa: D401
         """The total number of tags matched by the query at the time the query was made."""
@@ -67,7 +96,12 @@ class AsyncTagQueryResultCollection(abc.ABC):
 
         new_skip = self._current_skip + len(self._current_page)
         if new_skip < self.total_count:
-            self._current_page = await self._query_page_async(new_skip)
+            if self._max_concurrency is None:
+                self._current_page = await self._query_page_async(new_skip)
+            else:
+                self._current_page = await self._query_prefetched_page_async(
+                    new_skip, len(self._current_page)
+                )
         else:
             self._current_page = None
 
@@ -85,10 +119,43 @@ class AsyncTagQueryResultCollection(abc.ABC):
         Raises:
             ApiException: if the API call fails.
         """
+        self._cancel_prefetched()
         self._current_skip = self._skip
         self._current_page = await self._query_page_async(self._current_skip)
         return self._current_page
 
+    async def _query_prefetched_page_async(
+        self, skip: int, page_size: int
+    ) -> List[tbase.TagData]:
+        assert self._max_concurrency is not None
+        if self._prefetched and self._prefetched[0][0] != skip:
+            # The page sizes changed, so the prefetched offsets are wrong.
+            self._cancel_prefetched()
+
+        next_skip = self._prefetched[-1][0] + page_size if self._prefetched else skip
+        while (
+            len(self._prefetched) < self._max_concurrency
+            and next_skip < self._total_count
+        ):
+            self._prefetched.append(
+                (next_skip, asyncio.ensure_future(self._query_page_async(next_skip)))
+            )
+            next_skip += page_size
+
+        _, future = self._prefetched.popleft()
+        try:
+            return await future
+        except BaseException:
+            self._cancel_prefetched()
+            raise
+
+    def _cancel_prefetched(self) -> None:
+        while self._prefetched:
+            _, future = self._prefetched.popleft()
+            if future.done() and not future.cancelled():
+                future.exception()  # the error was already reported, or is moot
+            future.cancel()
+
     @abc.abstractmethod
     async def _query_page_async(self, skip: int) -> List[tbase.TagData]:
         """Asynchronously query for a single page of results and updates :attr:`total_count`.
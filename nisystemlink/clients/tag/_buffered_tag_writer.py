@@ -3,15 +3,21 @@
 """Implementation of BufferedTagWriter."""
 
 import abc
+import asyncio
 import datetime
 import sys
 import threading
+from collections import deque
 from types import TracebackType
-from typing import Any, Callable, Type
+from typing import Any, Callable, Deque, List, Tuple, Type
 
 from nisystemlink.clients import core, tag as tbase
+from nisystemlink.clients.tag._core._async_manual_reset_timer import (
+    AsyncManualResetTimer,
+)
 from nisystemlink.clients.tag._core._itime_stamper import ITimeStamper
 from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.tag._core._write_spool import WriteSpool
 
 
 class BufferedTagWriter(tbase.ITagWriter):
@@ -24,10 +30,38 @@ class BufferedTagWriter(tbase.ITagWriter):
     Note that :class:`BufferedTagWriter` objects support using the ``with`` statement
     (or the ``async with`` statement), to automatically :meth:`send
     <send_buffered_writes>` any remaining buffered writes on exit.
+
+    By default, writes that fill the buffer or are sent by the flush timer are sent on
+    the thread that triggered them. When a ``send_queue_size`` is given, those writes
+    are instead placed on a bounded queue and sent by a dedicated background thread, so
+    that :meth:`write()` never waits for the server. Errors from the background thread
+    are raised by the next call to :meth:`write()` or :meth:`send_buffered_writes()`.
+
+    Writers whose flush timer is an :class:`AsyncManualResetTimer` instead send the
+    writes on the timer's event loop, using the asynchronous API.
+
+    When a ``spool`` is given, writes that fill the buffer or are sent by the flush
+    timer are instead appended to the spool on disk, and a background thread sends
+    them in order as fast as the server accepts them. Writes that fail to send because
+    the server can't be reached or has an internal error stay in the spool and are
+    retried, so a slow or unreachable server doesn't cause writes to be lost or memory
+    to grow. Writes that the server rejects are discarded, and the error is raised by
+    the next call to :meth:`write()` or :meth:`send_buffered_writes()`.
     """
 
+    _SPOOL_RETRY_MIN_SECONDS = 0.5
+
+    _SPOOL_RETRY_MAX_SECONDS = 30.0
+
     def __init__(
-        self, stamper: ITimeStamper, buffer_size: int, flush_timer: ManualResetTimer
+        self,
+        stamper: ITimeStamper,
+        buffer_size: int,
+        flush_timer: ManualResetTimer | AsyncManualResetTimer,
+        *,
+        send_queue_size: int | None = None,
+        queue_full_policy: tbase.QueueFullPolicy = tbase.QueueFullPolicy.BLOCK,
+        spool: WriteSpool | None = None,
     ) -> None:
         """Initialize the writer.
 
@@ -37,7 +71,27 @@ class BufferedTagWriter(tbase.ITagWriter):
                 sending them to the server.
             flush_timer: A timer that, once started, elapses whenever buffered writes
                 should be sent automatically. Does not have to be a configured timer.
+                Writes sent by an :class:`AsyncManualResetTimer` are sent with
+                :meth:`_send_writes_async()` on the timer's event loop.
+            send_queue_size: The maximum number of full buffers waiting to be sent by a
+                background thread, or None to send on the writing thread.
+            queue_full_policy: What to do when the buffer fills while the send queue or
+                the spool is full. With a spool, :attr:`QueueFullPolicy.RAISE`
+                discards the writes that don't fit, and writes sent by
+                :meth:`send_buffered_writes()` or when the writer is closed never wait
+                for room.
+            spool: The spool to send writes through, or None to send them directly.
+                The writer closes the spool when it's closed.
+
+        Raises:
+            ValueError: if ``send_queue_size`` is less than one.
+            ValueError: if both ``send_queue_size`` and ``spool`` are given.
         """
+        if send_queue_size is not None and send_queue_size < 1:
+            raise ValueError("send_queue_size cannot be 0 or negative")
+        if send_queue_size is not None and spool is not None:
+            raise ValueError("send_queue_size and spool cannot both be given")
+
         self._lock = threading.Lock()
         self._buffer_limit = buffer_size
         self._flush_timer = flush_timer
@@ -45,10 +99,34 @@ class BufferedTagWriter(tbase.ITagWriter):
 
         self._closed = False
         self._num_buffered = 0
-        self._send_error: core.ApiException | None = None
+        self._send_error: Exception | None = None
         self._timer_generation = 0
         self._timer_handler: Callable[[], None] | None = None
 
+        self._send_queue_size = send_queue_size
+        self._queue_full_policy = queue_full_policy
+        self._send_queue: Deque[Tuple[Any, int]] = deque()
+        self._send_queue_changed = threading.Condition(self._lock)
+        self._sending = False
+        self._sender: threading.Thread | None = None
+        self._sender_stopped = False
+        self._dropped_writes = 0
+
+        self._spool = spool
+        self._spool_changed = threading.Condition()
+        self._spool_sender: threading.Thread | None = None
+        self._spool_error: Exception | None = None
+        self._spool_retry = False
+        self._spool_stopped = False
+
+    @property
+    def dropped_writes(self) -> int:  # noqa: D401
+        """The number of writes discarded by :attr:`QueueFullPolicy.DROP_OLDEST`, by
+        :attr:`QueueFullPolicy.RAISE` when the spool is full, or because they couldn't
+        be sent.
+        """
+        return self._dropped_writes
+
     @abc.abstractmethod
     def _buffer_value(self, path: str, value: Any) -> None:
         """Add a value to the buffer.
@@ -124,6 +202,40 @@ class BufferedTagWriter(tbase.ITagWriter):
         """
         ...
 
+    @abc.abstractmethod
+    def _prepend_buffer(self, updates: Any) -> None:
+        """Add writes that failed to send to the front of the buffer.
+
+        Args:
+            updates: The writes to add.
+        """
+        ...
+
+    @abc.abstractmethod
+    def _spool_records(self, updates: Any) -> List[Tuple[bytes, int]]:
+        """Serialize buffered writes into the records to add to the spool.
+
+        Args:
+            updates: The writes, in the format returned by :meth:`_copy_buffer`.
+
+        Returns:
+            The records, as ``(data, count)`` tuples, where ``count`` is the number of
+            writes in ``data``. Each record is sent with :meth:`_send_spooled`.
+        """
+        ...
+
+    @abc.abstractmethod
+    def _send_spooled(self, data: bytes) -> None:
+        """Send a record created by :meth:`_spool_records` to the server.
+
+        Args:
+            data: The record to send.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        ...
+
     def clear_buffered_writes(self) -> None:
         """Clear any pending writes from :meth:`write()`.
 
@@ -137,19 +249,37 @@ class BufferedTagWriter(tbase.ITagWriter):
             self._stop_timer_while_locked()
             self._clear_buffer()
             self._num_buffered = 0
+            self._send_queue.clear()
+            self._send_queue_changed.notify_all()
 
     def send_buffered_writes(self) -> None:
         """Write all of the pending writes from :meth:`write()` to the server.
 
-        Does nothing if there are no pending writes.
+        Does nothing if there are no pending writes. When sending on a background
+        thread, waits until every queued write has been sent. When sending through a
+        spool, waits until the spool is empty or a spooled write fails to send.
 
         Raises:
             ReferenceError: if the writer has been closed.
+            BufferError: if the spool is full and the writer's policy is
+                :attr:`QueueFullPolicy.RAISE`.
             ApiException: if the API call fails.
         """
         if self._closed:
             raise ReferenceError("BufferedTagWriter")
 
+        if self._spool is not None:
+            with self._lock:
+                self._spool_buffered_values_while_locked()
+            self._wait_for_spool()
+            return
+
+        if self._send_queue_size is not None:
+            with self._lock:
+                self._queue_buffered_values_while_locked(block=False)
+            self._wait_for_send_queue()
+            return
+
         with self._lock:
             updates = self._retrieve_buffered_values_while_locked()
 
@@ -159,15 +289,33 @@ class BufferedTagWriter(tbase.ITagWriter):
     async def send_buffered_writes_async(self) -> None:
         """Asynchronously write all of the pending writes from :meth:`write()` to the server.
 
-        Does nothing if there are no pending writes.
+        Does nothing if there are no pending writes. When sending on a background
+        thread, waits until every queued write has been sent. When sending through a
+        spool, waits until the spool is empty or a spooled write fails to send.
 
         Raises:
             ReferenceError: if the writer has been closed.
+            BufferError: if the spool is full and the writer's policy is
+                :attr:`QueueFullPolicy.RAISE`.
             ApiException: if the API call fails.
         """
         if self._closed:
             raise ReferenceError("BufferedTagWriter")
 
+        if self._spool is not None:
+            with self._lock:
+                self._spool_buffered_values_while_locked()
+            await asyncio.get_running_loop().run_in_executor(None, self._wait_for_spool)
+            return
+
+        if self._send_queue_size is not None:
+            with self._lock:
+                self._queue_buffered_values_while_locked(block=False)
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._wait_for_send_queue
+            )
+            return
+
         with self._lock:
             updates = self._retrieve_buffered_values_while_locked()
 
@@ -178,6 +326,7 @@ class BufferedTagWriter(tbase.ITagWriter):
         if self._closed:
             raise ReferenceError("BufferedTagWriter")
 
+        self._start_spool_sender()
         self._flush_timer.__enter__()
         return self
 
@@ -185,6 +334,7 @@ class BufferedTagWriter(tbase.ITagWriter):
         if self._closed:
             raise ReferenceError("BufferedTagWriter")
 
+        self._start_spool_sender()
         await self._flush_timer.__aenter__()
         return self
 
@@ -197,7 +347,10 @@ class BufferedTagWriter(tbase.ITagWriter):
         if self._closed:
             return False
 
-        self.send_buffered_writes()
+        try:
+            self.send_buffered_writes()
+        finally:
+            self._dispose()
         self._closed = True
 
         suppress = self._flush_timer.__exit__(exc_type, exc_val, exc_tb)
@@ -212,7 +365,10 @@ class BufferedTagWriter(tbase.ITagWriter):
         if self._closed:
             return False
 
-        await self.send_buffered_writes_async()
+        try:
+            await self.send_buffered_writes_async()
+        finally:
+            self._dispose()
         self._closed = True
 
         suppress = await self._flush_timer.__aexit__(exc_type, exc_val, exc_tb)
@@ -242,18 +398,25 @@ class BufferedTagWriter(tbase.ITagWriter):
             ValueError: if `path` or `value` is None.
             ValueError: if `data_type` is invalid.
             ReferenceError: if the writer has been closed.
+            BufferError: if the send queue is full and the writer's policy is
+                :attr:`QueueFullPolicy.RAISE`.
             ApiException: if the API call fails.
         """
         timestamped_value = self._prepare_write(path, data_type, value, timestamp)
 
         pending_error = None
         updates = None
+        wait_for_spool = False
         with self._lock:
+            self._check_send_queue_while_locked()
             self._buffer_value(path, timestamped_value)
             self._num_buffered += 1
 
-            if self._num_buffered == self._buffer_limit:
-                updates = self._retrieve_buffered_values_while_locked()
+            # Requeued writes can take the buffer past its limit
+            if self._waits_for_spool_room and self._buffer_full_while_locked():
+                wait_for_spool = True
+            elif self._buffer_full_while_locked():
+                updates = self._take_full_buffer_while_locked()
             elif self._num_buffered == 1:
                 self._start_timer_while_locked()
 
@@ -261,6 +424,9 @@ class BufferedTagWriter(tbase.ITagWriter):
                 pending_error = self._send_error
                 self._send_error = None
 
+        if wait_for_spool:
+            self._spool_full_buffer()
+
         if updates is not None:
             self._send_writes(updates)
 
@@ -294,18 +460,28 @@ class BufferedTagWriter(tbase.ITagWriter):
             ValueError: if `path` or `value` is None.
             ValueError: if `data_type` is invalid.
             ReferenceError: if the writer has been closed.
+            BufferError: if the send queue is full and the writer's policy is
+                :attr:`QueueFullPolicy.RAISE`.
             ApiException: if the API call fails.
         """
         timestamped_value = self._prepare_write(path, data_type, value, timestamp)
 
         pending_error = None
         updates = None
+        take_full_buffer: Callable[[], None] | None = None
         with self._lock:
+            self._check_send_queue_while_locked()
             self._buffer_value(path, timestamped_value)
             self._num_buffered += 1
 
-            if self._num_buffered == self._buffer_limit:
-                updates = self._retrieve_buffered_values_while_locked()
+            # Requeued writes can take the buffer past its limit
+            if self._buffer_full_while_locked():
+                if self._waits_for_spool_room:
+                    take_full_buffer = self._spool_full_buffer
+                elif self._send_queue_blocks_while_locked():
+                    take_full_buffer = self._queue_full_buffer
+                else:
+                    updates = self._take_full_buffer_while_locked()
             elif self._num_buffered == 1:
                 self._start_timer_while_locked()
 
@@ -313,6 +489,10 @@ class BufferedTagWriter(tbase.ITagWriter):
                 pending_error = self._send_error
                 self._send_error = None
 
+        if take_full_buffer is not None:
+            # Wait for room without blocking the event loop
+            await asyncio.get_running_loop().run_in_executor(None, take_full_buffer)
+
         if updates is not None:
             await self._send_writes_async(updates)
 
@@ -351,6 +531,317 @@ class BufferedTagWriter(tbase.ITagWriter):
             tbase.TagPathUtilities.validate(path), data_type, value, timestamp
         )
 
+    def _check_send_queue_while_locked(self) -> None:
+        """Raise if the next write would fill the buffer while the send queue is full
+        and the policy is :attr:`QueueFullPolicy.RAISE`.
+
+        Must hold :attr:`_lock`.
+        """
+        if (
+            self._send_queue_size is not None
+            and self._queue_full_policy == tbase.QueueFullPolicy.RAISE
+            and 0 < self._buffer_limit <= self._num_buffered + 1
+            and len(self._send_queue) >= self._send_queue_size
+        ):
+            raise BufferError("The BufferedTagWriter send queue is full")
+
+    def _buffer_full_while_locked(self) -> bool:
+        """Return whether the buffer has reached its size limit.
+
+        Must hold :attr:`_lock`.
+        """
+        return 0 < self._buffer_limit <= self._num_buffered
+
+    @property
+    def _waits_for_spool_room(self) -> bool:  # noqa: D401
+        """Whether full buffers wait for room in the spool before they're spooled."""
+        return (
+            self._spool is not None
+            and self._queue_full_policy == tbase.QueueFullPolicy.BLOCK
+        )
+
+    def _spool_full_buffer(self) -> None:
+        """Wait for room in the spool, without holding :attr:`_lock`, then move the
+        buffered values to it if the buffer is still full.
+
+        Writes made while waiting join the buffer rather than being spooled ahead of
+        it.
+        """
+        assert self._spool is not None
+        self._spool.wait_for_room()
+        with self._lock:
+            if self._buffer_full_while_locked():
+                self._spool_buffered_values_while_locked()
+
+    def _take_full_buffer_while_locked(self) -> Any:
+        """Return the buffered values to send on the calling thread, or queue them for
+        the background sender.
+
+        Must hold :attr:`_lock`.
+
+        Returns:
+            The buffered values, or None if they were queued.
+        """
+        if self._spool is not None:
+            self._spool_buffered_values_while_locked()
+            return None
+
+        if self._send_queue_size is None:
+            return self._retrieve_buffered_values_while_locked()
+
+        self._queue_buffered_values_while_locked(block=True)
+        return None
+
+    def _send_queue_blocks_while_locked(self) -> bool:
+        """Return whether queuing a full buffer would wait for the send queue.
+
+        Must hold :attr:`_lock`.
+        """
+        return (
+            self._send_queue_size is not None
+            and self._queue_full_policy == tbase.QueueFullPolicy.BLOCK
+            and len(self._send_queue) >= self._send_queue_size
+        )
+
+    def _queue_full_buffer(self) -> None:
+        """Wait for room in the send queue, then move the buffered values to it if the
+        buffer is still full.
+        """
+        with self._lock:
+            if self._buffer_full_while_locked():
+                self._queue_buffered_values_while_locked(block=True)
+
+    def _queue_buffered_values_while_locked(self, block: bool) -> None:
+        """Move the buffered values, if any, to the send queue.
+
+        Must hold :attr:`_lock`.
+
+        Args:
+            block: True to apply the writer's :class:`QueueFullPolicy` when the queue is
+                full, or False to exceed the queue's size.
+        """
+        size = self._send_queue_size
+        assert size is not None
+        if block and self._queue_full_policy == tbase.QueueFullPolicy.DROP_OLDEST:
+            while len(self._send_queue) >= size:
+                _, count = self._send_queue.popleft()
+                self._dropped_writes += count
+        elif block:
+            # Wait before taking the buffer, so that later writes join it rather than
+            # being queued ahead of it.
+            self._send_queue_changed.wait_for(
+                lambda: len(self._send_queue) < size or self._sender_stopped
+            )
+
+        if self._sender_stopped:
+            return
+
+        count = self._num_buffered
+        updates = self._retrieve_buffered_values_while_locked()
+        if updates is None:
+            return
+
+        self._send_queue.append((updates, count))
+        if self._sender is None:
+            self._sender = threading.Thread(
+                target=self._run_sender, name="BufferedTagWriter", daemon=True
+            )
+            self._sender.start()
+        self._send_queue_changed.notify_all()
+
+    def _wait_for_send_queue(self) -> None:
+        """Wait until the background sender has sent every queued write.
+
+        Raises:
+            ApiException: if a queued write failed to send.
+        """
+        with self._lock:
+            self._send_queue_changed.wait_for(
+                lambda: not (self._send_queue or self._sending)
+            )
+            pending_error, self._send_error = self._send_error, None
+        if pending_error is not None:
+            raise pending_error
+
+    def _run_sender(self) -> None:
+        while True:
+            with self._lock:
+                self._send_queue_changed.wait_for(
+                    lambda: self._send_queue or self._sender_stopped
+                )
+                if not self._send_queue:
+                    return
+                updates, _ = self._send_queue.popleft()
+                self._sending = True
+                self._send_queue_changed.notify_all()
+
+            try:
+                self._send_writes(updates)
+                error = None
+            except Exception as ex:
+                error = ex
+
+            with self._lock:
+                self._sending = False
+                if error is not None:
+                    self._send_error = error
+                self._send_queue_changed.notify_all()
+
+    def _spool_buffered_values_while_locked(self) -> None:
+        """Move the buffered values, if any, to the spool.
+
+        Must hold :attr:`_lock`. Never waits for room in the spool; with
+        :attr:`QueueFullPolicy.BLOCK`, callers wait with :meth:`_spool_full_buffer()`
+        first, or exceed the spool's maximum size.
+
+        Raises:
+            BufferError: if the spool is full and the writer's policy is
+                :attr:`QueueFullPolicy.RAISE`. The buffered values are discarded.
+        """
+        assert self._spool is not None
+        count = self._num_buffered
+        updates = self._retrieve_buffered_values_while_locked()
+        if updates is None:
+            return
+
+        policy = None if self._waits_for_spool_room else self._queue_full_policy
+        try:
+            self._dropped_writes += self._spool.append(
+                self._spool_records(updates), policy
+            )
+        except BufferError:
+            self._dropped_writes += count
+            raise
+        self._start_spool_sender()
+
+    def _start_spool_sender(self) -> None:
+        """Start sending the spooled writes, including any left by a previous writer."""
+        if self._spool is None:
+            return
+        with self._spool_changed:
+            if self._spool_sender is None and not self._spool_stopped:
+                self._spool_sender = threading.Thread(
+                    target=self._run_spool_sender,
+                    name="BufferedTagWriter-spool",
+                    daemon=True,
+                )
+                self._spool_sender.start()
+
+    def _wait_for_spool(self) -> None:
+        """Wait until the spool is empty, retrying a failed write immediately.
+
+        Raises:
+            ApiException: if a spooled write failed to send. It stays in the spool.
+        """
+        spool = self._spool
+        assert spool is not None
+        self._start_spool_sender()
+        with self._spool_changed:
+            self._spool_error = None
+            self._spool_retry = True
+            self._spool_changed.notify_all()
+            self._spool_changed.wait_for(
+                lambda: not spool.pending_records
+                or self._spool_error is not None
+                or self._spool_stopped
+            )
+            pending_error, self._spool_error = self._spool_error, None
+        if pending_error is None:
+            with self._lock:
+                pending_error, self._send_error = self._send_error, None
+        if pending_error is not None:
+            raise pending_error
+
+    def _run_spool_sender(self) -> None:
+        spool = self._spool
+        assert spool is not None
+        failures = 0
+        while True:
+            record = spool.wait_for_record()
+            with self._spool_changed:
+                if self._spool_stopped:
+                    return
+                self._spool_retry = False
+            if record is None:
+                continue
+
+            try:
+                self._send_spooled(record.data)
+                error = None
+            except Exception as ex:
+                error = ex
+
+            if error is not None and _is_rejection(error):
+                # Retrying can't succeed, so discard the record rather than blocking
+                # the records behind it, and report the error once
+                with self._lock:
+                    self._send_error = error
+                    self._dropped_writes += record.writes
+                error = None
+
+            if error is None:
+                spool.commit(record)
+                failures = 0
+
+            with self._spool_changed:
+                if error is not None and self._spool_retry:
+                    # A retry was requested while the send was failing, so try again
+                    continue
+                self._spool_error = error
+                self._spool_changed.notify_all()
+                if error is not None:
+                    # Back off until the server recovers, unless asked to retry now
+                    failures += 1
+                    delay = min(
+                        self._SPOOL_RETRY_MIN_SECONDS * 2 ** (failures - 1),
+                        self._SPOOL_RETRY_MAX_SECONDS,
+                    )
+                    self._spool_changed.wait_for(
+                        lambda: self._spool_retry or self._spool_stopped, delay
+                    )
+
+    def _stop_spool_sender(self) -> None:
+        """Stop the spool sender, if it was started, and close the spool."""
+        if self._spool is None:
+            return
+        with self._spool_changed:
+            self._spool_stopped = True
+            self._spool_changed.notify_all()
+            sender = self._spool_sender
+        self._spool.interrupt()
+        if sender is not None:
+            sender.join()
+        self._spool.close()
+
+    def _dispose(self) -> None:
+        """Release the resources used to send writes once the writer is closed."""
+        self._stop_sender()
+        self._stop_spool_sender()
+
+    def _requeue_while_locked(self, updates: Any, count: int) -> None:
+        """Return writes that failed to send to the front of the buffer, so that they
+        are sent again with the next batch.
+
+        Must hold :attr:`_lock`.
+
+        Args:
+            updates: The writes to buffer again.
+            count: The number of writes in ``updates``.
+        """
+        self._prepend_buffer(updates)
+        self._num_buffered += count
+        if self._num_buffered == count:
+            self._start_timer_while_locked()
+
+    def _stop_sender(self) -> None:
+        """Stop the background sender, if it was started, after it sends the queue."""
+        with self._lock:
+            self._sender_stopped = True
+            self._send_queue_changed.notify_all()
+            sender = self._sender
+        if sender is not None:
+            sender.join()
+
     def _retrieve_buffered_values_while_locked(self) -> Any:
         """Return the buffered values, if any, and clears the buffer.
 
@@ -377,9 +868,14 @@ class BufferedTagWriter(tbase.ITagWriter):
             return
 
         handler_generation = self._timer_generation
-        self._flush_timer.elapsed -= self._timer_handler
-        self._timer_handler = lambda: self._timer_expired(handler_generation)
-        self._flush_timer.elapsed += self._timer_handler
+        if isinstance(self._flush_timer, AsyncManualResetTimer):
+            self._flush_timer.callback = lambda: self._timer_expired_async(
+                handler_generation
+            )
+        else:
+            self._flush_timer.elapsed -= self._timer_handler
+            self._timer_handler = lambda: self._timer_expired(handler_generation)
+            self._flush_timer.elapsed += self._timer_handler
         self._flush_timer.start()
 
     def _stop_timer_while_locked(self) -> None:
@@ -391,19 +887,68 @@ class BufferedTagWriter(tbase.ITagWriter):
         self._timer_generation += 1
 
     def _timer_expired(self, generation: int) -> None:
+        updates = self._take_expired_buffer(generation)
+        if updates is not None:
+            try:
+                self._send_writes(updates)
+            except core.ApiException as ex:
+                with self._lock:
+                    self._send_error = ex
+
+    async def _timer_expired_async(self, generation: int) -> None:
+        if self._send_queue_size is not None:
+            # Queuing may wait for room in the send queue
+            updates = await asyncio.get_running_loop().run_in_executor(
+                None, self._take_expired_buffer, generation
+            )
+        else:
+            updates = self._take_expired_buffer(generation)
+        if updates is not None:
+            try:
+                await self._send_writes_async(updates)
+            except core.ApiException as ex:
+                with self._lock:
+                    self._send_error = ex
+
+    def _take_expired_buffer(self, generation: int) -> Any:
+        """Return the buffered values to send when the flush timer elapses, or queue
+        them for the background sender.
+
+        Args:
+            generation: The timer generation when the timer was started.
+
+        Returns:
+            The buffered values, or None if there's nothing to send.
+        """
         if self._closed:
-            return
+            return None
 
         with self._lock:
             if generation != self._timer_generation:
                 # The timer was canceled after we were already queued.
-                return
+                return None
+
+            if self._spool is not None:
+                if self._waits_for_spool_room and not self._spool.has_room:
+                    # Don't tie up the timer's thread; try again when it next elapses
+                    self._start_timer_while_locked()
+                    return None
+                try:
+                    self._spool_buffered_values_while_locked()
+                except BufferError as ex:
+                    self._send_error = ex
+                return None
 
-            updates = self._retrieve_buffered_values_while_locked()
+            if self._send_queue_size is not None:
+                self._queue_buffered_values_while_locked(block=True)
+                return None
 
-        if updates is not None:
-            try:
-                self._send_writes(updates)
-            except core.ApiException as ex:
-                with self._lock:
-                    self._send_error = ex
+            return self._retrieve_buffered_values_while_locked()
+
+
+def _is_rejection(error: Exception) -> bool:
+    """Return whether ``error`` means the server rejected a request, such that sending
+    it again can't succeed.
+    """
+    status = error.http_status_code if isinstance(error, core.ApiException) else None
+    return status is not None and 400 <= status < 500 and status not in (408, 429)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of AsyncManualResetTimer."""
+
+import asyncio
+import datetime
+import threading
+import traceback
+from types import TracebackType
+from typing import Awaitable, Callable, Type
+
+from typing_extensions import final, Literal
+
+
+@final
+class AsyncManualResetTimer:
+    """Represents a timer, like :class:`ManualResetTimer`, that runs as a task on an
+    asyncio event loop and awaits an asynchronous :attr:`callback` when it elapses.
+
+    :meth:`start()` must be called to restart the timer each time it elapses. The timer
+    doesn't use any threads, but :meth:`start()` and :meth:`stop()` may be called from
+    any thread.
+    """
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'AsyncManualResetTimer' is not an acceptable base type")
+
+    def __init__(
+        self,
+        interval: datetime.timedelta,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        """Initialize a timer that elapses a single time, ``interval`` after
+        :meth:`start()` is called.
+
+        Args:
+            interval: The amount of time after calling :meth:`start()` before
+                :attr:`callback` is called.
+            loop: The event loop to run the timer on, or None to use the running loop.
+
+        Raises:
+            ValueError: if ``interval`` is less than or equal to zero.
+            RuntimeError: if ``loop`` is None and there is no running event loop.
+        """
+        interval_secs = interval.total_seconds()
+        if interval_secs <= 0:
+            raise ValueError("interval cannot be <= 0")
+
+        self._interval = interval_secs
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._lock = threading.Lock()
+        self._started = False
+        self._generation = 0
+        self._task: asyncio.Task[None] | None = None
+        self.callback: Callable[[], Awaitable[None]] | None = None
+        """The function to call and await each time the timer elapses."""
+
+    @property
+    def interval(self) -> datetime.timedelta:  # noqa: D401
+        """The amount of time after calling :meth:`start()` before :attr:`callback` is
+        called.
+        """
+        return datetime.timedelta(seconds=self._interval)
+
+    @property
+    def can_start(self) -> bool:  # noqa: D401
+        """Whether or not the timer can be started, which is always True."""
+        return True
+
+    def start(self, interval: datetime.timedelta | None = None) -> None:
+        """Start the timer, if it isn't already running.
+
+        Args:
+            interval: The amount of time before :attr:`callback` is called this time,
+                or None to use the timer's interval.
+        """
+        delay = interval.total_seconds() if interval is not None else self._interval
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._generation += 1
+            generation = self._generation
+
+        if self._is_loop_thread():
+            self._create_task(generation, delay)
+        else:
+            self._loop.call_soon_threadsafe(self._create_task, generation, delay)
+
+    def stop(self) -> None:
+        """Stop the timer."""
+        with self._lock:
+            self._started = False
+            self._generation += 1
+            task, self._task = self._task, None
+
+        if task is not None:
+            if self._is_loop_thread():
+                task.cancel()
+            elif not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(task.cancel)
+
+    def _is_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _create_task(self, generation: int, delay: float) -> None:
+        with self._lock:
+            # Ignore a start that was followed by a stop before it got to the loop
+            if generation != self._generation:
+                return
+            self._task = self._loop.create_task(self._run(generation, delay))
+
+    async def _run(self, generation: int, delay: float) -> None:
+        await asyncio.sleep(delay)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._started = False
+            self._task = None
+
+        callback = self.callback
+        if callback is None:
+            return
+        try:
+            await callback()
+        except Exception:
+            traceback.print_exc()
+
+    def __enter__(self) -> "AsyncManualResetTimer":
+        return self
+
+    async def __aenter__(self) -> "AsyncManualResetTimer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Literal[False]:
+        self.stop()
+        self.callback = None
+        return False
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Literal[False]:
+        self.stop()
+        self.callback = None
+        return False
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of CallbackDispatcher."""
+
+import asyncio
+import itertools
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Tuple
+
+from nisystemlink.clients import tag as tbase
+from typing_extensions import final
+
+
+@final
+class CallbackDispatcher:
+    """Calls callbacks on an executor, in order for each key.
+
+    Callbacks with the same key are called one at a time, in the order they were
+    dispatched. Callbacks with different keys may be called concurrently.
+    """
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'CallbackDispatcher' is not an acceptable base type")
+
+    _DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        *,
+        max_pending: int | None = None,
+        queue_full_policy: tbase.QueueFullPolicy = tbase.QueueFullPolicy.BLOCK
+    ) -> None:
+        """Initialize a dispatcher.
+
+        Args:
+            executor: The executor to call the callbacks on, or None to use a thread
+                pool owned by the dispatcher.
+            max_pending: The maximum number of callbacks waiting to be called, or None
+                for no limit.
+            queue_full_policy: What to do when a callback is dispatched while
+                ``max_pending`` callbacks are waiting. Only ``BLOCK`` and
+                ``DROP_OLDEST`` are supported.
+
+        Raises:
+            ValueError: if ``max_pending`` is less than one.
+            ValueError: if ``queue_full_policy`` is ``RAISE``.
+        """
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending cannot be 0 or negative")
+        if queue_full_policy == tbase.QueueFullPolicy.RAISE:
+            raise ValueError("queue_full_policy RAISE is not supported for callbacks")
+
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            self._DEFAULT_MAX_WORKERS, thread_name_prefix="CallbackDispatcher"
+        )
+        self._max_pending = max_pending
+        self._queue_full_policy = queue_full_policy
+        self._condition = threading.Condition()
+        self._queues: Dict[str, Deque[Tuple[int, Callable[[], None]]]] = {}
+        self._counter = itertools.count()
+        self._pending = 0
+        self._dropped = 0
+        self._closed = False
+
+    @property
+    def dropped(self) -> int:  # noqa: D401
+        """The number of callbacks that were discarded because too many were pending."""
+        return self._dropped
+
+    def dispatch(self, key: str, callback: Callable[[], None]) -> None:
+        """Call a callback on the executor after the callbacks previously dispatched
+        with the same key.
+
+        Exceptions raised by the callback are printed and otherwise ignored.
+
+        Args:
+            key: The key that determines the order of the callback.
+            callback: The function to call.
+        """
+        self._dispatch(key, callback, block=True)
+
+    async def dispatch_async(self, key: str, callback: Callable[[], None]) -> None:
+        """Call a callback on the executor after the callbacks previously dispatched
+        with the same key, without blocking the event loop while waiting for room.
+
+        Exceptions raised by the callback are printed and otherwise ignored.
+
+        Args:
+            key: The key that determines the order of the callback.
+            callback: The function to call.
+        """
+        if not self._dispatch(key, callback, block=False):
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.dispatch, key, callback
+            )
+
+    def _dispatch(self, key: str, callback: Callable[[], None], block: bool) -> bool:
+        """Dispatch a callback.
+
+        Args:
+            key: The key that determines the order of the callback.
+            callback: The function to call.
+            block: Whether to wait for room when the policy is ``BLOCK``.
+
+        Returns:
+            False if the callback was not dispatched because it would have had to wait
+            for room, otherwise True.
+        """
+        with self._condition:
+            if self._closed:
+                return True
+            max_pending = self._max_pending
+            if max_pending is not None:
+                if self._queue_full_policy == tbase.QueueFullPolicy.BLOCK:
+                    if not block and self._pending >= max_pending:
+                        return False
+                    self._condition.wait_for(
+                        lambda: self._pending < max_pending or self._closed
+                    )
+                    if self._closed:
+                        return True
+                elif self._pending >= max_pending:
+                    self._drop_oldest_while_locked()
+
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+                try:
+                    self._executor.submit(self._drain, key, queue)
+                except BaseException:
+                    # Let the next dispatch for this key start a drain
+                    del self._queues[key]
+                    raise
+            queue.append((next(self._counter), callback))
+            self._pending += 1
+            return True
+
+    def close(self) -> None:
+        """Discard the callbacks that are waiting to be called and stop dispatching
+        new ones.
+        """
+        with self._condition:
+            self._closed = True
+            for queue in self._queues.values():
+                queue.clear()
+            self._pending = 0
+            self._condition.notify_all()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    def _drop_oldest_while_locked(self) -> None:
+        # The queue with the oldest head holds the oldest pending callback.
+        oldest = min(
+            (queue for queue in self._queues.values() if queue),
+            key=lambda queue: queue[0][0],
+        )
+        oldest.popleft()
+        self._pending -= 1
+        self._dropped += 1
+
+    def _drain(self, key: str, queue: Deque[Tuple[int, Callable[[], None]]]) -> None:
+        while True:
+            with self._condition:
+                if not queue:
+                    # Nothing left for this key; the next dispatch starts a new drain
+                    del self._queues[key]
+                    return
+                _, callback = queue.popleft()
+                self._pending -= 1
+                self._condition.notify_all()
+            try:
+                callback()
+            except Exception:
+                traceback.print_exc()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of ExecutorTimerScheduler."""
+
+from concurrent.futures import Executor
+from typing import Callable
+
+from nisystemlink.clients.tag._timer_scheduler import TimerHandle, TimerScheduler
+from typing_extensions import final
+
+
+@final
+class ExecutorTimerScheduler(TimerScheduler):
+    """A :class:`TimerScheduler` that keeps its deadlines on another scheduler, and
+    calls the callbacks on an executor.
+
+    Callbacks that make blocking calls then tie up the executor's threads instead of
+    the other scheduler's, so they can't delay the timers of other owners of that
+    scheduler.
+    """
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'ExecutorTimerScheduler' is not an acceptable base type")
+
+    def __init__(self, scheduler: TimerScheduler, executor: Executor) -> None:
+        """Initialize a scheduler.
+
+        Args:
+            scheduler: The scheduler that keeps the deadlines.
+            executor: The executor to call the callbacks on. It is shut down when the
+                scheduler is closed.
+        """
+        self._scheduler = scheduler
+        self._executor = executor
+        self._closed = False
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        if self._closed:
+            raise RuntimeError("The timer scheduler is closed.")
+
+        handle = TimerHandle(callback)
+        inner = self._scheduler.call_later(delay, lambda: self._submit(handle))
+        handle._on_cancel = inner.cancel
+        return handle
+
+    def close(self) -> None:
+        self._closed = True
+        self._executor.shutdown(wait=False)
+
+    def _submit(self, handle: TimerHandle) -> None:
+        if handle.cancelled or self._closed:
+            return
+        try:
+            self._executor.submit(handle.run)
+        except RuntimeError:
+            # The executor was shut down
+            pass
@@ -3,15 +3,18 @@
 """Implementation of ManualResetTimer."""
 
 import datetime
+import functools
 import threading
 import traceback
+import weakref
 from types import TracebackType
-from typing import Any, Callable, List, Type
+from typing import Any, Callable, Type
 
 import events
 from nisystemlink.clients.core._internal._classproperty_support import (
     ClasspropertySupport,
 )
+from nisystemlink.clients.tag._timer_scheduler import TimerHandle, TimerScheduler
 from typing_extensions import final, Literal
 
 
@@ -20,6 +23,10 @@ class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
     """Represents a timer for periodic background operations such that :meth:`start()`
     must be called to restart the timer each time the :attr:`elapsed` event is raised.
 
+    Timers don't have threads of their own. Instead, they register with a
+    :class:`TimerScheduler <nisystemlink.clients.tag.TimerScheduler>` that is shared by
+    many timers.
+
     Attributes:
         elapsed: An event that is triggered when the timer has elapsed.
 
@@ -51,44 +58,52 @@ class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
             obj = cls.__new__(ManualResetTimer)
             super(ManualResetTimer, obj).__init__()  # but call the base constructor
 
-            obj._thread = None
-            obj._running = []  # used as mutable boolean; empty is False
+            obj._scheduler = None
+            obj._handle = None
+            obj._generation = 0
 
             cls.__null_timer_impl = obj
         return cls.__null_timer_impl
 
-    def __init__(self, interval: datetime.timedelta) -> None:
+    def __init__(
+        self,
+        interval: datetime.timedelta,
+        scheduler: "TimerScheduler | None" = None,
+    ) -> None:
         """Initialize a timer that fires at the given interval a single time once
         :meth:`start()` has been called and then automatically stops.
 
         Args:
             interval: The amount of time after calling :meth:`start()` before
                 :attr:`elapsed` is raised.
+            scheduler: The scheduler that raises :attr:`elapsed`, or None to use the
+                process-wide default scheduler.
 
         Raises:
             ValueError: if ``interval`` is less than or equal to zero.
         """
         super().__init__()
+        self._scheduler: TimerScheduler | None = None
+        self._handle: TimerHandle | None = None
+        self._generation = 0
         interval_secs = interval.total_seconds()
         if interval_secs <= 0:
             raise ValueError("interval cannot be <= 0")
 
-        # Note: This _running flag means that the *thread* is running, not the timer
-        self._running = [None]  # used as mutable boolean; non-empty is True
-        self._timer_start = threading.Event()
-        self._timer_cancel = threading.Event()
-        self._thread: threading.Thread | None = threading.Thread(
-            target=self._run,
-            args=[
-                self._running,
-                interval_secs,
-                self._timer_start,
-                self._timer_cancel,
-                self.elapsed,
-            ],
+        self._interval = interval_secs
+        self._lock = threading.Lock()
+        self._scheduler = (
+            scheduler if scheduler is not None else TimerScheduler.get_default()
         )
-        self._thread.daemon = True
-        self._thread.start()
+
+    @property
+    def interval(self) -> datetime.timedelta | None:  # noqa: D401
+        """The amount of time after calling :meth:`start()` before :attr:`elapsed` is
+        raised, or None if the timer isn't configured.
+        """
+        if self._scheduler is None:
+            return None
+        return datetime.timedelta(seconds=self._interval)
 
     @property
     def can_start(self) -> bool:  # noqa: D401
@@ -97,35 +112,60 @@ class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
         A timer that isn't configured will never raise :attr:`elapsed`, even when
         :meth:`start()` is called.
         """
-        return self._thread is not None
+        return self._scheduler is not None
 
-    def start(self) -> None:
-        """Start the timer."""
-        if self._running:
-            self._timer_cancel.clear()
-            self._timer_start.set()
+    def start(self, interval: datetime.timedelta | None = None) -> None:
+        """Start the timer, if it isn't already running.
+
+        Args:
+            interval: The amount of time before :attr:`elapsed` is raised this time, or
+                None to use the timer's interval.
+        """
+        if self._scheduler is None:
+            return
+        with self._lock:
+            if self._handle is None:
+                self._generation += 1
+                self._handle = self._scheduler.call_later(
+                    (
+                        interval.total_seconds()
+                        if interval is not None
+                        else self._interval
+                    ),
+                    functools.partial(
+                        self._run, weakref.ref(self), self._generation, self.elapsed
+                    ),
+                )
 
     def stop(self) -> None:
         """Stop the timer."""
-        if self._running:
-            self._timer_cancel.set()
+        if self._scheduler is None:
+            return
+        with self._lock:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
 
     @staticmethod
     def _run(
-        running: List[None],
-        interval: int,
-        timer_start: threading.Event,
-        timer_cancel: threading.Event,
+        timer_ref: "weakref.ReferenceType[ManualResetTimer]",
+        generation: int,
         elapsed: Callable[[], None],
     ) -> None:
-        while running:
-            timer_start.wait()
-            timer_start.clear()
-            if running and not timer_cancel.wait(interval):
-                try:
-                    elapsed()
-                except Exception:
-                    traceback.print_exc()
+        # Only hold a weak reference to the timer while it's scheduled, so that an
+        # abandoned timer can still be deleted.
+        timer = timer_ref()
+        if timer is None:
+            return
+        with timer._lock:
+            # Ignore a callback that was already running when the timer was stopped
+            if timer._handle is None or timer._generation != generation:
+                return
+            timer._handle = None
+        try:
+            elapsed()
+        except Exception:
+            traceback.print_exc()
 
     def __enter__(self) -> "ManualResetTimer":
         return self
@@ -160,13 +200,6 @@ class ManualResetTimer(events.Events, metaclass=ClasspropertySupport):
         for handler in list(self.elapsed):
             self.elapsed -= handler
 
-        # Stop the thread
-        if self._running:
-            self._running.clear()  # set our "mutable boolean" to False
-            self._thread = None
-            self._timer_cancel.set()
-            self._timer_start.set()
-
     # Work around https://github.com/pyeve/events/issues/17
     def __getattr__(self, name: str) -> Any:
         if name in self.__events__:
@@ -3,6 +3,7 @@
 """Implementation of SerializedTagWithAggregates."""
 
 import datetime
+import sys
 
 from nisystemlink.clients import tag as tbase
 from typing_extensions import final
@@ -15,8 +16,21 @@ class SerializedTagWithAggregates:
 
     Clients typically do not interact with this instances of this class directly. Use a
     :class:`.TagValueReader` instead.
+
+    Instances are immutable, don't have a ``__dict__``, and share interned tag paths.
     """
 
+    __slots__ = [
+        "_path",
+        "_data_type",
+        "_value",
+        "_timestamp",
+        "_count",
+        "_min",
+        "_max",
+        "_mean",
+    ]
+
     def __init_subclass__(cls) -> None:
         raise TypeError(
             "type 'SerializedTagWithAggregates' is not an acceptable base type"
@@ -51,7 +65,7 @@ class SerializedTagWithAggregates:
             mean: The mean value of the tag, or None if the tag is not collecting
                 aggregates or the data type of the tag does not track a mean value.
         """
-        self._path = path
+        self._path = sys.intern(path)
         self._data_type = data_type
         self._value = value
         self._timestamp = timestamp
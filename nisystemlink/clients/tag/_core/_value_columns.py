@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""Bulk decoding of serialized tag values into pandas DataFrames."""
+
+import datetime
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+import pandas as pd
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
+    SerializedTagWithAggregates,
+)
+
+_NUMERIC_DTYPES = {
+    tbase.DataType.DOUBLE: (float, np.float64),
+    tbase.DataType.INT32: (int, np.int32),
+    tbase.DataType.UINT64: (int, np.uint64),
+}
+
+_NULLABLE_DTYPES = {
+    tbase.DataType.INT32: "Int32",
+    tbase.DataType.UINT64: "UInt64",
+}
+
+
+def values_to_data_frames(
+    values: Iterable[SerializedTagWithAggregates],
+) -> Dict[tbase.DataType, pd.DataFrame]:
+    """Decode serialized tag values into one DataFrame per data type.
+
+    Each DataFrame is indexed by tag path and has ``value``, ``timestamp``, and
+    ``count`` columns. Numeric data types also have ``min``, ``max``, and ``mean``
+    columns. Values are decoded a column at a time. Times are ``datetime64[us, UTC]``,
+    and missing timestamps and aggregates are ``NaT``, ``NaN``, or ``<NA>``. Values of
+    tags with an unknown data type, or without a value, are skipped.
+
+    Args:
+        values: The serialized values to decode.
+
+    Returns:
+        A DataFrame for each data type that has at least one value.
+
+    Raises:
+        ValueError: if a value can't be decoded as its tag's data type.
+    """
+    # Collect the fields of each data type's values in a single pass
+    groups: Dict[tbase.DataType, _Columns] = {}
+    for value in values:
+        data_type = value.data_type
+        if value.value is None or data_type == tbase.DataType.UNKNOWN:
+            continue
+        columns = groups.get(data_type)
+        if columns is None:
+            columns = groups[data_type] = _Columns()
+        columns.paths.append(value.path)
+        columns.values.append(value.value)
+        columns.timestamps.append(value.timestamp)
+        columns.counts.append(value.count)
+        columns.mins.append(value.min)
+        columns.maxs.append(value.max)
+        columns.means.append(value.mean)
+
+    return {
+        data_type: columns.to_data_frame(data_type)
+        for data_type, columns in groups.items()
+    }
+
+
+class _Columns:
+    """The fields of the values of a single data type."""
+
+    def __init__(self) -> None:
+        self.paths: List[str] = []
+        self.values: List[str] = []
+        self.timestamps: List[datetime.datetime | None] = []
+        self.counts: List[int | None] = []
+        self.mins: List[str | None] = []
+        self.maxs: List[str | None] = []
+        self.means: List[float | None] = []
+
+    def to_data_frame(self, data_type: tbase.DataType) -> pd.DataFrame:
+        columns = {
+            "value": _decode(data_type, self.values),
+            "timestamp": _timestamps(self.timestamps),
+            "count": pd.array(self.counts, dtype="Int64"),
+        }
+        if data_type in _NUMERIC_DTYPES:
+            columns["min"] = _decode(data_type, self.mins)
+            columns["max"] = _decode(data_type, self.maxs)
+            columns["mean"] = np.array(self.means, dtype=np.float64)
+        return pd.DataFrame(
+            columns, index=pd.Index(self.paths, name="path", dtype=object)
+        )
+
+
+def _decode(data_type: tbase.DataType, strings: Sequence[str | None]) -> object:
+    missing = np.array([s is None for s in strings], dtype=bool)
+
+    if data_type in _NUMERIC_DTYPES:
+        parse, dtype = _NUMERIC_DTYPES[data_type]
+        column = np.fromiter(
+            map(parse, (s if s is not None else "0" for s in strings)),
+            dtype,
+            len(strings),
+        )
+        if not missing.any():
+            return column
+        if data_type == tbase.DataType.DOUBLE:
+            column[missing] = np.nan
+            return column
+        nullable = pd.array(column, dtype=_NULLABLE_DTYPES[data_type])
+        nullable[missing] = pd.NA
+        return nullable
+
+    if data_type == tbase.DataType.BOOLEAN:
+        strings_array = np.array(strings, dtype=object)
+        column = strings_array == "True"
+        if not np.all(column | (strings_array == "False") | missing):
+            raise ValueError("Boolean tag values must be 'True' or 'False'")
+        if not missing.any():
+            return column
+        nullable = pd.array(column, dtype="boolean")
+        nullable[missing] = pd.NA
+        return nullable
+
+    if data_type == tbase.DataType.DATE_TIME:
+        times = str_to_datetime64(s if s is not None else "NaTZ" for s in strings)
+        return pd.DatetimeIndex(times).tz_localize(datetime.timezone.utc)
+
+    return np.array(strings, dtype=object)
+
+
+def _timestamps(timestamps: Sequence[datetime.datetime | None]) -> pd.DatetimeIndex:
+    # Naive timestamps are UTC, as in TimestampUtilities.datetime_to_str
+    return pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True)).as_unit("us")
+
+
+def str_to_datetime64(timestamps: Iterable[str]) -> np.ndarray:
+    """Parse SystemLink-formatted timestamp strings into a NumPy array.
+
+    Args:
+        timestamps: The timestamps to parse, in the standard format used in
+            SystemLink.
+
+    Returns:
+        A ``datetime64[us]`` array of the UTC times. Digits beyond microseconds
+        are truncated.
+
+    Raises:
+        ValueError: if a timestamp format is not as expected
+    """
+    values = []
+    for timestamp in timestamps:
+        if not timestamp.endswith("Z"):
+            raise ValueError(
+                "Given timestamp doesn't end with 'Z': '{}'".format(timestamp)
+            )
+        values.append(timestamp[:-1])
+    return np.array(values, dtype="datetime64[us]")
+
+
+def datetime64_to_str(values: np.ndarray) -> List[str]:
+    """Convert a NumPy array of UTC times into string timestamps in the standard
+    format used in SystemLink.
+
+    The strings match those returned by
+    :meth:`TimestampUtilities.datetime_to_str()` for the same times.
+
+    Args:
+        values: A ``datetime64`` array of UTC times.
+
+    Returns:
+        The string representations of the timestamps.
+
+    Raises:
+        ValueError: if ``values`` contains ``NaT``.
+    """
+    values = np.asarray(values, dtype="datetime64[us]")
+    if np.isnat(values).any():
+        raise ValueError("values cannot contain NaT")
+    return [
+        value[:-7] + "Z" if value.endswith(".000000") else value + "Z"
+        for value in np.datetime_as_string(values, unit="us").tolist()
+    ]
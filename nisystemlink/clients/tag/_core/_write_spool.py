@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of WriteSpool."""
+
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import deque
+from typing import Deque, NamedTuple, Sequence, Tuple
+
+from nisystemlink.clients import tag as tbase
+from typing_extensions import final
+
+# Each record is a header followed by the payload. The length is written last, so that
+# a record whose length is zero (the fill of a new segment) marks the end of a segment.
+_HEADER = struct.Struct("<IIIB")  # length, write count, crc32 of payload, state
+_PENDING = 0
+_SENT = 1
+
+_SEGMENT_NAME = re.compile(r"^(\d{20})\.spool$")
+
+
+class SpooledRecord(NamedTuple):
+    """A record read from a :class:`WriteSpool`, to be passed back to
+    :meth:`WriteSpool.commit()` once it's been sent.
+    """
+
+    segment: "_Segment"
+    offset: int
+    end: int
+    data: bytes
+    writes: int
+
+
+@final
+class WriteSpool:
+    """An append-only, disk-backed queue of serialized tag writes.
+
+    Records are stored in memory-mapped segment files in a directory, so that a
+    backlog of writes is held by the operating system's page cache instead of the
+    process's memory. Segments are deleted once all of their records are sent. Records
+    that weren't sent when the spool was closed are sent by the next spool that uses
+    the same directory.
+
+    Records are written to the memory maps without flushing them to disk, so they
+    survive the process exiting but may be lost if the system stops. :meth:`flush()`
+    flushes them.
+    """
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'WriteSpool' is not an acceptable base type")
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        *,
+        segment_size: int = 4 * 1024 * 1024,
+        max_size: int = 256 * 1024 * 1024,
+    ) -> None:
+        """Open a spool, recovering any unsent records in ``directory``.
+
+        Args:
+            directory: The directory to keep the segment files in. It's created if it
+                doesn't exist. Only one spool may use a directory at a time.
+            segment_size: The size of each segment file, in bytes. Records larger than
+                a segment get a segment of their own.
+            max_size: The maximum total size of the segment files, in bytes.
+
+        Raises:
+            ValueError: if ``segment_size`` is less than one.
+            ValueError: if ``max_size`` is less than ``segment_size``.
+            OSError: if the directory or its segment files can't be accessed.
+        """
+        if segment_size < 1:
+            raise ValueError("segment_size cannot be 0 or negative")
+        if max_size < segment_size:
+            raise ValueError("max_size cannot be less than segment_size")
+
+        self._directory = os.fspath(directory)
+        self._segment_size = segment_size
+        self._max_size = max_size
+        self._condition = threading.Condition()
+        self._segments: Deque[_Segment] = deque()
+        self._size = 0
+        self._pending_records = 0
+        self._closed = False
+        self._interrupted = False
+
+        os.makedirs(self._directory, exist_ok=True)
+        ids = sorted(
+            int(match.group(1))
+            for match in map(_SEGMENT_NAME.match, os.listdir(self._directory))
+            if match
+        )
+        for id in ids:
+            path = self._segment_path(id)
+            if os.path.getsize(path) == 0:
+                os.remove(path)  # the process stopped while creating the segment
+                continue
+            segment = _Segment.recover(path, id)
+            self._segments.append(segment)
+            self._size += segment.size
+            self._pending_records += segment.pending_records
+        self._next_id = ids[-1] + 1 if ids else 0
+        self._delete_sent_segments()
+
+    @property
+    def size(self) -> int:  # noqa: D401
+        """The total size of the segment files, in bytes."""
+        return self._size
+
+    @property
+    def pending_records(self) -> int:  # noqa: D401
+        """The number of records that haven't been sent."""
+        return self._pending_records
+
+    @property
+    def has_room(self) -> bool:  # noqa: D401
+        """Whether a new segment can be added without exceeding the maximum size."""
+        with self._condition:
+            return self._has_room_while_locked()
+
+    def wait_for_room(self, timeout: float | None = None) -> bool:
+        """Wait until :attr:`has_room` is True or the spool is closed.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait
+                indefinitely.
+
+        Returns:
+            Whether there is room in the spool.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._closed or self._has_room_while_locked(), timeout
+            )
+            return not self._closed and self._has_room_while_locked()
+
+    def append(
+        self,
+        records: Sequence[Tuple[bytes, int]],
+        queue_full_policy: tbase.QueueFullPolicy | None,
+    ) -> int:
+        """Add records to the end of the spool.
+
+        Args:
+            records: The records to add, as ``(data, count)`` tuples, where ``count`` is
+                the number of tag writes in ``data``.
+            queue_full_policy: What to do when there isn't room for a record, or None
+                to add the records even if the spool exceeds its maximum size.
+
+        Returns:
+            The number of tag writes discarded to make room.
+
+        Raises:
+            BufferError: if there isn't room for all of the records and
+                ``queue_full_policy`` is :attr:`QueueFullPolicy.RAISE`. None of the
+                records are added.
+            ReferenceError: if the spool was closed.
+        """
+        dropped = 0
+        with self._condition:
+            if queue_full_policy == tbase.QueueFullPolicy.RAISE and not self._fits(
+                records
+            ):
+                raise BufferError("The tag write spool is full")
+            for data, count in records:
+                dropped += self._append_while_locked(data, count, queue_full_policy)
+            self._condition.notify_all()
+        return dropped
+
+    def wait_for_record(self, timeout: float | None = None) -> SpooledRecord | None:
+        """Wait for the oldest unsent record.
+
+        Returns the same record until it is passed to :meth:`commit()`.
+
+        Args:
+            timeout: The maximum number of seconds to wait, or None to wait until a
+                record is available or the spool is closed.
+
+        Returns:
+            The record, or None if the spool was closed, the timeout expired, or the
+            wait was interrupted.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._pending_records or self._closed or self._interrupted,
+                timeout,
+            )
+            if self._interrupted:
+                self._interrupted = False
+                return None
+            if self._closed or not self._pending_records:
+                return None
+            for segment in self._segments:
+                record = segment.peek()
+                if record is not None:
+                    return record
+            assert False, "pending records weren't found"
+
+    def commit(self, record: SpooledRecord) -> None:
+        """Mark a record returned by :meth:`wait_for_record()` as sent.
+
+        Does nothing if the record's segment was discarded to make room.
+
+        Args:
+            record: The record that was sent.
+        """
+        with self._condition:
+            if record.segment.closed:
+                return
+            record.segment.mark_sent(record)
+            self._pending_records -= 1
+            self._delete_sent_segments()
+            self._condition.notify_all()
+
+    def interrupt(self) -> None:
+        """Make the current or next call to :meth:`wait_for_record()` return None."""
+        with self._condition:
+            self._interrupted = True
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Flush the records to disk."""
+        with self._condition:
+            for segment in self._segments:
+                segment.flush()
+
+    def close(self) -> None:
+        """Flush and close the segment files, keeping unsent records for the next spool
+        that uses the same directory.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            for segment in self._segments:
+                segment.close()
+            self._segments.clear()
+            self._condition.notify_all()
+
+    def _append_while_locked(
+        self, data: bytes, count: int, queue_full_policy: tbase.QueueFullPolicy | None
+    ) -> int:
+        if self._closed:
+            raise ReferenceError("WriteSpool")
+
+        needed = _HEADER.size + len(data)
+        writable = self._segments[-1] if self._segments else None
+        if writable is not None and writable.writable and writable.room >= needed:
+            writable.append(data, count)
+            self._pending_records += 1
+            return 0
+
+        if writable is not None:
+            writable.seal()
+            self._delete_sent_segments()
+
+        size = max(self._segment_size, needed)
+        dropped = 0
+        while (
+            queue_full_policy is not None
+            and self._size + size > self._max_size
+            and self._segments
+        ):
+            if queue_full_policy == tbase.QueueFullPolicy.RAISE:
+                raise BufferError("The tag write spool is full")
+            elif queue_full_policy == tbase.QueueFullPolicy.DROP_OLDEST:
+                segment = self._segments.popleft()
+                dropped += segment.pending_writes
+                self._pending_records -= segment.pending_records
+                self._delete(segment)
+            else:
+                self._condition.wait()
+                if self._closed:
+                    raise ReferenceError("WriteSpool")
+
+        segment = _Segment.create(
+            self._segment_path(self._next_id), self._next_id, size
+        )
+        self._next_id += 1
+        self._segments.append(segment)
+        self._size += segment.size
+        segment.append(data, count)
+        self._pending_records += 1
+        return dropped
+
+    def _has_room_while_locked(self) -> bool:
+        # Segments whose records have all been sent are deleted to make room
+        return (
+            not self._pending_records
+            or self._size + self._segment_size <= self._max_size
+        )
+
+    def _fits(self, records: Sequence[Tuple[bytes, int]]) -> bool:
+        """Return whether the records can be added without discarding any."""
+        writable = self._segments[-1] if self._segments else None
+        room = writable.room if writable is not None and writable.writable else 0
+        size = self._size
+        for data, _ in records:
+            needed = _HEADER.size + len(data)
+            if needed > room:
+                segment_size = max(self._segment_size, needed)
+                size += segment_size
+                if size > self._max_size:
+                    return False
+                room = segment_size
+            room -= needed
+        return True
+
+    def _delete_sent_segments(self) -> None:
+        while (
+            self._segments
+            and not self._segments[0].writable
+            and not self._segments[0].pending_records
+        ):
+            self._delete(self._segments.popleft())
+
+    def _delete(self, segment: "_Segment") -> None:
+        self._size -= segment.size
+        segment.close()
+        os.remove(segment.path)
+
+    def _segment_path(self, id: int) -> str:
+        return os.path.join(self._directory, "{:020d}.spool".format(id))
+
+
+class _Segment:
+    """A memory-mapped segment file of a :class:`WriteSpool`."""
+
+    def __init__(self, path: str, id: int, file_map: mmap.mmap) -> None:
+        self.path = path
+        self.id = id
+        self.size = len(file_map)
+        self.writable = True
+        self.closed = False
+        self.pending_records = 0
+        self.pending_writes = 0
+        self._map = file_map
+        self._read_offset = 0
+        self._write_offset = 0
+
+    @classmethod
+    def create(cls, path: str, id: int, size: int) -> "_Segment":
+        with open(path, "w+b") as file:
+            file.truncate(size)
+            return cls(path, id, mmap.mmap(file.fileno(), size))
+
+    @classmethod
+    def recover(cls, path: str, id: int) -> "_Segment":
+        with open(path, "r+b") as file:
+            segment = cls(path, id, mmap.mmap(file.fileno(), 0))
+        # Only append to new segments, so that a torn record can't be overwritten
+        segment.writable = False
+
+        offset = 0
+        while offset + _HEADER.size <= segment.size:
+            length, count, crc, state = _HEADER.unpack_from(segment._map, offset)
+            end = offset + _HEADER.size + length
+            if length == 0 or end > segment.size:
+                break
+            if zlib.crc32(segment._map[offset + _HEADER.size : end]) != crc:
+                break  # the process stopped while writing the record
+            if state == _PENDING:
+                if segment.pending_records == 0:
+                    segment._read_offset = offset
+                segment.pending_records += 1
+                segment.pending_writes += count
+            offset = end
+        if segment.pending_records == 0:
+            segment._read_offset = offset
+        segment._write_offset = offset
+        return segment
+
+    @property
+    def room(self) -> int:  # noqa: D401
+        """The number of bytes left in the segment."""
+        return self.size - self._write_offset
+
+    def append(self, data: bytes, count: int) -> None:
+        offset = self._write_offset
+        start = offset + _HEADER.size
+        end = start + len(data)
+        self._map[start:end] = data
+        self._map[offset:start] = _HEADER.pack(
+            len(data), count, zlib.crc32(data), _PENDING
+        )
+        self._write_offset = end
+        self.pending_records += 1
+        self.pending_writes += count
+
+    def peek(self) -> SpooledRecord | None:
+        offset = self._read_offset
+        while self.pending_records and offset < self._write_offset:
+            length, count, _, state = _HEADER.unpack_from(self._map, offset)
+            start = offset + _HEADER.size
+            end = start + length
+            if state == _PENDING:
+                self._read_offset = offset
+                return SpooledRecord(self, offset, end, self._map[start:end], count)
+            offset = end
+        return None
+
+    def mark_sent(self, record: SpooledRecord) -> None:
+        # The state is the last byte of the header
+        self._map[record.offset + _HEADER.size - 1] = _SENT
+        self._read_offset = record.end
+        self.pending_records -= 1
+        self.pending_writes -= record.writes
+
+    def seal(self) -> None:
+        """Stop appending to the segment, and flush it."""
+        self.writable = False
+        self.flush()
+
+    def flush(self) -> None:
+        if not self.closed:
+            self._map.flush()
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._map.flush()
+            self._map.close()
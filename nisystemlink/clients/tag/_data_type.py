@@ -60,7 +60,7 @@ class DataType(enum.Enum):
 
     @classmethod
     def from_api_name(cls, name: str) -> "DataType":
-        return cls(_FROM_API_NAME.get(name, cls.UNKNOWN))
+        return _FROM_API_NAME.get(name, cls.UNKNOWN)
 
 
 _API_NAME = {
@@ -2,20 +2,31 @@
 
 """Implementation of HttpBufferedTagWriter."""
 
+import asyncio
 import datetime
-from collections import OrderedDict
-from typing import Any, Dict
+import json
+import re
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Dict, List, Mapping, Pattern, Sequence, Tuple
 
-from nisystemlink.clients import tag as tbase
+from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient
 from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
+from nisystemlink.clients.tag._buffered_tag_writer import _is_rejection
+from nisystemlink.clients.tag._core._async_manual_reset_timer import (
+    AsyncManualResetTimer,
+)
 from nisystemlink.clients.tag._core._itime_stamper import ITimeStamper
 from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+from nisystemlink.clients.tag._core._write_spool import WriteSpool
 from typing_extensions import final
 
 
 @final
 class HttpBufferedTagWriter(tbase.BufferedTagWriter):
+    _MAX_SEND_ATTEMPTS = 3
+
     def __init_subclass__(cls) -> None:
         raise TypeError("type 'HttpBufferedTagWriter' is not an acceptable base type")
 
@@ -24,17 +35,78 @@ class HttpBufferedTagWriter(tbase.BufferedTagWriter):
         client: HttpClient,
         stamper: ITimeStamper,
         buffer_size: int,
-        flush_timer: ManualResetTimer,
+        flush_timer: ManualResetTimer | AsyncManualResetTimer,
+        *,
+        send_queue_size: int | None = None,
+        queue_full_policy: tbase.QueueFullPolicy = tbase.QueueFullPolicy.BLOCK,
+        keep_last: int | None = None,
+        keep_last_by_path: Mapping[str, int] | None = None,
+        max_paths_per_request: int | None = None,
+        max_bytes_per_request: int | None = None,
+        max_concurrent_requests: int = 4,
+        spool: WriteSpool | None = None,
     ) -> None:
-        super().__init__(stamper, buffer_size, flush_timer)
+        if max_paths_per_request is not None and max_paths_per_request < 1:
+            raise ValueError("max_paths_per_request cannot be 0 or negative")
+        if max_bytes_per_request is not None and max_bytes_per_request < 1:
+            raise ValueError("max_bytes_per_request cannot be 0 or negative")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests cannot be 0 or negative")
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last cannot be 0 or negative")
+        patterns: List[Tuple[Pattern[str], int]] = []
+        for pattern, count in (keep_last_by_path or {}).items():
+            if count < 1:
+                raise ValueError("keep_last_by_path counts cannot be 0 or negative")
+            regex = ".*".join(
+                re.escape(part)
+                for part in tbase.TagPathUtilities.validate_query(pattern).split("*")
+            )
+            patterns.append((re.compile(regex), count))
+
+        super().__init__(
+            stamper,
+            buffer_size,
+            flush_timer,
+            send_queue_size=send_queue_size,
+            queue_full_policy=queue_full_policy,
+            spool=spool,
+        )
         self._api = client.at_uri("/nitag/v2")
         self._buffer: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._keep_last = keep_last
+        self._keep_last_patterns = patterns
+        self._keep_last_by_path: Dict[str, int | None] = {}
+        self._max_paths_per_request = max_paths_per_request
+        self._max_bytes_per_request = max_bytes_per_request
+        self._max_concurrent_requests = max_concurrent_requests
+        self._executor: ThreadPoolExecutor | None = None
+        self._send_attempts: Dict[str, int] = {}
 
     def _buffer_value(self, path: str, value: Dict[str, Any]) -> None:
         if path not in self._buffer:
-            self._buffer.setdefault(path, {"path": path, "updates": []})
+            keep_last = self._get_keep_last(path)
+            self._buffer[path] = {
+                "path": path,
+                "updates": [] if keep_last is None else deque(maxlen=keep_last),
+            }
         self._buffer[path]["updates"].append(value)
 
+    def _get_keep_last(self, path: str) -> int | None:
+        """Return the number of values to keep for ``path``, or None to keep all."""
+        try:
+            return self._keep_last_by_path[path]
+        except KeyError:
+            pass
+
+        keep_last = self._keep_last
+        for pattern, count in self._keep_last_patterns:
+            if pattern.fullmatch(path):
+                keep_last = count
+                break
+        self._keep_last_by_path[path] = keep_last
+        return keep_last
+
     def _clear_buffer(self) -> None:
         self._buffer.clear()
 
@@ -55,10 +127,190 @@ class HttpBufferedTagWriter(tbase.BufferedTagWriter):
             item["timestamp"] = TimestampUtilities.datetime_to_str(timestamp)
         return item
 
+    def _prepend_buffer(self, updates: List[Dict[str, Any]]) -> None:
+        buffer: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        for item in updates:
+            path = item["path"]
+            keep_last = self._get_keep_last(path)
+            values: Any = [] if keep_last is None else deque(maxlen=keep_last)
+            values.extend(item["updates"])
+            buffer[path] = {"path": path, "updates": values}
+        for path, item in self._buffer.items():
+            if path in buffer:
+                buffer[path]["updates"].extend(item["updates"])
+            else:
+                buffer[path] = item
+        self._buffer = buffer
+
+    def _dispose(self) -> None:
+        super()._dispose()
+        if self._executor is not None:
+            self._executor.shutdown()
+
     def _send_writes(self, updates: Dict[str, Dict[str, Any]]) -> None:
-        self._api.post("/update-current-values", data=list(updates.values()))
+        chunks = self._split(self._serialize(updates))
+        if len(chunks) == 1:
+            try:
+                self._api.post("/update-current-values", data=chunks[0])
+            except Exception as ex:
+                self._handle_chunk_errors(chunks, [ex])
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrent_requests,
+                thread_name_prefix="HttpBufferedTagWriter",
+            )
+        futures = [
+            self._executor.submit(self._api.post, "/update-current-values", data=chunk)
+            for chunk in chunks
+        ]
+        self._handle_chunk_errors(chunks, [future.exception() for future in futures])
 
     async def _send_writes_async(self, updates: Dict[str, Any]) -> None:
-        await self._api.as_async.post(
-            "/update-current-values", data=list(updates.values())
+        chunks = self._split(self._serialize(updates))
+        if len(chunks) == 1:
+            try:
+                await self._api.as_async.post("/update-current-values", data=chunks[0])
+            except Exception as ex:
+                self._handle_chunk_errors(chunks, [ex])
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+
+        async def send(chunk: List[Dict[str, Any]]) -> Any:
+            async with semaphore:
+                return await self._api.as_async.post(
+                    "/update-current-values", data=chunk
+                )
+
+        sends: List[Awaitable[Any]] = [send(chunk) for chunk in chunks]
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        self._handle_chunk_errors(
+            chunks,
+            [result if isinstance(result, Exception) else None for result in results],
+        )
+
+    def _spool_records(
+        self, updates: Dict[str, Dict[str, Any]]
+    ) -> List[Tuple[bytes, int]]:
+        # Each record is the body of one request, so a failed request is retried alone
+        return [
+            (
+                json.dumps(chunk).encode(),
+                sum(len(item["updates"]) for item in chunk),
+            )
+            for chunk in self._split(self._serialize(updates))
+        ]
+
+    def _send_spooled(self, data: bytes) -> None:
+        self._api.post("/update-current-values", data=json.loads(data))
+
+    def _handle_chunk_errors(
+        self,
+        chunks: Sequence[List[Dict[str, Any]]],
+        errors: Sequence[BaseException | None],
+    ) -> None:
+        """Buffer the writes of the chunks that failed to send again, and raise an
+        error summarizing the failures.
+
+        Writes the server rejected, and writes that have already failed to send
+        :attr:`_MAX_SEND_ATTEMPTS` times, are discarded and counted in
+        :attr:`dropped_writes` instead.
+
+        Args:
+            chunks: The chunks that were sent.
+            errors: The error raised when sending each chunk, or None if it was sent.
+
+        Raises:
+            ApiException: if any chunk failed to send.
+        """
+        retry: List[Dict[str, Any]] = []
+        dropped = 0
+        with self._lock:
+            for chunk, error in zip(chunks, errors):
+                for item in chunk:
+                    path = item["path"]
+                    if error is None:
+                        self._send_attempts.pop(path, None)
+                        continue
+                    attempts = self._send_attempts.get(path, 0) + 1
+                    if (
+                        isinstance(error, Exception) and _is_rejection(error)
+                    ) or attempts >= self._MAX_SEND_ATTEMPTS:
+                        self._send_attempts.pop(path, None)
+                        dropped += len(item["updates"])
+                    else:
+                        self._send_attempts[path] = attempts
+                        retry.append(item)
+            if retry:
+                self._requeue_while_locked(
+                    retry, sum(len(item["updates"]) for item in retry)
+                )
+            self._dropped_writes += dropped
+
+        failed = sum(error is not None for error in errors)
+        if not failed:
+            return
+
+        first_error = next(error for error in errors if error is not None)
+        api_error = first_error if isinstance(first_error, core.ApiException) else None
+        raise core.ApiException(
+            "{} of {} requests to update tag values failed. {} writes have been "
+            "buffered to be sent again, and {} writes were discarded.".format(
+                failed,
+                len(chunks),
+                sum(len(item["updates"]) for item in retry),
+                dropped,
+            ),
+            error=api_error.error if api_error else None,
+            http_status_code=api_error.http_status_code if api_error else None,
+            inner=first_error if isinstance(first_error, Exception) else None,
         )
+
+    def _split(self, items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split serialized writes into the chunks to send in separate requests.
+
+        All of the writes to a tag are sent in the same request, so that they're applied
+        in order.
+
+        Args:
+            items: The writes to send, grouped by tag.
+
+        Returns:
+            The chunks to send.
+        """
+        max_paths = self._max_paths_per_request
+        max_bytes = self._max_bytes_per_request
+        if max_paths is None and max_bytes is None:
+            return [items]
+
+        chunks: List[List[Dict[str, Any]]] = []
+        chunk: List[Dict[str, Any]] = []
+        chunk_bytes = 1  # The opening bracket of the list
+        for item in items:
+            # Each item is followed by a comma or the closing bracket of the list.
+            item_bytes = len(json.dumps(item)) + 1 if max_bytes is not None else 0
+            if chunk and (
+                (max_paths is not None and len(chunk) >= max_paths)
+                or (max_bytes is not None and chunk_bytes + item_bytes > max_bytes)
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_bytes = 1
+            chunk.append(item)
+            chunk_bytes += item_bytes
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def _serialize(updates: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            (
+                item
+                if isinstance(item["updates"], list)
+                else {"path": item["path"], "updates": list(item["updates"])}
+            )
+            for item in updates.values()
+        ]
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of HttpShardedTagSelection."""
+
+import asyncio
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.core._internal._http_client import HttpClient
+from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
+    SerializedTagWithAggregates,
+)
+from nisystemlink.clients.tag._http._http_tag_selection import HttpTagSelection
+from nisystemlink.clients.tag._http._http_tag_subscription import HttpTagSubscription
+from typing_extensions import final
+
+T = TypeVar("T")
+
+
+@final
+class HttpShardedTagSelection(tbase.TagSelection):
+    """A :class:`TagSelection` that splits its paths across multiple server-side
+    selections, which are read concurrently.
+    """
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'HttpShardedTagSelection' is not an acceptable base type")
+
+    def __init__(
+        self,
+        client: HttpClient,
+        tags: Sequence[tbase.TagData],
+        shard_size: int,
+        *,
+        max_concurrency: int = 4,
+        timer_scheduler: tbase.TimerScheduler | None = None,
+        _paths: Sequence[str] | None = None
+    ) -> None:
+        """Initialize a selection using existing data.
+
+        Args:
+            client: The HTTP client object for communicating with the server.
+            tags: The tags to store in the selection.
+            shard_size: The maximum number of paths in each server-side selection.
+            max_concurrency: The maximum number of server-side selections to read at
+                once.
+            timer_scheduler: The scheduler for the timers of subscriptions created
+                from the selection, or None to use the process-wide default scheduler.
+
+        Raises:
+            ValueError: if ``tags`` contains tags that are None or have invalid paths.
+            ValueError: if ``tags`` contains duplicate tags.
+            ValueError: if ``tags`` is None.
+            ValueError: if ``shard_size`` or ``max_concurrency`` is less than one.
+        """
+        super().__init__(tags, _paths)
+        self._client = client
+        self._timer_scheduler = timer_scheduler
+        self._shards: List[HttpTagSelection] = []
+        self._shards_stale = True
+        self._executor: ThreadPoolExecutor | None = None
+
+        if shard_size < 1:
+            raise ValueError("shard_size cannot be 0 or negative")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency cannot be 0 or negative")
+        self._shard_size = shard_size
+        self._max_concurrency = max_concurrency
+
+    @classmethod
+    def open(
+        cls,
+        client: HttpClient,
+        paths: Sequence[str],
+        shard_size: int,
+        *,
+        max_concurrency: int = 4,
+        timer_scheduler: tbase.TimerScheduler | None = None
+    ) -> "HttpShardedTagSelection":
+        """Initialize a selection using queried data.
+
+        Args:
+            client: The HTTP client object for communicating with the server.
+            paths: The paths used in the query.
+            shard_size: The maximum number of paths in each server-side selection.
+            max_concurrency: The maximum number of server-side selections to read at
+                once.
+            timer_scheduler: The scheduler for the timers of subscriptions created
+                from the selection, or None to use the process-wide default scheduler.
+
+        Returns:
+            The created selection.
+
+        Raises:
+            ValueError: if ``paths`` is None.
+            ValueError: if ``paths`` contains duplicate paths.
+            ValueError: if ``shard_size`` or ``max_concurrency`` is less than one.
+            ApiException: if the API call fails.
+        """
+        if paths is None:
+            raise ValueError("paths cannot be None")
+
+        selection = HttpShardedTagSelection(
+            client,
+            [],
+            shard_size,
+            max_concurrency=max_concurrency,
+            timer_scheduler=timer_scheduler,
+            _paths=cls._validate_paths(list(paths)),
+        )
+        try:
+            selection.refresh_metadata()
+        except BaseException:
+            selection.close()
+            raise
+        return selection
+
+    @classmethod
+    async def open_async(
+        cls,
+        client: HttpClient,
+        paths: Sequence[str],
+        shard_size: int,
+        *,
+        max_concurrency: int = 4,
+        timer_scheduler: tbase.TimerScheduler | None = None
+    ) -> "HttpShardedTagSelection":
+        """Asynchronously initialize a selection using queried data.
+
+        Args:
+            client: The HTTP client object for communicating with the server.
+            paths: The paths used in the query.
+            shard_size: The maximum number of paths in each server-side selection.
+            max_concurrency: The maximum number of server-side selections to read at
+                once.
+            timer_scheduler: The scheduler for the timers of subscriptions created
+                from the selection, or None to use the process-wide default scheduler.
+
+        Returns:
+            A task representing the asynchronous operation. On completion, contains the
+            created selection.
+
+        Raises:
+            ValueError: if ``paths`` is None.
+            ValueError: if ``paths`` contains duplicate paths.
+            ValueError: if ``shard_size`` or ``max_concurrency`` is less than one.
+            ApiException: if the API call fails.
+        """
+        if paths is None:
+            raise ValueError("paths cannot be None")
+
+        selection = HttpShardedTagSelection(
+            client,
+            [],
+            shard_size,
+            max_concurrency=max_concurrency,
+            timer_scheduler=timer_scheduler,
+            _paths=cls._validate_paths(list(paths)),
+        )
+        try:
+            await selection.refresh_metadata_async()
+        except BaseException:
+            await selection.close_async()
+            raise
+        return selection
+
+    def _on_paths_changed(self) -> None:
+        self._shards_stale = True
+
+    def _close_internal(self) -> None:
+        for shard in self._shards:
+            shard.close()
+        self._shards.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _close_internal_async(self) -> None:
+        await asyncio.gather(*[shard.close_async() for shard in self._shards])
+        self._shards.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _create_subscription_internal(
+        self,
+        update_interval: datetime.timedelta | None = None,
+        max_update_interval: datetime.timedelta | None = None,
+    ) -> tbase.TagSubscription:
+        return HttpTagSubscription.create_for_selection(
+            self._client,
+            self,
+            update_interval,
+            timer_scheduler=self._timer_scheduler,
+            max_update_interval=max_update_interval,
+        )
+
+    async def _create_subscription_internal_async(
+        self,
+        update_interval: datetime.timedelta | None = None,
+        max_update_interval: datetime.timedelta | None = None,
+    ) -> tbase.TagSubscription:
+        return await HttpTagSubscription.create_for_selection_async(
+            self._client,
+            self,
+            update_interval,
+            timer_scheduler=self._timer_scheduler,
+            max_update_interval=max_update_interval,
+        )
+
+    def _delete_tags_from_server_internal(self) -> None:
+        self._call_shards(lambda shard: shard._delete_tags_from_server_internal())
+
+    async def _delete_tags_from_server_internal_async(self) -> None:
+        await self._call_shards_async(
+            lambda shard: shard._delete_tags_from_server_internal_async()
+        )
+
+    def _read_tag_metadata(self) -> List[tbase.TagData]:
+        results = self._call_shards(lambda shard: shard._read_tag_metadata())
+        return [tag for result in results for tag in result]
+
+    async def _read_tag_metadata_async(self) -> List[tbase.TagData]:
+        results = await self._call_shards_async(
+            lambda shard: shard._read_tag_metadata_async()
+        )
+        return [tag for result in results for tag in result]
+
+    def _read_tag_values(self) -> List[SerializedTagWithAggregates | None]:
+        results = self._call_shards(lambda shard: shard._read_tag_values())
+        return [value for result in results for value in result]
+
+    async def _read_tag_values_async(
+        self,
+    ) -> List[SerializedTagWithAggregates | None]:
+        results = await self._call_shards_async(
+            lambda shard: shard._read_tag_values_async()
+        )
+        return [value for result in results for value in result]
+
+    def _read_changed_tag_values(
+        self, previous: Dict[str, SerializedTagWithAggregates]
+    ) -> List[SerializedTagWithAggregates | None]:
+        results = self._call_shards(
+            lambda shard: shard._read_changed_tag_values(previous)
+        )
+        return [value for result in results for value in result]
+
+    async def _read_changed_tag_values_async(
+        self, previous: Dict[str, SerializedTagWithAggregates]
+    ) -> List[SerializedTagWithAggregates | None]:
+        results = await self._call_shards_async(
+            lambda shard: shard._read_changed_tag_values_async(previous)
+        )
+        return [value for result in results for value in result]
+
+    def _read_tag_metadata_and_values(
+        self,
+    ) -> Tuple[List[tbase.TagData], List[SerializedTagWithAggregates | None]]:
+        results = self._call_shards(lambda shard: shard._read_tag_metadata_and_values())
+        return self._merge_metadata_and_values(results)
+
+    async def _read_tag_metadata_and_values_async(
+        self,
+    ) -> Tuple[List[tbase.TagData], List[SerializedTagWithAggregates | None]]:
+        results = await self._call_shards_async(
+            lambda shard: shard._read_tag_metadata_and_values_async()
+        )
+        return self._merge_metadata_and_values(results)
+
+    def _reset_aggregates_internal(self) -> None:
+        self._call_shards(lambda shard: shard._reset_aggregates_internal())
+
+    async def _reset_aggregates_internal_async(self) -> None:
+        await self._call_shards_async(
+            lambda shard: shard._reset_aggregates_internal_async()
+        )
+
+    @staticmethod
+    def _merge_metadata_and_values(
+        results: List[
+            Tuple[List[tbase.TagData], List[SerializedTagWithAggregates | None]]
+        ],
+    ) -> Tuple[List[tbase.TagData], List[SerializedTagWithAggregates | None]]:
+        return (
+            [tag for metadata, _ in results for tag in metadata],
+            [value for _, values in results for value in values],
+        )
+
+    def _assign_shards(self) -> List[HttpTagSelection]:
+        """Split the selection's paths into shards, reusing existing shards.
+
+        Returns:
+            The shards that are no longer needed, which must be closed.
+        """
+        if not self._shards_stale:
+            return []
+
+        paths = sorted(self._paths)
+        chunks = [
+            paths[i : i + self._shard_size]
+            for i in range(0, len(paths), self._shard_size)
+        ]
+        removed = self._shards[len(chunks) :]
+        del self._shards[len(chunks) :]
+        for i, chunk in enumerate(chunks):
+            if i == len(self._shards):
+                self._shards.append(HttpTagSelection(self._client, [], _paths=chunk))
+            elif sorted(self._shards[i].paths) != chunk:
+                self._shards[i].clear_tags()
+                self._shards[i].open_tags(chunk)
+        self._shards_stale = False
+        return removed
+
+    def _call_shards(self, fn: Callable[[HttpTagSelection], T]) -> List[T]:
+        for shard in self._assign_shards():
+            shard.close()
+        timings = [datetime.timedelta(0)] * len(self._shards)
+
+        def call(index: int) -> T:
+            start = time.perf_counter()
+            try:
+                return fn(self._shards[index])
+            finally:
+                timings[index] = datetime.timedelta(seconds=time.perf_counter() - start)
+
+        indices = range(len(self._shards))
+        if len(self._shards) > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    thread_name_prefix="HttpShardedTagSelection",
+                )
+            results = list(self._executor.map(call, indices))
+        else:
+            results = [call(i) for i in indices]
+        self._shard_timings = timings
+        return results
+
+    async def _call_shards_async(
+        self, fn: Callable[[HttpTagSelection], Awaitable[T]]
+    ) -> List[T]:
+        await asyncio.gather(*[shard.close_async() for shard in self._assign_shards()])
+        timings = [datetime.timedelta(0)] * len(self._shards)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def call(index: int) -> Any:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    return await fn(self._shards[index])
+                finally:
+                    timings[index] = datetime.timedelta(
+                        seconds=time.perf_counter() - start
+                    )
+
+        results = await asyncio.gather(*[call(i) for i in range(len(self._shards))])
+        self._shard_timings = timings
+        return list(results)
@@ -26,11 +26,13 @@ class HttpTagQueryResultCollection(tbase.TagQueryResultCollection):
         take: int | None,
         tag_query_result: Dict[str, Any],
         http_response: HttpResponse,
+        *,
+        max_concurrency: int | None = None
     ) -> None:
         first_page, total_count = self.__handle_query_response(
             tag_query_result, http_response
         )
-        super().__init__(first_page, total_count, skip)
+        super().__init__(first_page, total_count, skip, max_concurrency=max_concurrency)
 
         api = client.at_uri("/nitag/v2")
         base_params = {
@@ -3,12 +3,11 @@
 """Implementation of HttpTagSelection."""
 
 import datetime
-from typing import Any, Awaitable, Callable, List, Sequence, Tuple, TypeVar
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple, TypeVar
 
 from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient, HttpResponse
 from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
-from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
     SerializedTagWithAggregates,
 )
@@ -28,6 +27,7 @@ class HttpTagSelection(tbase.TagSelection):
         client: HttpClient,
         tags: Sequence[tbase.TagData],
         *,
+        timer_scheduler: tbase.TimerScheduler | None = None,
         _paths: Sequence[str] | None = None
     ) -> None:
         """Initialize a selection using existing data.
@@ -35,6 +35,8 @@ class HttpTagSelection(tbase.TagSelection):
         Args:
             client: The HTTP client object for communicating with the server.
             tags: The tags to store in the selection.
+            timer_scheduler: The scheduler for the timers of subscriptions created
+                from the selection, or None to use the process-wide default scheduler.
 
         Raises:
             ValueError: if ``tags`` contains tags that are None or have invalid paths.
@@ -43,17 +45,28 @@ class HttpTagSelection(tbase.TagSelection):
         """
         super().__init__(tags, _paths)
         self._client = client
+        self._timer_scheduler = timer_scheduler
         self._api = client.at_uri("/nitag/v2/selections")
         self._selection_stale = False
         self._token = None  # str | None
+        # The last serialized value read for each tag, and the value decoded from it
+        self._serialized_values: Dict[str, Tuple[Any, SerializedTagWithAggregates]] = {}
 
     @classmethod
-    def open(cls, client: HttpClient, paths: Sequence[str]) -> "HttpTagSelection":
+    def open(
+        cls,
+        client: HttpClient,
+        paths: Sequence[str],
+        *,
+        timer_scheduler: tbase.TimerScheduler | None = None
+    ) -> "HttpTagSelection":
         """Initialize a selection using queried data.
 
         Args:
             client: The HTTP client object for communicating with the server.
             paths: The paths used in the query.
+            timer_scheduler: The scheduler for the timers of subscriptions created
+                from the selection, or None to use the process-wide default scheduler.
 
         Returns:
             The created selection.
@@ -79,7 +92,10 @@ class HttpTagSelection(tbase.TagSelection):
                 raise tbase.TagManager.invalid_response(http_response)
 
             selection = HttpTagSelection(
-                client, [tbase.TagData.from_json_dict(t) for t in tags], _paths=paths
+                client,
+                [tbase.TagData.from_json_dict(t) for t in tags],
+                timer_scheduler=timer_scheduler,
+                _paths=paths,
             )
             selection._token = token
             return selection
@@ -93,13 +109,19 @@ class HttpTagSelection(tbase.TagSelection):
 
     @classmethod
     async def open_async(
-        cls, client: HttpClient, paths: Sequence[str]
+        cls,
+        client: HttpClient,
+        paths: Sequence[str],
+        *,
+        timer_scheduler: tbase.TimerScheduler | None = None
     ) -> "HttpTagSelection":
         """Asynchronously initialize a selection using queried data.
 
         Args:
             client: The HTTP client object for communicating with the server.
             paths: The paths used in the query.
+            timer_scheduler: The scheduler for the timers of subscriptions created
+                from the selection, or None to use the process-wide default scheduler.
 
         Returns:
             A task representing the asynchronous operation. On completion, contains the
@@ -126,7 +148,10 @@ class HttpTagSelection(tbase.TagSelection):
                 raise tbase.TagManager.invalid_response(http_response)
 
             selection = HttpTagSelection(
-                client, [tbase.TagData.from_json_dict(t) for t in tags], _paths=paths
+                client,
+                [tbase.TagData.from_json_dict(t) for t in tags],
+                timer_scheduler=timer_scheduler,
+                _paths=paths,
             )
             selection._token = token
             return selection
@@ -160,25 +185,29 @@ class HttpTagSelection(tbase.TagSelection):
             pass
 
     def _create_subscription_internal(
-        self, update_interval: datetime.timedelta | None = None
+        self,
+        update_interval: datetime.timedelta | None = None,
+        max_update_interval: datetime.timedelta | None = None,
     ) -> tbase.TagSubscription:
-        update_timer: ManualResetTimer | None = None
-        if update_interval is not None:
-            update_timer = ManualResetTimer(update_interval)
-        paths = set(self.paths).union(self.metadata.keys())
-        return HttpTagSubscription.create(
-            self._client, paths, update_timer, heartbeat_timer=None
+        return HttpTagSubscription.create_for_selection(
+            self._client,
+            self,
+            update_interval,
+            timer_scheduler=self._timer_scheduler,
+            max_update_interval=max_update_interval,
         )
 
     async def _create_subscription_internal_async(
-        self, update_interval: datetime.timedelta | None = None
+        self,
+        update_interval: datetime.timedelta | None = None,
+        max_update_interval: datetime.timedelta | None = None,
     ) -> tbase.TagSubscription:
-        update_timer: ManualResetTimer | None = None
-        if update_interval is not None:
-            update_timer = ManualResetTimer(update_interval)
-        paths = set(self.paths).union(self.metadata.keys())
-        return await HttpTagSubscription.create_async(
-            self._client, paths, update_timer, heartbeat_timer=None
+        return await HttpTagSubscription.create_for_selection_async(
+            self._client,
+            self,
+            update_interval,
+            timer_scheduler=self._timer_scheduler,
+            max_update_interval=max_update_interval,
         )
 
     def _delete_tags_from_server_internal(self) -> None:
@@ -231,8 +260,53 @@ class HttpTagSelection(tbase.TagSelection):
         response, http_response = await self._ensure_selection_and_call_async(fn)
         return self._handle_read_tags_values(response, http_response)
 
-    def _handle_read_tags_values(
+    def _read_changed_tag_values(
+        self, previous: Dict[str, SerializedTagWithAggregates]
+    ) -> List[SerializedTagWithAggregates | None]:
+        def fn(token: str) -> Tuple[Any, HttpResponse]:
+            return self._api.get("/{id}/values", params={"id": token})
+
+        response, http_response = self._ensure_selection_and_call(fn)
+        return self._handle_read_changed_tag_values(response, http_response, previous)
+
+    async def _read_changed_tag_values_async(
+        self, previous: Dict[str, SerializedTagWithAggregates]
+    ) -> List[SerializedTagWithAggregates | None]:
+        def fn(token: str) -> Awaitable[Tuple[Any, HttpResponse]]:
+            return self._api.as_async.get("/{id}/values", params={"id": token})
+
+        response, http_response = await self._ensure_selection_and_call_async(fn)
+        return self._handle_read_changed_tag_values(response, http_response, previous)
+
+    def _handle_read_changed_tag_values(
         self,
+        response: List[Any],
+        http_response: HttpResponse,
+        previous: Dict[str, SerializedTagWithAggregates],
+    ) -> List[SerializedTagWithAggregates | None]:
+        if response is None or any(t is None for t in response):
+            raise tbase.TagManager.invalid_response(http_response)
+
+        serialized_values = {}
+        result: List[SerializedTagWithAggregates | None] = []
+        for t in response:
+            path = t.get("path")
+            last = self._serialized_values.get(path)
+            # Only reuse the decoded value if it's still the caller's current value,
+            # since a full refresh may have replaced it without going through here
+            if last is not None and last[0] == t and previous.get(path) is last[1]:
+                value: SerializedTagWithAggregates | None = last[1]
+            else:
+                value = self._handle_read_tags_values([t], http_response)[0]
+            if value is not None:
+                serialized_values[value.path] = (t, value)
+            result.append(value)
+
+        self._serialized_values = serialized_values
+        return result
+
+    @staticmethod
+    def _handle_read_tags_values(
         response: List[Any],
         http_response: HttpResponse,
         paths: List[str] | None = None,
@@ -2,9 +2,11 @@
 
 """Implementation of HttpTagSubscription."""
 
+import asyncio
 import datetime
+import traceback
 import weakref
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient
@@ -18,11 +20,15 @@ from nisystemlink.clients.tag._core._serialized_tag_with_aggregates_reader impor
 )
 from typing_extensions import final
 
+_Change = Tuple[tbase.TagData, tbase.TagValueReader | None]
+
 
 @final
 class HttpTagSubscription(tbase.TagSubscription):
     _DEFAULT_POLLING_INTERVAL_MILLISECONDS = 5000.0
 
+    _MAX_QUEUED_CHANGES = 16
+
     __MAGIC = object()
 
     def __init_subclass__(cls) -> None:
@@ -35,6 +41,9 @@ class HttpTagSubscription(tbase.TagSubscription):
         paths: Iterable[str],
         update_timer: ManualResetTimer | None = None,
         heartbeat_timer: ManualResetTimer | None = None,
+        *,
+        timer_scheduler: tbase.TimerScheduler | None = None,
+        max_update_interval: datetime.timedelta | None = None,
     ) -> "HttpTagSubscription":
         """Create an :class:`HttpTagSubscription` with a custom heartbeat timer for testing purposes.
 
@@ -45,16 +54,31 @@ class HttpTagSubscription(tbase.TagSubscription):
                 a default timer.
             heartbeat_timer: A timer for sending a heartbeat to keep the subscription
                 alive, or None to use a default timer.
+            timer_scheduler: The scheduler for the default timers, or None to use the
+                process-wide default scheduler.
+            max_update_interval: The longest time to wait between polls for updates,
+                or None to always poll at the interval of ``update_timer``. When given,
+                the interval doubles after each poll that finds no updates, up to this
+                maximum, and returns to the interval of ``update_timer`` as soon as a
+                poll finds updates.
 
         Returns:
             The created subscription.
 
         Raises:
             ValueError: if ``paths`` is None.
+            ValueError: if ``max_update_interval`` is less than the interval of
+                ``update_timer``.
             ApiException: if the API call fails.
         """
         subscription = HttpTagSubscription(
-            cls.__MAGIC, client, paths, update_timer, heartbeat_timer
+            cls.__MAGIC,
+            client,
+            paths,
+            update_timer,
+            heartbeat_timer,
+            timer_scheduler=timer_scheduler,
+            max_update_interval=max_update_interval,
         )
         subscription._initialize()
         return subscription
@@ -66,6 +90,9 @@ class HttpTagSubscription(tbase.TagSubscription):
         paths: Iterable[str],
         update_timer: ManualResetTimer | None = None,
         heartbeat_timer: ManualResetTimer | None = None,
+        *,
+        timer_scheduler: tbase.TimerScheduler | None = None,
+        max_update_interval: datetime.timedelta | None = None,
     ) -> "HttpTagSubscription":
         """Asynchronously create an :class:`HttpTagSubscription` with a custom heartbeat timer for testing purposes.
 
@@ -76,6 +103,13 @@ class HttpTagSubscription(tbase.TagSubscription):
                 a default timer.
             heartbeat_timer: A timer for sending a heartbeat to keep the subscription
                 alive, or None to use a default timer.
+            timer_scheduler: The scheduler for the default timers, or None to use the
+                process-wide default scheduler.
+            max_update_interval: The longest time to wait between polls for updates,
+                or None to always poll at the interval of ``update_timer``. When given,
+                the interval doubles after each poll that finds no updates, up to this
+                maximum, and returns to the interval of ``update_timer`` as soon as a
+                poll finds updates.
 
         Returns:
             A task representing the asynchronous operation. On completion, contains the
@@ -83,14 +117,113 @@ class HttpTagSubscription(tbase.TagSubscription):
 
         Raises:
             ValueError: if ``paths`` is None.
+            ValueError: if ``max_update_interval`` is less than the interval of
+                ``update_timer``.
             ApiException: if the API call fails.
         """
         subscription = HttpTagSubscription(
-            cls.__MAGIC, client, paths, update_timer, heartbeat_timer
+            cls.__MAGIC,
+            client,
+            paths,
+            update_timer,
+            heartbeat_timer,
+            timer_scheduler=timer_scheduler,
+            max_update_interval=max_update_interval,
         )
         await subscription._initialize_async()
         return subscription
 
+    @classmethod
+    def create_for_selection(
+        cls,
+        client: HttpClient,
+        selection: tbase.TagSelection,
+        update_interval: datetime.timedelta | None = None,
+        *,
+        timer_scheduler: tbase.TimerScheduler | None = None,
+        max_update_interval: datetime.timedelta | None = None,
+    ) -> "HttpTagSubscription":
+        """Create an :class:`HttpTagSubscription` for the paths and tags of a selection.
+
+        Args:
+            client: The HTTP client object for communicating with the server.
+            selection: The selection whose paths and tags to subscribe to.
+            update_interval: How often to poll for updates, or None to use the
+                default interval.
+            timer_scheduler: The scheduler for the timers, or None to use the
+                process-wide default scheduler.
+            max_update_interval: The longest time to wait between polls for updates,
+                or None to always poll at ``update_interval``.
+
+        Returns:
+            The created subscription.
+
+        Raises:
+            ValueError: if ``max_update_interval`` is less than ``update_interval``.
+            ApiException: if the API call fails.
+        """
+        return cls.create(
+            client,
+            cls._selection_paths(selection),
+            cls._selection_update_timer(update_interval, timer_scheduler),
+            heartbeat_timer=None,
+            timer_scheduler=timer_scheduler,
+            max_update_interval=max_update_interval,
+        )
+
+    @classmethod
+    async def create_for_selection_async(
+        cls,
+        client: HttpClient,
+        selection: tbase.TagSelection,
+        update_interval: datetime.timedelta | None = None,
+        *,
+        timer_scheduler: tbase.TimerScheduler | None = None,
+        max_update_interval: datetime.timedelta | None = None,
+    ) -> "HttpTagSubscription":
+        """Asynchronously create an :class:`HttpTagSubscription` for the paths and tags
+        of a selection.
+
+        Args:
+            client: The HTTP client object for communicating with the server.
+            selection: The selection whose paths and tags to subscribe to.
+            update_interval: How often to poll for updates, or None to use the
+                default interval.
+            timer_scheduler: The scheduler for the timers, or None to use the
+                process-wide default scheduler.
+            max_update_interval: The longest time to wait between polls for updates,
+                or None to always poll at ``update_interval``.
+
+        Returns:
+            A task representing the asynchronous operation. On completion, contains the
+            created subscription.
+
+        Raises:
+            ValueError: if ``max_update_interval`` is less than ``update_interval``.
+            ApiException: if the API call fails.
+        """
+        return await cls.create_async(
+            client,
+            cls._selection_paths(selection),
+            cls._selection_update_timer(update_interval, timer_scheduler),
+            heartbeat_timer=None,
+            timer_scheduler=timer_scheduler,
+            max_update_interval=max_update_interval,
+        )
+
+    @staticmethod
+    def _selection_paths(selection: tbase.TagSelection) -> Iterable[str]:
+        return set(selection.paths).union(selection.metadata.keys())
+
+    @staticmethod
+    def _selection_update_timer(
+        update_interval: datetime.timedelta | None,
+        timer_scheduler: tbase.TimerScheduler | None,
+    ) -> ManualResetTimer | None:
+        if update_interval is None:
+            return None
+        return ManualResetTimer(update_interval, timer_scheduler)
+
     def __init__(
         self,
         magic: object,
@@ -98,11 +231,14 @@ class HttpTagSubscription(tbase.TagSubscription):
         paths: Iterable[str],
         update_timer: ManualResetTimer | None = None,
         heartbeat_timer: ManualResetTimer | None = None,
+        *,
+        timer_scheduler: tbase.TimerScheduler | None = None,
+        max_update_interval: datetime.timedelta | None = None,
     ) -> None:
         assert (
             magic is self.__MAGIC
         ), "Do not construct an HttpTagSubscription directly. Use create() instead."
-        super().__init__(paths, heartbeat_timer)
+        super().__init__(paths, heartbeat_timer, timer_scheduler=timer_scheduler)
         self._api = client.at_uri("/nitag/v2/subscriptions")
         if update_timer is not None:
             self._update_timer = update_timer
@@ -110,7 +246,8 @@ class HttpTagSubscription(tbase.TagSubscription):
             self._update_timer = ManualResetTimer(
                 datetime.timedelta(
                     milliseconds=self._DEFAULT_POLLING_INTERVAL_MILLISECONDS
-                )
+                ),
+                timer_scheduler,
             )
             # _exit_stack is instantiated in the base class
             self._exit_stack.enter_context(self._update_timer)
@@ -124,7 +261,24 @@ class HttpTagSubscription(tbase.TagSubscription):
 
         self._update_timer_handler = callback
         self._update_timer.elapsed += self._update_timer_handler
+
+        self._max_update_interval = max_update_interval
+        self._poll_interval: datetime.timedelta | None = None
+        if max_update_interval is not None:
+            self._min_update_interval = self._update_timer.interval or (
+                datetime.timedelta(
+                    milliseconds=self._DEFAULT_POLLING_INTERVAL_MILLISECONDS
+                )
+            )
+            if max_update_interval < self._min_update_interval:
+                raise ValueError(
+                    "max_update_interval cannot be less than the update interval"
+                )
+            self._poll_interval = self._min_update_interval
         self._token: str | None = None
+        self._changes: "asyncio.Queue[List[_Change] | None] | None" = None
+        self._poll_loop: asyncio.AbstractEventLoop | None = None
+        self._poll_task: "asyncio.Task[None] | None" = None
 
     # Base class implementation is sufficient:
     #   def __enter__(self):
@@ -136,6 +290,7 @@ class HttpTagSubscription(tbase.TagSubscription):
         if self._token is None:
             return
 
+        self._stop_polling()
         try:
             self._update_timer.stop()
             self._update_timer.elapsed -= self._update_timer_handler
@@ -148,6 +303,7 @@ class HttpTagSubscription(tbase.TagSubscription):
         if self._token is None:
             return
 
+        await self._stop_polling_async()
         try:
             self._update_timer.stop()
             self._update_timer.elapsed -= self._update_timer_handler
@@ -172,7 +328,8 @@ class HttpTagSubscription(tbase.TagSubscription):
         # subscription if they want current information.
         self._api.get("/{id}/values/current", params={"id": token})
         self._token = token
-        self._update_timer.start()
+        if self._changes is None:
+            self._update_timer.start()
 
     async def _create_subscription_on_server_async(self, paths: List[str]) -> None:
         response, http_response = await self._api.as_async.post(
@@ -190,7 +347,8 @@ class HttpTagSubscription(tbase.TagSubscription):
         # subscription if they want current information.
         await self._api.as_async.get("/{id}/values/current", params={"id": token})
         self._token = token
-        self._update_timer.start()
+        if self._changes is None:
+            self._update_timer.start()
 
     def _send_heartbeat(self) -> None:
         assert self._token is not None
@@ -199,7 +357,7 @@ class HttpTagSubscription(tbase.TagSubscription):
     def _update_timer_elapsed(self) -> None:
         try:
             token = self._token
-            if token is None:
+            if token is None or self._changes is not None:
                 return
 
             try:
@@ -209,56 +367,178 @@ class HttpTagSubscription(tbase.TagSubscription):
             except core.ApiException:
                 return
 
-            if response is None:
-                return
-
-            subscriptions = response.get("subscriptionUpdates")
-            if subscriptions is None:
-                return
+            changes = self._parse_updates(response)
+            self._record_poll(bool(changes))
+            for tag, reader in changes:
+                self._on_tag_changed(tag, reader)
+        finally:
+            if self._changes is None:
+                self._update_timer.start(self._poll_interval)
 
-            for subscription in subscriptions:
-                if subscription is None:
+    async def _get_changes_internal_async(
+        self,
+    ) -> List[_Change]:
+        if self._changes is None:
+            # Stop polling on the update timer, so that every change is delivered by
+            # the polling task.
+            self._changes = asyncio.Queue(self._MAX_QUEUED_CHANGES)
+            self._update_timer.stop()
+            self._poll_loop = asyncio.get_running_loop()
+            self._poll_task = self._poll_loop.create_task(self._poll_async())
+
+        changes = await self._changes.get()
+        if changes is None:
+            # Closed. Leave the marker for any other waiters.
+            _put_closed_marker(self._changes)
+            return []
+        return changes
+
+    async def _poll_async(self) -> None:
+        queue = self._changes
+        assert queue is not None
+        interval = self._update_timer.interval or datetime.timedelta(
+            milliseconds=self._DEFAULT_POLLING_INTERVAL_MILLISECONDS
+        )
+        try:
+            while True:
+                await asyncio.sleep((self._poll_interval or interval).total_seconds())
+                token = self._token
+                if token is None:
                     continue
 
-                updates = subscription.get("updates")
-                if updates is None:
+                try:
+                    response, _ = await self._api.as_async.get(
+                        "/{id}/values/current", params={"id": token}
+                    )
+                except core.ApiException:
                     continue
 
-                for update in updates:
-                    if update is None:
-                        continue
-
-                    tag = update.get("tag")
-                    timestamp = update.get("timestamp")
-                    if tag is None or timestamp is None:
-                        continue
-
-                    tag = tbase.TagData.from_json_dict(tag)
+                changes = self._parse_updates(response)
+                self._record_poll(bool(changes))
+                for tag, reader in changes:
                     try:
-                        tag.validate_path()
-                    except ValueError:
-                        continue
-                    aggregates = update.get("aggregates") or {}
-                    if tag.data_type == tbase.DataType.UNKNOWN:
-                        self._on_tag_changed(tag, None)
-                    else:
-                        value = SerializedTagWithAggregates(
-                            tag.path,
-                            tag.data_type,
-                            update.get("value"),
-                            TimestampUtilities.str_to_datetime(timestamp),
-                            aggregates.get("count"),
-                            aggregates.get("min"),
-                            aggregates.get("max"),
-                            (
-                                float(aggregates["avg"])
-                                if aggregates.get("avg") is not None
-                                else None
-                            ),
-                        )
-                        reader = tbase.TagValueReader(
-                            SerializedTagWithAggregatesReader(value), tag
-                        )  # type: tbase.TagValueReader
-                        self._on_tag_changed(tag, reader)
+                        await self._on_tag_changed_async(tag, reader)
+                    except Exception:
+                        traceback.print_exc()
+                if changes:
+                    # Stop polling while the consumer is behind, rather than holding
+                    # an unbounded number of batches
+                    await queue.put(changes)
         finally:
-            self._update_timer.start()
+            # Wake waiters however polling stops
+            _put_closed_marker(queue)
+
+    def _record_poll(self, found_changes: bool) -> None:
+        if found_changes:
+            self._nonempty_polls += 1
+        else:
+            self._empty_polls += 1
+
+        if self._max_update_interval is None:
+            return
+        assert self._poll_interval is not None
+        if found_changes:
+            self._poll_interval = self._min_update_interval
+        else:
+            self._poll_interval = min(
+                self._poll_interval * 2, self._max_update_interval
+            )
+
+    def _stop_polling(self) -> None:
+        task, self._poll_task = self._poll_task, None
+        if task is None or self._poll_loop is None:
+            return
+        changes = self._changes
+        assert changes is not None
+
+        def stop() -> None:
+            task.cancel()
+            _put_closed_marker(changes)
+
+        try:
+            self._poll_loop.call_soon_threadsafe(stop)
+        except RuntimeError:
+            # The event loop is already closed
+            pass
+
+    async def _stop_polling_async(self) -> None:
+        task = self._poll_task
+        if task is None or self._poll_loop is not asyncio.get_running_loop():
+            self._stop_polling()
+            return
+
+        self._poll_task = None
+        assert self._changes is not None
+        task.cancel()
+        _put_closed_marker(self._changes)
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @staticmethod
+    def _parse_updates(
+        response: Dict[str, Any] | None,
+    ) -> List[_Change]:
+        changes: List[_Change] = []
+        if response is None:
+            return changes
+
+        subscriptions = response.get("subscriptionUpdates")
+        if subscriptions is None:
+            return changes
+
+        for subscription in subscriptions:
+            if subscription is None:
+                continue
+
+            updates = subscription.get("updates")
+            if updates is None:
+                continue
+
+            for update in updates:
+                if update is None:
+                    continue
+
+                tag = update.get("tag")
+                timestamp = update.get("timestamp")
+                if tag is None or timestamp is None:
+                    continue
+
+                tag = tbase.TagData.from_json_dict(tag)
+                try:
+                    tag.validate_path()
+                except ValueError:
+                    continue
+                aggregates = update.get("aggregates") or {}
+                if tag.data_type == tbase.DataType.UNKNOWN:
+                    changes.append((tag, None))
+                else:
+                    value = SerializedTagWithAggregates(
+                        tag.path,
+                        tag.data_type,
+                        update.get("value"),
+                        TimestampUtilities.str_to_datetime(timestamp),
+                        aggregates.get("count"),
+                        aggregates.get("min"),
+                        aggregates.get("max"),
+                        (
+                            float(aggregates["avg"])
+                            if aggregates.get("avg") is not None
+                            else None
+                        ),
+                    )
+                    reader = tbase.TagValueReader(
+                        SerializedTagWithAggregatesReader(value), tag
+                    )  # type: tbase.TagValueReader
+                    changes.append((tag, reader))
+        return changes
+
+
+def _put_closed_marker(changes: "asyncio.Queue[List[_Change] | None]") -> None:
+    """Add the marker that tells waiters the subscription was closed, discarding the
+    oldest batch of changes if the queue is full.
+    """
+    if changes.full():
+        changes.get_nowait()
+    changes.put_nowait(None)
@@ -132,24 +132,7 @@ class ITagReader(_ITagReaderOverloads):
             ApiException: if the API call fails.
         """
         data = self._read(path, include_timestamp, include_aggregates)
-        if data is None or data.value is None:
-            return None
-
-        value = self._deserialize_value(data.value, data.data_type)
-        if value is None:
-            # TODO: Error information
-            raise core.ApiException()
-
-        return tbase.TagWithAggregates(
-            data.path,
-            data.data_type,
-            value,
-            data.timestamp,
-            data.count,
-            self._deserialize_value(data.min, data.data_type),
-            self._deserialize_value(data.max, data.data_type),
-            data.mean,
-        )
+        return self._deserialize_tag(data)
 
     async def read_async(
         self,
@@ -180,24 +163,7 @@ class ITagReader(_ITagReaderOverloads):
             ApiException: if the API call fails.
         """
         data = await self._read_async(path, include_timestamp, include_aggregates)
-        if data is None or data.value is None:
-            return None
-
-        value = self._deserialize_value(data.value, data.data_type)
-        if value is None:
-            # TODO: Error information
-            raise core.ApiException()
-
-        return tbase.TagWithAggregates(
-            data.path,
-            data.data_type,
-            value,
-            data.timestamp,
-            data.count,
-            self._deserialize_value(data.min, data.data_type),
-            self._deserialize_value(data.max, data.data_type),
-            data.mean,
-        )
+        return self._deserialize_tag(data)
 
     @abc.abstractmethod
     def _read(
@@ -257,6 +223,40 @@ class ITagReader(_ITagReaderOverloads):
         """
         ...
 
+    @classmethod
+    def _deserialize_tag(
+        cls, data: SerializedTagWithAggregates | None
+    ) -> tbase.TagWithAggregates | None:
+        """Deserialize a tag's value and aggregates read from the server.
+
+        Args:
+            data: The serialized value, or None if the tag doesn't have a value.
+
+        Returns:
+            The deserialized value, or None if the tag doesn't have a value.
+
+        Raises:
+            ApiException: if the value can't be deserialized.
+        """
+        if data is None or data.value is None:
+            return None
+
+        value = cls._deserialize_value(data.value, data.data_type)
+        if value is None:
+            # TODO: Error information
+            raise core.ApiException()
+
+        return tbase.TagWithAggregates(
+            data.path,
+            data.data_type,
+            value,
+            data.timestamp,
+            data.count,
+            cls._deserialize_value(data.min, data.data_type),
+            cls._deserialize_value(data.max, data.data_type),
+            data.mean,
+        )
+
     @classmethod
     def _deserialize_value(cls, value: str | None, data_type: tbase.DataType) -> Any:
         if value is None:
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of QueueFullPolicy."""
+
+import enum
+
+
+class QueueFullPolicy(enum.Enum):
+    """Represents what a :class:`BufferedTagWriter` does when its buffer fills while its send queue is full."""
+
+    BLOCK = 0
+    """Wait until the background sender takes a batch off of the queue."""
+
+    DROP_OLDEST = 1
+    """Discard the oldest queued batch of writes to make room for the new batch."""
+
+    RAISE = 2
+    """Raise a :class:`BufferError` instead of buffering the write that would fill
+    the buffer.
+    """
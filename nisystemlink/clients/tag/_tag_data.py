@@ -2,6 +2,7 @@
 
 """Implementation of TagData."""
 
+import sys
 from typing import Any, Dict, Iterable, List
 
 from nisystemlink.clients import tag as tbase
@@ -10,7 +11,23 @@ from typing_extensions import final
 
 @final
 class TagData:
-    """Contains the metadata for a SystemLink tag."""
+    """Contains the metadata for a SystemLink tag.
+
+    Instances don't have a ``__dict__``, tag paths are interned, and the
+    :attr:`keywords` list and :attr:`properties` dictionary aren't allocated until
+    they're first used, so that large numbers of tags can be kept in memory cheaply.
+    """
+
+    __slots__ = [
+        "_path",
+        "_data_type",
+        "_keywords",
+        "_properties",
+        "_collect_aggregates",
+        "_retention_type",
+        "_retention_count",
+        "_retention_days",
+    ]
 
     _RETENTION_TYPE_PROP = "nitagRetention"
 
@@ -45,10 +62,10 @@ class TagData:
             keywords: The tag's keywords.
             properties: The tag's properties.
         """
-        self._path = path
+        self._path = sys.intern(path) if path is not None else path
         self._data_type = tbase.DataType.UNKNOWN if data_type is None else data_type
-        self._keywords = list(keywords) if keywords else []
-        self._properties: Dict[str, str] = {}
+        self._keywords: List[str] | None = list(keywords) if keywords else None
+        self._properties: Dict[str, str] | None = None
         self._collect_aggregates = False
         self._retention_type = tbase.RetentionType.NONE
         self._retention_count: int | None = None
@@ -58,11 +75,21 @@ class TagData:
 
     @classmethod
     def from_json_dict(cls, data: Dict[str, Any]) -> "TagData":
-        data_type_str = data.get("type") or "UNKNOWN"
-        data_type = tbase.DataType.from_api_name(data_type_str)
-        tag = cls(data["path"], data_type, data.get("keywords"), data.get("properties"))
-        if data.get("collectAggregates"):
-            tag.collect_aggregates = True
+        # Fill in the slots directly rather than going through __init__, since this is
+        # called for every tag returned by the server.
+        tag = cls.__new__(cls)
+        tag._path = sys.intern(data["path"])
+        tag._data_type = tbase.DataType.from_api_name(data.get("type") or "UNKNOWN")
+        keywords = data.get("keywords")
+        tag._keywords = list(keywords) if keywords else None
+        tag._properties = None
+        tag._collect_aggregates = bool(data.get("collectAggregates"))
+        tag._retention_type = tbase.RetentionType.NONE
+        tag._retention_count = None
+        tag._retention_days = None
+        properties = data.get("properties")
+        if properties:
+            tag.replace_properties(properties)
         return tag
 
     def to_json_dict(self) -> Dict[str, Any]:
@@ -113,6 +140,8 @@ class TagData:
     @property
     def keywords(self) -> List[str]:  # noqa: D401
         """The list of keywords associated with the tag."""
+        if self._keywords is None:
+            self._keywords = []
         return self._keywords
 
     @property
@@ -123,6 +152,8 @@ class TagData:
     @property
     def properties(self) -> Dict[str, str]:  # noqa: D401
         """The properties associated with the tag."""
+        if self._properties is None:
+            self._properties = {}
         return self._properties
 
     @property
@@ -173,7 +204,10 @@ class TagData:
         Args:
             keywords: The tag's new keywords, or None to clear all keywords.
         """
-        self._keywords[:] = keywords
+        if self._keywords is not None:
+            self._keywords[:] = keywords or []
+        elif keywords:
+            self._keywords = list(keywords)
 
     def replace_properties(self, properties: Dict[str, str]) -> None:
         """Replace all of the tag's :attr:`properties` with those in ``properties``.
@@ -181,9 +215,10 @@ class TagData:
         Args:
             properties: The tag's new properties, or None to clear all properties.
         """
-        self._properties.clear()
+        if self._properties is not None:
+            self._properties.clear()
 
-        if properties is None:
+        if not properties:
             return
 
         for key, value in properties.items():
@@ -211,7 +246,7 @@ class TagData:
                     self._retention_count = None
             else:
                 # Not a special property. Preserve it in the dictionary.
-                self._properties[key] = value
+                self.properties[key] = value
 
     def _copy_retention_properties(self, destination: Dict[str, str]) -> None:
         """Copy the tag's retention settings into ``destination``.
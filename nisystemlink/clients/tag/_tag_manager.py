@@ -4,22 +4,34 @@
 
 import asyncio
 import datetime
-from typing import Any, Awaitable, Dict, Iterable, List, Sequence, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.core._internal._http_client import HttpClient, HttpResponse
 from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
+from nisystemlink.clients.tag._core._async_manual_reset_timer import (
+    AsyncManualResetTimer,
+)
+from nisystemlink.clients.tag._core._executor_timer_scheduler import (
+    ExecutorTimerScheduler,
+)
 from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
     SerializedTagWithAggregates,
 )
 from nisystemlink.clients.tag._core._system_time_stamper import SystemTimeStamper
+from nisystemlink.clients.tag._core._write_spool import WriteSpool
 from nisystemlink.clients.tag._http._http_async_tag_query_result_collection import (
     HttpAsyncTagQueryResultCollection,
 )
 from nisystemlink.clients.tag._http._http_buffered_tag_writer import (
     HttpBufferedTagWriter,
 )
+from nisystemlink.clients.tag._http._http_sharded_tag_selection import (
+    HttpShardedTagSelection,
+)
 from nisystemlink.clients.tag._http._http_tag_query_result_collection import (
     HttpTagQueryResultCollection,
 )
@@ -27,6 +39,7 @@ from nisystemlink.clients.tag._http._http_tag_selection import HttpTagSelection
 from nisystemlink.clients.tag._http._temporary_tag_selection import (
     TemporaryTagSelection,
 )
+from nisystemlink.clients.tag._tag_metadata_cache import _copy_metadata
 from typing_extensions import final
 
 
@@ -37,12 +50,30 @@ class TagManager(tbase.ITagReader):
     def __init_subclass__(cls) -> None:
         raise TypeError("type 'TagManager' is not an acceptable base type")
 
-    def __init__(self, configuration: core.HttpConfiguration | None = None) -> None:
+    _TIMER_CALLBACK_WORKERS = 4
+
+    def __init__(
+        self,
+        configuration: core.HttpConfiguration | None = None,
+        *,
+        timer_scheduler: tbase.TimerScheduler | None = None,
+        metadata_cache: tbase.TagMetadataCache | None = None,
+    ) -> None:
         """Initialize an instance.
 
         Args:
             configuration: Defines the web server to connect to and information about
                 how to connect.
+            timer_scheduler: The scheduler for the timers of writers, selections, and
+                subscriptions created by the instance, or None to use the process-wide
+                default scheduler. With the default scheduler, the timers' callbacks
+                are called on up to four threads owned by the instance, so that slow
+                requests don't delay the timers of other instances. Use an
+                :class:`AsyncioTimerScheduler` in applications that run an asyncio
+                event loop.
+            metadata_cache: The cache to use for the metadata returned by
+                :meth:`open()` and :meth:`refresh()`, or None to always query the
+                server. The cache may be shared with other instances.
 
         Raises:
             ApiException: if the current system cannot communicate with a SystemLink
@@ -54,13 +85,41 @@ class TagManager(tbase.ITagReader):
 
         self._http_client = HttpClient(configuration)
         self._api = self._http_client.at_uri("/nitag/v2")
+        if timer_scheduler is None:
+            # The threads exit once the instance and everything it created are deleted
+            timer_scheduler = ExecutorTimerScheduler(
+                tbase.TimerScheduler.get_default(),
+                ThreadPoolExecutor(
+                    self._TIMER_CALLBACK_WORKERS,
+                    thread_name_prefix="TagManager-timers",
+                ),
+            )
+        self._timer_scheduler = timer_scheduler
+        self._metadata_cache = metadata_cache
+
+    @property
+    def metadata_cache(self) -> tbase.TagMetadataCache | None:  # noqa: D401
+        """The cache used for tag metadata, or None if metadata isn't cached."""
+        return self._metadata_cache
 
-    def create_selection(self, tags: List[tbase.TagData]) -> tbase.TagSelection:
+    def create_selection(
+        self,
+        tags: List[tbase.TagData],
+        *,
+        shard_size: int | None = None,
+        max_concurrency: int = 4,
+    ) -> tbase.TagSelection:
         """Create an :class:`TagSelection` that initially contains the given ``tags``
         without retrieving any additional data from the server.
 
         Args:
             tags: The tags to include in the selection.
+            shard_size: The maximum number of paths in each server-side selection, or
+                None to use a single server-side selection. Selections with more paths
+                are split into multiple server-side selections that are read
+                concurrently.
+            max_concurrency: The maximum number of server-side selections to read at
+                once. Only used with ``shard_size``.
 
         Returns:
             The created selection.
@@ -68,16 +127,41 @@ class TagManager(tbase.ITagReader):
         Raises:
             ValueError: if any of the given ``tags`` is None or has an invalid path.
             ValueError: if ``tags`` is None.
+            ValueError: if ``shard_size`` or ``max_concurrency`` is less than one.
         """
-        return HttpTagSelection(self._http_client, tags)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency cannot be 0 or negative")
+        if shard_size is not None:
+            return HttpShardedTagSelection(
+                self._http_client,
+                tags,
+                shard_size,
+                max_concurrency=max_concurrency,
+                timer_scheduler=self._timer_scheduler,
+            )
+        return HttpTagSelection(
+            self._http_client, tags, timer_scheduler=self._timer_scheduler
+        )
 
-    def open_selection(self, paths: List[str]) -> tbase.TagSelection:
+    def open_selection(
+        self,
+        paths: List[str],
+        *,
+        shard_size: int | None = None,
+        max_concurrency: int = 4,
+    ) -> tbase.TagSelection:
         """Query the server for the metadata for the given tag ``paths`` and return the
         results in a :class:`TagSelection`.
 
         Args:
             paths: The paths of the tags to include in the selection. May include
                 glob-style wildcards.
+            shard_size: The maximum number of paths in each server-side selection, or
+                None to use a single server-side selection. Selections with more paths
+                are split into multiple server-side selections that are read
+                concurrently.
+            max_concurrency: The maximum number of server-side selections to read at
+                once. Only used with ``shard_size``.
 
         Returns:
             The created selection with :attr:`TagSelection.metadata` containing the
@@ -87,17 +171,42 @@ class TagManager(tbase.ITagReader):
             ValueError: if any of the given ``paths`` is None or invalid.
             ValueError: if ``paths`` contains duplicate paths.
             ValueError: if ``paths`` is None.
+            ValueError: if ``shard_size`` or ``max_concurrency`` is less than one.
             ApiException: if the API call fails.
         """
-        return HttpTagSelection.open(self._http_client, paths)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency cannot be 0 or negative")
+        if shard_size is not None:
+            return HttpShardedTagSelection.open(
+                self._http_client,
+                paths,
+                shard_size,
+                max_concurrency=max_concurrency,
+                timer_scheduler=self._timer_scheduler,
+            )
+        return HttpTagSelection.open(
+            self._http_client, paths, timer_scheduler=self._timer_scheduler
+        )
 
-    def open_selection_async(self, paths: List[str]) -> Awaitable[tbase.TagSelection]:
+    def open_selection_async(
+        self,
+        paths: List[str],
+        *,
+        shard_size: int | None = None,
+        max_concurrency: int = 4,
+    ) -> Awaitable[tbase.TagSelection]:
         """Asynchronously query the server for the metadata for the given tag ``paths``
         and return the results in a :class:`TagSelection`.
 
         Args:
             paths: The paths of the tags to include in the selection. May include
                 glob-style wildcards.
+            shard_size: The maximum number of paths in each server-side selection, or
+                None to use a single server-side selection. Selections with more paths
+                are split into multiple server-side selections that are read
+                concurrently.
+            max_concurrency: The maximum number of server-side selections to read at
+                once. Only used with ``shard_size``.
 
         Returns:
             A task representing the asynchronous operation. On success, contains the
@@ -108,16 +217,29 @@ class TagManager(tbase.ITagReader):
             ValueError: if any of the given ``paths`` is None or invalid.
             ValueError: if ``paths`` contains duplicate paths.
             ValueError: if ``paths`` is None.
+            ValueError: if ``shard_size`` or ``max_concurrency`` is less than one.
             ApiException: if the API call fails.
         """
-        return HttpTagSelection.open_async(self._http_client, paths)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency cannot be 0 or negative")
+        if shard_size is not None:
+            return HttpShardedTagSelection.open_async(
+                self._http_client,
+                paths,
+                shard_size,
+                max_concurrency=max_concurrency,
+                timer_scheduler=self._timer_scheduler,
+            )
+        return HttpTagSelection.open_async(
+            self._http_client, paths, timer_scheduler=self._timer_scheduler
+        )
 
     def open(
         self,
         path: str,
         data_type: tbase.DataType | None = None,
         *,
-        create: bool | None = None
+        create: bool | None = None,
     ) -> tbase.TagData:
         """Query the server for the metadata of a tag, optionally creating it if it doesn't already exist.
 
@@ -151,6 +273,10 @@ class TagManager(tbase.ITagReader):
         if data_type == tbase.DataType.UNKNOWN:
             raise ValueError("Must specify a valid data type")
 
+        cached = self._open_from_cache(path, data_type)
+        if cached is not None:
+            return cached
+
         tag: Dict[str, Any] | None = None
         try:
             tag, _ = self._api.get(
@@ -167,21 +293,21 @@ class TagManager(tbase.ITagReader):
             if data_type is not None and tag["type"] != data_type.api_name:
                 raise core.ApiException("Tag exists with a conflicting data type")
 
-            return tbase.TagData.from_json_dict(tag)
+            return self._cache_opened(tbase.TagData.from_json_dict(tag))
         else:
             if data_type is None:
                 raise ValueError("data_type cannot be None when create is True")
 
             # Tag didn't already exist, so try to create it.
             self._api.post("/tags", data={"type": data_type.api_name, "path": path})
-            return tbase.TagData(path, data_type)
+            return self._cache_opened(tbase.TagData(path, data_type))
 
     async def open_async(
         self,
         path: str,
         data_type: tbase.DataType | None = None,
         *,
-        create: bool | None = None
+        create: bool | None = None,
     ) -> tbase.TagData:
         """Asynchronously query the server for the metadata of a tag, optionally
         creating it if it doesn't already exist.
@@ -214,6 +340,10 @@ class TagManager(tbase.ITagReader):
         if data_type == tbase.DataType.UNKNOWN:
             raise ValueError("Must specify a valid data type")
 
+        cached = self._open_from_cache(path, data_type)
+        if cached is not None:
+            return cached
+
         tag: Dict[str, Any] | None = None
         try:
             tag, _ = await self._api.as_async.get(
@@ -230,7 +360,7 @@ class TagManager(tbase.ITagReader):
             if data_type is not None and tag["type"] != data_type.api_name:
                 raise core.ApiException("Tag exists with a conflicting data type")
 
-            return tbase.TagData.from_json_dict(tag)
+            return self._cache_opened(tbase.TagData.from_json_dict(tag))
         else:
             if data_type is None:
                 raise ValueError("data_type cannot be None when create is True")
@@ -239,7 +369,23 @@ class TagManager(tbase.ITagReader):
             await self._api.as_async.post(
                 "/tags", data={"type": data_type.api_name, "path": path}
             )
-            return tbase.TagData(path, data_type)
+            return self._cache_opened(tbase.TagData(path, data_type))
+
+    def _open_from_cache(
+        self, path: str, data_type: tbase.DataType | None
+    ) -> tbase.TagData | None:
+        if self._metadata_cache is None:
+            return None
+
+        tag = self._metadata_cache.get(tbase.TagPathUtilities.validate(path))
+        if tag is not None and data_type is not None and tag.data_type != data_type:
+            raise core.ApiException("Tag exists with a conflicting data type")
+        return tag
+
+    def _cache_opened(self, tag: tbase.TagData) -> tbase.TagData:
+        if self._metadata_cache is not None:
+            self._metadata_cache.add([tag])
+        return tag
 
     def refresh(self, tags: List[tbase.TagData]) -> None:
         """Populate the given ``tags`` with the latest metadata from the server.
@@ -256,9 +402,13 @@ class TagManager(tbase.ITagReader):
             ValueError: if ``tags`` is None.
             ApiException: if the API call fails.
         """
-        paths = self._prepare_refresh(tags)
+        tags = self._prepare_refresh(tags)
+        if not tags:
+            return
+
         response, http_response = self._api.get(
-            "/tags", params={"path": paths, "take": str(len(tags))}
+            "/tags",
+            params={"path": ",".join(t.path for t in tags), "take": str(len(tags))},
         )
         self._handle_refresh(tags, response, http_response)
 
@@ -280,19 +430,38 @@ class TagManager(tbase.ITagReader):
             ValueError: if ``tags`` is None.
             ApiException: if the API call fails.
         """
-        paths = self._prepare_refresh(tags)
+        tags = self._prepare_refresh(tags)
+        if not tags:
+            return
+
         response, http_response = await self._api.as_async.get(
-            "/tags", params={"path": paths, "take": str(len(tags))}
+            "/tags",
+            params={"path": ",".join(t.path for t in tags), "take": str(len(tags))},
         )
         self._handle_refresh(tags, response, http_response)
 
-    def _prepare_refresh(self, tags: List[tbase.TagData]) -> str:
+    def _prepare_refresh(self, tags: List[tbase.TagData]) -> List[tbase.TagData]:
+        """Validate the tags to refresh, fill in those that are cached, and return the
+        rest.
+        """
         if tags is None:
             raise ValueError("tags cannot be None")
         elif any(t is None for t in tags):
             raise ValueError("Tags cannot contain None")
 
-        return ",".join(t.validate_path() for t in tags)
+        for t in tags:
+            t.validate_path()
+        if self._metadata_cache is None:
+            return tags
+
+        missing = []
+        for t in tags:
+            cached = self._metadata_cache.get(t.path)
+            if cached is not None:
+                _copy_metadata(cached, t)
+            else:
+                missing.append(t)
+        return missing
 
     def _handle_refresh(
         self,
@@ -318,6 +487,11 @@ class TagManager(tbase.ITagReader):
             else:
                 data.data_type = tbase.DataType.UNKNOWN
 
+        if self._metadata_cache is not None:
+            self._metadata_cache.add(
+                t for t in tags if t.data_type != tbase.DataType.UNKNOWN
+            )
+
     def query(
         self,
         paths: Sequence[str] | None = None,
@@ -325,7 +499,8 @@ class TagManager(tbase.ITagReader):
         properties: Dict[str, str] | None = None,
         *,
         skip: int = 0,
-        take: int | None = None
+        take: int | None = None,
+        max_concurrency: int | None = None,
     ) -> tbase.TagQueryResultCollection:
         """Query the server for available tags matching the given criteria.
 
@@ -337,6 +512,8 @@ class TagManager(tbase.ITagReader):
                 None.
             skip: The number of tags to initially skip in the results.
             take: The number of tags to include in each page of results.
+            max_concurrency: The maximum number of pages to request at once when
+                enumerating the results, or None to request one page at a time.
 
         Returns:
             A :class:`TagQueryResultCollection` containing the first page of results.
@@ -345,12 +522,13 @@ class TagManager(tbase.ITagReader):
 
         Raises:
             ValueError: if ``skip`` or ``take`` is negative.
+            ValueError: if ``max_concurrency`` is less than one.
             ValueError: if ``paths`` is an empty list.
             ValueError: if any of ``paths`` are None.
             ApiException: if the API call fails.
         """
         path_str, keyword_str, prop_str = self._prepare_query(
-            paths, keywords, properties, skip, take
+            paths, keywords, properties, skip, take, max_concurrency
         )
         params = {
             "path": path_str,
@@ -372,6 +550,7 @@ class TagManager(tbase.ITagReader):
             take,
             first_page,
             http_response,
+            max_concurrency=max_concurrency,
         )
 
     async def query_async(
@@ -381,7 +560,8 @@ class TagManager(tbase.ITagReader):
         properties: Dict[str, str] | None = None,
         *,
         skip: int = 0,
-        take: int | None = None
+        take: int | None = None,
+        max_concurrency: int | None = None,
     ) -> tbase.AsyncTagQueryResultCollection:
         """Asynchronously query the server for available tags matching the given criteria.
 
@@ -393,6 +573,8 @@ class TagManager(tbase.ITagReader):
                 None.
             skip: The number of tags to initially skip in the results.
             take: The number of tags to include in each page of results.
+            max_concurrency: The maximum number of pages to request at once when
+                moving through the results, or None to request one page at a time.
 
         Returns:
             A task representing the asynchronous operation. On success, contains a
@@ -403,10 +585,11 @@ class TagManager(tbase.ITagReader):
         Raises:
             ValueError: if ``skip`` is negative.
             ValueError: if ``take`` is negative.
+            ValueError: if ``max_concurrency`` is less than one.
             ApiException: if the API call fails.
         """
         path_str, keyword_str, prop_str = self._prepare_query(
-            paths, keywords, properties, skip, take
+            paths, keywords, properties, skip, take, max_concurrency
         )
         params = {
             "path": path_str,
@@ -428,6 +611,7 @@ class TagManager(tbase.ITagReader):
             take,
             first_page,
             http_response,
+            max_concurrency=max_concurrency,
         )
 
     def _prepare_query(
@@ -437,6 +621,7 @@ class TagManager(tbase.ITagReader):
         properties: Dict[str, str] | None,
         skip: int | None,
         take: int | None = None,
+        max_concurrency: int | None = None,
     ) -> Tuple[str | None, str | None, str | None]:
         if paths is not None and len(paths) == 0:
             raise ValueError("paths cannot be empty an empty list")
@@ -446,6 +631,8 @@ class TagManager(tbase.ITagReader):
             raise ValueError("skip cannot be negative")
         if take is not None and take < 0:
             raise ValueError("take cannot be negative")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency cannot be 0 or negative")
 
         path_str = None
         keyword_str = None
@@ -485,9 +672,12 @@ class TagManager(tbase.ITagReader):
             ApiException: if the API call fails.
         """
         tag_models, merge = self._prepare_update(updates)
-        partial_success, _ = self._api.post(
-            "/update-tags", data={"tags": tag_models, "merge": merge}
-        )
+        try:
+            partial_success, _ = self._api.post(
+                "/update-tags", data={"tags": tag_models, "merge": merge}
+            )
+        finally:
+            self._invalidate_cache(u.path for u in updates)
 
         if partial_success is not None:
             err_dict = partial_success.get("error")
@@ -526,9 +716,12 @@ class TagManager(tbase.ITagReader):
             ApiException: if the API call fails.
         """
         tag_models, merge = self._prepare_update(updates)
-        partial_success, _ = await self._api.as_async.post(
-            "/update-tags", data={"tags": tag_models, "merge": merge}
-        )
+        try:
+            partial_success, _ = await self._api.as_async.post(
+                "/update-tags", data={"tags": tag_models, "merge": merge}
+            )
+        finally:
+            self._invalidate_cache(u.path for u in updates)
 
         if partial_success is not None:
             err_dict = partial_success.get("error")
@@ -620,6 +813,12 @@ class TagManager(tbase.ITagReader):
         return self._perform_delete_async(validated_paths)
 
     def _perform_delete(self, paths: List[str]) -> None:
+        try:
+            self._delete(paths)
+        finally:
+            self._invalidate_cache(paths)
+
+    def _delete(self, paths: List[str]) -> None:
         if len(paths) < 4:
             # Few enough to make multiple, single deletes rather than creating a selection.
             exceptions = []
@@ -640,6 +839,12 @@ class TagManager(tbase.ITagReader):
                 self._api.delete("/selections/{id}/tags", params={"id": selection.id})
 
     async def _perform_delete_async(self, paths: List[str]) -> None:
+        try:
+            await self._delete_async(paths)
+        finally:
+            self._invalidate_cache(paths)
+
+    async def _delete_async(self, paths: List[str]) -> None:
         if len(paths) < 4:
             # Few enough to make multiple, single deletes rather than creating a selection.
             await asyncio.gather(
@@ -659,11 +864,106 @@ class TagManager(tbase.ITagReader):
                     "/selections/{id}/tags", params={"id": selection.id}
                 )
 
+    def _invalidate_cache(self, paths: Iterable[str]) -> None:
+        if self._metadata_cache is not None:
+            self._metadata_cache.invalidate(paths)
+
+    def warm_metadata_cache(
+        self,
+        paths: Sequence[str] | None = None,
+        keywords: Iterable[str] | None = None,
+        properties: Dict[str, str] | None = None,
+        *,
+        take: int | None = None,
+    ) -> int:
+        """Query the server for tags matching the given criteria and add every page of
+        results to :attr:`metadata_cache`.
+
+        Args:
+            paths: List of tag paths to include in the result. May include glob-style
+                wildcards.
+            keywords: List of keywords that tags must have, or None.
+            properties: Mapping of properties and their values that tags must have, or
+                None.
+            take: The number of tags to include in each page of results.
+
+        Returns:
+            The number of tags added to the cache.
+
+        Raises:
+            ValueError: if the instance has no :attr:`metadata_cache`.
+            ValueError: if ``take`` is negative.
+            ValueError: if ``paths`` is an empty list.
+            ValueError: if any of ``paths`` are None.
+            ApiException: if the API call fails.
+        """
+        cache = self._require_metadata_cache()
+        count = 0
+        for page in self.query(paths, keywords, properties, take=take):
+            cache.add(page)
+            count += len(page)
+        return count
+
+    async def warm_metadata_cache_async(
+        self,
+        paths: Sequence[str] | None = None,
+        keywords: Iterable[str] | None = None,
+        properties: Dict[str, str] | None = None,
+        *,
+        take: int | None = None,
+    ) -> int:
+        """Asynchronously query the server for tags matching the given criteria and
+        add every page of results to :attr:`metadata_cache`.
+
+        Args:
+            paths: List of tag paths to include in the result. May include glob-style
+                wildcards.
+            keywords: List of keywords that tags must have, or None.
+            properties: Mapping of properties and their values that tags must have, or
+                None.
+            take: The number of tags to include in each page of results.
+
+        Returns:
+            A task representing the asynchronous operation. On success, contains the
+            number of tags added to the cache.
+
+        Raises:
+            ValueError: if the instance has no :attr:`metadata_cache`.
+            ValueError: if ``take`` is negative.
+            ValueError: if ``paths`` is an empty list.
+            ValueError: if any of ``paths`` are None.
+            ApiException: if the API call fails.
+        """
+        cache = self._require_metadata_cache()
+        count = 0
+        results = await self.query_async(paths, keywords, properties, take=take)
+        page = results.current_page
+        while page is not None:
+            cache.add(page)
+            count += len(page)
+            page = await results.move_next_page_async()
+        return count
+
+    def _require_metadata_cache(self) -> tbase.TagMetadataCache:
+        if self._metadata_cache is None:
+            raise ValueError("The TagManager was not created with a metadata_cache")
+        return self._metadata_cache
+
     def create_writer(
         self,
         *,
         buffer_size: int | None = None,
-        max_buffer_time: datetime.timedelta | None = None
+        max_buffer_time: datetime.timedelta | None = None,
+        send_queue_size: int | None = None,
+        queue_full_policy: tbase.QueueFullPolicy = tbase.QueueFullPolicy.BLOCK,
+        keep_last: int | None = None,
+        keep_last_by_path: Mapping[str, int] | None = None,
+        max_paths_per_request: int | None = None,
+        max_bytes_per_request: int | None = None,
+        max_concurrent_requests: int = 4,
+        spool_directory: str | os.PathLike | None = None,
+        max_spool_size: int = 256 * 1024 * 1024,
+        spool_segment_size: int = 4 * 1024 * 1024,
     ) -> tbase.BufferedTagWriter:
         """Create a tag writer that buffers tag values until
         :meth:`~BufferedTagWriter.send_buffered_writes()` is called on the returned
@@ -675,14 +975,166 @@ class TagManager(tbase.ITagReader):
             buffer_size: The maximum number of tag writes to buffer before automatically
                 sending them to the server.
             max_buffer_time: The amount of time before writes are sent.
+            send_queue_size: The maximum number of full buffers waiting to be sent by a
+                background thread, or None to send automatic writes on the thread that
+                triggers them.
+            queue_full_policy: What to do when the buffer fills while the send queue or
+                the spool is full. Only used when ``send_queue_size`` or
+                ``spool_directory`` is given. With a spool,
+                :attr:`QueueFullPolicy.DROP_OLDEST` discards the oldest unsent writes,
+                and :attr:`QueueFullPolicy.RAISE` discards the writes that don't fit.
+                With :attr:`QueueFullPolicy.BLOCK`, writes sent by the
+                ``max_buffer_time`` timer wait in the buffer until there's room, and
+                :meth:`~BufferedTagWriter.send_buffered_writes()` doesn't wait.
+            keep_last: The number of most recent values to keep for each tag between
+                sends, or None to send every value. Older values are discarded as new
+                ones are written, but still count towards ``buffer_size``.
+            keep_last_by_path: The number of most recent values to keep for tags
+                matching each tag path, which may contain ``*`` wildcards. The first
+                matching path is used, and tags that don't match any use ``keep_last``.
+            max_paths_per_request: The maximum number of tags to send in a single
+                request, or None for no limit.
+            max_bytes_per_request: The approximate maximum size of the body of a single
+                request, or None for no limit. All of the values written to a tag are
+                sent in the same request, even if they exceed this size.
+            max_concurrent_requests: The maximum number of requests to send at once
+                when a send is split into multiple requests. If a request fails, an
+                ``ApiException`` is raised and the writes it contained are buffered
+                again, to be sent with the next batch. Writes that the server rejects
+                with a client error, or that fail to send three times, are discarded
+                and counted in ``dropped_writes`` instead.
+            spool_directory: A directory to store writes in until they're sent, or None
+                to keep them in memory. When given, full buffers and writes sent by the
+                ``max_buffer_time`` timer are appended to files in the directory and
+                sent by a background thread, which retries the writes that fail to send
+                until they succeed. Writes that the server rejects with a client error
+                are discarded and counted in ``dropped_writes``. Writes left unsent
+                when the writer is closed are sent by the next writer that uses the
+                directory. Only one writer may use a directory at a time.
+            max_spool_size: The maximum number of bytes of writes to store in
+                ``spool_directory``.
+            spool_segment_size: The size of each file in ``spool_directory``. The space
+                used by sent writes is freed a file at a time.
 
         Returns:
             The created writer. Close the writer to free resources.
 
         Raises:
             ValueError: if ``buffer_size`` and ``max_buffer_time`` are both None.
-            ValueError: if ``buffer_size`` is less than one.
+            ValueError: if ``buffer_size``, ``send_queue_size``, ``keep_last``, a count
+                in ``keep_last_by_path``, ``max_paths_per_request``,
+                ``max_bytes_per_request``, ``max_concurrent_requests``, or
+                ``spool_segment_size`` is less than one.
+            ValueError: if ``max_spool_size`` is less than ``spool_segment_size``.
+            ValueError: if both ``send_queue_size`` and ``spool_directory`` are given.
+            OSError: if ``spool_directory`` can't be accessed.
+        """
+        buffer_size = self._validate_writer_limits(buffer_size, max_buffer_time)
+        if send_queue_size is not None and spool_directory is not None:
+            raise ValueError("send_queue_size and spool_directory cannot both be given")
+        if max_buffer_time is not None:
+            timer = ManualResetTimer(max_buffer_time, self._timer_scheduler)
+        else:
+            timer = ManualResetTimer.null_timer
+
+        spool = None
+        if spool_directory is not None:
+            spool = WriteSpool(
+                spool_directory,
+                segment_size=spool_segment_size,
+                max_size=max_spool_size,
+            )
+        try:
+            return HttpBufferedTagWriter(
+                self._http_client,
+                SystemTimeStamper(),
+                buffer_size,
+                timer,
+                send_queue_size=send_queue_size,
+                queue_full_policy=queue_full_policy,
+                keep_last=keep_last,
+                keep_last_by_path=keep_last_by_path,
+                max_paths_per_request=max_paths_per_request,
+                max_bytes_per_request=max_bytes_per_request,
+                max_concurrent_requests=max_concurrent_requests,
+                spool=spool,
+            )
+        except BaseException:
+            if spool is not None:
+                spool.close()
+            raise
+
+    async def create_writer_async(
+        self,
+        *,
+        buffer_size: int | None = None,
+        max_buffer_time: datetime.timedelta | None = None,
+        keep_last: int | None = None,
+        keep_last_by_path: Mapping[str, int] | None = None,
+        max_paths_per_request: int | None = None,
+        max_bytes_per_request: int | None = None,
+        max_concurrent_requests: int = 4,
+    ) -> tbase.BufferedTagWriter:
+        """Create a tag writer for asyncio applications, like :meth:`create_writer()`,
+        whose ``max_buffer_time`` timer is a task on the running event loop.
+
+        Writes sent by the timer are sent on the event loop using the asynchronous
+        API, so the writer doesn't use any threads as long as it's only used with
+        :meth:`~BufferedTagWriter.write_async()`,
+        :meth:`~BufferedTagWriter.send_buffered_writes_async()`, and ``async with``.
+
+        Args:
+            buffer_size: The maximum number of tag writes to buffer before automatically
+                sending them to the server.
+            max_buffer_time: The amount of time before writes are sent.
+            keep_last: The number of most recent values to keep for each tag between
+                sends, or None to send every value. Older values are discarded as new
+                ones are written, but still count towards ``buffer_size``.
+            keep_last_by_path: The number of most recent values to keep for tags
+                matching each tag path, which may contain ``*`` wildcards. The first
+                matching path is used, and tags that don't match any use ``keep_last``.
+            max_paths_per_request: The maximum number of tags to send in a single
+                request, or None for no limit.
+            max_bytes_per_request: The approximate maximum size of the body of a single
+                request, or None for no limit. All of the values written to a tag are
+                sent in the same request, even if they exceed this size.
+            max_concurrent_requests: The maximum number of requests to send at once
+                when a send is split into multiple requests.
+
+        Returns:
+            A task representing the asynchronous operation. On success, contains the
+            created writer. Close the writer to free resources.
+
+        Raises:
+            ValueError: if ``buffer_size`` and ``max_buffer_time`` are both None.
+            ValueError: if ``buffer_size``, ``keep_last``, a count in
+                ``keep_last_by_path``, ``max_paths_per_request``,
+                ``max_bytes_per_request``, or ``max_concurrent_requests`` is less than
+                one.
         """
+        buffer_size = self._validate_writer_limits(buffer_size, max_buffer_time)
+        timer: ManualResetTimer | AsyncManualResetTimer
+        if max_buffer_time is not None:
+            timer = AsyncManualResetTimer(max_buffer_time)
+        else:
+            timer = ManualResetTimer.null_timer
+
+        return HttpBufferedTagWriter(
+            self._http_client,
+            SystemTimeStamper(),
+            buffer_size,
+            timer,
+            keep_last=keep_last,
+            keep_last_by_path=keep_last_by_path,
+            max_paths_per_request=max_paths_per_request,
+            max_bytes_per_request=max_bytes_per_request,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+
+    def _validate_writer_limits(
+        self, buffer_size: int | None, max_buffer_time: datetime.timedelta | None
+    ) -> int:
+        """Validate the limits of a writer, and return the buffer size to use."""
         if buffer_size is None and max_buffer_time is None:
             raise ValueError("must provide either buffer_size or max_buffer_time")
 
@@ -692,16 +1144,170 @@ class TagManager(tbase.ITagReader):
         else:
             buffer_size = 0
 
-        if max_buffer_time is not None:
-            if max_buffer_time.total_seconds() < 0.001:
-                raise ValueError("max_buffer_time must be at least 1 millisecond")
-            timer = ManualResetTimer(max_buffer_time)
+        if max_buffer_time is not None and max_buffer_time.total_seconds() < 0.001:
+            raise ValueError("max_buffer_time must be at least 1 millisecond")
+
+        return buffer_size
+
+    def read_many(
+        self,
+        paths: Iterable[str],
+        *,
+        include_timestamp: bool = False,
+        include_aggregates: bool = False,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+    ) -> Dict[str, tbase.TagWithAggregates | None]:
+        """Retrieve the current values of many tags from the server.
+
+        The tags are read in chunks of ``chunk_size`` tags, each using a single
+        temporary selection, and up to ``max_concurrency`` chunks are read at once.
+
+        Args:
+            paths: The paths of the tags to read.
+            include_timestamp: True to include the timestamp associated with each value
+                in the result.
+            include_aggregates: True to include the tags' aggregate values in the result
+                if the tags are set to :attr:`TagData.collect_aggregates`.
+            chunk_size: The maximum number of tags to read with a single request.
+            max_concurrency: The maximum number of chunks to read at once.
+
+        Returns:
+            The value of each tag, and the timestamp and/or aggregate values if
+            requested, by path. The value is None if the tag exists but doesn't have a
+            value. Tags that don't exist are omitted.
+
+        Raises:
+            ValueError: if any path is empty, invalid, or None.
+            ValueError: if ``chunk_size`` or ``max_concurrency`` is less than one.
+            ApiException: if the API call fails.
+        """
+        chunks = self._prepare_read_many(paths, chunk_size, max_concurrency)
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(chunks)),
+                thread_name_prefix="TagManager",
+            ) as executor:
+                results = list(executor.map(self._read_chunk, chunks))
         else:
-            timer = ManualResetTimer.null_timer
+            results = [self._read_chunk(chunk) for chunk in chunks]
+        return self._handle_read_many(results, include_timestamp, include_aggregates)
 
-        return HttpBufferedTagWriter(
-            self._http_client, SystemTimeStamper(), buffer_size, timer
+    async def read_many_async(
+        self,
+        paths: Iterable[str],
+        *,
+        include_timestamp: bool = False,
+        include_aggregates: bool = False,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+    ) -> Dict[str, tbase.TagWithAggregates | None]:
+        """Asynchronously retrieve the current values of many tags from the server.
+
+        The tags are read in chunks of ``chunk_size`` tags, each using a single
+        temporary selection, and up to ``max_concurrency`` chunks are read at once.
+
+        Args:
+            paths: The paths of the tags to read.
+            include_timestamp: True to include the timestamp associated with each value
+                in the result.
+            include_aggregates: True to include the tags' aggregate values in the result
+                if the tags are set to :attr:`TagData.collect_aggregates`.
+            chunk_size: The maximum number of tags to read with a single request.
+            max_concurrency: The maximum number of chunks to read at once.
+
+        Returns:
+            A task representing the asynchronous operation. On completion, contains the
+            value of each tag, and the timestamp and/or aggregate values if requested,
+            by path. The value is None if the tag exists but doesn't have a value. Tags
+            that don't exist are omitted.
+
+        Raises:
+            ValueError: if any path is empty, invalid, or None.
+            ValueError: if ``chunk_size`` or ``max_concurrency`` is less than one.
+            ApiException: if the API call fails.
+        """
+        chunks = self._prepare_read_many(paths, chunk_size, max_concurrency)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read_chunk(
+            chunk: List[str],
+        ) -> Dict[str, SerializedTagWithAggregates | None]:
+            async with semaphore:
+                return await self._read_chunk_async(chunk)
+
+        results = await asyncio.gather(*[read_chunk(chunk) for chunk in chunks])
+        return self._handle_read_many(results, include_timestamp, include_aggregates)
+
+    def _prepare_read_many(
+        self, paths: Iterable[str], chunk_size: int, max_concurrency: int
+    ) -> List[List[str]]:
+        if chunk_size < 1:
+            raise ValueError("chunk_size cannot be 0 or negative")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency cannot be 0 or negative")
+        if paths is None:
+            raise ValueError("paths cannot be None")
+
+        validated_paths = list(
+            dict.fromkeys(tbase.TagPathUtilities.validate(p) for p in paths)
         )
+        return [
+            validated_paths[i : i + chunk_size]
+            for i in range(0, len(validated_paths), chunk_size)
+        ]
+
+    def _read_chunk(
+        self, paths: List[str]
+    ) -> Dict[str, SerializedTagWithAggregates | None]:
+        with TemporaryTagSelection.create(self._http_client, paths) as selection:
+            response, http_response = self._api.get(
+                "/selections/{id}/values", params={"id": selection.id}
+            )
+        return self._handle_read_chunk(response, http_response)
+
+    async def _read_chunk_async(
+        self, paths: List[str]
+    ) -> Dict[str, SerializedTagWithAggregates | None]:
+        async with await TemporaryTagSelection.create_async(
+            self._http_client, paths
+        ) as selection:
+            response, http_response = await self._api.as_async.get(
+                "/selections/{id}/values", params={"id": selection.id}
+            )
+        return self._handle_read_chunk(response, http_response)
+
+    def _handle_read_chunk(
+        self, response: List[Any], http_response: HttpResponse
+    ) -> Dict[str, SerializedTagWithAggregates | None]:
+        values = HttpTagSelection._handle_read_tags_values(response, http_response)
+        return {t["path"]: value for t, value in zip(response, values)}
+
+    def _handle_read_many(
+        self,
+        results: Iterable[Dict[str, SerializedTagWithAggregates | None]],
+        include_timestamp: bool,
+        include_aggregates: bool,
+    ) -> Dict[str, tbase.TagWithAggregates | None]:
+        values: Dict[str, tbase.TagWithAggregates | None] = {}
+        for result in results:
+            for path, data in result.items():
+                if data is None:
+                    values[path] = None
+                    continue
+                values[path] = self._deserialize_tag(
+                    SerializedTagWithAggregates(
+                        data.path,
+                        data.data_type,
+                        data.value,
+                        data.timestamp if include_timestamp else None,
+                        data.count if include_aggregates else None,
+                        data.min if include_aggregates else None,
+                        data.max if include_aggregates else None,
+                        data.mean if include_aggregates else None,
+                    )
+                )
+        return values
 
     def _read(
         self, path: str, include_timestamp: bool, include_aggregates: bool
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of TagMetadataCache."""
+
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Tuple
+
+from nisystemlink.clients import tag as tbase
+from typing_extensions import final
+
+
+@final
+class TagMetadataCache:
+    """A bounded cache of tag metadata, keyed by path, that a :class:`TagManager` uses
+    to avoid querying the server for tags it has recently seen.
+
+    Entries expire after a fixed time to live, and the least recently used entries are
+    evicted when the cache is full. A cache may be shared by multiple managers.
+    Updates and deletes made through a manager invalidate the affected entries, but
+    changes made by other clients aren't seen until the entries expire.
+    """
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'TagMetadataCache' is not an acceptable base type")
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: datetime.timedelta = datetime.timedelta(minutes=1),
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: The maximum number of tags to keep.
+            ttl: How long a tag's metadata is kept before it must be read from the
+                server again.
+
+        Raises:
+            ValueError: if ``max_size`` is less than one.
+            ValueError: if ``ttl`` is zero or negative.
+        """
+        if max_size < 1:
+            raise ValueError("max_size cannot be 0 or negative")
+        if ttl <= datetime.timedelta(0):
+            raise ValueError("ttl must be positive")
+
+        self._max_size = max_size
+        self._ttl = ttl.total_seconds()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[float, tbase.TagData]] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def max_size(self) -> int:  # noqa: D401
+        """The maximum number of tags kept in the cache."""
+        return self._max_size
+
+    @property
+    def ttl(self) -> datetime.timedelta:  # noqa: D401
+        """How long a tag's metadata is kept in the cache."""
+        return datetime.timedelta(seconds=self._ttl)
+
+    def get(self, path: str) -> tbase.TagData | None:
+        """Get a copy of the cached metadata for a tag.
+
+        Args:
+            path: The path of the tag.
+
+        Returns:
+            A copy of the tag's metadata, or None if the tag isn't cached or its entry
+            has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            expires, tag = entry
+            if expires <= time.monotonic():
+                del self._entries[path]
+                return None
+            self._entries.move_to_end(path)
+        return _copy(tag)
+
+    def add(self, tags: Iterable[tbase.TagData]) -> None:
+        """Add or replace the cached metadata for one or more tags.
+
+        Args:
+            tags: The tags to cache. The cache keeps copies, so later changes to
+                ``tags`` aren't reflected in the cache.
+        """
+        copies = [_copy(t) for t in tags]
+        with self._lock:
+            expires = time.monotonic() + self._ttl
+            for tag in copies:
+                self._entries[tag.path] = (expires, tag)
+                self._entries.move_to_end(tag.path)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, paths: Iterable[str]) -> None:
+        """Remove one or more tags from the cache.
+
+        Args:
+            paths: The paths of the tags to remove. Paths that aren't cached are
+                ignored.
+        """
+        with self._lock:
+            for path in paths:
+                self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """Remove all tags from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _copy(tag: tbase.TagData) -> tbase.TagData:
+    copy = tbase.TagData(tag.path)
+    _copy_metadata(tag, copy)
+    return copy
+
+
+def _copy_metadata(source: tbase.TagData, destination: tbase.TagData) -> None:
+    destination.data_type = source.data_type
+    destination.replace_keywords(source.keywords)
+    destination.replace_properties(source.properties)
+    destination.collect_aggregates = source.collect_aggregates
+    destination.retention_type = source.retention_type
+    destination.retention_count = source.retention_count
+    destination.retention_days = source.retention_days
@@ -3,7 +3,10 @@
 """Implementation of TagQueryResultCollection."""
 
 import abc
-from typing import Iterable, List
+import itertools
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterator, List
 
 from nisystemlink.clients import core, tag as tbase
 
@@ -12,11 +15,17 @@ class TagQueryResultCollection(abc.ABC):
     """Represents a paginated list of tags returned by a query.
 
     Iterating over the collection makes additional server requests to retrieve pages
-    after the first.
+    after the first. When the collection has a :attr:`max_concurrency`, the remaining
+    pages are requested in parallel, and are still returned in order.
     """
 
     def __init__(
-        self, first_page: List[tbase.TagData], total_count: int, skip: int
+        self,
+        first_page: List[tbase.TagData],
+        total_count: int,
+        skip: int,
+        *,
+        max_concurrency: int | None = None
     ) -> None:
         """Initialize an instance with the first page of query results.
 
@@ -24,7 +33,14 @@ class TagQueryResultCollection(abc.ABC):
             first_page: The first page of results, or None if there are no results.
             total_count: The total number of results in the query.
             skip: The skip used for the first page of results.
+            max_concurrency: The maximum number of pages to request at once, or None
+                to request one page at a time.
+
+        Raises:
+            ValueError: if ``max_concurrency`` is less than one.
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency cannot be 0 or negative")
         self._first_page: List[tbase.TagData] | None = None
         if first_page:
             if skip >= total_count:
@@ -36,14 +52,25 @@ class TagQueryResultCollection(abc.ABC):
             pass  # leave it as None, even if passed in as []
         self._use_cached_page = True
         self._total_count = total_count
+        self._pinned_total_count: int | None = None
         self._skip = skip
+        self._max_concurrency = max_concurrency
+
+    @property
+    def max_concurrency(self) -> int | None:  # noqa: D401
+        """The maximum number of pages requested at once, or None if pages are
+        requested one at a time.
+        """
+        return self._max_concurrency
 
     @property
     def total_count(self) -> int:  # noqa: D401
         """The total number of tags matched by the query at the time the query was made."""
+        if self._pinned_total_count is not None:
+            return self._pinned_total_count
         return self._total_count
 
-    def __iter__(self) -> Iterable[List[tbase.TagData]]:
+    def __iter__(self) -> Iterator[List[tbase.TagData]]:
         """Enumerate over the pages of tag query results.
 
         Calls to ``next(iter())`` may throw :class:`.ApiException`.
@@ -52,6 +79,7 @@ class TagQueryResultCollection(abc.ABC):
             The created enumerator.
         """
         skip = self._skip
+        page_size = 0
 
         if self._use_cached_page:
             self._use_cached_page = False
@@ -62,23 +90,64 @@ class TagQueryResultCollection(abc.ABC):
                 return
 
             skip += len(page)
+            page_size = len(page)
             yield page
 
             if skip >= self._total_count:
                 return
 
         while True:
+            if self._max_concurrency is not None and page_size:
+                # The size of the first page tells us the offsets of the rest.
+                yield from self._query_pages_concurrently(skip, page_size)
+                return
+
             page = self._query_page(skip)
 
             if not page:
                 return
 
             skip += len(page)
+            page_size = len(page)
             yield page
 
             if skip >= self._total_count:
                 break
 
+    def _query_pages_concurrently(
+        self, skip: int, page_size: int
+    ) -> Iterator[List[tbase.TagData]]:
+        assert self._max_concurrency is not None
+        # Each page updates the total count from the thread that fetched it, in no
+        # particular order, so report the total that the offsets were computed from
+        total_count = self._pinned_total_count = self._total_count
+        skips = iter(range(skip, total_count, page_size))
+        try:
+            with ThreadPoolExecutor(
+                self._max_concurrency, thread_name_prefix="TagQueryResultCollection"
+            ) as executor:
+                pending: Deque[Future[List[tbase.TagData]]] = deque(
+                    executor.submit(self._query_page, s)
+                    for s in itertools.islice(skips, self._max_concurrency)
+                )
+                try:
+                    while pending:
+                        page = pending.popleft().result()
+                        if not page:
+                            return
+
+                        next_skip = next(skips, None)
+                        if next_skip is not None:
+                            pending.append(executor.submit(self._query_page, next_skip))
+                        yield page
+                finally:
+                    for future in pending:
+                        future.cancel()
+        finally:
+            # Every page has finished, so no thread writes the total count anymore
+            self._total_count = total_count
+            self._pinned_total_count = None
+
     @abc.abstractmethod
     def _query_page(self, skip: int) -> List[tbase.TagData]:
         """Query for a single page of results and updates :attr:`total_count`.
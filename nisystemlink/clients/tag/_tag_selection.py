@@ -6,13 +6,25 @@ import abc
 import asyncio
 import datetime
 from types import TracebackType
-from typing import Awaitable, Dict, List, Sequence, Tuple, Type
+from typing import (
+    Awaitable,
+    Dict,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
 
 from nisystemlink.clients import tag as tbase
 from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
     SerializedTagWithAggregates,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class TagSelection(tbase.ITagReader):
     """Represents a set of tags that can be read, written, or deleted together.
@@ -70,6 +82,7 @@ class TagSelection(tbase.ITagReader):
         }
 
         self._values: Dict[str, SerializedTagWithAggregates] | None = None
+        self._shard_timings: List[datetime.timedelta] = []
 
     @property
     def paths(self) -> Tuple[str, ...]:  # noqa: D401
@@ -102,6 +115,17 @@ class TagSelection(tbase.ITagReader):
         """
         return dict(self._readers)
 
+    @property
+    def shard_timings(self) -> List[datetime.timedelta]:  # noqa: D401
+        """The time taken by each shard of the selection during the most recent call to
+        the server.
+
+        Selections created with a ``shard_size`` split their paths across multiple
+        server-side selections, called shards, which are read concurrently. The list is
+        empty for selections that aren't sharded or haven't called the server.
+        """
+        return list(self._shard_timings)
+
     @abc.abstractmethod
     def _close_internal(self) -> None:
         """Clean up server resources associated with the selection."""
@@ -118,13 +142,18 @@ class TagSelection(tbase.ITagReader):
 
     @abc.abstractmethod
     def _create_subscription_internal(
-        self, update_interval: datetime.timedelta | None = None
+        self,
+        update_interval: datetime.timedelta | None = None,
+        max_update_interval: datetime.timedelta | None = None,
     ) -> tbase.TagSubscription:
         """Subscribe to receive events when tags in the selection are written to using the specified update interval.
 
         Args:
             update_interval: How often to receive tag update notifications from the
                 server, or None to use the default.
+            max_update_interval: The longest time to wait between update notifications
+                when the tags aren't changing, or None to always use
+                ``update_interval``.
 
         Returns:
             The created subscription.
@@ -136,7 +165,9 @@ class TagSelection(tbase.ITagReader):
 
     @abc.abstractmethod
     async def _create_subscription_internal_async(
-        self, update_interval: datetime.timedelta | None = None
+        self,
+        update_interval: datetime.timedelta | None = None,
+        max_update_interval: datetime.timedelta | None = None,
     ) -> tbase.TagSubscription:
         """Asynchronously subscribe to receive events when tags in the selection are
         written to using the specified update interval.
@@ -144,6 +175,9 @@ class TagSelection(tbase.ITagReader):
         Args:
             update_interval: How often to receive tag update notifications from the
                 server, or None to use the default.
+            max_update_interval: The longest time to wait between update notifications
+                when the tags aren't changing, or None to always use
+                ``update_interval``.
 
         Returns:
             A task representing the asynchronous operation. On success, contains the
@@ -199,6 +233,27 @@ class TagSelection(tbase.ITagReader):
         """
         ...
 
+    def _read_changed_tag_values(
+        self, previous: Dict[str, SerializedTagWithAggregates]
+    ) -> List[SerializedTagWithAggregates | None]:
+        """Retrieve the values of all tags in the selection, reusing the previously
+        retrieved values that haven't changed.
+
+        Implementations that can tell from the serialized response that a value hasn't
+        changed return the same object from ``previous`` instead of decoding it again.
+        By default, every value is decoded.
+
+        Args:
+            previous: The previously retrieved values, by tag path.
+
+        Returns:
+            The list of the tag values.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        return self._read_tag_values()
+
     @abc.abstractmethod
     def _read_tag_metadata_and_values(
         self,
@@ -241,6 +296,26 @@ class TagSelection(tbase.ITagReader):
         """
         ...
 
+    async def _read_changed_tag_values_async(
+        self, previous: Dict[str, SerializedTagWithAggregates]
+    ) -> List[SerializedTagWithAggregates | None]:
+        """Asynchronously retrieve the values of all tags in the selection, reusing the
+        previously retrieved values that haven't changed.
+
+        By default, every value is decoded.
+
+        Args:
+            previous: The previously retrieved values, by tag path.
+
+        Returns:
+            A task representing the asynchronous operation. When complete, contains the
+            list of the tag values.
+
+        Raises:
+            ApiException: if the API call fails.
+        """
+        return await self._read_tag_values_async()
+
     @abc.abstractmethod
     async def _read_tag_metadata_and_values_async(
         self,
@@ -369,7 +444,10 @@ class TagSelection(tbase.ITagReader):
             self._values.clear()
 
     def create_subscription(
-        self, *, update_interval: datetime.timedelta | None = None
+        self,
+        *,
+        update_interval: datetime.timedelta | None = None,
+        max_update_interval: datetime.timedelta | None = None
     ) -> tbase.TagSubscription:
         """Subscribe to receive events when tags in the selection are written to.
 
@@ -390,12 +468,20 @@ class TagSelection(tbase.ITagReader):
         Args:
             update_interval: How often to receive tag updates notifications from the
                 server. Default is ``datetime.timedelta(seconds=30)``.
+            max_update_interval: The longest time to wait between update notifications
+                when the tags aren't changing, or None to always use
+                ``update_interval``. When given, the server is polled less often after
+                polls that find no updates, up to this maximum, and at
+                ``update_interval`` again as soon as a poll finds updates. Use
+                :attr:`TagSubscription.empty_polls` and
+                :attr:`TagSubscription.nonempty_polls` to monitor the polling.
 
         Returns:
             The created subscription.
 
         Raises:
             ValueError: if update_interval is negative.
+            ValueError: if max_update_interval is less than update_interval.
             ReferenceError: if the selection has been closed.
             ApiException: if the API call fails.
         """
@@ -404,11 +490,20 @@ class TagSelection(tbase.ITagReader):
 
         if update_interval is not None and update_interval.total_seconds() < 0:
             raise ValueError("update_interval cannot be negative")
+        if (
+            update_interval is not None
+            and max_update_interval is not None
+            and max_update_interval < update_interval
+        ):
+            raise ValueError("max_update_interval cannot be less than update_interval")
 
-        return self._create_subscription_internal(update_interval)
+        return self._create_subscription_internal(update_interval, max_update_interval)
 
     def create_subscription_async(
-        self, *, update_interval: datetime.timedelta | None = None
+        self,
+        *,
+        update_interval: datetime.timedelta | None = None,
+        max_update_interval: datetime.timedelta | None = None
     ) -> Awaitable[tbase.TagSubscription]:
         """Asynchronously subscribe to receive events when tags in the selection are written to.
 
@@ -422,12 +517,16 @@ class TagSelection(tbase.ITagReader):
             update_interval: How often to receive tag updates notifications from the
                 server. Depending on the :class:`TagManager` implementation in use, this
                 may involve polling the server or have a minimum value.
+            max_update_interval: The longest time to wait between update notifications
+                when the tags aren't changing, or None to always use
+                ``update_interval``.
 
         Returns:
             A task representing the asynchronous operation. On success, contains the
             created subscription.
 
         Raises:
+            ValueError: if max_update_interval is less than update_interval.
             ReferenceError: if the selection has been closed.
             ApiException: if the API call fails.
         """
@@ -441,7 +540,20 @@ class TagSelection(tbase.ITagReader):
             f.set_exception(ValueError("update_interval cannot be negative"))
             return f
 
-        return self._create_subscription_internal_async(update_interval)
+        if (
+            update_interval is not None
+            and max_update_interval is not None
+            and max_update_interval < update_interval
+        ):
+            f = asyncio.get_event_loop().create_future()
+            f.set_exception(
+                ValueError("max_update_interval cannot be less than update_interval")
+            )
+            return f
+
+        return self._create_subscription_internal_async(
+            update_interval, max_update_interval
+        )
 
     def delete_tags_from_server(self) -> None:
         """Delete all tags in the selection from the server.
@@ -626,6 +738,83 @@ class TagSelection(tbase.ITagReader):
         values = await self._read_tag_values_async()
         self._update_values(values)
 
+    def refresh_changed_values(self) -> Set[str]:
+        """Refresh the current value of tags in the selection, only updating the tags
+        whose values have changed since the last refresh.
+
+        A tag's value has changed if its timestamp, value, data type, or aggregates
+        differ from the previously retrieved value, or if it no longer has a value. The
+        first refresh reports every tag that has a value. Values are compared in the
+        form the server sent them, so unchanged values aren't decoded again.
+
+        Returns:
+            The paths of the tags whose values changed.
+
+        Raises:
+            ReferenceError: if the selection has been closed.
+            ApiException: if the API call fails.
+        """
+        if self._closed:
+            raise ReferenceError("TagSelection")
+
+        values = self._read_changed_tag_values(self._values or {})
+        return self._update_changed_values(values)
+
+    async def refresh_changed_values_async(self) -> Set[str]:
+        """Asynchronously refresh the current value of tags in the selection, only
+        updating the tags whose values have changed since the last refresh.
+
+        A tag's value has changed if its timestamp, value, data type, or aggregates
+        differ from the previously retrieved value, or if it no longer has a value. The
+        first refresh reports every tag that has a value. Values are compared in the
+        form the server sent them, so unchanged values aren't decoded again.
+
+        Returns:
+            A task representing the asynchronous operation. On success, contains the
+            paths of the tags whose values changed.
+
+        Raises:
+            ReferenceError: if the selection has been closed.
+            ApiException: if the API call fails.
+        """
+        if self._closed:
+            raise ReferenceError("TagSelection")
+
+        values = await self._read_changed_tag_values_async(self._values or {})
+        return self._update_changed_values(values)
+
+    def snapshot(self) -> Dict[tbase.DataType, "pd.DataFrame"]:
+        """Get the most recently retrieved values of the tags in the selection as
+        columns, decoded in bulk instead of one :meth:`TagValueReader.read()` at a time.
+
+        Each data type gets its own DataFrame, indexed by tag path, with ``value``,
+        ``timestamp``, and ``count`` columns. :attr:`DataType.DOUBLE`,
+        :attr:`DataType.INT32`, and :attr:`DataType.UINT64` also have ``min``,
+        ``max``, and ``mean`` columns. Values and aggregates use the NumPy type
+        matching the data type, times are ``datetime64[us, UTC]``, and timestamps or
+        aggregates that weren't retrieved are ``NaT``, ``NaN``, or ``<NA>``. Tags
+        without a value or with an unknown data type are left out. Call
+        :meth:`refresh_values()` to update the values.
+
+        Returns:
+            A DataFrame for each data type that has at least one value.
+
+        Raises:
+            ReferenceError: if the selection has been closed.
+            ValueError: if a value can't be decoded as its tag's data type.
+        """
+        if self._closed:
+            raise ReferenceError("TagSelection")
+        if self._values is None:
+            return {}
+
+        # Imported here so that importing the tag client doesn't load pandas
+        from nisystemlink.clients.tag._core._value_columns import (
+            values_to_data_frames,
+        )
+
+        return values_to_data_frames(self._values.values())
+
     def remove_tags(self, tags: List[tbase.TagData | str]) -> None:
         """Remove one or more tags from the selection.
 
@@ -804,23 +993,59 @@ class TagSelection(tbase.ITagReader):
             del self._values[missing_path]
 
         for value in values:
-            if value is None:
-                continue
+            if value is not None:
+                self._apply_value(value)
 
-            self._values[value.path] = value
+    def _update_changed_values(
+        self, values: List[SerializedTagWithAggregates | None]
+    ) -> Set[str]:
+        if self._values is None:
+            self._values = {}
 
-            tag = self._metadata.get(value.path)
-            if tag is None:
-                tag = tbase.TagData(value.path, value.data_type)
-                self._metadata[value.path] = tag
-            elif tag.data_type != value.data_type:
-                tag.data_type = value.data_type
-            else:
+        new_values = {v.path: v for v in values if v is not None}
+        changed = set(self._values.keys()).difference(new_values.keys())
+        for missing_path in changed:
+            del self._values[missing_path]
+
+        for path, value in new_values.items():
+            old_value = self._values.get(path)
+            if old_value is value:
                 continue
+            if old_value is None or not self._same_value(old_value, value):
+                self._apply_value(value)
+                changed.add(path)
+        return changed
+
+    def _apply_value(self, value: SerializedTagWithAggregates) -> None:
+        assert self._values is not None
+        self._values[value.path] = value
 
-            reader = self._create_value_reader(tag)
-            if reader is not None:
-                self._readers[value.path] = reader
+        tag = self._metadata.get(value.path)
+        if tag is None:
+            tag = tbase.TagData(value.path, value.data_type)
+            self._metadata[value.path] = tag
+        elif tag.data_type != value.data_type:
+            tag.data_type = value.data_type
+        else:
+            return
+
+        reader = self._create_value_reader(tag)
+        if reader is not None:
+            self._readers[value.path] = reader
+
+    @staticmethod
+    def _same_value(
+        old: SerializedTagWithAggregates, new: SerializedTagWithAggregates
+    ) -> bool:
+        return (
+            old.timestamp == new.timestamp
+            and old.value == new.value
+            and old.data_type == new.data_type
+            and old.count == new.count
+            and old.min == new.min
+            and old.max == new.max
+            and old.mean == new.mean
+        )
 
     @classmethod
     def _validate_paths(cls, paths: List[str]) -> List[str]:
@@ -5,12 +5,15 @@
 import abc
 import contextlib
 import datetime
+import functools
 import weakref
+from concurrent.futures import Executor
 from types import TracebackType
-from typing import Iterable, List, Type
+from typing import AsyncIterator, Iterable, List, Tuple, Type
 
 import events
 from nisystemlink.clients import core, tag as tbase
+from nisystemlink.clients.tag._core._callback_dispatcher import CallbackDispatcher
 from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 
 
@@ -19,6 +22,13 @@ class TagSubscription(events.Events, abc.ABC):
 
     Call :meth:`close()` to stop receiving events.
 
+    Asynchronous applications can instead receive changes in batches from
+    :meth:`get_changes()`, or one at a time with ``async for``::
+
+        async with subscription:
+            async for tag, reader in subscription:
+                print("{} changed".format(tag.path))
+
     Note that :class:`TagSubscription` objects support using the ``with`` statement (or
     the ``async with`` statement), to :meth:`close()` the subsription automatically on
     exit.
@@ -53,7 +63,11 @@ class TagSubscription(events.Events, abc.ABC):
     """Send a heartbeat every 30 seconds based on a server-side expiration of 60 seconds."""
 
     def __init__(
-        self, paths: Iterable[str], heartbeat_timer: ManualResetTimer | None
+        self,
+        paths: Iterable[str],
+        heartbeat_timer: ManualResetTimer | None,
+        *,
+        timer_scheduler: "tbase.TimerScheduler | None" = None
     ) -> None:
         """Initialize the instance.
 
@@ -64,6 +78,8 @@ class TagSubscription(events.Events, abc.ABC):
             paths: The tag path queries to include in the subscription.
             heartbeat_timer: A timer for sending a heartbeat to keep the subscription
                 alive for testing purposes, or None to use a default timer.
+            timer_scheduler: The scheduler for the default heartbeat timer, or None to
+                use the process-wide default scheduler.
 
         Raises:
             ValueError: if ``paths`` is None.
@@ -77,7 +93,8 @@ class TagSubscription(events.Events, abc.ABC):
             self._heartbeat_timer = heartbeat_timer
         else:
             self._heartbeat_timer = ManualResetTimer(
-                datetime.timedelta(milliseconds=self._HEARTBEAT_INTERVAL_MILLISECONDS)
+                datetime.timedelta(milliseconds=self._HEARTBEAT_INTERVAL_MILLISECONDS),
+                timer_scheduler,
             )
         self._exit_stack = contextlib.ExitStack()
         self._exit_stack.enter_context(self._heartbeat_timer)
@@ -92,10 +109,73 @@ class TagSubscription(events.Events, abc.ABC):
         self._heartbeat_timer_handler = callback
         self._heartbeat_timer.elapsed += self._heartbeat_timer_handler
         self._closed = False
+        self._empty_polls = 0
+        self._nonempty_polls = 0
+        self._dispatcher: CallbackDispatcher | None = None
+
+    @property
+    def empty_polls(self) -> int:  # noqa: D401
+        """The number of times the server was polled for updates and had none.
+
+        Always zero for implementations that don't poll the server.
+        """
+        return self._empty_polls
+
+    @property
+    def nonempty_polls(self) -> int:  # noqa: D401
+        """The number of times the server was polled for updates and had at least one.
+
+        Always zero for implementations that don't poll the server.
+        """
+        return self._nonempty_polls
 
     def __del__(self) -> None:
         self._exit_stack.close()
 
+    @property
+    def dropped_changes(self) -> int:  # noqa: D401
+        """The number of changes that weren't passed to :attr:`tag_changed` because
+        too many were waiting for a callback executor.
+        """
+        return 0 if self._dispatcher is None else self._dispatcher.dropped
+
+    def set_callback_executor(
+        self,
+        executor: Executor | None = None,
+        *,
+        max_pending: int | None = None,
+        queue_full_policy: tbase.QueueFullPolicy = tbase.QueueFullPolicy.BLOCK
+    ) -> None:
+        """Raise :attr:`tag_changed` on an executor instead of on the thread that polls
+        for updates, so that slow callbacks don't delay the next poll.
+
+        Changes to the same tag are passed to :attr:`tag_changed` one at a time, in
+        the order they were received. Changes to different tags may be passed
+        concurrently. Exceptions raised by the callbacks are printed and otherwise
+        ignored.
+
+        Args:
+            executor: The executor to raise :attr:`tag_changed` on, or None to use a
+                small thread pool owned by the subscription.
+            max_pending: The maximum number of changes waiting for the executor, or
+                None for no limit.
+            queue_full_policy: What to do when a change is received while
+                ``max_pending`` changes are waiting. ``BLOCK`` delays polling until a
+                change is passed to :attr:`tag_changed`, and ``DROP_OLDEST`` discards
+                the change that has waited longest and counts it in
+                :attr:`dropped_changes`.
+
+        Raises:
+            ValueError: if ``max_pending`` is less than one.
+            ValueError: if ``queue_full_policy`` is ``RAISE``.
+        """
+        dispatcher = CallbackDispatcher(
+            executor, max_pending=max_pending, queue_full_policy=queue_full_policy
+        )
+        previous, self._dispatcher = self._dispatcher, dispatcher
+        if previous is not None:
+            previous.close()
+
     def _initialize(self) -> None:
         """Create and initialize the subscription.
 
@@ -153,6 +233,23 @@ class TagSubscription(events.Events, abc.ABC):
         """
         ...
 
+    async def _get_changes_internal_async(
+        self,
+    ) -> List[Tuple[tbase.TagData, tbase.TagValueReader | None]]:
+        """Asynchronously wait for the changes found by the next poll that finds any.
+
+        Returns:
+            A task representing the asynchronous operation. On completion, contains the
+            changes, or an empty list if the subscription was closed while waiting.
+
+        Raises:
+            NotImplementedError: if the subscription doesn't support
+                :meth:`get_changes()`.
+        """
+        raise NotImplementedError(
+            "{} does not support get_changes".format(type(self).__name__)
+        )
+
     @abc.abstractmethod
     def _send_heartbeat(self) -> None:
         """Send a heartbeat for the subscription to keep it active.
@@ -186,6 +283,8 @@ class TagSubscription(events.Events, abc.ABC):
 
         self._close_internal()
         self._heartbeat_timer.elapsed -= self._heartbeat_timer_handler
+        if self._dispatcher is not None:
+            self._dispatcher.close()
         self._closed = True
 
     async def close_async(self) -> None:
@@ -201,8 +300,56 @@ class TagSubscription(events.Events, abc.ABC):
 
         await self._close_internal_async()
         self._heartbeat_timer.elapsed -= self._heartbeat_timer_handler
+        if self._dispatcher is not None:
+            self._dispatcher.close()
         self._closed = True
 
+    async def get_changes(
+        self,
+    ) -> List[Tuple[tbase.TagData, tbase.TagValueReader | None]]:
+        """Asynchronously wait for the next batch of changes to the subscription's
+        tags.
+
+        The first call switches the subscription from polling for changes in the
+        background to polling with a task on the running event loop, at the same
+        interval. Each batch contains every change found by a single poll, in the
+        order reported by the server. :attr:`tag_changed` is still raised for each
+        change. Polling pauses while too many batches are waiting to be retrieved, so
+        that a slow consumer doesn't hold an unbounded number of changes in memory.
+
+        Returns:
+            A task representing the asynchronous operation. On completion, contains a
+            list of the ``(tag, reader)`` pairs that :attr:`tag_changed` receives, or an
+            empty list if the subscription is closed.
+
+        Raises:
+            NotImplementedError: if the subscription doesn't support waiting for
+                changes.
+        """
+        if self._closed:
+            return []
+        return await self._get_changes_internal_async()
+
+    def __aiter__(
+        self,
+    ) -> AsyncIterator[Tuple[tbase.TagData, tbase.TagValueReader | None]]:
+        """Iterate over the changes returned by :meth:`get_changes()` one at a time,
+        until the subscription is closed.
+        """
+        return self._iterate_changes()
+
+    async def _iterate_changes(
+        self,
+    ) -> AsyncIterator[Tuple[tbase.TagData, tbase.TagValueReader | None]]:
+        while True:
+            changes = await self.get_changes()
+            if not changes:
+                return
+            for change in changes:
+                if self._closed:
+                    return
+                yield change
+
     def __enter__(self) -> "TagSubscription":
         return self
 
@@ -246,14 +393,37 @@ class TagSubscription(events.Events, abc.ABC):
     def _on_tag_changed(
         self, tag: tbase.TagData, value: tbase.TagValueReader | None
     ) -> None:
-        """Raise the :attr:`tag_changed` event.
+        """Raise the :attr:`tag_changed` event, on the callback executor if one is set.
 
         Args:
             tag: The tag that was changed.
             value: The new value and any associated information, or None if the tag has
                 an unknown data type.
         """
-        self.tag_changed(tag, value)
+        if self._dispatcher is None:
+            self.tag_changed(tag, value)
+        else:
+            self._dispatcher.dispatch(
+                tag.path, functools.partial(self.tag_changed, tag, value)
+            )
+
+    async def _on_tag_changed_async(
+        self, tag: tbase.TagData, value: tbase.TagValueReader | None
+    ) -> None:
+        """Raise the :attr:`tag_changed` event, on the callback executor if one is set,
+        without blocking the event loop while waiting for room on the executor.
+
+        Args:
+            tag: The tag that was changed.
+            value: The new value and any associated information, or None if the tag has
+                an unknown data type.
+        """
+        if self._dispatcher is None:
+            self.tag_changed(tag, value)
+        else:
+            await self._dispatcher.dispatch_async(
+                tag.path, functools.partial(self.tag_changed, tag, value)
+            )
 
     def _heartbeat_timer_elapsed(self) -> None:
         try:
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+"""Implementation of TimerScheduler."""
+
+import abc
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, Deque, List, Tuple
+
+from typing_extensions import final
+
+
+@final
+class TimerHandle:
+    """Represents a callback scheduled by a :class:`TimerScheduler`."""
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'TimerHandle' is not an acceptable base type")
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        """Initialize a handle for a scheduled callback.
+
+        Args:
+            callback: The function to call when the handle's deadline is reached.
+        """
+        self._callback: Callable[[], None] | None = callback
+        self._on_cancel: Callable[[], None] | None = None
+
+    @property
+    def cancelled(self) -> bool:  # noqa: D401
+        """Whether or not :meth:`cancel()` has been called."""
+        return self._callback is None
+
+    def cancel(self) -> None:
+        """Prevent the callback from being called, if it hasn't been called already."""
+        self._callback = None
+        on_cancel, self._on_cancel = self._on_cancel, None
+        if on_cancel is not None:
+            on_cancel()
+
+    def run(self) -> None:
+        """Call the callback, unless the handle was cancelled.
+
+        Exceptions raised by the callback are printed and otherwise ignored.
+        """
+        callback = self._callback
+        if callback is None:
+            return
+        self._callback = None
+        try:
+            callback()
+        except Exception:
+            traceback.print_exc()
+
+
+class TimerScheduler(abc.ABC):
+    """Represents a service that calls scheduled callbacks, shared by many timers.
+
+    Timers that register with the same scheduler share its threads, so the number of
+    threads depends on how many callbacks run at once rather than how many timers
+    exist.
+    """
+
+    _DEFAULT_MAX_WORKERS = 4
+
+    __default: "TimerScheduler | None" = None
+    __default_lock = threading.Lock()
+
+    @staticmethod
+    def get_default() -> "TimerScheduler":
+        """Get the process-wide :class:`ThreadedTimerScheduler` that is used by timers
+        that aren't given a scheduler.
+
+        The default scheduler calls at most four callbacks at once, however many timers
+        use it. A :class:`TagManager <nisystemlink.clients.tag.TagManager>` that isn't
+        given a scheduler calls the callbacks of its timers, which send requests, on
+        threads of its own, so they don't hold up the default scheduler.
+
+        Returns:
+            The default scheduler.
+        """
+        with TimerScheduler.__default_lock:
+            if TimerScheduler.__default is None:
+                TimerScheduler.__default = ThreadedTimerScheduler(
+                    TimerScheduler._DEFAULT_MAX_WORKERS
+                )
+            return TimerScheduler.__default
+
+    @abc.abstractmethod
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """Schedule a callback to be called once after a delay.
+
+        Callbacks may be called on a different thread than the one that scheduled them,
+        and must not assume that they are called in any particular order relative to
+        other callbacks with the same deadline.
+
+        Args:
+            delay: The number of seconds to wait before calling ``callback``.
+            callback: The function to call.
+
+        Returns:
+            A handle that can be used to cancel the callback.
+
+        Raises:
+            RuntimeError: if the scheduler is closed.
+        """
+        ...
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Stop calling scheduled callbacks and free the scheduler's resources."""
+        ...
+
+
+@final
+class ThreadedTimerScheduler(TimerScheduler):
+    """A :class:`TimerScheduler` that keeps its deadlines in a heap serviced by a single
+    thread, and calls the callbacks on a pool of worker threads so that slow callbacks
+    don't delay other timers.
+
+    The pool starts a worker whenever a callback is due and every worker is busy, up to
+    ``max_workers``, and workers exit after being idle for a while.
+    """
+
+    _IDLE_WORKER_SECONDS = 60.0
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'ThreadedTimerScheduler' is not an acceptable base type")
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize a scheduler. Its threads are started when first needed.
+
+        Args:
+            max_workers: The maximum number of callbacks to call at once, or None for
+                no limit. Callbacks that make blocking calls can delay every other
+                callback once the limit is reached.
+
+        Raises:
+            ValueError: if ``max_workers`` is less than one.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers cannot be 0 or negative")
+
+        self._max_workers = max_workers
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        self._counter = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+        self._workers_changed = threading.Condition()
+        self._due: Deque[TimerHandle] = deque()
+        self._workers = 0
+        self._idle_workers = 0
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        handle = TimerHandle(callback)
+        deadline = time.monotonic() + delay
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The timer scheduler is closed.")
+            heapq.heappush(self._heap, (deadline, next(self._counter), handle))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="TimerScheduler", daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0][2] is handle:
+                self._condition.notify()
+        return handle
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._heap.clear()
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+        with self._workers_changed:
+            self._due.clear()
+            self._workers_changed.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._closed:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                remaining = self._heap[0][0] - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+
+                _, _, handle = heapq.heappop(self._heap)
+                self._run_on_worker(handle)
+
+    def _run_on_worker(self, handle: TimerHandle) -> None:
+        with self._workers_changed:
+            self._due.append(handle)
+            if self._idle_workers >= len(self._due):
+                self._workers_changed.notify()
+                return
+            if self._max_workers is not None and self._workers >= self._max_workers:
+                # A busy worker takes it when it finishes
+                return
+            self._workers += 1
+        threading.Thread(
+            target=self._work, name="TimerScheduler-worker", daemon=True
+        ).start()
+
+    def _work(self) -> None:
+        while True:
+            with self._workers_changed:
+                self._idle_workers += 1
+                self._workers_changed.wait_for(
+                    lambda: self._due or self._closed, self._IDLE_WORKER_SECONDS
+                )
+                self._idle_workers -= 1
+                if not self._due:
+                    self._workers -= 1
+                    return
+                handle = self._due.popleft()
+            handle.run()
+
+
+@final
+class AsyncioTimerScheduler(TimerScheduler):
+    """A :class:`TimerScheduler` that keeps its deadlines on an asyncio event loop, for
+    applications that already run one.
+
+    Callbacks are called on the loop's default executor so that they don't block the
+    loop.
+    """
+
+    def __init_subclass__(cls) -> None:
+        raise TypeError("type 'AsyncioTimerScheduler' is not an acceptable base type")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Initialize a scheduler.
+
+        Args:
+            loop: The event loop to schedule callbacks on, or None to use the running
+                loop.
+
+        Raises:
+            RuntimeError: if ``loop`` is None and there is no running event loop.
+        """
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._closed = False
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        if self._closed:
+            raise RuntimeError("The timer scheduler is closed.")
+
+        handle = TimerHandle(callback)
+        deadline = self._loop.time() + delay
+
+        def elapsed() -> None:
+            if not (handle.cancelled or self._closed):
+                self._loop.run_in_executor(None, handle.run)
+
+        def schedule() -> None:
+            if handle.cancelled:
+                return
+            loop_handle = self._loop.call_at(deadline, elapsed)
+            handle._on_cancel = lambda: self._cancel_soon(loop_handle)
+            if handle.cancelled:
+                loop_handle.cancel()
+
+        self._loop.call_soon_threadsafe(schedule)
+        return handle
+
+    def _cancel_soon(self, loop_handle: asyncio.TimerHandle) -> None:
+        try:
+            self._loop.call_soon_threadsafe(loop_handle.cancel)
+        except RuntimeError:
+            # The event loop is already closed
+            pass
+
+    def close(self) -> None:
+        self._closed = True
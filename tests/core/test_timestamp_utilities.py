@@ -0,0 +1,106 @@
+import datetime
+import time
+
+import pytest
+from nisystemlink.clients.core._internal._timestamp_utilities import (
+    TimestampUtilities,
+)
+
+
+def _str_to_datetime_strptime(timestamp: str) -> datetime.datetime:
+    """The original implementation, for comparison."""
+    if not timestamp.endswith("Z"):
+        raise ValueError(timestamp)
+    timestamp = timestamp[:-1].ljust(26, "0")[:26] + "+0000"
+    return datetime.datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def _datetime_to_str_isoformat(value: datetime.datetime) -> str:
+    """The original implementation, for comparison."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    else:
+        value = value.astimezone(datetime.timezone.utc)
+    return value.isoformat().replace("+00:00", "Z")
+
+
+_TIMESTAMPS = [
+    "2024-01-02T03:04:05.6Z",
+    "2024-01-02T03:04:05.000Z",
+    "2024-01-02T03:04:05.123456Z",
+    "2024-01-02T03:04:05.1234567Z",
+    "0001-01-01T00:00:00.0Z",
+    "9999-12-31T23:59:59.999999Z",
+]
+
+_DATETIMES = [
+    datetime.datetime(2024, 1, 2, 3, 4, 5),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, 600),
+    datetime.datetime(2024, 1, 2, 3, 4, 5, 600, datetime.timezone.utc),
+    datetime.datetime(
+        2024, 1, 2, 3, 4, 5, 600, datetime.timezone(datetime.timedelta(hours=-5))
+    ),
+]
+
+
+class TestTimestampUtilities:
+    @pytest.mark.parametrize("timestamp", _TIMESTAMPS)
+    def test__str_to_datetime__same_result_as_strptime(self, timestamp):
+        result = TimestampUtilities.str_to_datetime(timestamp)
+
+        assert result == _str_to_datetime_strptime(timestamp)
+        assert result.tzinfo is datetime.timezone.utc
+
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
+            "2024-01-02T03:04:05.6",
+            "2024-01-02T03:04:05Z",
+            "2024-13-02T03:04:05.0Z",
+            "2024-01-02 03:04:05.0Z",
+            "not a timestamp",
+        ],
+    )
+    def test__invalid_timestamp__str_to_datetime__raises(self, timestamp):
+        with pytest.raises(ValueError):
+            TimestampUtilities.str_to_datetime(timestamp)
+
+    @pytest.mark.parametrize("value", _DATETIMES)
+    def test__datetime_to_str__same_result_as_isoformat(self, value):
+        assert TimestampUtilities.datetime_to_str(value) == _datetime_to_str_isoformat(
+            value
+        )
+
+    @pytest.mark.slow
+    def test__benchmark__parse_and_format(self):
+        count = 100_000
+        start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        values = [
+            start + datetime.timedelta(microseconds=7 * i + 1) for i in range(count)
+        ]
+        timestamps = [_datetime_to_str_isoformat(v) for v in values]
+
+        def measure(name, function, argument):
+            begin = time.perf_counter()
+            function(argument)
+            elapsed = time.perf_counter() - begin
+            print(f"{name}: {elapsed * 1000:.1f} ms for {count} timestamps")
+
+        measure(
+            "strptime",
+            lambda ts: [_str_to_datetime_strptime(t) for t in ts],
+            timestamps,
+        )
+        measure(
+            "str_to_datetime",
+            lambda ts: [TimestampUtilities.str_to_datetime(t) for t in ts],
+            timestamps,
+        )
+        measure(
+            "isoformat", lambda vs: [_datetime_to_str_isoformat(v) for v in vs], values
+        )
+        measure(
+            "datetime_to_str",
+            lambda vs: [TimestampUtilities.datetime_to_str(v) for v in vs],
+            values,
+        )
@@ -0,0 +1 @@
+# flake8: noqa
@@ -0,0 +1,109 @@
+import json
+import threading
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+import responses
+from nisystemlink.clients.dataframe import DataFrameClient
+
+_OPERATIONS: Dict[str, Callable[[Any, Any], bool]] = {
+    "EQUALS": lambda a, b: a == b,
+    "LESS_THAN": lambda a, b: a < b,
+    "LESS_THAN_EQUALS": lambda a, b: a <= b,
+    "GREATER_THAN": lambda a, b: a > b,
+    "GREATER_THAN_EQUALS": lambda a, b: a >= b,
+}
+
+
+class FakeTable:
+    """Serves the metadata of a table with an ``index`` and an INT32 ``value`` column,
+    and paged, filtered, and sorted query results for its rows.
+    """
+
+    ID = "table_id"
+
+    def __init__(self, index_type: str, index_values: List[Any]) -> None:
+        self.index_type = index_type
+        self.rows: List[List[str]] = []
+        self.rows_modified_at = pd.Timestamp("2024-01-01T00:00:00Z")
+        self.metadata_revision = 1
+        self.queries: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.fail_ranges = False
+        self.append(index_values)
+
+    def append(self, index_values: List[Any]) -> None:
+        """Appends rows whose value is their position in the table."""
+        start = len(self.rows)
+        self.rows += [
+            [str(value), str(start + i)] for i, value in enumerate(index_values)
+        ]
+        self.rows_modified_at += pd.Timedelta(seconds=1)
+
+    def _parse(self, value: str) -> Any:
+        return pd.Timestamp(value) if self.index_type == "TIMESTAMP" else int(value)
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            "columns": [
+                {"name": "index", "dataType": self.index_type, "columnType": "INDEX"},
+                {"name": "value", "dataType": "INT32", "columnType": "NORMAL"},
+            ],
+            "createdAt": "2024-01-01T00:00:00Z",
+            "id": self.ID,
+            "metadataModifiedAt": "2024-01-01T00:00:00Z",
+            "metadataRevision": self.metadata_revision,
+            "name": "table",
+            "properties": {},
+            "rowCount": len(self.rows),
+            "rowsModifiedAt": self.rows_modified_at.isoformat(),
+            "supportsAppend": True,
+            "workspace": "workspace",
+        }
+
+    def get(self, request) -> tuple:
+        return (200, {}, json.dumps(self.metadata()))
+
+    def query(self, request) -> tuple:
+        query = json.loads(request.body)
+        with self.lock:
+            self.queries.append(query)
+        if self.fail_ranges and query.get("take") != 1:
+            return (400, {}, json.dumps({"error": {"message": "failure"}}))
+
+        rows = self.rows
+        for column_filter in query.get("filters") or []:
+            column = 0 if column_filter["column"] == "index" else 1
+            compare = _OPERATIONS[column_filter["operation"]]
+            value = self._parse(column_filter["value"])
+            rows = [r for r in rows if compare(self._parse(r[column]), value)]
+        order_by = (query.get("orderBy") or [{}])[0]
+        rows = sorted(
+            rows,
+            key=lambda r: self._parse(r[0]),
+            reverse=bool(order_by.get("descending")),
+        )
+
+        start = int(query.get("continuationToken") or 0)
+        take = query.get("take") or 2
+        page = rows[start : start + take]
+        token = str(start + take) if start + take < len(rows) else None
+        columns = query.get("columns") or ["index", "value"]
+        data = [[r[0] if c == "index" else r[1] for c in columns] for r in page]
+        body = {
+            "frame": {"columns": columns, "data": data},
+            "totalRowCount": len(rows),
+            "continuationToken": token,
+        }
+        return (200, {}, json.dumps(body))
+
+
+def serve(client: DataFrameClient, table: FakeTable, rsps) -> None:
+    """Registers the table's endpoints with a ``responses.RequestsMock``."""
+    base_url = client.session.base_url
+    rsps.add_callback(responses.GET, f"{base_url}tables/{table.ID}", callback=table.get)
+    rsps.add_callback(
+        responses.POST,
+        f"{base_url}tables/{table.ID}/query-data",
+        callback=table.query,
+    )
@@ -0,0 +1,180 @@
+import time
+from typing import List
+
+import pytest
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+
+pa = pytest.importorskip("pyarrow")
+
+_TABLE_ID = "table_id"
+
+
+@pytest.fixture
+def client() -> DataFrameClient:
+    """Fixture to create a DataFrameClient that talks to a mocked server."""
+    return DataFrameClient(HttpConfiguration("https://test.example.com", api_key="key"))
+
+
+@pytest.fixture
+def sent_bodies(client: DataFrameClient):
+    """Fixture to capture the Arrow request bodies sent to the append endpoint."""
+    bodies: List[bytes] = []
+
+    def callback(request):
+        bodies.append(b"".join(bytes(chunk) for chunk in request.body))
+        return (204, {}, "")
+
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(
+            responses.POST,
+            f"{client.session.base_url}tables/{_TABLE_ID}/data",
+            callback=callback,
+        )
+        yield bodies
+
+
+def _batches(count: int, rows: int) -> list:
+    return [
+        pa.record_batch(
+            [pa.array(range(i * rows, (i + 1) * rows), type=pa.int64())], names=["a"]
+        )
+        for i in range(count)
+    ]
+
+
+def _read_stream(body: bytes) -> list:
+    return list(pa.ipc.open_stream(body))
+
+
+class TestArrowIngestion:
+    def test__default_options__batches_written_individually_with_zstd(
+        self, client: DataFrameClient, sent_bodies: List[bytes]
+    ):
+        statistics = client.append_table_data(_TABLE_ID, _batches(4, 10))
+
+        assert len(sent_bodies) == 1
+        received = _read_stream(sent_bodies[0])
+        assert [b.num_rows for b in received] == [10, 10, 10, 10]
+        assert statistics is not None
+        assert statistics.batch_count == 4
+        assert statistics.message_count == 4
+        assert statistics.row_count == 40
+        assert statistics.bytes_sent == len(sent_bodies[0])
+
+    def test__coalesce_rows__small_batches_combined(
+        self, client: DataFrameClient, sent_bodies: List[bytes]
+    ):
+        statistics = client.append_table_data(
+            _TABLE_ID, _batches(10, 10), coalesce_rows=25
+        )
+
+        received = _read_stream(sent_bodies[0])
+        assert [b.num_rows for b in received] == [30, 30, 30, 10]
+        assert pa.Table.from_batches(received).column("a").to_pylist() == list(
+            range(100)
+        )
+        assert statistics is not None
+        assert statistics.batch_count == 10
+        assert statistics.message_count == 4
+        assert statistics.row_count == 100
+
+    def test__coalesce_bytes__small_batches_combined(
+        self, client: DataFrameClient, sent_bodies: List[bytes]
+    ):
+        # Each batch holds 10 int64 values, or 80 bytes.
+        client.append_table_data(_TABLE_ID, _batches(6, 10), coalesce_bytes=160)
+
+        received = _read_stream(sent_bodies[0])
+        assert [b.num_rows for b in received] == [20, 20, 20]
+
+    def test__large_batch__coalesce_rows__written_as_is(
+        self, client: DataFrameClient, sent_bodies: List[bytes]
+    ):
+        client.append_table_data(_TABLE_ID, _batches(2, 50), coalesce_rows=10)
+
+        received = _read_stream(sent_bodies[0])
+        assert [b.num_rows for b in received] == [50, 50]
+
+    @pytest.mark.parametrize("compression", ["zstd", "lz4", None])
+    def test__compression__stream_readable(
+        self, client: DataFrameClient, sent_bodies: List[bytes], compression
+    ):
+        client.append_table_data(_TABLE_ID, _batches(3, 1000), compression=compression)
+
+        received = _read_stream(sent_bodies[0])
+        assert sum(b.num_rows for b in received) == 3000
+
+    def test__no_compression__compression_ratio_near_one(
+        self, client: DataFrameClient, sent_bodies: List[bytes]
+    ):
+        statistics = client.append_table_data(
+            _TABLE_ID, _batches(1, 10000), compression=None
+        )
+
+        assert statistics is not None
+        assert statistics.compression_ratio is not None
+        assert 0.9 < statistics.compression_ratio <= 1.0
+
+    def test__zstd_compression__compressible_data__compression_ratio_above_one(
+        self, client: DataFrameClient, sent_bodies: List[bytes]
+    ):
+        batch = pa.record_batch([pa.array([7] * 10000, type=pa.int64())], names=["a"])
+
+        statistics = client.append_table_data(
+            _TABLE_ID, batch, compression="zstd", compression_level=3
+        )
+
+        assert statistics is not None
+        assert statistics.compression_ratio is not None
+        assert statistics.compression_ratio > 10
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"compression": "gzip"},
+            {"compression": None, "compression_level": 1},
+            {"coalesce_rows": 0},
+            {"coalesce_bytes": 0},
+        ],
+    )
+    def test__invalid_options__raises(self, client: DataFrameClient, kwargs):
+        with pytest.raises(ValueError):
+            client.append_table_data(_TABLE_ID, _batches(1, 1), **kwargs)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("compression", ["zstd", "lz4", None])
+    def test__benchmark__batch_sizes(
+        self, client: DataFrameClient, sent_bodies: List[bytes], compression
+    ):
+        total_rows = 1_000_000
+        for rows_per_batch in (10, 1000, 100_000):
+            batches = [
+                pa.record_batch(
+                    [
+                        pa.array(range(i, i + rows_per_batch), type=pa.int64()),
+                        pa.array([float(i)] * rows_per_batch, type=pa.float64()),
+                    ],
+                    names=["a", "b"],
+                )
+                for i in range(0, total_rows, rows_per_batch)
+            ]
+            for coalesce_rows in (None, 100_000):
+                start = time.perf_counter()
+                statistics = client.append_table_data(
+                    _TABLE_ID,
+                    batches,
+                    compression=compression,
+                    coalesce_rows=coalesce_rows,
+                )
+                elapsed = time.perf_counter() - start
+                assert statistics is not None
+                assert statistics.row_count == total_rows
+                print(
+                    f"compression={compression} rows_per_batch={rows_per_batch} "
+                    f"coalesce_rows={coalesce_rows}: {elapsed * 1000:.1f} ms, "
+                    f"{statistics.message_count} messages, "
+                    f"{statistics.bytes_sent} bytes sent, "
+                    f"ratio={statistics.compression_ratio:.2f}"
+                )
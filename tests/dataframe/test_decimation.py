@@ -0,0 +1,206 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from nisystemlink.clients.dataframe.models import DecimationMethod, DecimationOptions
+from nisystemlink.clients.dataframe.utilities import (
+    _decimation,
+    decimate_data,
+    decimate_data_lttb,
+)
+
+
+def _options(**kwargs) -> DecimationOptions:
+    return DecimationOptions(x_column="x", **kwargs)
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """Fixture for two intervals of 5 rows each, in reverse x order."""
+    return pd.DataFrame(
+        {
+            "x": np.arange(10)[::-1],
+            "a": [5.0, 1.0, 9.0, 3.0, 2.0, 7.0, 4.0, 8.0, 0.0, 6.0][::-1],
+            "b": [0, 1, 2, 3, 4, 5, 6, 7, 8, 9][::-1],
+        }
+    )
+
+
+class TestDecimateData:
+    def test__fewer_rows_than_intervals__all_rows_returned_in_x_order(self, data):
+        result = decimate_data(data, _options(intervals=10))
+
+        assert result["x"].tolist() == list(range(10))
+
+    def test__lossy__evenly_distributed_rows(self, data):
+        result = decimate_data(
+            data, _options(intervals=4, method=DecimationMethod.Lossy)
+        )
+
+        assert result["x"].tolist() == [0, 3, 6, 9]
+        assert result.index.tolist() == [9, 6, 3, 0]
+
+    def test__max_min__extremes_of_each_interval(self, data):
+        result = decimate_data(
+            data,
+            _options(intervals=2, y_columns=["a"], method=DecimationMethod.MaxMin),
+        )
+
+        # Interval [0, 4] has a max at x=2 and a min at x=1. Interval [5, 9] has a
+        # max at x=7 and a min at x=8.
+        assert result["x"].tolist() == [1, 2, 7, 8]
+
+    def test__entry_exit__extremes_plus_first_and_last_rows(self, data):
+        result = decimate_data(
+            data,
+            _options(intervals=2, y_columns=["a"], method=DecimationMethod.EntryExit),
+        )
+
+        assert result["x"].tolist() == [0, 1, 2, 4, 5, 7, 8, 9]
+
+    def test__max_min__default_y_columns__all_numeric_columns_used(self, data):
+        result = decimate_data(
+            data, _options(intervals=2, method=DecimationMethod.MaxMin)
+        )
+
+        assert result["x"].tolist() == [0, 1, 2, 4, 5, 7, 8, 9]
+
+    def test__max_min__nan_values__ignored(self):
+        data = pd.DataFrame(
+            {"x": np.arange(6), "a": [np.nan, 1.0, 2.0, np.nan, np.nan, np.nan]}
+        )
+
+        result = decimate_data(
+            data,
+            _options(intervals=2, y_columns=["a"], method=DecimationMethod.MaxMin),
+        )
+
+        assert result["x"].tolist() == [1, 2]
+
+    def test__timestamp_x_column__intervals_by_time(self):
+        data = pd.DataFrame(
+            {
+                "x": pd.to_datetime(["2024-01-01T00:00:00", "2024-01-01T00:00:01"])
+                .append(pd.date_range("2024-01-01T00:00:10", periods=3, freq="s"))
+                .append(pd.DatetimeIndex([pd.NaT])),
+                "a": [1, 2, 3, 5, 4, 100],
+            }
+        )
+
+        result = decimate_data(
+            data,
+            _options(intervals=2, y_columns=["a"], method=DecimationMethod.MaxMin),
+        )
+
+        assert result["a"].tolist() == [1, 2, 3, 5]
+
+    def test__equal_x_values__single_interval(self):
+        data = pd.DataFrame({"x": [1, 1, 1, 1], "a": [3, 1, 4, 2]})
+
+        result = decimate_data(
+            data,
+            _options(intervals=2, y_columns=["a"], method=DecimationMethod.MaxMin),
+        )
+
+        assert result["a"].tolist() == [1, 4]
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            DecimationOptions(),
+            DecimationOptions(x_column="missing"),
+            DecimationOptions(x_column="x", intervals=0),
+            DecimationOptions(
+                x_column="x", y_columns=["s"], method=DecimationMethod.MaxMin
+            ),
+        ],
+    )
+    def test__invalid_options__raises(self, options):
+        data = pd.DataFrame({"x": [1, 2, 3], "s": ["a", "b", "c"]})
+
+        with pytest.raises(ValueError):
+            decimate_data(data, options)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("method", list(DecimationMethod))
+    def test__benchmark__re_decimation(self, method):
+        rows = 100_000
+        data = pd.DataFrame(
+            {
+                "x": np.arange(rows),
+                "a": np.random.default_rng(0).standard_normal(rows),
+            }
+        )
+        options = _options(intervals=1000, y_columns=["a"], method=method)
+
+        decimate_data(data, options)
+        start = time.perf_counter()
+        for _ in range(100):
+            decimate_data(data, options)
+        elapsed = (time.perf_counter() - start) / 100
+        print(f"{method.value}: {elapsed * 1000:.3f} ms for {rows} rows")
+
+
+class TestDecimateDataLttb:
+    def test__first_last_and_peaks_kept(self):
+        y = np.zeros(101)
+        y[25] = 10
+        y[75] = -10
+        data = pd.DataFrame({"x": np.arange(101), "y": y})
+
+        result = decimate_data_lttb(data, "x", "y", intervals=5)
+
+        assert len(result) == 5
+        assert result["x"].iloc[0] == 0
+        assert result["x"].iloc[-1] == 100
+        assert 25 in result["x"].tolist()
+        assert 75 in result["x"].tolist()
+
+    def test__exact_number_of_rows_returned(self):
+        data = pd.DataFrame(
+            {"x": np.arange(10_000), "y": np.sin(np.arange(10_000) / 100)}
+        )
+
+        result = decimate_data_lttb(data, "x", "y", intervals=500)
+
+        assert len(result) == 500
+        assert result["x"].is_monotonic_increasing
+
+    @pytest.mark.parametrize("intervals", [3, 50, 700, 2500])
+    def test__small_buckets__decimate__same_rows_as_bucket_at_a_time(
+        self, monkeypatch, intervals
+    ):
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            {"x": np.arange(3000), "y": rng.integers(0, 4, 3000).astype(float)}
+        )
+
+        monkeypatch.setattr(_decimation, "_LTTB_MAX_TABLE_WIDTH", 0)
+        expected = decimate_data_lttb(data, "x", "y", intervals=intervals)
+        monkeypatch.setattr(_decimation, "_LTTB_MAX_TABLE_WIDTH", 1 << 30)
+        result = decimate_data_lttb(data, "x", "y", intervals=intervals)
+
+        assert result.index.tolist() == expected.index.tolist()
+
+    def test__too_few_intervals__raises(self):
+        data = pd.DataFrame({"x": [1, 2, 3], "y": [1, 2, 3]})
+
+        with pytest.raises(ValueError):
+            decimate_data_lttb(data, "x", "y", intervals=2)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("intervals", [1000, 10_000, 100_000])
+    def test__benchmark__lttb(self, intervals):
+        rows = 1_000_000
+        data = pd.DataFrame(
+            {
+                "x": np.arange(rows),
+                "y": np.random.default_rng(0).standard_normal(rows).cumsum(),
+            }
+        )
+
+        start = time.perf_counter()
+        decimate_data_lttb(data, "x", "y", intervals=intervals)
+        elapsed = time.perf_counter() - start
+        print(f"LTTB: {elapsed * 1000:.3f} ms for {rows} rows, {intervals} intervals")
@@ -0,0 +1,216 @@
+import json
+import re
+import threading
+from typing import Any, Dict, List
+from unittest import mock
+
+import pandas as pd
+import pytest
+import responses
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import DataFrame
+from nisystemlink.clients.dataframe.utilities import TableIngestionScheduler
+
+_CONFIGURATION = HttpConfiguration("https://test.example.com", api_key="key")
+_URL = re.compile(r"https://test\.example\.com/nidataframe/v1/tables/(\w+)/data.*")
+
+
+def _frame(*values: int) -> DataFrame:
+    return DataFrame(columns=["a"], data=[[str(v)] for v in values])
+
+
+class FakeService:
+    """Records append requests, optionally holding them until released."""
+
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.release = threading.Event()
+        self.release.set()
+        self.entered = threading.Event()
+        self.failing_tables: List[str] = []
+
+    def append(self, request) -> tuple:
+        self.entered.set()
+        self.release.wait(timeout=10)
+        match = _URL.match(request.url)
+        assert match
+        table_id = match.group(1)
+        with self.lock:
+            self.requests.append({"table": table_id, **json.loads(request.body)})
+        if table_id in self.failing_tables:
+            return (400, {}, json.dumps({"error": {"message": "failure"}}))
+        return (204, {}, "")
+
+    def rows(self, table_id: str) -> List[str]:
+        return [
+            row[0]
+            for request in self.requests
+            if request["table"] == table_id and "frame" in request
+            for row in request["frame"]["data"]
+        ]
+
+
+@pytest.fixture
+def service():
+    """Fixture for a mocked DataFrame Service."""
+    service = FakeService()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add_callback(responses.POST, _URL, callback=service.append)
+        yield service
+
+
+class TestTableIngestionScheduler:
+    def test__appends_queued__rows_sent_in_order_per_table(self, service):
+        with TableIngestionScheduler(_CONFIGURATION, max_workers=4) as scheduler:
+            for i in range(20):
+                scheduler.append("t1", _frame(i))
+                scheduler.append("t2", _frame(100 + i))
+
+        assert service.rows("t1") == [str(i) for i in range(20)]
+        assert service.rows("t2") == [str(100 + i) for i in range(20)]
+
+    def test__appends_queued_while_busy__combined_into_one_request(self, service):
+        service.release.clear()
+        with TableIngestionScheduler(_CONFIGURATION, max_batch_rows=4) as scheduler:
+            scheduler.append("t1", _frame(0))
+            service.entered.wait(timeout=10)
+            for i in range(1, 7):
+                scheduler.append("t1", _frame(i))
+            service.release.set()
+
+        assert [r["frame"]["data"] for r in service.requests] == [
+            [["0"]],
+            [["1"], ["2"], ["3"], ["4"]],
+            [["5"], ["6"]],
+        ]
+
+    def test__pandas_appends__table_metadata_fetched_once(self):
+        metadata = mock.Mock(columns=["columns"])
+        with mock.patch.object(
+            DataFrameClient, "get_table_metadata", return_value=metadata
+        ) as get_table_metadata, mock.patch.object(
+            DataFrameClient, "append_table_data"
+        ) as append_table_data:
+            with TableIngestionScheduler(_CONFIGURATION) as scheduler:
+                scheduler.append("t1", pd.DataFrame({"a": [0]}))
+                scheduler.flush()
+                scheduler.append("t1", pd.DataFrame({"a": [1]}))
+
+        assert get_table_metadata.call_count == 1
+        assert [
+            call.kwargs["columns"] for call in append_table_data.call_args_list
+        ] == [
+            ["columns"],
+            ["columns"],
+        ]
+
+    def test__finish__end_of_data_sent_with_last_rows(self, service):
+        service.release.clear()
+        with TableIngestionScheduler(_CONFIGURATION) as scheduler:
+            scheduler.append("t1", _frame(0))
+            service.entered.wait(timeout=10)
+            scheduler.append("t1", _frame(1))
+            scheduler.finish("t1")
+            service.release.set()
+
+        assert [r.get("endOfData") for r in service.requests] == [None, True]
+        assert scheduler.get_statistics("t1").finished
+
+    def test__finish_without_rows__end_of_data_sent_alone(self, service):
+        with TableIngestionScheduler(_CONFIGURATION) as scheduler:
+            scheduler.finish("t1")
+
+        assert service.requests == [{"table": "t1", "endOfData": True}]
+
+    def test__finished_table__append_raises(self, service):
+        with TableIngestionScheduler(_CONFIGURATION) as scheduler:
+            scheduler.finish("t1")
+
+            with pytest.raises(ValueError):
+                scheduler.append("t1", _frame(0))
+
+    def test__many_tables__uploads_run_concurrently(self, service):
+        barrier = threading.Barrier(4, timeout=10)
+        original_append = service.append
+
+        def append(request):
+            barrier.wait()
+            return original_append(request)
+
+        service.append = append
+        with TableIngestionScheduler(_CONFIGURATION, max_workers=4) as scheduler:
+            for table in ("a", "b", "c", "d"):
+                scheduler.append(table, _frame(0))
+
+        assert sorted(r["table"] for r in service.requests) == ["a", "b", "c", "d"]
+
+    def test__busy_table__other_tables_take_turns(self, service):
+        service.release.clear()
+        with TableIngestionScheduler(
+            _CONFIGURATION, max_workers=1, max_batch_rows=1
+        ) as scheduler:
+            scheduler.append("a", _frame(0))
+            service.entered.wait(timeout=10)
+            scheduler.append("a", _frame(1))
+            scheduler.append("a", _frame(2))
+            scheduler.append("b", _frame(0))
+            service.release.set()
+
+        assert [r["table"] for r in service.requests] == ["a", "b", "a", "a"]
+
+    def test__append_fails__error_raised_and_other_tables_unaffected(self, service):
+        service.failing_tables.append("bad")
+        scheduler = TableIngestionScheduler(_CONFIGURATION)
+        scheduler.append("bad", _frame(0))
+        scheduler.append("good", _frame(1))
+
+        with pytest.raises(ApiException):
+            scheduler.flush()
+        scheduler.append("good", _frame(2))
+        scheduler.close()
+
+        assert service.rows("good") == ["1", "2"]
+        statistics = scheduler.get_statistics("bad")
+        assert statistics.requests_failed == 1
+        assert statistics.rows_queued == 0
+
+    def test__rows_sent__statistics_counted(self, service):
+        with TableIngestionScheduler(_CONFIGURATION) as scheduler:
+            scheduler.append("t1", _frame(0, 1, 2))
+            scheduler.append("t2", _frame(0))
+
+        statistics = scheduler.get_all_statistics()
+        assert statistics["t1"].rows_sent == 3
+        assert statistics["t1"].requests_sent == 1
+        assert statistics["t1"].rows_queued == 0
+        assert statistics["t1"].rows_per_second is not None
+        assert statistics["t2"].rows_sent == 1
+
+    def test__max_queued_rows_reached__append_blocks_until_sent(self, service):
+        service.release.clear()
+        with TableIngestionScheduler(_CONFIGURATION, max_queued_rows=2) as scheduler:
+            scheduler.append("t1", _frame(0, 1))
+            blocked = threading.Thread(target=scheduler.append, args=("t2", _frame(2)))
+            blocked.start()
+            blocked.join(timeout=0.2)
+            assert blocked.is_alive()
+
+            service.release.set()
+            blocked.join(timeout=10)
+            assert not blocked.is_alive()
+
+        assert service.rows("t2") == ["2"]
+
+    def test__closed__append_raises(self, service):
+        scheduler = TableIngestionScheduler(_CONFIGURATION)
+        scheduler.close()
+
+        with pytest.raises(RuntimeError):
+            scheduler.append("t1", _frame(0))
+
+    def test__unsupported_data__raises(self, service):
+        with TableIngestionScheduler(_CONFIGURATION) as scheduler:
+            with pytest.raises(ValueError):
+                scheduler.append("t1", [1, 2, 3])  # type: ignore[arg-type]
@@ -0,0 +1,278 @@
+import json
+import subprocess
+import sys
+from typing import Any, Dict, List
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import Column
+
+pa = pytest.importorskip("pyarrow")
+
+_TABLE_ID = "table_id"
+
+_COLUMNS = [
+    {"name": "index", "dataType": "INT32", "columnType": "INDEX"},
+    {"name": "flag", "dataType": "BOOL", "columnType": "NORMAL"},
+    {"name": "value", "dataType": "FLOAT64", "columnType": "NULLABLE"},
+    {"name": "single", "dataType": "FLOAT32", "columnType": "NULLABLE"},
+    {"name": "count", "dataType": "INT64", "columnType": "NULLABLE"},
+    {"name": "label", "dataType": "STRING", "columnType": "NULLABLE"},
+    {"name": "time", "dataType": "TIMESTAMP", "columnType": "NULLABLE"},
+]
+
+
+@pytest.fixture
+def client() -> DataFrameClient:
+    """Fixture to create a DataFrameClient that talks to a mocked server."""
+    return DataFrameClient(HttpConfiguration("https://test.example.com", api_key="key"))
+
+
+@pytest.fixture
+def requests_sent(client: DataFrameClient):
+    """Fixture to capture the append requests sent for the mocked table."""
+    sent: List[Dict[str, Any]] = []
+
+    def append_callback(request):
+        if request.headers["Content-Type"] == "application/json":
+            sent.append({"json": json.loads(request.body)})
+        else:
+            body = b"".join(bytes(chunk) for chunk in request.body)
+            sent.append({"arrow": pa.ipc.open_stream(body).read_all()})
+        return (204, {}, "")
+
+    metadata = {
+        "columns": _COLUMNS,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "id": _TABLE_ID,
+        "metadataModifiedAt": "2024-01-01T00:00:00Z",
+        "metadataRevision": 1,
+        "name": "table",
+        "properties": {},
+        "rowCount": 0,
+        "rowsModifiedAt": "2024-01-01T00:00:00Z",
+        "supportsAppend": True,
+        "workspace": "workspace",
+    }
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(
+            responses.GET,
+            f"{client.session.base_url}tables/{_TABLE_ID}",
+            json=metadata,
+        )
+        rsps.add_callback(
+            responses.POST,
+            f"{client.session.base_url}tables/{_TABLE_ID}/data",
+            callback=append_callback,
+        )
+        yield sent
+
+
+def _frame(rows: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "index": np.arange(rows, dtype=np.int32),
+            "flag": np.arange(rows) % 2 == 0,
+            "value": np.linspace(0.1, 1.0, rows),
+            "time": pd.date_range("2024-01-01", periods=rows, freq="1500us"),
+        }
+    )
+
+
+class TestPandasIngestion:
+    def test__arrow__frame_converted_column_wise(
+        self, client: DataFrameClient, requests_sent
+    ):
+        frame = _frame()
+
+        statistics = client.append_table_data(_TABLE_ID, frame, end_of_data=True)
+
+        assert statistics is not None
+        assert len(requests_sent) == 1
+        table = requests_sent[0]["arrow"]
+        assert table.schema == pa.schema(
+            [
+                ("index", pa.int32()),
+                ("flag", pa.bool_()),
+                ("value", pa.float64()),
+                ("time", pa.timestamp("ms")),
+            ]
+        )
+        assert table.column("value").to_pylist() == frame["value"].tolist()
+        assert table.column("time").to_pylist() == [
+            time.to_pydatetime() for time in frame["time"].dt.floor("ms")
+        ]
+
+    def test__arrow__chunk_size__one_batch_per_chunk(
+        self, client: DataFrameClient, requests_sent
+    ):
+        statistics = client.append_table_data(_TABLE_ID, _frame(25), chunk_size=10)
+
+        assert statistics is not None
+        assert statistics.batch_count == 3
+        assert requests_sent[0]["arrow"].num_rows == 25
+
+    def test__arrow__nulls_and_nan__nan_preserved(
+        self, client: DataFrameClient, requests_sent
+    ):
+        frame = _frame(3)
+        frame["value"] = [1.0, np.nan, np.inf]
+        frame["count"] = pd.array([1, None, 3], dtype="Int64")
+        frame["label"] = ["a", None, 5]
+
+        client.append_table_data(_TABLE_ID, frame)
+
+        table = requests_sent[0]["arrow"]
+        values = table.column("value").to_pylist()
+        assert values[0] == 1.0 and np.isnan(values[1]) and values[2] == np.inf
+        assert table.column("count").to_pylist() == [1, None, 3]
+        assert table.column("label").to_pylist() == ["a", None, "5"]
+
+    def test__arrow__timezone_aware_timestamps__converted_to_utc(
+        self, client: DataFrameClient, requests_sent
+    ):
+        frame = _frame(1)
+        frame["time"] = pd.to_datetime(["2024-01-01T12:00:00+02:00"])
+
+        client.append_table_data(_TABLE_ID, frame)
+
+        assert requests_sent[0]["arrow"].column("time").to_pylist() == [
+            pd.Timestamp("2024-01-01T10:00:00").to_pydatetime()
+        ]
+
+    def test__json__values_encoded_as_strings(
+        self, client: DataFrameClient, requests_sent
+    ):
+        frame = _frame(3)
+        frame["value"] = [0.1, np.nan, -np.inf]
+        frame["single"] = np.array([0.1, np.inf, 2.5], dtype=np.float32)
+        frame["count"] = pd.array([None, 2, 3], dtype="Int64")
+        frame["label"] = ["a", None, "c"]
+
+        client.append_table_data(_TABLE_ID, frame, use_arrow=False, end_of_data=True)
+
+        assert requests_sent == [
+            {
+                "json": {
+                    "frame": {
+                        "columns": [
+                            "index",
+                            "flag",
+                            "value",
+                            "time",
+                            "single",
+                            "count",
+                            "label",
+                        ],
+                        "data": [
+                            [
+                                "0",
+                                "true",
+                                "0.1",
+                                "2024-01-01T00:00:00.000Z",
+                                "0.1",
+                                None,
+                                "a",
+                            ],
+                            [
+                                "1",
+                                "false",
+                                "NaN",
+                                "2024-01-01T00:00:00.001Z",
+                                "Infinity",
+                                "2",
+                                None,
+                            ],
+                            [
+                                "2",
+                                "true",
+                                "-Infinity",
+                                "2024-01-01T00:00:00.003Z",
+                                "2.5",
+                                "3",
+                                "c",
+                            ],
+                        ],
+                    },
+                    "endOfData": True,
+                }
+            }
+        ]
+
+    def test__json__chunk_size__end_of_data_sent_with_last_chunk(
+        self, client: DataFrameClient, requests_sent
+    ):
+        client.append_table_data(
+            _TABLE_ID, _frame(5), use_arrow=False, chunk_size=2, end_of_data=True
+        )
+
+        assert [len(r["json"]["frame"]["data"]) for r in requests_sent] == [2, 2, 1]
+        assert [r["json"].get("endOfData") for r in requests_sent] == [
+            None,
+            None,
+            True,
+        ]
+
+    def test__json__float64__round_trips_exactly(
+        self, client: DataFrameClient, requests_sent
+    ):
+        frame = _frame(100)
+        frame["value"] = np.random.default_rng(0).standard_normal(100) * 1e10
+
+        client.append_table_data(_TABLE_ID, frame, use_arrow=False)
+
+        sent = [float(row[2]) for row in requests_sent[0]["json"]["frame"]["data"]]
+        assert sent == frame["value"].tolist()
+
+    def test__empty_frame__end_of_data__sends_flag_only(
+        self, client: DataFrameClient, requests_sent
+    ):
+        client.append_table_data(_TABLE_ID, _frame(0), end_of_data=True)
+
+        assert requests_sent == [{"json": {"endOfData": True}}]
+
+    @pytest.mark.parametrize(
+        "change, message",
+        [
+            (lambda f: f.assign(extra=1), "not in the table"),
+            (lambda f: f.drop(columns=["flag"]), "missing non-nullable"),
+            (lambda f: f.assign(flag=1), "not compatible"),
+            (lambda f: f.assign(label=1.5), "not compatible"),
+            (lambda f: f.assign(time="2024-01-01"), "not compatible"),
+            (lambda f: f.assign(index=np.int64(2**31)), "outside the range"),
+        ],
+    )
+    def test__incompatible_frame__raises(
+        self, client: DataFrameClient, requests_sent, change, message
+    ):
+        with pytest.raises(ValueError, match=message):
+            client.append_table_data(_TABLE_ID, change(_frame()))
+
+        assert requests_sent == []
+
+    def test__columns_passed__append__metadata_not_fetched(
+        self, client: DataFrameClient, requests_sent
+    ):
+        columns = [Column.model_validate(column) for column in _COLUMNS]
+
+        with mock.patch.object(client, "get_table_metadata") as get_table_metadata:
+            client.append_table_data(_TABLE_ID, _frame(), columns=columns)
+
+        get_table_metadata.assert_not_called()
+        assert len(requests_sent) == 1
+
+    def test__client_imported__pandas_not_loaded(self):
+        code = (
+            "import sys, nisystemlink.clients.dataframe; "
+            "print('pandas' in sys.modules)"
+        )
+
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+        assert output.strip() == "False"
@@ -0,0 +1,133 @@
+import pandas as pd
+import pytest
+import responses
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    ColumnFilter,
+    FilterOperation,
+    QueryTableDataRequest,
+)
+from nisystemlink.clients.dataframe.utilities import query_table_data_parallel
+
+from .fake_table import FakeTable, serve
+
+
+@pytest.fixture
+def client() -> DataFrameClient:
+    """Fixture to create a DataFrameClient that talks to a mocked server."""
+    return DataFrameClient(HttpConfiguration("https://test.example.com", api_key="key"))
+
+
+class TestQueryTableDataParallel:
+    @pytest.mark.parametrize("partitions, max_workers", [(1, 1), (4, 2), (7, 7)])
+    def test__int_index__all_rows_yielded_in_order(
+        self, client: DataFrameClient, partitions, max_workers
+    ):
+        table = FakeTable("INT64", [3 * i for i in range(40)][::-1])
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            frames = list(
+                query_table_data_parallel(
+                    client,
+                    FakeTable.ID,
+                    QueryTableDataRequest(take=5),
+                    partitions=partitions,
+                    max_workers=max_workers,
+                )
+            )
+
+        indexes = [row[0] for frame in frames for row in frame.data]
+        assert indexes == [str(3 * i) for i in range(40)]
+
+    def test__timestamp_index__all_rows_yielded_in_order(self, client: DataFrameClient):
+        times = pd.date_range("2024-01-01", periods=30, freq="7s")
+        values = [t.strftime("%Y-%m-%dT%H:%M:%S.000Z") for t in times]
+        table = FakeTable("TIMESTAMP", values[::-1])
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            frames = list(query_table_data_parallel(client, FakeTable.ID, partitions=4))
+
+        assert [row[0] for frame in frames for row in frame.data] == values
+
+    def test__partitions__ranges_are_disjoint(self, client: DataFrameClient):
+        table = FakeTable("INT32", list(range(100)))
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            list(
+                query_table_data_parallel(
+                    client, FakeTable.ID, QueryTableDataRequest(take=100), partitions=4
+                )
+            )
+
+        ranges = sorted(
+            (q["filters"][0]["value"], q["filters"][1]["operation"])
+            for q in table.queries
+            if q.get("take") == 100
+        )
+        assert ranges == [
+            ("0", "LESS_THAN"),
+            ("25", "LESS_THAN"),
+            ("50", "LESS_THAN"),
+            ("75", "LESS_THAN_EQUALS"),
+        ]
+
+    def test__more_partitions_than_values__partitions_reduced(
+        self, client: DataFrameClient
+    ):
+        table = FakeTable("INT32", [5, 6])
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            frames = list(query_table_data_parallel(client, FakeTable.ID, partitions=8))
+
+        assert [row[0] for frame in frames for row in frame.data] == ["5", "6"]
+        assert len(table.queries) == 4
+
+    def test__query_filters__applied_to_bounds_and_ranges(
+        self, client: DataFrameClient
+    ):
+        table = FakeTable("INT32", list(range(20)))
+        query = QueryTableDataRequest(
+            columns=["value"],
+            filters=[
+                ColumnFilter(
+                    column="index", operation=FilterOperation.GreaterThan, value="9"
+                )
+            ],
+        )
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            frames = list(query_table_data_parallel(client, FakeTable.ID, query))
+
+        assert [row[0] for frame in frames for row in frame.data] == [
+            str(i) for i in range(10, 20)
+        ]
+
+    def test__no_matching_rows__yields_nothing(self, client: DataFrameClient):
+        table = FakeTable("INT32", [])
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            frames = list(query_table_data_parallel(client, FakeTable.ID))
+
+        assert frames == []
+
+    def test__worker_fails__error_raised_to_caller(self, client: DataFrameClient):
+        table = FakeTable("INT32", list(range(20)))
+        table.fail_ranges = True
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            with pytest.raises(ApiException):
+                list(query_table_data_parallel(client, FakeTable.ID))
+
+    def test__order_by__raises(self, client: DataFrameClient):
+        query = QueryTableDataRequest.model_validate({"orderBy": [{"column": "index"}]})
+
+        with pytest.raises(ValueError):
+            next(query_table_data_parallel(client, FakeTable.ID, query))
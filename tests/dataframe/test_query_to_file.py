@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import (
+    ColumnOrderBy,
+    QueryTableDataRequest,
+)
+from nisystemlink.clients.dataframe.utilities import query_table_data_to_file
+
+from .fake_table import FakeTable, serve
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def client() -> DataFrameClient:
+    """Fixture to create a DataFrameClient that talks to a mocked server."""
+    return DataFrameClient(HttpConfiguration("https://test.example.com", api_key="key"))
+
+
+class TestQueryTableDataToFile:
+    def test__all_pages__written_to_file_and_mapped(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT64", list(range(10)))
+        path = tmp_path / "result.arrow"
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            result = query_table_data_to_file(
+                client, FakeTable.ID, path, QueryTableDataRequest(take=4)
+            )
+
+        assert path.exists()
+        assert result.schema == pa.schema(
+            [
+                pa.field("index", pa.int64(), nullable=False),
+                pa.field("value", pa.int32(), nullable=False),
+            ]
+        )
+        assert result.column("index").to_pylist() == list(range(10))
+        assert result.column("index").num_chunks == 3
+        assert [q["columns"] for q in table.queries] == [["index", "value"]] * 3
+
+    def test__query_columns__converted_in_query_order(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT32", [3, 1, 2])
+        query = QueryTableDataRequest(
+            columns=["value", "index"],
+            order_by=[ColumnOrderBy(column="index", descending=True)],
+        )
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            result = query_table_data_to_file(
+                client, FakeTable.ID, tmp_path / "result.arrow", query
+            )
+
+        assert result.column_names == ["value", "index"]
+        assert result.column("index").to_pylist() == [3, 2, 1]
+
+    def test__result__not_copied_into_memory(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT64", list(range(1000)))
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            allocated = pa.total_allocated_bytes()
+            result = query_table_data_to_file(
+                client,
+                FakeTable.ID,
+                tmp_path / "result.arrow",
+                QueryTableDataRequest(take=1000),
+            )
+
+        assert result.num_rows == 1000
+        assert pa.total_allocated_bytes() == allocated
+
+    def test__unknown_column__raises(self, client: DataFrameClient, tmp_path: Path):
+        table = FakeTable("INT32", [1])
+
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+            serve(client, table, rsps)
+            with pytest.raises(ValueError):
+                query_table_data_to_file(
+                    client,
+                    FakeTable.ID,
+                    tmp_path / "result.arrow",
+                    QueryTableDataRequest(columns=["missing"]),
+                )
@@ -0,0 +1,230 @@
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import pytest
+import responses
+from nisystemlink.clients.core import ApiException, HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.models import QueryTablesRequest, TableMetadata
+from nisystemlink.clients.dataframe.utilities import iterate_tables, TableMetadataCache
+
+_BASE_URL = "https://test.example.com/nidataframe/v1/"
+_MODIFIED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _table(id: str, modified_at: datetime = _MODIFIED_AT) -> Dict[str, Any]:
+    return {
+        "columns": [{"name": "index", "dataType": "INT32", "columnType": "INDEX"}],
+        "createdAt": "2024-01-01T00:00:00Z",
+        "id": id,
+        "metadataModifiedAt": modified_at.isoformat(),
+        "metadataRevision": 1,
+        "name": id,
+        "properties": {},
+        "rowCount": 0,
+        "rowsModifiedAt": "2024-01-01T00:00:00Z",
+        "supportsAppend": True,
+        "workspace": "workspace",
+    }
+
+
+def _paged(ids: List[str], continuation_token: str | None = None) -> Dict[str, Any]:
+    return {
+        "tables": [_table(id) for id in ids],
+        "continuationToken": continuation_token,
+    }
+
+
+@pytest.fixture
+def client() -> DataFrameClient:
+    """Fixture to create a DataFrameClient that talks to a mocked server."""
+    return DataFrameClient(HttpConfiguration("https://test.example.com", api_key="key"))
+
+
+class TestIterateTables:
+    def test__list__all_pages_returned(self, client: DataFrameClient):
+        with responses.RequestsMock() as rsps:
+            rsps.get(
+                f"{_BASE_URL}tables",
+                json=_paged(["a", "b"], "token"),
+                match=[responses.matchers.query_param_matcher({})],
+            )
+            rsps.get(
+                f"{_BASE_URL}tables",
+                json=_paged(["c"]),
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"continuationToken": "token"}
+                    )
+                ],
+            )
+
+            ids = [table.id for table in iterate_tables(client)]
+
+        assert ids == ["a", "b", "c"]
+
+    def test__query__continuation_tokens_followed_and_cache_filled(
+        self, client: DataFrameClient
+    ):
+        cache = TableMetadataCache(client)
+        bodies = []
+
+        def query(request):
+            body = json.loads(request.body)
+            bodies.append(body)
+            if body.get("continuationToken") is None:
+                return (200, {}, json.dumps(_paged(["a"], "token")))
+            return (200, {}, json.dumps(_paged(["b"])))
+
+        with responses.RequestsMock() as rsps:
+            rsps.add_callback(responses.POST, f"{_BASE_URL}query-tables", query)
+            tables = list(
+                iterate_tables(
+                    client, QueryTablesRequest(filter="name != null"), cache=cache
+                )
+            )
+
+            assert cache.get("a") is tables[0]
+            assert cache.get("b") is tables[1]
+
+        assert [b.get("continuationToken") for b in bodies] == [None, "token"]
+        assert all(b["filter"] == "name != null" for b in bodies)
+
+    def test__next_page__fetched_while_caller_processes_current(
+        self, client: DataFrameClient
+    ):
+        second_page_requested = threading.Event()
+
+        def query(request):
+            if json.loads(request.body).get("continuationToken") is None:
+                return (200, {}, json.dumps(_paged(["a"], "token")))
+            second_page_requested.set()
+            return (200, {}, json.dumps(_paged(["b"])))
+
+        with responses.RequestsMock() as rsps:
+            rsps.add_callback(responses.POST, f"{_BASE_URL}query-tables", query)
+            tables = iterate_tables(client, QueryTablesRequest(filter=""))
+            next(tables)
+
+            assert second_page_requested.wait(timeout=10)
+            assert [table.id for table in tables] == ["b"]
+
+    def test__request_fails__raises(self, client: DataFrameClient):
+        with responses.RequestsMock() as rsps:
+            rsps.get(f"{_BASE_URL}tables", json=_paged(["a"], "token"))
+            rsps.get(f"{_BASE_URL}tables", status=400)
+            tables = iterate_tables(client)
+
+            assert next(tables).id == "a"
+            with pytest.raises(ApiException):
+                next(tables)
+
+    def test__invalid_prefetch_pages__raises(self, client: DataFrameClient):
+        with pytest.raises(ValueError):
+            next(iterate_tables(client, prefetch_pages=0))
+
+
+class TestTableMetadataCache:
+    def test__get__fetched_once(self, client: DataFrameClient):
+        cache = TableMetadataCache(client)
+
+        with responses.RequestsMock() as rsps:
+            rsps.get(f"{_BASE_URL}tables/a", json=_table("a"))
+            first = cache.get("a")
+            second = cache.get("a")
+
+        assert first is second
+        assert "a" in cache
+
+    def test__get_many__missing_tables_fetched_in_one_request(
+        self, client: DataFrameClient
+    ):
+        cache = TableMetadataCache(client)
+        cache.update([TableMetadata.model_validate(_table("a"))])
+
+        with responses.RequestsMock() as rsps:
+            rsps.get(
+                f"{_BASE_URL}tables",
+                json=_paged(["b", "c"]),
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"take": "3", "id": ["b", "c", "d"]}
+                    )
+                ],
+            )
+            tables = cache.get_many(["a", "b", "c", "d", "b"])
+
+        assert list(tables) == ["a", "b", "c"]
+        assert len(cache) == 3
+
+    def test__get_many__many_missing_tables__ids_split_across_requests(
+        self, client: DataFrameClient
+    ):
+        cache = TableMetadataCache(client)
+        ids = [f"table{i}" for i in range(150)]
+
+        with responses.RequestsMock() as rsps:
+            rsps.get(
+                f"{_BASE_URL}tables",
+                json=_paged(ids[:100]),
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"take": "100", "id": ids[:100]}
+                    )
+                ],
+            )
+            rsps.get(
+                f"{_BASE_URL}tables",
+                json=_paged(ids[100:]),
+                match=[
+                    responses.matchers.query_param_matcher(
+                        {"take": "50", "id": ids[100:]}
+                    )
+                ],
+            )
+            tables = cache.get_many(ids)
+
+        assert list(tables) == ids
+
+    def test__update__older_metadata_ignored(self, client: DataFrameClient):
+        cache = TableMetadataCache(client)
+        newer = TableMetadata.model_validate(
+            _table("a", _MODIFIED_AT + timedelta(hours=1))
+        )
+        cache.update([newer])
+
+        cache.update([TableMetadata.model_validate(_table("a"))])
+
+        assert cache.get("a") is newer
+
+    def test__update__newer_metadata_replaces_entry(self, client: DataFrameClient):
+        cache = TableMetadataCache(client)
+        cache.update([TableMetadata.model_validate(_table("a"))])
+        newer = TableMetadata.model_validate(
+            _table("a", _MODIFIED_AT + timedelta(hours=1))
+        )
+
+        cache.update([newer])
+
+        assert cache.get("a") is newer
+
+    def test__invalidate__next_get_fetches(self, client: DataFrameClient):
+        cache = TableMetadataCache(client)
+        cache.update([TableMetadata.model_validate(_table("a"))])
+
+        cache.invalidate("a")
+
+        assert "a" not in cache
+        with responses.RequestsMock() as rsps:
+            rsps.get(f"{_BASE_URL}tables/a", json=_table("a"))
+            cache.get("a")
+
+    def test__invalidate_all__cache_cleared(self, client: DataFrameClient):
+        cache = TableMetadataCache(client)
+        cache.update([TableMetadata.model_validate(_table(id)) for id in "abc"])
+
+        cache.invalidate()
+
+        assert len(cache) == 0
@@ -0,0 +1,164 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import responses
+from nisystemlink.clients.core import HttpConfiguration
+from nisystemlink.clients.dataframe import DataFrameClient
+from nisystemlink.clients.dataframe.utilities import TableMirror
+
+from .fake_table import FakeTable, serve
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def client() -> DataFrameClient:
+    """Fixture to create a DataFrameClient that talks to a mocked server."""
+    return DataFrameClient(HttpConfiguration("https://test.example.com", api_key="key"))
+
+
+class TestTableMirror:
+    def test__first_refresh__whole_table_mirrored(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT64", list(range(10)))
+        mirror = TableMirror(client, FakeTable.ID, tmp_path, page_size=4)
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            added = mirror.refresh()
+
+        assert added == 10
+        assert mirror.watermark == "9"
+        assert mirror.row_count == 10
+        data = mirror.read()
+        assert data.column("index").to_pylist() == list(range(10))
+        assert data.column("value").to_pylist() == list(range(10))
+        assert data.column("index").num_chunks == 3
+        assert (tmp_path / FakeTable.ID).is_dir()
+
+    def test__rows_appended__only_new_rows_fetched(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT32", list(range(5)))
+        mirror = TableMirror(client, FakeTable.ID, tmp_path)
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            mirror.refresh()
+            table.append([5, 6, 7])
+            table.queries.clear()
+            added = mirror.refresh()
+
+        assert added == 3
+        assert table.queries[0]["filters"] == [
+            {"column": "index", "operation": "GREATER_THAN", "value": "4"}
+        ]
+        assert mirror.read().column("index").to_pylist() == list(range(8))
+
+    def test__table_not_modified__no_query_sent(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT32", list(range(5)))
+        mirror = TableMirror(client, FakeTable.ID, tmp_path)
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            mirror.refresh()
+            queries = len(table.queries)
+            added = mirror.refresh()
+
+        assert added == 0
+        assert len(table.queries) == queries
+
+    def test__table_without_index__refresh__raises(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT32", list(range(5)))
+        metadata = table.metadata()
+        metadata["columns"][0]["columnType"] = "NORMAL"
+        mirror = TableMirror(client, FakeTable.ID, tmp_path)
+
+        with responses.RequestsMock() as rsps:
+            rsps.get(f"{client.session.base_url}tables/{FakeTable.ID}", json=metadata)
+            with pytest.raises(ValueError, match="must have an index column"):
+                mirror.refresh()
+
+    def test__new_instance__state_loaded_from_disk(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT32", list(range(5)))
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            TableMirror(client, FakeTable.ID, tmp_path).refresh()
+            table.append([5])
+            mirror = TableMirror(client, FakeTable.ID, tmp_path)
+            added = mirror.refresh()
+
+        assert mirror.rows_modified_at == table.rows_modified_at
+        assert added == 1
+        assert mirror.read(["value"]).column_names == ["value"]
+        assert mirror.read().num_rows == 6
+
+    def test__metadata_revision_changed__mirror_rebuilt(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT32", list(range(5)))
+        mirror = TableMirror(client, FakeTable.ID, tmp_path)
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            mirror.refresh()
+            table.metadata_revision += 1
+            added = mirror.refresh()
+
+        assert added == 5
+        assert mirror.read().num_rows == 5
+
+    def test__timestamp_index__values_parsed_as_utc(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        values = ["2024-01-01T00:00:00.000Z", "2024-01-01T00:00:01.500Z"]
+        table = FakeTable("TIMESTAMP", values)
+        mirror = TableMirror(client, FakeTable.ID, tmp_path)
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            mirror.refresh()
+
+        assert mirror.watermark == values[-1]
+        assert mirror.read().column("index").to_pylist() == [
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 1, 0, 0, 1, 500000),
+        ]
+
+    def test__read__memory_mapped_without_copying(
+        self, client: DataFrameClient, tmp_path: Path
+    ):
+        table = FakeTable("INT64", list(range(1000)))
+        mirror = TableMirror(client, FakeTable.ID, tmp_path, page_size=1000)
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            mirror.refresh()
+
+        allocated = pa.total_allocated_bytes()
+        data = mirror.read()
+
+        assert data.num_rows == 1000
+        assert pa.total_allocated_bytes() == allocated
+
+    def test__clear__data_removed(self, client: DataFrameClient, tmp_path: Path):
+        table = FakeTable("INT32", list(range(5)))
+        mirror = TableMirror(client, FakeTable.ID, tmp_path)
+
+        with responses.RequestsMock() as rsps:
+            serve(client, table, rsps)
+            mirror.refresh()
+        mirror.clear()
+
+        assert mirror.watermark is None
+        assert mirror.row_count == 0
+        assert not (tmp_path / FakeTable.ID).exists()
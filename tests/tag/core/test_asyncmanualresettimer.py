@@ -0,0 +1,84 @@
+import asyncio
+import datetime
+import threading
+
+import pytest
+from nisystemlink.clients.tag._core._async_manual_reset_timer import (
+    AsyncManualResetTimer,
+)
+
+
+class TestAsyncManualResetTimer:
+    def test__no_running_loop__constructed__raises(self):
+        with pytest.raises(RuntimeError):
+            AsyncManualResetTimer(datetime.timedelta(seconds=1))
+
+    @pytest.mark.asyncio
+    async def test__bad_interval__constructed__raises(self):
+        with pytest.raises(ValueError):
+            AsyncManualResetTimer(datetime.timedelta(0))
+
+    @pytest.mark.asyncio
+    async def test__started__callback_awaited_once_on_loop(self):
+        calls = []
+
+        async def callback():
+            calls.append(threading.get_ident())
+
+        uut = AsyncManualResetTimer(datetime.timedelta(milliseconds=10))
+        uut.callback = callback
+
+        uut.start()
+        uut.start()
+        await asyncio.sleep(0.1)
+
+        assert calls == [threading.get_ident()]
+
+    @pytest.mark.asyncio
+    async def test__restarted_in_callback__callback_awaited_again(self):
+        calls = []
+        uut = AsyncManualResetTimer(datetime.timedelta(milliseconds=10))
+
+        async def callback():
+            calls.append(None)
+            if len(calls) < 3:
+                uut.start()
+
+        uut.callback = callback
+
+        uut.start()
+        await asyncio.sleep(0.2)
+
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test__stopped__callback_not_awaited(self):
+        calls = []
+
+        async def callback():
+            calls.append(None)
+
+        async with AsyncManualResetTimer(datetime.timedelta(milliseconds=10)) as uut:
+            uut.callback = callback
+            uut.start()
+            uut.stop()
+            await asyncio.sleep(0.05)
+
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test__started_from_other_thread__callback_awaited_on_loop(self):
+        calls = []
+
+        async def callback():
+            calls.append(threading.get_ident())
+
+        uut = AsyncManualResetTimer(datetime.timedelta(milliseconds=10))
+        uut.callback = callback
+
+        thread = threading.Thread(target=uut.start)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.1)
+
+        assert calls == [threading.get_ident()]
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._callback_dispatcher import CallbackDispatcher
+
+
+class TestCallbackDispatcher:
+    def test__many_keys__callbacks_called_in_order_per_key(self):
+        called = {"a": [], "b": [], "c": []}
+        done = threading.Semaphore(0)
+        uut = CallbackDispatcher(ThreadPoolExecutor(4))
+
+        def callback(key, i):
+            called[key].append(i)
+            done.release()
+
+        for i in range(100):
+            for key in called:
+                uut.dispatch(key, lambda key=key, i=i: callback(key, i))
+        for _ in range(300):
+            assert done.acquire(timeout=5)
+        uut.close()
+
+        for values in called.values():
+            assert values == list(range(100))
+
+    def test__slow_callback__other_keys_not_delayed(self):
+        release = threading.Event()
+        done = threading.Event()
+        uut = CallbackDispatcher()
+
+        uut.dispatch("slow", lambda: release.wait(timeout=5))
+        uut.dispatch("fast", done.set)
+
+        assert done.wait(timeout=5)
+        release.set()
+        uut.close()
+
+    def test__callback_raises__later_callbacks_called(self):
+        done = threading.Event()
+        uut = CallbackDispatcher()
+
+        uut.dispatch("a", lambda: 1 / 0)
+        uut.dispatch("a", done.set)
+
+        assert done.wait(timeout=5)
+        uut.close()
+
+    def test__max_pending_with_block__dispatch_waits(self):
+        release = threading.Event()
+        started = threading.Event()
+        uut = CallbackDispatcher(ThreadPoolExecutor(1), max_pending=1)
+
+        def slow():
+            started.set()
+            release.wait(timeout=5)
+
+        uut.dispatch("a", slow)
+        assert started.wait(timeout=5)
+        uut.dispatch("a", lambda: None)
+        blocked = threading.Thread(target=uut.dispatch, args=("a", lambda: None))
+        blocked.start()
+        blocked.join(timeout=0.1)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(timeout=5)
+        assert not blocked.is_alive()
+        uut.close()
+
+    @pytest.mark.asyncio
+    async def test__max_pending_with_block__dispatch_async__event_loop_not_blocked(
+        self,
+    ):
+        release = threading.Event()
+        started = threading.Event()
+        done = threading.Event()
+        uut = CallbackDispatcher(ThreadPoolExecutor(1), max_pending=1)
+
+        def slow():
+            started.set()
+            release.wait(timeout=5)
+
+        await uut.dispatch_async("a", slow)
+        assert started.wait(timeout=5)
+        await uut.dispatch_async("a", lambda: None)
+        blocked = asyncio.ensure_future(uut.dispatch_async("a", done.set))
+        await asyncio.sleep(0.1)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=5)
+        assert done.wait(timeout=5)
+        uut.close()
+
+    def test__submit_raises__dispatch__later_dispatch_drains_key(self):
+        done = threading.Event()
+        executor = ThreadPoolExecutor(1)
+        submit = executor.submit
+        failures = [RuntimeError("cannot schedule new futures after shutdown")]
+
+        def flaky_submit(*args):
+            if failures:
+                raise failures.pop()
+            return submit(*args)
+
+        executor.submit = flaky_submit  # type: ignore
+        uut = CallbackDispatcher(executor)
+
+        with pytest.raises(RuntimeError):
+            uut.dispatch("a", lambda: None)
+        uut.dispatch("a", done.set)
+
+        assert done.wait(timeout=5)
+        uut.close()
+
+    def test__max_pending_with_drop_oldest__oldest_callback_discarded(self):
+        release = threading.Event()
+        started = threading.Event()
+        called = []
+        done = threading.Event()
+        uut = CallbackDispatcher(
+            ThreadPoolExecutor(1),
+            max_pending=2,
+            queue_full_policy=tbase.QueueFullPolicy.DROP_OLDEST,
+        )
+
+        def slow():
+            started.set()
+            release.wait(timeout=5)
+
+        uut.dispatch("a", slow)
+        assert started.wait(timeout=5)
+        uut.dispatch("b", lambda: called.append(1))
+        uut.dispatch("a", lambda: called.append(2))
+        uut.dispatch("b", lambda: (called.append(3), done.set()))
+        release.set()
+
+        assert done.wait(timeout=5)
+        assert sorted(called) == [2, 3]
+        assert uut.dropped == 1
+        uut.close()
+
+    def test__raise_policy__constructor__raises(self):
+        with pytest.raises(ValueError):
+            CallbackDispatcher(queue_full_policy=tbase.QueueFullPolicy.RAISE)
+        with pytest.raises(ValueError):
+            CallbackDispatcher(max_pending=0)
@@ -0,0 +1,69 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._executor_timer_scheduler import (
+    ExecutorTimerScheduler,
+)
+
+
+class TestExecutorTimerScheduler:
+    def test__slow_callbacks__other_schedulers_timers_not_delayed(self):
+        shared = tbase.ThreadedTimerScheduler(max_workers=1)
+        uut = ExecutorTimerScheduler(shared, ThreadPoolExecutor(2))
+        release = threading.Event()
+        started = threading.Semaphore(0)
+        done = threading.Event()
+
+        def slow():
+            started.release()
+            release.wait(timeout=10)
+
+        try:
+            for _ in range(4):
+                uut.call_later(0.01, slow)
+            assert started.acquire(timeout=5)
+            shared.call_later(0.02, done.set)
+
+            assert done.wait(timeout=5)
+        finally:
+            release.set()
+            uut.close()
+            shared.close()
+
+    def test__callback_cancelled__not_called(self):
+        shared = tbase.ThreadedTimerScheduler()
+        uut = ExecutorTimerScheduler(shared, ThreadPoolExecutor(1))
+        called = []
+        done = threading.Event()
+        try:
+            handle = uut.call_later(0.02, lambda: called.append(None))
+            uut.call_later(0.05, done.set)
+            handle.cancel()
+
+            assert done.wait(timeout=5)
+        finally:
+            uut.close()
+            shared.close()
+
+        assert called == []
+
+    def test__callback_called_on_executor(self):
+        shared = tbase.ThreadedTimerScheduler()
+        uut = ExecutorTimerScheduler(
+            shared, ThreadPoolExecutor(1, thread_name_prefix="executor")
+        )
+        names = []
+        done = threading.Event()
+        try:
+            uut.call_later(
+                0.01,
+                lambda: (names.append(threading.current_thread().name), done.set()),
+            )
+
+            assert done.wait(timeout=5)
+        finally:
+            uut.close()
+            shared.close()
+
+        assert names[0].startswith("executor")
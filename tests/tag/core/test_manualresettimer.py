@@ -1,6 +1,8 @@
 import datetime
+import threading
 import time
 
+from nisystemlink.clients.tag import ThreadedTimerScheduler
 from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 
 
@@ -23,3 +25,44 @@ class TestManualResetTimer:
             time.sleep(0.280)
 
             assert 2 <= len(data) <= 3
+
+    def test__stopped__elapsed_not_raised(self):
+        data = []
+        interval = datetime.timedelta(milliseconds=50)
+        with ManualResetTimer(interval) as uut:
+            uut.elapsed += lambda: data.append(None)
+
+            uut.start()
+            uut.stop()
+            time.sleep(0.150)
+
+            assert data == []
+
+    def test__started_twice__elapsed_raised_once(self):
+        data = []
+        interval = datetime.timedelta(milliseconds=50)
+        with ManualResetTimer(interval) as uut:
+            uut.elapsed += lambda: data.append(None)
+
+            uut.start()
+            uut.start()
+            time.sleep(0.150)
+
+            assert len(data) == 1
+
+    def test__many_timers__share_scheduler_threads(self):
+        scheduler = ThreadedTimerScheduler(max_workers=2)
+        threads_before = threading.active_count()
+        interval = datetime.timedelta(milliseconds=10)
+        elapsed = threading.Semaphore(0)
+        timers = [ManualResetTimer(interval, scheduler) for _ in range(200)]
+        try:
+            for timer in timers:
+                timer.elapsed += elapsed.release
+                timer.start()
+            for _ in timers:
+                assert elapsed.acquire(timeout=5)
+
+            assert threading.active_count() <= threads_before + 3
+        finally:
+            scheduler.close()
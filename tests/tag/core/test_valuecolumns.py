@@ -0,0 +1,49 @@
+import datetime
+
+import numpy as np
+import pytest
+from nisystemlink.clients.core._internal._timestamp_utilities import (
+    TimestampUtilities,
+)
+from nisystemlink.clients.tag._core._value_columns import (
+    datetime64_to_str,
+    str_to_datetime64,
+)
+
+
+class TestValueColumns:
+    def test__str_to_datetime64__microsecond_array_returned(self):
+        result = str_to_datetime64(
+            [
+                "2024-01-02T03:04:05.6Z",
+                "2024-01-02T03:04:05.1234567Z",
+                "0001-01-01T00:00:00.0Z",
+            ]
+        )
+
+        assert result.dtype == np.dtype("datetime64[us]")
+        assert result.tolist() == [
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 600000),
+            datetime.datetime(2024, 1, 2, 3, 4, 5, 123456),
+            datetime.datetime(1, 1, 1),
+        ]
+
+    def test__timestamp_without_z__str_to_datetime64__raises(self):
+        with pytest.raises(ValueError):
+            str_to_datetime64(["2024-01-02T03:04:05.6"])
+
+    def test__datetime64_to_str__same_result_as_datetime_to_str(self):
+        values = np.array(
+            ["2024-01-02T03:04:05", "2024-01-02T03:04:05.000600"],
+            dtype="datetime64[us]",
+        )
+
+        result = datetime64_to_str(values)
+
+        assert result == [
+            TimestampUtilities.datetime_to_str(v) for v in values.tolist()
+        ]
+
+    def test__nat__datetime64_to_str__raises(self):
+        with pytest.raises(ValueError):
+            datetime64_to_str(np.array(["NaT"], dtype="datetime64[us]"))
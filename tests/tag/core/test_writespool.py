@@ -0,0 +1,185 @@
+import os
+import threading
+
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._write_spool import WriteSpool
+
+BLOCK = tbase.QueueFullPolicy.BLOCK
+
+
+def _drain(spool):
+    data = []
+    while True:
+        record = spool.wait_for_record(timeout=0)
+        if record is None:
+            return data
+        data.append(record.data)
+        spool.commit(record)
+
+
+def _segment_files(directory):
+    return sorted(f for f in os.listdir(directory) if f.endswith(".spool"))
+
+
+class TestWriteSpool:
+    def test__records_appended__read_in_order(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=64, max_size=1024)
+
+        assert spool.append([(b"one", 1), (b"two", 2)], BLOCK) == 0
+        spool.append([(b"three", 3)], BLOCK)
+
+        assert spool.pending_records == 3
+        assert _drain(spool) == [b"one", b"two", b"three"]
+        assert spool.pending_records == 0
+
+    def test__record_not_committed__returned_again(self, tmp_path):
+        spool = WriteSpool(tmp_path)
+        spool.append([(b"one", 1), (b"two", 1)], BLOCK)
+
+        first = spool.wait_for_record(timeout=0)
+        again = spool.wait_for_record(timeout=0)
+
+        assert first is not None and again is not None
+        assert first.data == again.data == b"one"
+        assert first.writes == 1
+
+    def test__spool_closed__unsent_records_recovered(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=64, max_size=1024)
+        spool.append([(b"one", 1), (b"two", 2), (b"three" * 10, 3)], BLOCK)
+        record = spool.wait_for_record(timeout=0)
+        assert record is not None
+        spool.commit(record)
+        spool.close()
+
+        recovered = WriteSpool(tmp_path, segment_size=64, max_size=1024)
+
+        assert recovered.pending_records == 2
+        assert _drain(recovered) == [b"two", b"three" * 10]
+
+    def test__recovered_spool__appends_after_recovered_records(self, tmp_path):
+        spool = WriteSpool(tmp_path)
+        spool.append([(b"one", 1)], BLOCK)
+        spool.close()
+
+        recovered = WriteSpool(tmp_path)
+        recovered.append([(b"two", 1)], BLOCK)
+
+        assert _drain(recovered) == [b"one", b"two"]
+
+    def test__torn_record__recovery_stops_before_it(self, tmp_path):
+        spool = WriteSpool(tmp_path)
+        spool.append([(b"one", 1), (b"two", 1)], BLOCK)
+        spool.close()
+        path = os.path.join(tmp_path, _segment_files(tmp_path)[0])
+        with open(path, "r+b") as file:
+            contents = file.read()
+            file.seek(contents.index(b"two"))
+            file.write(b"TWO")
+
+        recovered = WriteSpool(tmp_path)
+
+        assert _drain(recovered) == [b"one"]
+
+    def test__all_records_sent__segments_deleted(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=32, max_size=1024)
+        spool.append([(b"x" * 10, 1) for _ in range(3)], BLOCK)
+        assert len(_segment_files(tmp_path)) == 3
+
+        _drain(spool)
+
+        # The segment being written to is kept
+        assert len(_segment_files(tmp_path)) == 1
+        assert spool.size == 32
+
+    def test__spool_full_and_drop_oldest_policy__oldest_records_dropped(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=32, max_size=64)
+        spool.append([(b"x" * 10, 2), (b"y" * 10, 3)], BLOCK)
+
+        dropped = spool.append([(b"z" * 10, 4)], tbase.QueueFullPolicy.DROP_OLDEST)
+
+        assert dropped == 2
+        assert _drain(spool) == [b"y" * 10, b"z" * 10]
+        assert spool.size <= 64
+
+    def test__spool_full_and_raise_policy__nothing_appended(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=32, max_size=64)
+        spool.append([(b"x" * 10, 1)], BLOCK)
+
+        with pytest.raises(BufferError):
+            spool.append([(b"y" * 10, 1), (b"z" * 10, 1)], tbase.QueueFullPolicy.RAISE)
+
+        assert _drain(spool) == [b"x" * 10]
+
+    def test__spool_full_and_block_policy__append_waits_for_commit(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=32, max_size=64)
+        spool.append([(b"x" * 10, 1), (b"y" * 10, 1)], BLOCK)
+
+        blocked = threading.Thread(target=spool.append, args=([(b"z" * 10, 1)], BLOCK))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        record = spool.wait_for_record(timeout=0)
+        assert record is not None
+        spool.commit(record)
+        blocked.join(timeout=10)
+
+        assert not blocked.is_alive()
+        assert _drain(spool) == [b"y" * 10, b"z" * 10]
+
+    def test__spool_full__has_room_after_commit(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=32, max_size=64)
+        spool.append([(b"x" * 10, 1), (b"y" * 10, 1)], BLOCK)
+        assert not spool.has_room
+        assert not spool.wait_for_room(timeout=0)
+
+        record = spool.wait_for_record(timeout=0)
+        assert record is not None
+        spool.commit(record)
+
+        assert spool.has_room
+        assert spool.wait_for_room(timeout=0)
+
+    def test__spool_full_and_no_policy__records_exceed_max_size(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=32, max_size=64)
+        spool.append([(b"x" * 10, 1), (b"y" * 10, 1)], BLOCK)
+
+        assert spool.append([(b"z" * 10, 1)], None) == 0
+
+        assert spool.size > 64
+        assert _drain(spool) == [b"x" * 10, b"y" * 10, b"z" * 10]
+
+    def test__record_larger_than_segment__gets_own_segment(self, tmp_path):
+        spool = WriteSpool(tmp_path, segment_size=32, max_size=1024)
+
+        spool.append([(b"x" * 100, 1)], BLOCK)
+
+        assert spool.size > 100
+        assert _drain(spool) == [b"x" * 100]
+
+    def test__interrupted__wait_for_record_returns_none(self, tmp_path):
+        spool = WriteSpool(tmp_path)
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(spool.wait_for_record())
+        )
+        waiter.start()
+
+        spool.interrupt()
+        waiter.join(timeout=10)
+
+        assert results == [None]
+
+    def test__closed__append_raises(self, tmp_path):
+        spool = WriteSpool(tmp_path)
+        spool.close()
+
+        with pytest.raises(ReferenceError):
+            spool.append([(b"one", 1)], BLOCK)
+
+    def test__bad_arguments__raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            WriteSpool(tmp_path, segment_size=0)
+        with pytest.raises(ValueError):
+            WriteSpool(tmp_path, segment_size=64, max_size=32)
@@ -1,7 +1,8 @@
+import json
 from datetime import datetime, timedelta
 
 import pytest  # type: ignore
-from nisystemlink.clients import tag as tbase
+from nisystemlink.clients import core, tag as tbase
 from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
 from nisystemlink.clients.tag._core._system_time_stamper import SystemTimeStamper
 from nisystemlink.clients.tag._http._http_buffered_tag_writer import (
@@ -154,3 +155,258 @@ class TestHttpBufferedTagWriter(HttpClientTestBase):
         assert data2[0]["updates"] == [
             {"value": {"type": "INT", "value": str(value2)}, "timestamp": utctime2}
         ]
+
+    def _make_writer(self, **kwargs):
+        return HttpBufferedTagWriter(
+            self._client,
+            SystemTimeStamper(),
+            0,
+            ManualResetTimer.null_timer,
+            **kwargs,
+        )
+
+    def _sent_values(self):
+        call = self._client.all_requests.call_args_list[-1]
+        return {
+            item["path"]: [update["value"]["value"] for update in item["updates"]]
+            for item in call[1]["data"]
+        }
+
+    def test__keep_last__send_buffered_writes__only_latest_values_sent(self):
+        uut = self._make_writer(keep_last=2)
+
+        for value in range(5):
+            uut.write("tag1", tbase.DataType.INT32, value)
+        uut.write("tag2", tbase.DataType.INT32, 9)
+        uut.send_buffered_writes()
+
+        assert self._sent_values() == {"tag1": ["3", "4"], "tag2": ["9"]}
+        data = self._client.all_requests.call_args_list[-1][1]["data"]
+        assert all(isinstance(item["updates"], list) for item in data)
+
+    def test__keep_last_by_path__matching_paths_coalesced(self):
+        uut = self._make_writer(keep_last_by_path={"status.*": 1, "*.state": 2})
+
+        for value in range(3):
+            uut.write("status.temperature", tbase.DataType.INT32, value)
+            uut.write("motor.state", tbase.DataType.INT32, value)
+            uut.write("waveform", tbase.DataType.INT32, value)
+        uut.send_buffered_writes()
+
+        assert self._sent_values() == {
+            "status.temperature": ["2"],
+            "motor.state": ["1", "2"],
+            "waveform": ["0", "1", "2"],
+        }
+
+    def test__keep_last_and_keep_last_by_path__pattern_takes_precedence(self):
+        uut = self._make_writer(keep_last=1, keep_last_by_path={"history.*": 3})
+
+        for value in range(4):
+            uut.write("history.a", tbase.DataType.INT32, value)
+            uut.write("current", tbase.DataType.INT32, value)
+        uut.send_buffered_writes()
+
+        assert self._sent_values() == {
+            "history.a": ["1", "2", "3"],
+            "current": ["3"],
+        }
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"keep_last": 0},
+            {"keep_last_by_path": {"tag": 0}},
+            {"keep_last_by_path": {"": 1}},
+        ],
+    )
+    def test__invalid_keep_last__raises(self, kwargs):
+        with pytest.raises(ValueError):
+            self._make_writer(**kwargs)
+
+    def _sent_paths(self):
+        return [
+            [item["path"] for item in call[1]["data"]]
+            for call in self._client.all_requests.call_args_list
+        ]
+
+    def _fail_requests_for(self, path, status=500):
+        def request(method, uri, params=None, data=None):
+            if any(item["path"] == path for item in data):
+                raise core.ApiException("failure", http_status_code=status)
+            return None, None
+
+        self._client.all_requests.configure_mock(side_effect=request)
+
+    def test__max_paths_per_request__send_buffered_writes__split_into_requests(self):
+        uut = self._make_writer(max_paths_per_request=2)
+
+        for i in range(5):
+            uut.write(f"tag{i}", tbase.DataType.INT32, i)
+        uut.send_buffered_writes()
+
+        assert sorted(self._sent_paths()) == [
+            ["tag0", "tag1"],
+            ["tag2", "tag3"],
+            ["tag4"],
+        ]
+
+    def test__max_bytes_per_request__send_buffered_writes__split_by_size(self):
+        uut = self._make_writer(max_bytes_per_request=200)
+
+        for i in range(4):
+            uut.write(f"tag{i}", tbase.DataType.INT32, i, timestamp=datetime.now())
+        uut.send_buffered_writes()
+
+        assert len(self._client.all_requests.call_args_list) > 1
+        for call in self._client.all_requests.call_args_list:
+            assert len(json.dumps(call[1]["data"])) <= 200
+        assert sorted(path for paths in self._sent_paths() for path in paths) == [
+            "tag0",
+            "tag1",
+            "tag2",
+            "tag3",
+        ]
+
+    def test__max_bytes_per_request__tag_larger_than_limit__sent_alone_and_whole(
+        self,
+    ):
+        uut = self._make_writer(max_bytes_per_request=10)
+
+        uut.write("tag1", tbase.DataType.INT32, 1)
+        uut.write("tag1", tbase.DataType.INT32, 2)
+        uut.write("tag2", tbase.DataType.INT32, 3)
+        uut.send_buffered_writes()
+
+        assert sorted(self._sent_paths()) == [["tag1"], ["tag2"]]
+
+    def test__chunk_fails__send_buffered_writes__only_failed_chunk_resent(self):
+        uut = self._make_writer(max_paths_per_request=1)
+        self._fail_requests_for("tag2")
+        for i in range(3):
+            uut.write(f"tag{i}", tbase.DataType.INT32, i)
+
+        with pytest.raises(core.ApiException) as excinfo:
+            uut.send_buffered_writes()
+        assert "1 of 3" in excinfo.value.message
+        assert excinfo.value.http_status_code == 500
+
+        self._client.all_requests.reset_mock()
+        self._client.all_requests.configure_mock(side_effect=None)
+        uut.write("tag2", tbase.DataType.INT32, 5)
+        uut.send_buffered_writes()
+
+        assert self._sent_paths() == [["tag2"]]
+        updates = self._client.all_requests.call_args[1]["data"][0]["updates"]
+        assert [update["value"]["value"] for update in updates] == ["2", "5"]
+
+    @pytest.mark.asyncio
+    async def test__chunk_fails__send_buffered_writes_async__only_failed_chunk_resent(
+        self,
+    ):
+        uut = self._make_writer(max_paths_per_request=1, max_concurrent_requests=2)
+        self._fail_requests_for("tag0")
+        for i in range(3):
+            await uut.write_async(f"tag{i}", tbase.DataType.INT32, i)
+
+        with pytest.raises(core.ApiException):
+            await uut.send_buffered_writes_async()
+        assert sorted(self._sent_paths()) == [["tag0"], ["tag1"], ["tag2"]]
+
+        self._client.all_requests.reset_mock()
+        self._client.all_requests.configure_mock(side_effect=None)
+        await uut.send_buffered_writes_async()
+
+        assert self._sent_paths() == [["tag0"]]
+
+    def test__single_request_fails__send_buffered_writes__writes_resent(self):
+        uut = self._make_writer()
+        self._fail_requests_for("tag1")
+        uut.write("tag0", tbase.DataType.INT32, 0)
+        uut.write("tag1", tbase.DataType.INT32, 1)
+
+        with pytest.raises(core.ApiException) as excinfo:
+            uut.send_buffered_writes()
+        assert excinfo.value.http_status_code == 500
+
+        self._client.all_requests.reset_mock()
+        self._client.all_requests.configure_mock(side_effect=None)
+        uut.send_buffered_writes()
+
+        assert self._sent_paths() == [["tag0", "tag1"]]
+
+    def test__failed_writes_requeued__more_writes__sent_when_buffer_full(self):
+        uut = HttpBufferedTagWriter(
+            self._client, SystemTimeStamper(), 2, ManualResetTimer.null_timer
+        )
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                [core.ApiException("failure", http_status_code=500), None, None]
+            )
+        )
+        uut.write("tag", tbase.DataType.INT32, 0)
+        with pytest.raises(core.ApiException):
+            uut.write("tag", tbase.DataType.INT32, 1)
+
+        # The requeued writes already fill the buffer, so the next write sends them
+        uut.write("tag", tbase.DataType.INT32, 2)
+        uut.write("tag", tbase.DataType.INT32, 3)
+        uut.write("tag", tbase.DataType.INT32, 4)
+
+        assert self._client.all_requests.call_count == 3
+        assert [
+            [update["value"]["value"] for update in call[1]["data"][0]["updates"]]
+            for call in self._client.all_requests.call_args_list
+        ] == [["0", "1"], ["0", "1", "2"], ["3", "4"]]
+
+    def test__request_rejected__more_writes__rejected_writes_dropped(self):
+        uut = HttpBufferedTagWriter(
+            self._client, SystemTimeStamper(), 3, ManualResetTimer.null_timer
+        )
+        self._fail_requests_for("bad", status=400)
+        uut.write("bad", tbase.DataType.INT32, 0)
+        uut.write("tag", tbase.DataType.INT32, 1)
+
+        with pytest.raises(core.ApiException) as excinfo:
+            uut.write("tag", tbase.DataType.INT32, 2)
+        assert excinfo.value.http_status_code == 400
+        assert uut.dropped_writes == 3
+
+        self._client.all_requests.reset_mock()
+        for i in range(3):
+            uut.write("tag", tbase.DataType.INT32, 3 + i)
+
+        assert self._client.all_requests.call_count == 1
+        assert [
+            update["value"]["value"]
+            for update in self._client.all_requests.call_args[1]["data"][0]["updates"]
+        ] == ["3", "4", "5"]
+
+    def test__request_keeps_failing__send_buffered_writes__dropped_after_max_attempts(
+        self,
+    ):
+        uut = self._make_writer(max_paths_per_request=1)
+        self._fail_requests_for("tag1")
+        uut.write("tag0", tbase.DataType.INT32, 0)
+        uut.write("tag1", tbase.DataType.INT32, 1)
+
+        for _ in range(HttpBufferedTagWriter._MAX_SEND_ATTEMPTS):
+            with pytest.raises(core.ApiException):
+                uut.send_buffered_writes()
+        self._client.all_requests.reset_mock()
+        uut.send_buffered_writes()
+
+        assert uut.dropped_writes == 1
+        assert self._client.all_requests.call_count == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_paths_per_request": 0},
+            {"max_bytes_per_request": 0},
+            {"max_concurrent_requests": 0},
+        ],
+    )
+    def test__invalid_request_limits__raises(self, kwargs):
+        with pytest.raises(ValueError):
+            self._make_writer(**kwargs)
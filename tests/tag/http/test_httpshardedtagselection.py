@@ -0,0 +1,144 @@
+import threading
+from datetime import timedelta
+
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._http._http_sharded_tag_selection import (
+    HttpShardedTagSelection,
+)
+
+from .httpclienttestbase import HttpClientTestBase, MockResponse
+
+
+class FakeSelections:
+    """Serves server-side selections of INT tags whose values equal their index."""
+
+    def __init__(self, client):
+        self.selections = {}
+        self.deleted = []
+        self.lock = threading.Lock()
+        client.all_requests.configure_mock(side_effect=self.request)
+
+    def _tag(self, path):
+        return {"path": path, "type": "INT"}
+
+    def _value(self, path):
+        return {
+            "path": path,
+            "current": {
+                "value": {"value": path[3:], "type": "INT"},
+                "timestamp": "2024-01-01T00:00:00.000Z",
+            },
+        }
+
+    def request(self, method, uri, params=None, data=None):
+        with self.lock:
+            if method == "POST" and uri == "/nitag/v2/selections":
+                token = "selection{}".format(len(self.selections))
+                self.selections[token] = list(data["searchPaths"])
+                ret = {"id": token}
+            elif method == "PUT":
+                self.selections[params["id"]] = list(data["searchPaths"])
+                ret = data
+            elif method == "DELETE" and uri == "/nitag/v2/selections/{id}":
+                self.deleted.append(params["id"])
+                ret = None
+            elif uri == "/nitag/v2/selections/{id}/tags":
+                ret = [self._tag(p) for p in self.selections[params["id"]]]
+            elif uri == "/nitag/v2/selections/{id}/values":
+                ret = [self._value(p) for p in self.selections[params["id"]]]
+            elif uri == "/nitag/v2/selections/{id}/tags-with-values":
+                ret = {
+                    "tagsWithValues": [
+                        {"tag": self._tag(p), **self._value(p)}
+                        for p in self.selections[params["id"]]
+                    ]
+                }
+            else:
+                assert False, (method, uri)
+        return ret, MockResponse(method, uri)
+
+    def live_shards(self):
+        return sorted(
+            sorted(paths)
+            for token, paths in self.selections.items()
+            if token not in self.deleted
+        )
+
+
+class TestHttpShardedTagSelection(HttpClientTestBase):
+    def test__open__paths_split_across_shards_and_metadata_merged(self):
+        server = FakeSelections(self._client)
+        paths = ["tag{}".format(i) for i in range(5)]
+
+        uut = HttpShardedTagSelection.open(self._client, paths, 2)
+
+        assert server.live_shards() == [
+            ["tag0", "tag1"],
+            ["tag2", "tag3"],
+            ["tag4"],
+        ]
+        assert sorted(uut.metadata) == paths
+        assert len(uut.shard_timings) == 3
+        assert all(isinstance(t, timedelta) for t in uut.shard_timings)
+
+    def test__refresh_values__values_merged_from_all_shards(self):
+        FakeSelections(self._client)
+        paths = ["tag{}".format(i) for i in range(5)]
+        uut = HttpShardedTagSelection.open(self._client, paths, 2)
+
+        uut.refresh_values()
+
+        assert {path: uut.values[path].read().value for path in paths} == {
+            path: int(path[3:]) for path in paths
+        }
+
+    def test__refresh__metadata_and_values_merged(self):
+        FakeSelections(self._client)
+        tags = [tbase.TagData("tag{}".format(i)) for i in range(3)]
+        uut = HttpShardedTagSelection(self._client, tags, 1)
+
+        uut.refresh()
+
+        assert uut.metadata["tag2"].data_type == tbase.DataType.INT32
+        assert uut.values["tag2"].read().value == 2
+
+    @pytest.mark.asyncio
+    async def test__refresh_values_async__values_merged_from_all_shards(self):
+        server = FakeSelections(self._client)
+        paths = ["tag{}".format(i) for i in range(4)]
+        uut = await HttpShardedTagSelection.open_async(self._client, paths, 3)
+
+        await uut.refresh_values_async()
+
+        assert server.live_shards() == [["tag0", "tag1", "tag2"], ["tag3"]]
+        assert uut.values["tag3"].read().value == 3
+        assert len(uut.shard_timings) == 2
+
+    def test__paths_removed__refresh__unneeded_shards_closed(self):
+        server = FakeSelections(self._client)
+        paths = ["tag{}".format(i) for i in range(4)]
+        uut = HttpShardedTagSelection.open(self._client, paths, 2)
+
+        uut.remove_tags(["tag0", "tag1"])
+        uut.refresh_values()
+
+        assert server.live_shards() == [["tag2", "tag3"]]
+
+    def test__close__all_shards_deleted(self):
+        server = FakeSelections(self._client)
+        uut = HttpShardedTagSelection.open(
+            self._client, ["tag{}".format(i) for i in range(4)], 2
+        )
+
+        uut.close()
+
+        assert server.live_shards() == []
+
+    def test__bad_arguments__raises(self):
+        with pytest.raises(ValueError):
+            HttpShardedTagSelection(self._client, [], 0)
+        with pytest.raises(ValueError):
+            HttpShardedTagSelection(self._client, [], 1, max_concurrency=0)
+        with pytest.raises(ValueError):
+            HttpShardedTagSelection.open(self._client, None, 1)
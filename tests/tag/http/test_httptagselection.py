@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest  # type: ignore
 from nisystemlink.clients import core, tag as tbase
+from nisystemlink.clients.core._internal._timestamp_utilities import TimestampUtilities
 from nisystemlink.clients.tag._http._http_tag_selection import HttpTagSelection
 
 from .httpclienttestbase import HttpClientTestBase, MockResponse
@@ -1009,6 +1010,72 @@ class TestHttpTagSelection(HttpClientTestBase):
         assert timestamp == value.timestamp
         assert 2 == value.value
 
+    def test__value_unchanged__refresh_changed_values__value_not_decoded_again(self):
+        path1 = "tag1"
+        path2 = "tag2"
+        timestamp_str = "2026-10-19T10:00:00.000Z"
+        token = uuid.uuid4()
+        tags = [
+            {"type": "INT", "path": path1},
+            {"type": "INT", "path": path2},
+        ]
+        values = [
+            {
+                "path": path,
+                "current": {
+                    "value": {"value": "1", "type": "INT"},
+                    "timestamp": timestamp_str,
+                },
+            }
+            for path in (path1, path2)
+        ]
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(token, tags, values)
+        )
+
+        uut = HttpTagSelection.open(self._client, [path1, path2])
+        assert uut.refresh_changed_values() == {path1, path2}
+        value1 = uut._values[path1]
+
+        values[1] = {
+            "path": path2,
+            "current": {
+                "value": {"value": "2", "type": "INT"},
+                "timestamp": "2026-10-19T10:00:01.000Z",
+            },
+        }
+        with mock.patch.object(
+            TimestampUtilities,
+            "str_to_datetime",
+            wraps=TimestampUtilities.str_to_datetime,
+        ) as str_to_datetime:
+            changed = uut.refresh_changed_values()
+
+        assert changed == {path2}
+        assert str_to_datetime.call_args_list == [mock.call("2026-10-19T10:00:01.000Z")]
+        assert uut._values[path1] is value1
+        assert uut.values[path2].read().value == 2
+
+    def test__values_refreshed_in_between__refresh_changed_values__change_reported(
+        self,
+    ):
+        path = "tag"
+        token = uuid.uuid4()
+        tags = [{"type": "INT", "path": path}]
+        values = [{"path": path, "current": {"value": {"value": "1", "type": "INT"}}}]
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(token, tags, values)
+        )
+
+        uut = HttpTagSelection.open(self._client, [path])
+        uut.refresh_changed_values()
+        values[0] = {"path": path, "current": {"value": {"value": "2", "type": "INT"}}}
+        uut.refresh_values()
+        values[0] = {"path": path, "current": {"value": {"value": "1", "type": "INT"}}}
+
+        assert uut.refresh_changed_values() == {path}
+        assert uut.values[path].read().value == 1
+
     def test__refresh__tags_and_values_reloaded(self):
         path1 = "tag1"
         path2 = "tag2"
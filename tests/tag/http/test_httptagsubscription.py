@@ -1,4 +1,6 @@
-from datetime import datetime, timezone
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List
 from unittest import mock
 
@@ -664,6 +666,278 @@ class TestHttpTagSubscription(HttpClientTestBase):
             ),
         ]
 
+    def _get_mock_polling_request(self, token, query_results):
+        # The first GET is made when creating the subscription, and is ignored
+        results = iter([{}] + query_results)
+
+        def mock_request(method, uri, params=None, data=None):
+            if method == "GET":
+                return next(results, {}), MockResponse(method, uri)
+            return self._get_mock_request(token, {})(method, uri, params, data)
+
+        return mock_request
+
+    @pytest.mark.asyncio
+    async def test__get_changes__one_batch_per_poll_returned(self):
+        token = "test subscription"
+        timestamp_str = TimestampUtilities.datetime_to_str(datetime.now(timezone.utc))
+        updates = self._one_update_of_each_type(timestamp_str)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request(
+                token,
+                [
+                    {"subscriptionUpdates": [{"updates": updates[:2]}]},
+                    {},
+                    {"subscriptionUpdates": [{"updates": updates[2:3]}]},
+                ],
+            )
+        )
+        timer = ManualResetTimer(timedelta(milliseconds=10))
+        events_received = []
+        uut = await HttpTagSubscription.create_async(
+            self._client, [], timer, ManualResetTimer.null_timer
+        )
+        uut.tag_changed += lambda tag, reader: events_received.append(tag.path)
+
+        async with uut:
+            batch1 = await asyncio.wait_for(uut.get_changes(), timeout=5)
+            batch2 = await asyncio.wait_for(uut.get_changes(), timeout=5)
+
+        assert [tag.path for tag, _ in batch1] == ["double", "int"]
+        assert batch1[0][1].read().value == 3.14
+        assert [tag.path for tag, _ in batch2] == ["string"]
+        assert events_received == ["double", "int", "string"]
+
+    @pytest.mark.asyncio
+    async def test__get_changes__update_timer_stopped(self):
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request("token", [])
+        )
+        timer = mock.Mock(ManualResetTimer, wraps=ManualResetTimer.null_timer)
+        type(timer).elapsed = events.events._EventSlot("elapsed")
+        timer.interval = timedelta(milliseconds=10)
+        uut = await HttpTagSubscription.create_async(
+            self._client, [], timer, ManualResetTimer.null_timer
+        )
+        starts = timer.start.call_count
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(uut.get_changes(), timeout=0.05)
+        timer.elapsed()
+        await uut.close_async()
+
+        timer.stop.assert_called()
+        assert timer.start.call_count == starts
+
+    @pytest.mark.asyncio
+    async def test__async_for__changes_iterated_until_closed(self):
+        timestamp_str = TimestampUtilities.datetime_to_str(datetime.now(timezone.utc))
+        updates = self._one_update_of_each_type(timestamp_str)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request(
+                "token",
+                [
+                    {"subscriptionUpdates": [{"updates": updates[:2]}]},
+                    {"subscriptionUpdates": [{"updates": updates[2:4]}]},
+                ],
+            )
+        )
+        uut = await HttpTagSubscription.create_async(
+            self._client,
+            [],
+            ManualResetTimer(timedelta(milliseconds=10)),
+            ManualResetTimer.null_timer,
+        )
+
+        paths = []
+        async for tag, _ in uut:
+            paths.append(tag.path)
+            if len(paths) == 3:
+                await uut.close_async()
+
+        assert paths == ["double", "int", "string"]
+
+    @pytest.mark.asyncio
+    async def test__closed_while_waiting__get_changes_returns_empty_batch(self):
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request("token", [])
+        )
+        uut = await HttpTagSubscription.create_async(
+            self._client,
+            [],
+            ManualResetTimer(timedelta(milliseconds=10)),
+            ManualResetTimer.null_timer,
+        )
+        waiter = asyncio.ensure_future(uut.get_changes())
+        await asyncio.sleep(0.05)
+
+        await uut.close_async()
+
+        assert await asyncio.wait_for(waiter, timeout=5) == []
+        assert await uut.get_changes() == []
+
+    @pytest.mark.asyncio
+    async def test__tag_changed_handler_raises__get_changes_still_returns_changes(
+        self,
+    ):
+        timestamp_str = TimestampUtilities.datetime_to_str(datetime.now(timezone.utc))
+        updates = self._one_update_of_each_type(timestamp_str)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request(
+                "token",
+                [
+                    {"subscriptionUpdates": [{"updates": updates[:1]}]},
+                    {"subscriptionUpdates": [{"updates": updates[1:2]}]},
+                ],
+            )
+        )
+        uut = await HttpTagSubscription.create_async(
+            self._client,
+            [],
+            ManualResetTimer(timedelta(milliseconds=10)),
+            ManualResetTimer.null_timer,
+        )
+
+        def handler(tag, reader):
+            raise RuntimeError("handler failed")
+
+        uut.tag_changed += handler
+
+        async with uut:
+            batch1 = await asyncio.wait_for(uut.get_changes(), timeout=5)
+            batch2 = await asyncio.wait_for(uut.get_changes(), timeout=5)
+
+        assert [tag.path for tag, _ in batch1 + batch2] == ["double", "int"]
+
+    @pytest.mark.asyncio
+    async def test__changes_not_retrieved__polling_paused(self):
+        timestamp_str = TimestampUtilities.datetime_to_str(datetime.now(timezone.utc))
+        updates = self._one_update_of_each_type(timestamp_str)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request(
+                "token", [{"subscriptionUpdates": [{"updates": updates[:1]}]}] * 1000
+            )
+        )
+        uut = await HttpTagSubscription.create_async(
+            self._client,
+            [],
+            ManualResetTimer(timedelta(milliseconds=1)),
+            ManualResetTimer.null_timer,
+        )
+
+        async with uut:
+            await asyncio.wait_for(uut.get_changes(), timeout=5)
+            await asyncio.sleep(0.5)
+            polls = self._client.all_requests.call_count
+
+            await asyncio.sleep(0.1)
+            assert self._client.all_requests.call_count == polls
+            assert polls < 50
+
+    def test__max_update_interval__interval_adapts_to_updates(self):
+        timestamp_str = TimestampUtilities.datetime_to_str(datetime.now(timezone.utc))
+        updates = self._one_update_of_each_type(timestamp_str)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request(
+                "token",
+                [{}, {"subscriptionUpdates": []}, {}, {}]
+                + [{"subscriptionUpdates": [{"updates": updates[:1]}]}, {}],
+            )
+        )
+        timer = mock.Mock(ManualResetTimer, wraps=ManualResetTimer.null_timer)
+        type(timer).elapsed = events.events._EventSlot("elapsed")
+        timer.interval = timedelta(seconds=1)
+        uut = HttpTagSubscription.create(
+            self._client,
+            [],
+            timer,
+            ManualResetTimer.null_timer,
+            max_update_interval=timedelta(seconds=5),
+        )
+
+        intervals = []
+        for _ in range(6):
+            timer.elapsed()
+            intervals.append(timer.start.call_args[0][0].total_seconds())
+
+        assert intervals == [2, 4, 5, 5, 1, 2]
+        assert uut.empty_polls == 5
+        assert uut.nonempty_polls == 1
+
+    def test__no_max_update_interval__interval_fixed(self):
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request("token", [])
+        )
+        timer = mock.Mock(ManualResetTimer, wraps=ManualResetTimer.null_timer)
+        type(timer).elapsed = events.events._EventSlot("elapsed")
+        uut = HttpTagSubscription.create(
+            self._client, [], timer, ManualResetTimer.null_timer
+        )
+
+        timer.elapsed()
+        timer.elapsed()
+
+        assert timer.start.call_args == mock.call(None)
+        assert uut.empty_polls == 2
+        assert uut.nonempty_polls == 0
+
+    def test__max_update_interval_less_than_update_interval__create__raises(self):
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request("token", [])
+        )
+
+        with pytest.raises(ValueError):
+            HttpTagSubscription.create(
+                self._client,
+                [],
+                ManualResetTimer(timedelta(seconds=10)),
+                ManualResetTimer.null_timer,
+                max_update_interval=timedelta(seconds=5),
+            )
+
+    def test__callback_executor__slow_callback_does_not_delay_polling(self):
+        timestamp_str = TimestampUtilities.datetime_to_str(datetime.now(timezone.utc))
+        updates = self._one_update_of_each_type(timestamp_str)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_polling_request(
+                "token",
+                [
+                    {"subscriptionUpdates": [{"updates": updates[:2]}]},
+                    {"subscriptionUpdates": [{"updates": updates[:1]}]},
+                ],
+            )
+        )
+        timer = mock.Mock(ManualResetTimer, wraps=ManualResetTimer.null_timer)
+        type(timer).elapsed = events.events._EventSlot("elapsed")
+        uut = HttpTagSubscription.create(
+            self._client, [], timer, ManualResetTimer.null_timer
+        )
+        uut.set_callback_executor()
+        release = threading.Event()
+        received = []
+        done = threading.Semaphore(0)
+
+        def on_tag_changed(tag, reader):
+            if tag.path == "double":
+                release.wait(timeout=5)
+            received.append((tag.path, threading.current_thread()))
+            done.release()
+
+        uut.tag_changed += on_tag_changed
+
+        timer.elapsed()
+        timer.elapsed()
+        assert "double" not in [path for path, _ in received]
+        release.set()
+        for _ in range(3):
+            assert done.acquire(timeout=5)
+        uut.close()
+
+        assert [path for path, _ in received if path == "double"] == ["double"] * 2
+        assert {path for path, _ in received} == {"double", "int"}
+        assert all(thread is not threading.current_thread() for _, thread in received)
+        assert uut.dropped_changes == 0
+
     @classmethod
     def _one_update_of_each_type(cls, timestamp_str: str) -> List[Any]:
         return [
@@ -254,3 +254,73 @@ class TestAsyncTagQueryResultCollection:
         assert first_page == uut.current_page
 
         uut.verify([0, 0])
+
+
+class TestConcurrentAsyncTagQueryResultCollection:
+    class PagedAsyncTagQueryResultCollection(AsyncTagQueryResultCollection):
+        """Serves pages of a fixed list of tags, recording the concurrent requests."""
+
+        def __init__(self, tags, page_size, *, max_concurrency):
+            super().__init__(
+                tags[:page_size], len(tags), 0, max_concurrency=max_concurrency
+            )
+            self._tags = tags
+            self._page_size = page_size
+            self._active = 0
+            self.max_active = 0
+            self.skips = []
+            self.errors = {}
+
+        async def _query_page_async(self, skip):
+            self.skips.append(skip)
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+            try:
+                await asyncio.sleep(0.01 * (len(self._tags) - skip) / len(self._tags))
+            finally:
+                self._active -= 1
+            if skip in self.errors:
+                raise self.errors.pop(skip)
+            return self._tags[skip : skip + self._page_size]
+
+    def test__bad_max_concurrency__constructed__raises(self):
+        with pytest.raises(ValueError):
+            self.PagedAsyncTagQueryResultCollection([], 1, max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test__max_concurrency__move_next_page__pages_prefetched_in_order(self):
+        tags = [TagData("tag{}".format(i), DataType.INT32) for i in range(25)]
+        uut = self.PagedAsyncTagQueryResultCollection(tags, 2, max_concurrency=4)
+
+        result = list(uut.current_page)
+        while await uut.move_next_page_async() is not None:
+            result.extend(uut.current_page)
+
+        assert result == tags
+        assert sorted(uut.skips) == list(range(2, 25, 2))
+        assert 1 < uut.max_active <= 4
+
+    @pytest.mark.asyncio
+    async def test__max_concurrency_and_server_error__move_next_page__can_continue(
+        self,
+    ):
+        tags = [TagData("tag{}".format(i), DataType.INT32) for i in range(6)]
+        uut = self.PagedAsyncTagQueryResultCollection(tags, 2, max_concurrency=2)
+        uut.errors[2] = ApiException()
+
+        with pytest.raises(ApiException):
+            await uut.move_next_page_async()
+        assert uut.current_page == tags[:2]
+
+        assert await uut.move_next_page_async() == tags[2:4]
+        assert await uut.move_next_page_async() == tags[4:]
+        assert await uut.move_next_page_async() is None
+
+    @pytest.mark.asyncio
+    async def test__max_concurrency__reset__prefetched_pages_discarded(self):
+        tags = [TagData("tag{}".format(i), DataType.INT32) for i in range(6)]
+        uut = self.PagedAsyncTagQueryResultCollection(tags, 2, max_concurrency=3)
+        await uut.move_next_page_async()
+
+        assert await uut.reset_async() == tags[:2]
+        assert await uut.move_next_page_async() == tags[2:4]
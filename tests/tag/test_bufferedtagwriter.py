@@ -1,4 +1,6 @@
+import asyncio
 import datetime
+import threading
 from unittest import mock
 from unittest.mock import Mock, PropertyMock
 
@@ -624,12 +626,13 @@ class TestBufferedTagWriter:
             )
 
     class MockBufferedTagWriter(tbase.BufferedTagWriter):
-        def __init__(self, stamper=None, buffer_size=None, flush_timer=None):
+        def __init__(self, stamper=None, buffer_size=None, flush_timer=None, **kwargs):
             assert buffer_size is not None
             super().__init__(
                 stamper or SystemTimeStamper(),
                 buffer_size,
                 flush_timer or ManualResetTimer.null_timer,
+                **kwargs,
             )
             self._timer = flush_timer
             self._time_stamper = stamper
@@ -640,6 +643,9 @@ class TestBufferedTagWriter:
             self.mock_create_item = Mock(side_effect=NotImplementedError)
             self.mock_send_writes = Mock(side_effect=NotImplementedError)
             self.mock_send_writes_async = Mock(side_effect=NotImplementedError)
+            self.mock_prepend_buffer = Mock(side_effect=NotImplementedError)
+            self.mock_spool_records = Mock(side_effect=NotImplementedError)
+            self.mock_send_spooled = Mock(side_effect=NotImplementedError)
 
         @property
         def timer(self):
@@ -669,3 +675,172 @@ class TestBufferedTagWriter:
 
         async def _send_writes_async(self, *args, **kwargs):
             return self.mock_send_writes_async(*args, **kwargs)
+
+        def _prepend_buffer(self, *args, **kwargs):
+            return self.mock_prepend_buffer(*args, **kwargs)
+
+        def _spool_records(self, *args, **kwargs):
+            return self.mock_spool_records(*args, **kwargs)
+
+        def _send_spooled(self, *args, **kwargs):
+            return self.mock_send_spooled(*args, **kwargs)
+
+
+class TestBufferedTagWriterSendQueue:
+    def setup_method(self, method):
+        self.sent = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def make_writer(self, **kwargs):
+        writer = TestBufferedTagWriter.MockBufferedTagWriter(None, 2, **kwargs)
+        buffer = []
+
+        def copy_buffer():
+            items = list(buffer)
+            buffer.clear()
+            return items
+
+        def send_writes(updates):
+            self.entered.set()
+            assert self.release.wait(timeout=10)
+            self.sent.append(updates)
+
+        writer.mock_create_item.configure_mock(side_effect=lambda path, *_: path)
+        writer.mock_buffer_value.configure_mock(
+            side_effect=lambda path, item: buffer.append(item)
+        )
+        writer.mock_copy_buffer.configure_mock(side_effect=copy_buffer)
+        writer.mock_clear_buffer.configure_mock(side_effect=buffer.clear)
+        writer.mock_send_writes.configure_mock(side_effect=send_writes)
+        return writer
+
+    def write(self, writer, *paths):
+        for path in paths:
+            writer.write(path, tbase.DataType.INT32, 1)
+
+    def test__buffer_fills__write__sent_on_background_thread(self):
+        writer = self.make_writer(send_queue_size=1)
+        self.release.clear()
+
+        self.write(writer, "tag1", "tag2")
+        assert self.entered.wait(timeout=10)
+        assert self.sent == []
+
+        self.release.set()
+        writer.send_buffered_writes()
+        assert self.sent == [["tag1", "tag2"]]
+
+    def test__writes_queued__send_buffered_writes__remaining_writes_sent_in_order(
+        self,
+    ):
+        writer = self.make_writer(send_queue_size=4)
+
+        self.write(writer, "tag1", "tag2", "tag3", "tag4", "tag5")
+        writer.send_buffered_writes()
+
+        assert self.sent == [["tag1", "tag2"], ["tag3", "tag4"], ["tag5"]]
+
+    @pytest.mark.asyncio
+    async def test__writes_queued__send_buffered_writes_async__queue_drained(self):
+        writer = self.make_writer(send_queue_size=4)
+
+        self.write(writer, "tag1", "tag2", "tag3")
+        await writer.send_buffered_writes_async()
+
+        assert self.sent == [["tag1", "tag2"], ["tag3"]]
+
+    def test__queue_full_and_block_policy__write__waits_for_sender(self):
+        writer = self.make_writer(send_queue_size=1)
+        self.release.clear()
+        self.write(writer, "tag1", "tag2")
+        assert self.entered.wait(timeout=10)
+        self.write(writer, "tag3", "tag4")
+
+        blocked = threading.Thread(target=self.write, args=(writer, "tag5", "tag6"))
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        self.release.set()
+        blocked.join(timeout=10)
+        assert not blocked.is_alive()
+        writer.send_buffered_writes()
+        assert self.sent == [["tag1", "tag2"], ["tag3", "tag4"], ["tag5", "tag6"]]
+
+    @pytest.mark.asyncio
+    async def test__queue_full_and_block_policy__write_async__event_loop_not_blocked(
+        self,
+    ):
+        writer = self.make_writer(send_queue_size=1)
+        self.release.clear()
+        self.write(writer, "tag1", "tag2")
+        assert self.entered.wait(timeout=10)
+        self.write(writer, "tag3", "tag4")
+        await writer.write_async("tag5", tbase.DataType.INT32, 1)
+
+        blocked = asyncio.ensure_future(
+            writer.write_async("tag6", tbase.DataType.INT32, 1)
+        )
+        await asyncio.sleep(0.2)
+        assert not blocked.done()
+
+        self.release.set()
+        await asyncio.wait_for(blocked, timeout=10)
+        await writer.send_buffered_writes_async()
+        assert self.sent == [["tag1", "tag2"], ["tag3", "tag4"], ["tag5", "tag6"]]
+
+    def test__queue_full_and_drop_oldest_policy__write__oldest_batch_dropped(self):
+        writer = self.make_writer(
+            send_queue_size=1, queue_full_policy=tbase.QueueFullPolicy.DROP_OLDEST
+        )
+        self.release.clear()
+        self.write(writer, "tag1", "tag2")
+        assert self.entered.wait(timeout=10)
+
+        self.write(writer, "tag3", "tag4", "tag5", "tag6")
+        self.release.set()
+        writer.send_buffered_writes()
+
+        assert self.sent == [["tag1", "tag2"], ["tag5", "tag6"]]
+        assert writer.dropped_writes == 2
+
+    def test__queue_full_and_raise_policy__write__raises_without_buffering(self):
+        writer = self.make_writer(
+            send_queue_size=1, queue_full_policy=tbase.QueueFullPolicy.RAISE
+        )
+        self.release.clear()
+        self.write(writer, "tag1", "tag2")
+        assert self.entered.wait(timeout=10)
+        self.write(writer, "tag3", "tag4", "tag5")
+
+        with pytest.raises(BufferError):
+            self.write(writer, "tag6")
+
+        self.release.set()
+        writer.send_buffered_writes()
+        assert self.sent == [["tag1", "tag2"], ["tag3", "tag4"], ["tag5"]]
+
+    def test__background_send_errored__send_buffered_writes__error_raised(self):
+        writer = self.make_writer(send_queue_size=1)
+        writer.mock_send_writes.configure_mock(side_effect=core.ApiException)
+
+        self.write(writer, "tag1", "tag2")
+
+        with pytest.raises(core.ApiException):
+            writer.send_buffered_writes()
+        writer.send_buffered_writes()
+
+    def test__writes_queued__writer_closed__writes_sent_and_sender_stopped(self):
+        writer = self.make_writer(send_queue_size=1)
+
+        with writer:
+            self.write(writer, "tag1", "tag2", "tag3")
+
+        assert self.sent == [["tag1", "tag2"], ["tag3"]]
+        assert not writer._sender.is_alive()
+
+    def test__invalid_send_queue_size__raises(self):
+        with pytest.raises(ValueError):
+            self.make_writer(send_queue_size=0)
@@ -0,0 +1,184 @@
+import datetime
+import gc
+import tracemalloc
+from typing import Any, Dict
+
+import pytest
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._serialized_tag_with_aggregates import (
+    SerializedTagWithAggregates,
+)
+
+
+class _DictTagData:
+    """The original layout of TagData, for comparison."""
+
+    def __init__(self, data):
+        self._path = data["path"]
+        self._data_type = tbase.DataType.from_api_name(data.get("type") or "UNKNOWN")
+        self._keywords = list(data.get("keywords") or [])
+        self._properties = {}
+        self._collect_aggregates = bool(data.get("collectAggregates"))
+        self._retention_type = tbase.RetentionType.NONE
+        self._retention_count = None
+        self._retention_days = None
+        for key, value in (data.get("properties") or {}).items():
+            if not key.startswith("nitag"):
+                self._properties[key] = value
+
+
+class _DictSerializedTagWithAggregates:
+    """The original layout of SerializedTagWithAggregates, for comparison."""
+
+    def __init__(self, path, data_type, value, timestamp, count, min, max, mean):
+        self._path = path
+        self._data_type = data_type
+        self._value = value
+        self._timestamp = timestamp
+        self._count = count
+        self._min = min
+        self._max = max
+        self._mean = mean
+
+
+def _tag_json(index: int, keywords: bool, properties: bool):
+    data: Dict[str, Any] = {
+        "path": "Group{}.Subgroup.tag{}".format(index % 100, index),
+        "type": "DOUBLE",
+        "collectAggregates": True,
+        "properties": {"nitagRetention": "COUNT", "nitagMaxHistoryCount": "100"},
+    }
+    if keywords:
+        data["keywords"] = ["keyword"]
+    if properties:
+        data["properties"]["units"] = "V"
+    return data
+
+
+def _bytes_per_item(create, items):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        created = [create(item) for item in items]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(created) == len(items)
+    return (after - before) / len(items)
+
+
+class TestTagData:
+    def test__from_json_dict__matches_constructor(self):
+        data = {
+            "path": "tag",
+            "type": "INT",
+            "keywords": ["a", "b"],
+            "properties": {"nitagRetention": "DURATION", "nitagHistoryTTLDays": "3"},
+            "collectAggregates": True,
+        }
+
+        tag = tbase.TagData.from_json_dict(data)
+        expected = tbase.TagData(
+            "tag", tbase.DataType.INT32, data["keywords"], data["properties"]
+        )
+        expected.collect_aggregates = True
+
+        assert tag.to_json_dict() == expected.to_json_dict()
+        assert tag.retention_type == tbase.RetentionType.DURATION
+        assert tag.retention_days == 3
+        assert tag.properties == {}
+        assert tag.keywords == ["a", "b"]
+        assert tag.keywords is not data["keywords"]
+
+    def test__from_json_dict_with_only_path__has_defaults(self):
+        tag = tbase.TagData.from_json_dict({"path": "tag"})
+
+        assert tag.data_type == tbase.DataType.UNKNOWN
+        assert tag.keywords == []
+        assert tag.properties == {}
+        assert tag.collect_aggregates is False
+        assert tag.retention_type == tbase.RetentionType.NONE
+        assert tag.retention_count is None
+        assert tag.retention_days is None
+
+    def test__tags_with_equal_paths__share_path(self):
+        path = "".join(["my.", "tag"])
+        other_path = "".join(["my.", "tag"])
+        assert path is not other_path
+
+        tag = tbase.TagData(path)
+        other = tbase.TagData.from_json_dict({"path": other_path})
+        value = SerializedTagWithAggregates(
+            "".join(["my.", "tag"]), tbase.DataType.INT32, "1"
+        )
+
+        assert tag.path is other.path
+        assert value.path is tag.path
+
+    def test__instances__have_no_dict(self):
+        tag = tbase.TagData("tag")
+        value = SerializedTagWithAggregates("tag", tbase.DataType.INT32, "1")
+
+        with pytest.raises(AttributeError):
+            tag.other = 1
+        with pytest.raises(AttributeError):
+            value.other = 1
+
+    def test__keywords_modified__included_in_json(self):
+        tag = tbase.TagData("tag", tbase.DataType.DOUBLE)
+
+        tag.keywords.append("keyword")
+        tag.properties["units"] = "V"
+
+        data = tag.to_json_dict()
+        assert data["keywords"] == ["keyword"]
+        assert data["properties"]["units"] == "V"
+
+    def test__replace_keywords_and_properties__updates_existing_containers(self):
+        tag = tbase.TagData("tag", tbase.DataType.DOUBLE, ["a"], {"b": "c"})
+        keywords = tag.keywords
+        properties = tag.properties
+
+        tag.replace_keywords(["d"])
+        tag.replace_properties({"e": "f"})
+
+        assert keywords == ["d"]
+        assert properties == {"e": "f"}
+        assert tag.keywords is keywords
+        assert tag.properties is properties
+
+    def test__replace_with_none__clears(self):
+        tag = tbase.TagData("tag", tbase.DataType.DOUBLE, ["a"], {"b": "c"})
+
+        tag.replace_keywords(None)
+        tag.replace_properties(None)
+
+        assert tag.keywords == []
+        assert tag.properties == {}
+
+    @pytest.mark.slow
+    def test__benchmark__memory_per_tag(self):
+        count = 50_000
+        timestamp = datetime.datetime.now(datetime.timezone.utc)
+        for keywords, properties in ((False, False), (True, True)):
+            tags = [_tag_json(i, keywords, properties) for i in range(count)]
+            before = _bytes_per_item(_DictTagData, tags)
+            after = _bytes_per_item(tbase.TagData.from_json_dict, tags)
+            print(
+                "TagData (keywords={}, properties={}): {:.0f} -> {:.0f} bytes".format(
+                    keywords, properties, before, after
+                )
+            )
+            assert after < before
+
+        values = [
+            (t["path"], tbase.DataType.DOUBLE, "1.5", timestamp, 3, "1", "2", 1.5)
+            for t in tags
+        ]
+        before = _bytes_per_item(lambda v: _DictSerializedTagWithAggregates(*v), values)
+        after = _bytes_per_item(lambda v: SerializedTagWithAggregates(*v), values)
+        print(
+            "SerializedTagWithAggregates: {:.0f} -> {:.0f} bytes".format(before, after)
+        )
+        assert after < before
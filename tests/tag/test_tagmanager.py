@@ -1,7 +1,9 @@
 import asyncio
+import threading
 import time
 import uuid
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from unittest import mock
 
@@ -37,6 +39,14 @@ def _wait_for_call_count(mock_obj, expected: int, *, timeout: float = 3.0):
         time.sleep(0.01)
 
 
+def _written_values(all_requests):
+    """Return the values sent by each request made by a tag writer."""
+    return [
+        [update["value"]["value"] for update in call[1]["data"][0]["updates"]]
+        for call in all_requests.call_args_list
+    ]
+
+
 class TestTagManager(HttpClientTestBase):
     def setup_method(self, method):
         super().setup_method(method)
@@ -2361,6 +2371,191 @@ class TestTagManager(HttpClientTestBase):
             self._uut.create_writer(buffer_size=0, max_buffer_time=timedelta(minutes=1))
         with pytest.raises(ValueError):
             self._uut.create_writer(buffer_size=1, max_buffer_time=timedelta(0))
+        with pytest.raises(ValueError):
+            self._uut.create_writer(buffer_size=1, send_queue_size=0)
+
+    def test__create_writer_with_send_queue__sends_on_background_thread(self):
+        writer = self._uut.create_writer(buffer_size=2, send_queue_size=1)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request([None, None])
+        )
+
+        with writer:
+            for value in range(3):
+                writer.write("tag", tbase.DataType.INT32, value)
+            _wait_for_call_count(self._client.all_requests, 1, timeout=5.0)
+
+        assert self._client.all_requests.call_count == 2
+        data = [
+            [update["value"]["value"] for update in call[1]["data"][0]["updates"]]
+            for call in self._client.all_requests.call_args_list
+        ]
+        assert data == [["0", "1"], ["2"]]
+
+    def test__bad_spool_arguments__create_writer__raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            self._uut.create_writer(
+                buffer_size=1, send_queue_size=1, spool_directory=tmp_path
+            )
+        with pytest.raises(ValueError):
+            self._uut.create_writer(
+                buffer_size=1,
+                spool_directory=tmp_path,
+                spool_segment_size=1024,
+                max_spool_size=512,
+            )
+        with pytest.raises(ValueError):
+            self._uut.create_writer(buffer_size=0, spool_directory=tmp_path)
+
+    def test__create_writer_with_spool__sends_on_background_thread(self, tmp_path):
+        writer = self._uut.create_writer(buffer_size=2, spool_directory=tmp_path)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request([None, None])
+        )
+
+        with writer:
+            for value in range(3):
+                writer.write("tag", tbase.DataType.INT32, value)
+            _wait_for_call_count(self._client.all_requests, 1, timeout=5.0)
+
+        assert self._client.all_requests.call_count == 2
+        assert _written_values(self._client.all_requests) == [["0", "1"], ["2"]]
+        assert not writer._spool_sender.is_alive()
+
+    def test__spooled_write_failed__send_buffered_writes__retried(self, tmp_path):
+        writer = self._uut.create_writer(buffer_size=2, spool_directory=tmp_path)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request([core.ApiException("offline"), None])
+        )
+
+        with writer:
+            writer.write("tag", tbase.DataType.INT32, 0)
+            writer.write("tag", tbase.DataType.INT32, 1)
+            _wait_for_call_count(self._client.all_requests, 1, timeout=5.0)
+
+            writer.send_buffered_writes()
+
+            assert self._client.all_requests.call_count == 2
+
+        assert _written_values(self._client.all_requests) == [["0", "1"], ["0", "1"]]
+
+    def test__server_offline__send_buffered_writes__raises_and_keeps_writes(
+        self, tmp_path
+    ):
+        writer = self._uut.create_writer(buffer_size=2, spool_directory=tmp_path)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                [core.ApiException("offline"), core.ApiException("offline"), None]
+            )
+        )
+
+        with writer:
+            writer.write("tag", tbase.DataType.INT32, 0)
+            writer.write("tag", tbase.DataType.INT32, 1)
+            _wait_for_call_count(self._client.all_requests, 1, timeout=5.0)
+
+            with pytest.raises(core.ApiException):
+                writer.send_buffered_writes()
+            writer.send_buffered_writes()
+
+        assert self._client.all_requests.call_count == 3
+        assert _written_values(self._client.all_requests) == [["0", "1"]] * 3
+
+    def test__writer_closed_while_offline__next_writer_sends_spooled_writes(
+        self, tmp_path
+    ):
+        writer = self._uut.create_writer(buffer_size=2, spool_directory=tmp_path)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                [core.ApiException("offline"), core.ApiException("offline"), None]
+            )
+        )
+
+        with pytest.raises(core.ApiException):
+            with writer:
+                writer.write("tag", tbase.DataType.INT32, 0)
+                writer.write("tag", tbase.DataType.INT32, 1)
+                _wait_for_call_count(self._client.all_requests, 1, timeout=5.0)
+
+        with self._uut.create_writer(buffer_size=2, spool_directory=tmp_path):
+            pass
+
+        assert self._client.all_requests.call_count == 3
+        assert _written_values(self._client.all_requests)[-1] == ["0", "1"]
+
+    def test__spooled_write_rejected__write__discarded_and_error_raised_once(
+        self, tmp_path
+    ):
+        writer = self._uut.create_writer(buffer_size=2, spool_directory=tmp_path)
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                [core.ApiException("bad value", http_status_code=400), None]
+            )
+        )
+
+        with writer:
+            writer.write("tag", tbase.DataType.INT32, 0)
+            writer.write("tag", tbase.DataType.INT32, 1)
+            _wait_for_call_count(self._client.all_requests, 1, timeout=5.0)
+            with pytest.raises(core.ApiException):
+                writer.send_buffered_writes()
+
+            writer.write("tag", tbase.DataType.INT32, 2)
+            writer.write("tag", tbase.DataType.INT32, 3)
+            writer.send_buffered_writes()
+
+        assert writer.dropped_writes == 2
+        assert _written_values(self._client.all_requests) == [["0", "1"], ["2", "3"]]
+
+    def test__spool_full_and_block_policy__write_waits_without_blocking_writer(
+        self, tmp_path
+    ):
+        # The spool only has room for one segment
+        writer = self._uut.create_writer(
+            buffer_size=1,
+            spool_directory=tmp_path,
+            spool_segment_size=256,
+            max_spool_size=256,
+        )
+        self._client.all_requests.configure_mock(
+            side_effect=core.ApiException("unavailable", http_status_code=503)
+        )
+        writer.write("tag", tbase.DataType.INT32, 0)
+        _wait_for_call_count(self._client.all_requests, 1, timeout=5.0)
+
+        blocked = threading.Thread(
+            target=writer.write, args=("tag", tbase.DataType.INT32, 1)
+        )
+        blocked.start()
+        blocked.join(timeout=0.2)
+        assert blocked.is_alive()
+
+        with pytest.raises(core.ApiException):
+            writer.send_buffered_writes()
+        with pytest.raises(core.ApiException):
+            writer.__exit__(None, None, None)
+        blocked.join(timeout=10)
+
+        assert not blocked.is_alive()
+
+    def test__spool_full_and_raise_policy__write__raises_and_counts_dropped_writes(
+        self, tmp_path
+    ):
+        # A single write is larger than the spool
+        writer = self._uut.create_writer(
+            buffer_size=1,
+            spool_directory=tmp_path,
+            spool_segment_size=16,
+            max_spool_size=16,
+            queue_full_policy=tbase.QueueFullPolicy.RAISE,
+        )
+
+        with writer:
+            with pytest.raises(BufferError):
+                writer.write("tag", tbase.DataType.INT32, 0)
+
+        assert writer.dropped_writes == 1
+        assert self._client.all_requests.call_count == 0
 
     def test__create_writer_with_buffer_size__sends_when_buffer_full(self):
         path = "tag"
@@ -2442,6 +2637,66 @@ class TestTagManager(HttpClientTestBase):
             ],
         )
 
+    @pytest.mark.asyncio
+    async def test__create_writer_async_with_buffer_time__sends_on_event_loop(self):
+        threads_before = threading.active_count()
+        senders = []
+
+        def mock_request(method, uri, params=None, data=None):
+            senders.append(threading.get_ident())
+            return None, MockResponse(method, uri)
+
+        self._client.all_requests.configure_mock(side_effect=mock_request)
+
+        async with await self._uut.create_writer_async(
+            max_buffer_time=timedelta(milliseconds=20)
+        ) as writer:
+            await writer.write_async("tag", tbase.DataType.INT32, 1)
+            self._client.all_requests.assert_not_called()
+
+            for _ in range(100):
+                if senders:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert senders == [threading.get_ident()]
+            assert threading.active_count() == threads_before
+            await writer.write_async("tag", tbase.DataType.INT32, 2)
+
+        assert len(senders) == 2
+
+    @pytest.mark.asyncio
+    async def test__bad_arguments__create_writer_async__raises(self):
+        with pytest.raises(ValueError):
+            await self._uut.create_writer_async()
+        with pytest.raises(ValueError):
+            await self._uut.create_writer_async(buffer_size=0)
+        with pytest.raises(ValueError):
+            await self._uut.create_writer_async(
+                max_buffer_time=timedelta(microseconds=1)
+            )
+
+    def test__timer_scheduler__create_writer__timer_uses_scheduler(self):
+        scheduler = mock.Mock(tbase.TimerScheduler)
+        with mock.patch(
+            "nisystemlink.clients.tag._tag_manager.HttpClient",
+            lambda *args, **kwargs: self._client,
+        ):
+            uut = tbase.TagManager(object(), timer_scheduler=scheduler)
+        writer = uut.create_writer(max_buffer_time=timedelta(milliseconds=50))
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request([None])
+        )
+
+        writer.write("tag", tbase.DataType.INT32, 1)
+        scheduler.call_later.assert_called_once()
+        delay, callback = scheduler.call_later.call_args[0]
+        self._client.all_requests.assert_not_called()
+        callback()
+
+        assert delay == 0.05
+        self._client.all_requests.assert_called_once()
+
     def test__create_writer_with_buffer_size_and_timer__obeys_both_settings(self):
         path = "tag"
         value1 = 1
@@ -2887,3 +3142,319 @@ class TestTagManager(HttpClientTestBase):
                 params={"path": path},
             ),
         ]
+
+    def _mock_selection_values(self, values):
+        """Serve temporary selections whose values are taken from ``values``."""
+        selections = {}
+
+        def mock_request(method, uri, params=None, data=None):
+            if method == "POST" and uri == "/nitag/v2/selections":
+                token = "selection{}".format(len(selections))
+                selections[token] = data["searchPaths"]
+                return {"id": token}, MockResponse(method, uri)
+            elif method == "GET" and uri == "/nitag/v2/selections/{id}/values":
+                return (
+                    [
+                        {"path": path, **values[path]}
+                        for path in selections[params["id"]]
+                        if path in values
+                    ],
+                    MockResponse(method, uri),
+                )
+            elif method == "DELETE":
+                return None, MockResponse(method, uri)
+            assert False, (method, uri)
+
+        self._client.all_requests.configure_mock(side_effect=mock_request)
+        return selections
+
+    _READ_MANY_VALUES = {
+        "tag1": {
+            "current": {
+                "value": {"value": "1", "type": "INT"},
+                "timestamp": "2024-01-01T00:00:00.000Z",
+            },
+            "aggregates": {"count": 3, "min": "0", "max": "2", "avg": 1.0},
+        },
+        "tag2": {
+            "current": {
+                "value": {"value": "2.5", "type": "DOUBLE"},
+                "timestamp": "2024-01-01T00:00:01.000Z",
+            }
+        },
+        "tag3": {"current": None},
+    }
+
+    def test__read_many__values_read_with_one_selection_per_chunk(self):
+        selections = self._mock_selection_values(self._READ_MANY_VALUES)
+
+        values = self._uut.read_many(
+            ["tag1", "tag2", "tag3", "missing", "tag1"], chunk_size=2
+        )
+
+        assert sorted(selections.values()) == [["tag1", "tag2"], ["tag3", "missing"]]
+        assert set(values) == {"tag1", "tag2", "tag3"}
+        assert values["tag1"].value == 1
+        assert values["tag1"].timestamp is None
+        assert values["tag1"].count is None
+        assert values["tag2"].value == 2.5
+        assert values["tag3"] is None
+
+    def test__read_many_with_timestamp_and_aggregates__included(self):
+        self._mock_selection_values(self._READ_MANY_VALUES)
+
+        values = self._uut.read_many(
+            ["tag1"], include_timestamp=True, include_aggregates=True
+        )
+
+        tag = values["tag1"]
+        assert tag.timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert tag.count == 3
+        assert tag.min == 0
+        assert tag.max == 2
+        assert tag.mean == 1.0
+
+    def test__different_max_concurrency__read_many__each_call_limited(self):
+        self._mock_selection_values(self._READ_MANY_VALUES)
+        paths = ["tag1", "tag2", "tag3"]
+
+        with mock.patch(
+            "nisystemlink.clients.tag._tag_manager.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as executor:
+            self._uut.read_many(paths, chunk_size=1, max_concurrency=2)
+            self._uut.read_many(paths, chunk_size=1, max_concurrency=3)
+
+        assert [call[1]["max_workers"] for call in executor.call_args_list] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test__read_many_async__chunks_read_concurrently(self):
+        selections = self._mock_selection_values(self._READ_MANY_VALUES)
+
+        values = await self._uut.read_many_async(
+            ["tag1", "tag2", "tag3"], chunk_size=1, include_timestamp=True
+        )
+
+        assert sorted(selections.values()) == [["tag1"], ["tag2"], ["tag3"]]
+        assert values["tag2"].timestamp == datetime(
+            2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc
+        )
+        assert values["tag3"] is None
+
+    def test__read_many__temporary_selections_deleted(self):
+        selections = self._mock_selection_values(self._READ_MANY_VALUES)
+
+        self._uut.read_many(["tag1", "tag2"], chunk_size=1)
+
+        deletes = [
+            call
+            for call in self._client.all_requests.call_args_list
+            if call[0][0] == "DELETE"
+        ]
+        assert sorted(call[1]["params"]["id"] for call in deletes) == sorted(selections)
+
+    def test__empty_paths__read_many__api_not_called(self):
+        assert self._uut.read_many([]) == {}
+        assert self._client.all_requests.call_count == 0
+
+    def test__bad_arguments__read_many__raises(self):
+        with pytest.raises(ValueError):
+            self._uut.read_many(None)
+        with pytest.raises(ValueError):
+            self._uut.read_many(["tag*"])
+        with pytest.raises(ValueError):
+            self._uut.read_many(["tag"], chunk_size=0)
+        with pytest.raises(ValueError):
+            self._uut.read_many(["tag"], max_concurrency=0)
+
+    def test__shard_size__create_selection__sharded_selection_created(self):
+        selection = self._uut.create_selection(
+            [tbase.TagData("tag1"), tbase.TagData("tag2")], shard_size=1
+        )
+
+        assert type(selection).__name__ == "HttpShardedTagSelection"
+        assert sorted(selection.paths) == ["tag1", "tag2"]
+        assert selection.shard_timings == []
+
+    def test__max_concurrency__create_selection__passed_to_sharded_selection(self):
+        selection = self._uut.create_selection(
+            [tbase.TagData("tag1"), tbase.TagData("tag2")],
+            shard_size=1,
+            max_concurrency=2,
+        )
+
+        assert selection._max_concurrency == 2
+
+    def test__bad_shard_size__create_selection__raises(self):
+        with pytest.raises(ValueError):
+            self._uut.create_selection([tbase.TagData("tag1")], shard_size=0)
+        with pytest.raises(ValueError):
+            self._uut.create_selection(
+                [tbase.TagData("tag1")], shard_size=1, max_concurrency=0
+            )
+
+    def _create_uut_with_cache(self, cache):
+        with mock.patch(
+            "nisystemlink.clients.tag._tag_manager.HttpClient", lambda *a: self._client
+        ):
+            return tbase.TagManager(object(), metadata_cache=cache)
+
+    def test__metadata_cache__open_twice__server_queried_once(self):
+        uut = self._create_uut_with_cache(tbase.TagMetadataCache())
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                [{"type": "INT", "path": "tag", "keywords": ["a"]}]
+            )
+        )
+
+        first = uut.open("tag")
+        second = uut.open("tag", tbase.DataType.INT32)
+
+        assert self._client.all_requests.call_count == 1
+        assert second is not first
+        assert second.keywords == ["a"]
+        assert second.data_type == tbase.DataType.INT32
+        with pytest.raises(core.ApiException):
+            uut.open("tag", tbase.DataType.DOUBLE)
+
+    @pytest.mark.asyncio
+    async def test__metadata_cache__open_async_twice__server_queried_once(self):
+        uut = self._create_uut_with_cache(tbase.TagMetadataCache())
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request([{"type": "INT", "path": "tag"}])
+        )
+
+        await uut.open_async("tag")
+        tag = await uut.open_async("tag")
+
+        assert self._client.all_requests.call_count == 1
+        assert tag.data_type == tbase.DataType.INT32
+
+    def test__metadata_cache__refresh__only_uncached_tags_queried(self):
+        uut = self._create_uut_with_cache(tbase.TagMetadataCache())
+        cached = tbase.TagData("tag1", tbase.DataType.BOOLEAN, ["a"], {"b": "c"})
+        cached.set_retention_days(3)
+        uut.metadata_cache.add([cached])
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                [{"totalCount": 1, "tags": [{"type": "DOUBLE", "path": "tag2"}]}]
+            )
+        )
+        tag1 = tbase.TagData("tag1")
+        tag2 = tbase.TagData("tag2")
+
+        uut.refresh([tag1, tag2])
+        uut.refresh([tbase.TagData("tag2")])
+
+        self._client.all_requests.assert_called_once_with(
+            "GET", "/nitag/v2/tags", params={"path": "tag2", "take": "1"}
+        )
+        assert tag1.to_json_dict() == cached.to_json_dict()
+        assert tag2.data_type == tbase.DataType.DOUBLE
+
+    @pytest.mark.asyncio
+    async def test__metadata_cache__refresh_async_all_cached__server_not_queried(
+        self,
+    ):
+        uut = self._create_uut_with_cache(tbase.TagMetadataCache())
+        uut.metadata_cache.add([tbase.TagData("tag", tbase.DataType.STRING)])
+        tag = tbase.TagData("tag")
+
+        await uut.refresh_async([tag])
+
+        assert self._client.all_requests.call_count == 0
+        assert tag.data_type == tbase.DataType.STRING
+
+    def test__metadata_cache__update_and_delete__cached_tags_invalidated(self):
+        uut = self._create_uut_with_cache(tbase.TagMetadataCache())
+        uut.metadata_cache.add(
+            [tbase.TagData(p, tbase.DataType.INT32) for p in ("tag1", "tag2", "tag3")]
+        )
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request([None, None, None])
+        )
+
+        uut.update([tbase.TagData("tag1", tbase.DataType.INT32)])
+        uut.update([tbase.TagDataUpdate("tag2", tbase.DataType.INT32, ["a"])])
+        uut.delete(["tag3"])
+
+        assert len(uut.metadata_cache) == 0
+
+    def test__metadata_cache__update_fails__cached_tags_invalidated(self):
+        uut = self._create_uut_with_cache(tbase.TagMetadataCache())
+        uut.metadata_cache.add([tbase.TagData("tag", tbase.DataType.INT32)])
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request([core.ApiException("failed")])
+        )
+
+        with pytest.raises(core.ApiException):
+            uut.update([tbase.TagData("tag", tbase.DataType.INT32)])
+
+        assert uut.metadata_cache.get("tag") is None
+
+    def test__metadata_cache__warm_metadata_cache__all_pages_cached(self):
+        uut = self._create_uut_with_cache(tbase.TagMetadataCache())
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                [
+                    {"totalCount": 3, "tags": [{"type": "INT", "path": "tag1"}]},
+                    {
+                        "totalCount": 3,
+                        "tags": [
+                            {"type": "DOUBLE", "path": "tag2"},
+                            {"type": "STRING", "path": "tag3"},
+                        ],
+                    },
+                ]
+            )
+        )
+
+        count = uut.warm_metadata_cache(["tag*"], take=2)
+
+        assert count == 3
+        assert self._client.all_requests.call_count == 2
+        tag = uut.open("tag3")
+        assert tag.data_type == tbase.DataType.STRING
+        assert self._client.all_requests.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test__metadata_cache__warm_metadata_cache_async__all_pages_cached(
+        self,
+    ):
+        uut = self._create_uut_with_cache(tbase.TagMetadataCache())
+        self._client.all_requests.configure_mock(
+            side_effect=self._get_mock_request(
+                [
+                    {"totalCount": 2, "tags": [{"type": "INT", "path": "tag1"}]},
+                    {"totalCount": 2, "tags": [{"type": "DOUBLE", "path": "tag2"}]},
+                ]
+            )
+        )
+
+        count = await uut.warm_metadata_cache_async(take=1)
+
+        assert count == 2
+        assert len(uut.metadata_cache) == 2
+
+    def test__no_metadata_cache__warm_metadata_cache__raises(self):
+        with pytest.raises(ValueError):
+            self._uut.warm_metadata_cache()
+
+    def test__bad_max_concurrency__query__raises_without_request(self):
+        with pytest.raises(ValueError):
+            self._uut.query(max_concurrency=0)
+        assert self._client.all_requests.call_count == 0
+
+    def test__max_concurrency__query__all_pages_returned_in_order(self):
+        def mock_request(method, uri, params=None, data=None):
+            skip = int(params["skip"])
+            tags = [{"type": "INT", "path": "tag{}".format(skip)}]
+            return {"totalCount": 3, "tags": tags}, MockResponse(method, uri)
+
+        self._client.all_requests.configure_mock(side_effect=mock_request)
+
+        result = self._uut.query(take=1, max_concurrency=2)
+
+        assert result.max_concurrency == 2
+        assert [page[0].path for page in result] == ["tag0", "tag1", "tag2"]
+        assert self._client.all_requests.call_count == 3
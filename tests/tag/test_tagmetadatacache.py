@@ -0,0 +1,69 @@
+import datetime
+from unittest import mock
+
+import pytest
+from nisystemlink.clients import tag as tbase
+
+
+class TestTagMetadataCache:
+    def test__bad_arguments__constructor__raises(self):
+        with pytest.raises(ValueError):
+            tbase.TagMetadataCache(max_size=0)
+        with pytest.raises(ValueError):
+            tbase.TagMetadataCache(ttl=datetime.timedelta(0))
+
+    def test__tag_added__get__returns_copy(self):
+        cache = tbase.TagMetadataCache()
+        tag = tbase.TagData("tag", tbase.DataType.DOUBLE, ["a"], {"b": "c"})
+        tag.collect_aggregates = True
+        tag.set_retention_count(5)
+
+        cache.add([tag])
+        tag.keywords.append("changed")
+        cached = cache.get("tag")
+
+        assert cached is not None
+        assert cached is not tag
+        assert cached.keywords == ["a"]
+        assert cached.properties == {"b": "c"}
+        assert cached.collect_aggregates is True
+        assert cached.retention_type == tbase.RetentionType.COUNT
+        assert cached.retention_count == 5
+        cached.keywords.append("changed")
+        assert cache.get("tag").keywords == ["a"]
+
+    def test__tag_not_added__get__returns_none(self):
+        assert tbase.TagMetadataCache().get("tag") is None
+
+    def test__ttl_elapsed__get__returns_none(self):
+        cache = tbase.TagMetadataCache(ttl=datetime.timedelta(seconds=10))
+        with mock.patch("time.monotonic", return_value=100.0):
+            cache.add([tbase.TagData("tag", tbase.DataType.INT32)])
+        with mock.patch("time.monotonic", return_value=109.0):
+            assert cache.get("tag") is not None
+        with mock.patch("time.monotonic", return_value=110.0):
+            assert cache.get("tag") is None
+        assert len(cache) == 0
+
+    def test__cache_full__add__least_recently_used_evicted(self):
+        cache = tbase.TagMetadataCache(max_size=2)
+        cache.add([tbase.TagData("tag1"), tbase.TagData("tag2")])
+        cache.get("tag1")
+
+        cache.add([tbase.TagData("tag3")])
+
+        assert len(cache) == 2
+        assert cache.get("tag2") is None
+        assert cache.get("tag1") is not None
+        assert cache.get("tag3") is not None
+
+    def test__invalidate_and_clear__tags_removed(self):
+        cache = tbase.TagMetadataCache()
+        cache.add([tbase.TagData("tag1"), tbase.TagData("tag2")])
+
+        cache.invalidate(["tag1", "missing"])
+        assert cache.get("tag1") is None
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
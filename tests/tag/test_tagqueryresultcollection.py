@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest  # type: ignore
 from nisystemlink.clients.core import ApiException
 from nisystemlink.clients.tag import DataType, TagData, TagQueryResultCollection
@@ -266,3 +269,86 @@ class TestTagQueryResultCollectionTests:
             next(itr)
 
         uut.verify([0, 0])
+
+
+class TestConcurrentTagQueryResultCollection:
+    class PagedTagQueryResultCollection(TagQueryResultCollection):
+        """Serves pages of a fixed list of tags, recording the concurrent requests."""
+
+        def __init__(self, tags, page_size, *, max_concurrency, delay=0.02):
+            super().__init__(
+                tags[:page_size], len(tags), 0, max_concurrency=max_concurrency
+            )
+            self._tags = tags
+            self._page_size = page_size
+            self._delay = delay
+            self._lock = threading.Lock()
+            self._active = 0
+            self.max_active = 0
+            self.skips = []
+            self.reported_total = None
+
+        def _query_page(self, skip):
+            with self._lock:
+                self.skips.append(skip)
+                self._active += 1
+                self.max_active = max(self.max_active, self._active)
+            # Later pages finish first, to check that the pages stay in order
+            time.sleep(self._delay * (len(self._tags) - skip) / len(self._tags))
+            with self._lock:
+                self._active -= 1
+            if self.reported_total is not None:
+                self._total_count = self.reported_total
+            return self._tags[skip : skip + self._page_size]
+
+    def test__bad_max_concurrency__constructed__raises(self):
+        with pytest.raises(ValueError):
+            self.PagedTagQueryResultCollection([], 1, max_concurrency=0)
+
+    def test__max_concurrency__iterating__pages_fetched_concurrently_in_order(self):
+        tags = [TagData("tag{}".format(i), DataType.INT32) for i in range(25)]
+        uut = self.PagedTagQueryResultCollection(tags, 2, max_concurrency=4)
+
+        pages = list(uut)
+
+        assert [t for page in pages for t in page] == tags
+        assert len(pages) == 13
+        assert sorted(uut.skips) == list(range(2, 25, 2))
+        assert 1 < uut.max_active <= 4
+
+    def test__total_count_changes__iterating_concurrently__first_total_kept(self):
+        tags = [TagData("tag{}".format(i), DataType.INT32) for i in range(6)]
+        uut = self.PagedTagQueryResultCollection(tags, 2, max_concurrency=3)
+        uut.reported_total = 100
+        totals = []
+
+        for page in uut:
+            totals.append(uut.total_count)
+
+        assert totals == [6, 6, 6]
+        assert uut.total_count == 6
+
+    def test__max_concurrency_without_cached_page__iterating__first_page_fetched_alone(
+        self,
+    ):
+        tags = [TagData("tag{}".format(i), DataType.INT32) for i in range(6)]
+        uut = self.PagedTagQueryResultCollection(tags, 2, max_concurrency=3)
+        list(uut)
+        uut.skips.clear()
+
+        pages = list(uut)
+
+        assert [t for page in pages for t in page] == tags
+        assert uut.skips[0] == 0
+        assert sorted(uut.skips[1:]) == [2, 4]
+
+    def test__max_concurrency__stop_iterating_early__remaining_pages_not_fetched(self):
+        tags = [TagData("tag{}".format(i), DataType.INT32) for i in range(100)]
+        uut = self.PagedTagQueryResultCollection(tags, 1, max_concurrency=2)
+
+        itr = iter(uut)
+        next(itr)
+        next(itr)
+        itr.close()
+
+        assert len(uut.skips) <= 3
@@ -1,4 +1,7 @@
 import datetime
+import subprocess
+import sys
+import time
 from unittest import mock
 from unittest.mock import Mock
 
@@ -224,8 +227,8 @@ class TestTagSelection:
             )
 
         assert selection.mock_create_subscription_internal.call_args_list == [
-            mock.call(None),
-            mock.call(update_interval),
+            mock.call(None, None),
+            mock.call(update_interval, None),
         ]
 
     @pytest.mark.asyncio
@@ -248,10 +251,41 @@ class TestTagSelection:
             )
 
         assert selection.mock_create_subscription_internal_async.call_args_list == [
-            mock.call(None),
-            mock.call(update_interval),
+            mock.call(None, None),
+            mock.call(update_interval, None),
         ]
 
+    def test__max_update_interval__create_subscription__passed_to_implementation(
+        self,
+    ):
+        selection = self.MockTagSelection([])
+        update_interval = datetime.timedelta(seconds=1)
+        max_update_interval = datetime.timedelta(minutes=1)
+        selection.mock_create_subscription_internal.configure_mock(side_effect=None)
+
+        selection.create_subscription(
+            update_interval=update_interval, max_update_interval=max_update_interval
+        )
+
+        selection.mock_create_subscription_internal.assert_called_once_with(
+            update_interval, max_update_interval
+        )
+
+    @pytest.mark.asyncio
+    async def test__max_update_interval_too_small__create_subscription__raises(self):
+        selection = self.MockTagSelection([])
+        update_interval = datetime.timedelta(minutes=1)
+        max_update_interval = datetime.timedelta(seconds=1)
+
+        with pytest.raises(ValueError):
+            selection.create_subscription(
+                update_interval=update_interval, max_update_interval=max_update_interval
+            )
+        with pytest.raises(ValueError):
+            await selection.create_subscription_async(
+                update_interval=update_interval, max_update_interval=max_update_interval
+            )
+
     def test__delete_tags_from_server__collections_cleared_after_delete(self):
         selection = self.MockTagSelection([TagData("tag1", DataType.BOOLEAN)], ["tag*"])
         selection.mock_delete_tags_from_server_internal.configure_mock(side_effect=None)
@@ -1434,6 +1468,214 @@ class TestTagSelection:
 
         selection.mock_close_internal_async.assert_called_once_with()
 
+    def _values(self, timestamp, *values):
+        return [
+            SerializedTagWithAggregates(path, DataType.INT32, value, timestamp)
+            for path, value in values
+        ]
+
+    def test__first_refresh__refresh_changed_values__all_values_reported(self):
+        timestamp = datetime.datetime.now(datetime.timezone.utc)
+        selection = self.MockTagSelection([TagData("tag1", DataType.INT32)], ["tag*"])
+        selection.mock_read_tag_values.configure_mock(
+            side_effect=None,
+            return_value=self._values(timestamp, ("tag1", "1"), ("tag2", "2")),
+        )
+
+        changed = selection.refresh_changed_values()
+
+        assert changed == {"tag1", "tag2"}
+        assert selection.values["tag2"].read().value == 2
+
+    def test__some_values_changed__refresh_changed_values__only_changed_reported(
+        self,
+    ):
+        timestamp1 = datetime.datetime.now(datetime.timezone.utc)
+        timestamp2 = timestamp1 + datetime.timedelta(seconds=1)
+        selection = self.MockTagSelection([], ["tag*"])
+        selection.mock_read_tag_values.configure_mock(
+            side_effect=[
+                self._values(timestamp1, ("tag1", "1"), ("tag2", "2"), ("tag3", "3")),
+                self._values(timestamp1, ("tag1", "1"), ("tag2", "2"))
+                + self._values(timestamp2, ("tag3", "3")),
+            ]
+        )
+        selection.refresh_changed_values()
+        reader = selection.values["tag1"]
+
+        changed = selection.refresh_changed_values()
+
+        assert changed == {"tag3"}
+        assert selection.values["tag1"] is reader
+        assert selection.values["tag3"].read(include_timestamp=True).timestamp == (
+            timestamp2
+        )
+
+    def test__value_removed__refresh_changed_values__path_reported(self):
+        timestamp = datetime.datetime.now(datetime.timezone.utc)
+        selection = self.MockTagSelection([], ["tag*"])
+        selection.mock_read_tag_values.configure_mock(
+            side_effect=[
+                self._values(timestamp, ("tag1", "1"), ("tag2", "2")),
+                self._values(timestamp, ("tag1", "1")),
+            ]
+        )
+        selection.refresh_changed_values()
+
+        changed = selection.refresh_changed_values()
+
+        assert changed == {"tag2"}
+        assert selection.values["tag2"].read() is None
+
+    @pytest.mark.asyncio
+    async def test__value_changed__refresh_changed_values_async__path_reported(self):
+        timestamp = datetime.datetime.now(datetime.timezone.utc)
+        selection = self.MockTagSelection([], ["tag*"])
+        selection.mock_read_tag_values_async.configure_mock(
+            side_effect=[
+                self._values(timestamp, ("tag1", "1"), ("tag2", "2")),
+                self._values(timestamp, ("tag1", "1"), ("tag2", "5")),
+            ]
+        )
+        await selection.refresh_changed_values_async()
+
+        changed = await selection.refresh_changed_values_async()
+
+        assert changed == {"tag2"}
+        assert (await selection.values["tag2"].read_async()).value == 5
+
+    def test__closed__refresh_changed_values__raises(self):
+        selection = self.MockTagSelection([])
+        selection.close()
+
+        with pytest.raises(ReferenceError):
+            selection.refresh_changed_values()
+
+    def test__values_refreshed__snapshot__columns_decoded_by_data_type(self):
+        timestamp = datetime.datetime(2024, 1, 2, 3, 4, 5, 6, datetime.timezone.utc)
+        selection = self.MockTagSelection([], ["*"])
+        selection.mock_read_tag_values.configure_mock(
+            side_effect=None,
+            return_value=[
+                SerializedTagWithAggregates(
+                    "d1", DataType.DOUBLE, "1.5", timestamp, 2, "1", "2", 1.5
+                ),
+                SerializedTagWithAggregates("d2", DataType.DOUBLE, "-2"),
+                SerializedTagWithAggregates(
+                    "i1", DataType.INT32, "-3", timestamp, 1, "-3", "-3", -3.0
+                ),
+                SerializedTagWithAggregates("i2", DataType.INT32, "4"),
+                SerializedTagWithAggregates(
+                    "u1", DataType.UINT64, "18446744073709551615"
+                ),
+                SerializedTagWithAggregates("b1", DataType.BOOLEAN, "True"),
+                SerializedTagWithAggregates("b2", DataType.BOOLEAN, "False"),
+                SerializedTagWithAggregates("s1", DataType.STRING, "text"),
+                SerializedTagWithAggregates(
+                    "t1", DataType.DATE_TIME, "2024-01-02T03:04:05.000006Z"
+                ),
+                SerializedTagWithAggregates("x", DataType.UNKNOWN, "?"),
+                SerializedTagWithAggregates("n", DataType.DOUBLE, None),
+            ],
+        )
+        selection.refresh_values()
+
+        frames = selection.snapshot()
+
+        assert set(frames) == {
+            DataType.DOUBLE,
+            DataType.INT32,
+            DataType.UINT64,
+            DataType.BOOLEAN,
+            DataType.STRING,
+            DataType.DATE_TIME,
+        }
+        doubles = frames[DataType.DOUBLE]
+        assert doubles.index.tolist() == ["d1", "d2"]
+        assert doubles["value"].dtype == "float64"
+        assert doubles["value"].tolist() == [1.5, -2.0]
+        assert doubles["timestamp"].iloc[0] == timestamp
+        assert doubles["timestamp"].isna().tolist() == [False, True]
+        assert doubles["count"].tolist()[0] == 2
+        assert doubles["min"].iloc[0] == 1.0
+        assert doubles["max"].isna().tolist() == [False, True]
+        assert doubles["mean"].iloc[0] == 1.5
+        ints = frames[DataType.INT32]
+        assert ints["value"].dtype == "int32"
+        assert ints["value"].tolist() == [-3, 4]
+        assert ints["min"].dtype == "Int32"
+        assert ints["min"].isna().tolist() == [False, True]
+        assert frames[DataType.UINT64]["value"].tolist() == [18446744073709551615]
+        assert frames[DataType.UINT64]["value"].dtype == "uint64"
+        assert frames[DataType.BOOLEAN]["value"].tolist() == [True, False]
+        assert frames[DataType.STRING]["value"].tolist() == ["text"]
+        assert "min" not in frames[DataType.STRING]
+        assert frames[DataType.DATE_TIME]["value"].iloc[0] == datetime.datetime(
+            2024, 1, 2, 3, 4, 5, 6, datetime.timezone.utc
+        )
+
+    def test__tag_package_imported__pandas_and_numpy_not_loaded(self):
+        code = (
+            "import sys, nisystemlink.clients.tag; "
+            "print('pandas' in sys.modules or 'numpy' in sys.modules)"
+        )
+
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+        assert output.strip() == "False"
+
+    def test__values_not_refreshed__snapshot__empty(self):
+        selection = self.MockTagSelection([TagData("tag", DataType.INT32)])
+
+        assert selection.snapshot() == {}
+
+    def test__invalid_value__snapshot__raises(self):
+        selection = self.MockTagSelection([], ["*"])
+        selection.mock_read_tag_values.configure_mock(
+            side_effect=None,
+            return_value=[SerializedTagWithAggregates("b", DataType.BOOLEAN, "yes")],
+        )
+        selection.refresh_values()
+
+        with pytest.raises(ValueError):
+            selection.snapshot()
+
+    def test__closed__snapshot__raises(self):
+        selection = self.MockTagSelection([])
+        selection.close()
+
+        with pytest.raises(ReferenceError):
+            selection.snapshot()
+
+    @pytest.mark.slow
+    def test__benchmark__snapshot_and_read(self):
+        count = 50_000
+        timestamp = datetime.datetime.now(datetime.timezone.utc)
+        selection = self.MockTagSelection([], ["*"])
+        selection.mock_read_tag_values.configure_mock(
+            side_effect=None,
+            return_value=[
+                SerializedTagWithAggregates(
+                    f"tag{i}", DataType.DOUBLE, str(i / 7), timestamp
+                )
+                for i in range(count)
+            ],
+        )
+        selection.refresh_values()
+
+        start = time.perf_counter()
+        values = [reader.read().value for reader in selection.values.values()]
+        read_elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        frame = selection.snapshot()[DataType.DOUBLE]
+        snapshot_elapsed = time.perf_counter() - start
+
+        assert frame["value"].tolist() == values
+        print(
+            f"read: {read_elapsed * 1000:.1f} ms, "
+            f"snapshot: {snapshot_elapsed * 1000:.1f} ms for {count} tags"
+        )
+
     class MockTagSelection(TagSelection):
         def __init__(self, tags, paths=None):
             self.mock_buffer_value = Mock(side_effect=NotImplementedError)
@@ -0,0 +1,30 @@
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+from nisystemlink.clients.tag._core._manual_reset_timer import ManualResetTimer
+
+
+class TestTagSubscription:
+    class MinimalTagSubscription(tbase.TagSubscription):
+        """Implements only the hooks that every subscription must provide."""
+
+        def _create_subscription_on_server(self, paths):
+            pass
+
+        async def _create_subscription_on_server_async(self, paths):
+            pass
+
+        def _send_heartbeat(self):
+            pass
+
+        def _close_internal(self):
+            pass
+
+        async def _close_internal_async(self):
+            pass
+
+    @pytest.mark.asyncio
+    async def test__get_changes_not_implemented__get_changes__raises(self):
+        uut = self.MinimalTagSubscription(["tag"], ManualResetTimer.null_timer)
+
+        with pytest.raises(NotImplementedError):
+            await uut.get_changes()
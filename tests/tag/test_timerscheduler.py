@@ -0,0 +1,187 @@
+import asyncio
+import threading
+from unittest import mock
+
+import pytest  # type: ignore
+from nisystemlink.clients import tag as tbase
+
+
+class TestThreadedTimerScheduler:
+    def test__callbacks_scheduled__called_in_deadline_order(self):
+        scheduler = tbase.ThreadedTimerScheduler(max_workers=1)
+        called = []
+        done = threading.Event()
+        try:
+            scheduler.call_later(0.06, lambda: (called.append(3), done.set()))
+            scheduler.call_later(0.02, lambda: called.append(1))
+            scheduler.call_later(0.04, lambda: called.append(2))
+
+            assert done.wait(timeout=5)
+        finally:
+            scheduler.close()
+
+        assert called == [1, 2, 3]
+
+    def test__callback_cancelled__not_called(self):
+        scheduler = tbase.ThreadedTimerScheduler()
+        called = []
+        done = threading.Event()
+        try:
+            handle = scheduler.call_later(0.02, lambda: called.append(None))
+            scheduler.call_later(0.05, done.set)
+            handle.cancel()
+
+            assert done.wait(timeout=5)
+        finally:
+            scheduler.close()
+
+        assert handle.cancelled
+        assert called == []
+
+    def test__callback_raises__later_callbacks_called(self):
+        scheduler = tbase.ThreadedTimerScheduler(max_workers=1)
+        done = threading.Event()
+        try:
+            scheduler.call_later(0.01, lambda: 1 / 0)
+            scheduler.call_later(0.02, done.set)
+
+            assert done.wait(timeout=5)
+        finally:
+            scheduler.close()
+
+    def test__many_callbacks__thread_count_constant(self):
+        scheduler = tbase.ThreadedTimerScheduler(max_workers=2)
+        threads_before = threading.active_count()
+        count = 500
+        done = threading.Semaphore(0)
+        try:
+            for _ in range(count):
+                scheduler.call_later(0.01, done.release)
+            for _ in range(count):
+                assert done.acquire(timeout=5)
+
+            assert threading.active_count() <= threads_before + 3
+        finally:
+            scheduler.close()
+
+    def test__no_max_workers__blocked_callbacks__other_callbacks_called(self):
+        scheduler = tbase.ThreadedTimerScheduler()
+        release = threading.Event()
+        done = threading.Event()
+        try:
+            for _ in range(8):
+                scheduler.call_later(0.01, lambda: release.wait(timeout=10))
+            scheduler.call_later(0.05, done.set)
+
+            assert done.wait(timeout=5)
+        finally:
+            release.set()
+            scheduler.close()
+
+    def test__max_workers_busy__callback_waits_for_worker(self):
+        scheduler = tbase.ThreadedTimerScheduler(max_workers=1)
+        release = threading.Event()
+        done = threading.Event()
+        try:
+            scheduler.call_later(0.01, lambda: release.wait(timeout=10))
+            scheduler.call_later(0.02, done.set)
+
+            assert not done.wait(timeout=0.2)
+            release.set()
+            assert done.wait(timeout=5)
+        finally:
+            release.set()
+            scheduler.close()
+
+    def test__closed__call_later__raises(self):
+        scheduler = tbase.ThreadedTimerScheduler()
+        scheduler.close()
+
+        with pytest.raises(RuntimeError):
+            scheduler.call_later(1, lambda: None)
+
+    def test__bad_arguments__constructor__raises(self):
+        with pytest.raises(ValueError):
+            tbase.ThreadedTimerScheduler(max_workers=0)
+
+    def test__get_default__same_instance_returned(self):
+        assert tbase.TimerScheduler.get_default() is tbase.TimerScheduler.get_default()
+
+    def test__get_default__worker_count_limited(self):
+        assert tbase.TimerScheduler.get_default()._max_workers == 4
+
+
+class TestAsyncioTimerScheduler:
+    @pytest.mark.asyncio
+    async def test__callback_scheduled__called_off_of_loop_thread(self):
+        scheduler = tbase.AsyncioTimerScheduler()
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+        threads = []
+
+        def callback():
+            threads.append(threading.current_thread())
+            loop.call_soon_threadsafe(done.set)
+
+        scheduler.call_later(0.01, callback)
+        await asyncio.wait_for(done.wait(), timeout=5)
+
+        assert threads[0] is not threading.current_thread()
+
+    @pytest.mark.asyncio
+    async def test__scheduled_from_other_thread__callback_called(self):
+        scheduler = tbase.AsyncioTimerScheduler()
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+
+        thread = threading.Thread(
+            target=scheduler.call_later,
+            args=(0.01, lambda: loop.call_soon_threadsafe(done.set)),
+        )
+        thread.start()
+        thread.join()
+
+        await asyncio.wait_for(done.wait(), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test__callback_cancelled__not_called(self):
+        scheduler = tbase.AsyncioTimerScheduler()
+        called = []
+
+        handle = scheduler.call_later(0.01, lambda: called.append(None))
+        handle.cancel()
+        await asyncio.sleep(0.05)
+
+        assert called == []
+
+    @pytest.mark.asyncio
+    async def test__callback_cancelled__loop_timer_cancelled(self):
+        scheduler = tbase.AsyncioTimerScheduler()
+        loop = asyncio.get_running_loop()
+        loop_handles = []
+        call_at = loop.call_at
+
+        def record_call_at(*args, **kwargs):
+            loop_handles.append(call_at(*args, **kwargs))
+            return loop_handles[-1]
+
+        with mock.patch.object(loop, "call_at", side_effect=record_call_at):
+            handle = scheduler.call_later(60, lambda: None)
+            await asyncio.sleep(0.01)
+        handle.cancel()
+        await asyncio.sleep(0.01)
+
+        # asyncio.sleep also uses call_at, for earlier deadlines
+        assert max(loop_handles, key=lambda h: h.when()).cancelled()
+
+    @pytest.mark.asyncio
+    async def test__closed__call_later__raises(self):
+        scheduler = tbase.AsyncioTimerScheduler()
+        scheduler.close()
+
+        with pytest.raises(RuntimeError):
+            scheduler.call_later(1, lambda: None)
+
+    def test__no_running_loop__constructor__raises(self):
+        with pytest.raises(RuntimeError):
+            tbase.AsyncioTimerScheduler()